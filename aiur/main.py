@@ -24,13 +24,16 @@ from sc2.data import Race, Result
 from sc2.ids.ability_id import AbilityId
 from sc2.ids.unit_typeid import UnitTypeId as U
 from sc2.ids.upgrade_id import UpgradeId as Up
+from sc2.position import Point2
 
 from strategy_engine import (
     StrategicAdvisor,
     GameState,
     Engagement,
     classify_opening,
+    maps,
 )
+from strategy_engine.orders import OrderBuffer
 
 # --------------------------------------------------------------------------- #
 # Scouting tables: enemy structure -> normalized name (for classify_opening)   #
@@ -95,6 +98,18 @@ class AiurBot(BotAI):
         self.last_log = 0.0
         self.enemy_opening = None
         self._wall = None               # cached ramp wall layout
+        self.order_buffer = OrderBuffer()
+
+    def _find_expansion_locations(self):
+        # the shipped per-map cache (strategy_engine/maps.py) when this map and
+        # spawn are in it; python-sc2's live resource clustering otherwise
+        if not maps.apply_expansions(self):
+            super()._find_expansion_locations()
+
+    async def _after_step(self):
+        # compact this step's orders before python-sc2 sends them (strategy_engine/orders.py)
+        self.order_buffer.flush(self)
+        return await super()._after_step()
 
     async def on_start(self):
         self.client.game_step = 4       # responsive without being wasteful
@@ -113,6 +128,7 @@ class AiurBot(BotAI):
 
     async def on_end(self, result: Result):
         print(f"AiurBot game ended: {result}")
+        print(self.order_buffer.stats.summary())
 
     # -------------------------------------------------------------- perceive ---
     def _perceive(self):
@@ -667,6 +683,12 @@ class AiurBot(BotAI):
     def _wall_layout(self):
         if self._wall is not None:
             return self._wall
+        spawn = maps.for_bot(self)
+        if spawn is not None and spawn.protoss_wall[0] is not None:
+            pylon, builds, hold = spawn.protoss_wall
+            self._wall = (Point2(pylon), [Point2(p) for p in builds],
+                          Point2(hold) if hold else None)
+            return self._wall
         try:
             ramp = self.main_base_ramp
             pylon = ramp.protoss_wall_pylon
@@ -704,6 +726,9 @@ class AiurBot(BotAI):
         return base.position.towards(self.game_info.map_center, -3)
 
     def _choke(self, base):
+        spawn = maps.for_bot(self)
+        if spawn is not None and spawn.ramp_top is not None:
+            return Point2(spawn.ramp_top).towards(base.position, 3)
         try:
             return self.main_base_ramp.top_center.towards(base.position, 3)
         except Exception:
@@ -0,0 +1,392 @@
+"""Offline accuracy benchmark for strategy_engine against replay ground truth.
+
+How would ``StrategicAdvisor`` have read a game we already know the ending of?
+This rebuilds, per player, the ``GameState`` the bot would have seen at every
+PlayerStatsEvent tick (~10s) -- own economy/supply/army/trade values from the
+tracker events, and the ``enemy_*`` fields as of the *last scout*, not the
+truth -- then runs the engine over every snapshot and scores it:
+
+  - opening read:  ``classify_opening`` on the structures scouted so far vs the
+    opponent's real family (``extract_openings`` on the full replay);
+  - aggression alarm: ``classify_opponent`` CHEESE/TIMING vs an all-in family;
+  - winner read:   ``assess_efficiency`` / ``power_timing`` vs the real winner;
+  - engagements:   ``assess_engagement`` right before each fight vs its trade.
+
+Visibility model (deterministic, so runs are comparable): the enemy base is
+scouted first at ``SCOUT_FIRST`` seconds and re-scouted every ``SCOUT_EVERY``;
+enemy structures in the forward zone and enemy units near our bases are seen
+from home after ``HOME_DELAY``. Parsing is the slow part, so each replay's
+reconstruction is cached (``replay_batch``); re-scoring after an engine change
+replays only the cached snapshots, thousands per second.
+
+    python analysis/advisor_eval.py <dir|replay ...> [--jobs N] [--out FILE]
+"""
+import bisect
+import os
+import sys
+import time
+from collections import Counter, defaultdict
+from math import hypot
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+import replay_batch as rb  # noqa: E402
+
+from strategy_engine import (  # noqa: E402
+    GameState, StrategicAdvisor, classify_opening,
+    Archetype, Engagement, PowerTiming, TradeVerdict,
+)
+from strategy_engine.combat_sim import is_combat_unit  # noqa: E402
+
+CACHE_VERSION = 2   # bump when reconstruct() output changes
+SCOUT_FIRST = 80    # first worker scout reaches the enemy main (~1:20)
+SCOUT_EVERY = 60    # then a fresh look (overlord / scan / unit) each minute
+HOME_DELAY = 5      # proxies / attackers near our bases are seen almost at once
+HOME_RADIUS = 30    # "near our bases" for the home-visibility model
+FIGHT_MIN = 300     # resource value lost in a 30s bucket that counts as a fight
+
+PRODUCTION = {"Gateway", "WarpGate", "Barracks", "Factory", "Starport",
+              "RoboticsFacility", "Stargate", "Hatchery", "Lair", "Hive"}
+TECH = {"CyberneticsCore", "TwilightCouncil", "RoboticsBay", "FleetBeacon",
+        "TemplarArchives", "DarkShrine", "Armory", "FusionCore", "GhostAcademy",
+        "RoachWarren", "BanelingNest", "HydraliskDen", "Spire", "InfestationPit",
+        "LurkerDenMP", "UltraliskCavern", "GreaterSpire"}
+UPGRADE_STRUCTURES = {"Forge", "EngineeringBay", "EvolutionChamber", "Armory"}
+STATIC_DEFENSE = {"PhotonCannon", "ShieldBattery", "Bunker", "MissileTurret",
+                  "PlanetaryFortress", "SpineCrawler", "SporeCrawler"}
+GAS = {"Assimilator", "AssimilatorRich", "Refinery", "RefineryRich",
+       "Extractor", "ExtractorRich"}
+AIR = {"Phoenix", "VoidRay", "Oracle", "Carrier", "Tempest", "Mothership",
+       "VikingFighter", "Medivac", "Liberator", "Banshee", "Raven",
+       "Battlecruiser", "Mutalisk", "Corruptor", "BroodLord", "Viper"}
+CLOAK = {"DarkTemplar", "Observer", "Banshee", "Ghost", "LurkerMP", "WidowMine"}
+LIGHT = {"Zealot", "Adept", "Marine", "Reaper", "Hellion", "Zergling", "Baneling",
+         "Mutalisk"}
+ALLIN_FAMILIES = {"protoss_proxy", "protoss_gate_allin", "terran_proxy_rax",
+                  "terran_2rax", "zerg_pool_rush"}
+
+
+# ---- reconstruction (needs sc2reader; runs in the worker pool, cached) -----
+
+def _near(x, y, points):
+    return any(hypot(x - px, y - py) <= HOME_RADIUS for px, py in points)
+
+
+def reconstruct(path):
+    """Per-player true-state timelines + ground truth, JSON-serializable."""
+    import loss_analysis as la
+    import extract_openings as ex
+    import sc2reader
+
+    r = sc2reader.load_replay(path, load_level=3)
+    humans = [p for p in r.players if not p.is_observer]
+    if len(humans) != 2:
+        return {"error": "not a 1v1"}
+    pids = [p.pid for p in humans]
+
+    alive = {}                        # unit_id -> [owner, name, x, y]
+    units = {}                        # unit_id -> [owner, name, born, died] (la.load shape)
+    upgrades = Counter()
+    seen_air, seen_cloak = defaultdict(bool), defaultdict(bool)
+    home_hits = defaultdict(list)     # pid -> seconds enemy units were near its bases
+    ticks = defaultdict(list)         # pid -> [true state dict]
+
+    def townhalls(pid):
+        return [(u[2], u[3]) for u in alive.values()
+                if u[0] == pid and u[1] in la.TOWNHALLS]
+
+    for e in r.tracker_events:
+        name = e.name
+        if name in ("UnitBornEvent", "UnitInitEvent"):
+            owner = getattr(e, "control_pid", None)
+            uname = getattr(getattr(e, "unit", None), "name", None)
+            if owner in pids and uname:
+                alive[e.unit_id] = [owner, uname, e.x, e.y]
+                units.setdefault(e.unit_id, [owner, uname, e.second, None])
+                seen_air[owner] |= uname in AIR
+                seen_cloak[owner] |= uname in CLOAK
+        elif name == "UnitTypeChangeEvent":
+            u = alive.get(e.unit_id)
+            if u:
+                u[1] = e.unit_type_name
+        elif name == "UnitDiedEvent":
+            if e.unit_id in units:
+                units[e.unit_id][3] = e.second
+            u = alive.pop(e.unit_id, None)
+            if u:
+                other = pids[1] if u[0] == pids[0] else pids[0]
+                x, y = getattr(e, "x", u[2]), getattr(e, "y", u[3])
+                if la.is_army(u[1]) and _near(x, y, townhalls(other)):
+                    home_hits[other].append(e.second)   # their army died at our door
+        elif name == "UnitPositionsEvent":
+            for unit, (x, y) in getattr(e, "units", {}).items():
+                u = alive.get(getattr(unit, "id", None))
+                if u and la.is_army(u[1]):
+                    other = pids[1] if u[0] == pids[0] else pids[0]
+                    if _near(x, y, townhalls(other)):
+                        home_hits[other].append(e.second)
+        elif name == "UpgradeCompleteEvent" and e.pid in pids:
+            n = e.upgrade_type_name
+            if not n.lower().startswith("spray") and not n.startswith("Reward"):
+                upgrades[e.pid] += 1
+        elif name == "PlayerStatsEvent" and e.pid in pids:
+            pid = e.pid
+            mine = [u[1] for u in alive.values() if u[0] == pid]
+            army = sum(la.COST[n][2] for n in mine if la.is_army(n))
+            light = sum(1 for n in mine if n in LIGHT)
+            killed = sum(getattr(e, f"{res}_killed_{kind}", 0)
+                         for res in ("minerals", "vespene")
+                         for kind in ("army", "economy", "technology"))
+            lost = sum(getattr(e, f"{res}_lost_{kind}", 0)
+                       for res in ("minerals", "vespene")
+                       for kind in ("army", "economy", "technology"))
+            ticks[pid].append(dict(
+                t=e.second,
+                workers=int(e.workers_active_count),
+                bases=sum(1 for n in mine if n in la.TOWNHALLS),
+                minerals=int(e.minerals_current), vespene=int(e.vespene_current),
+                income=e.minerals_collection_rate / 60.0,
+                supply_used=int(e.food_used), supply_cap=int(e.food_made),
+                army=army,
+                army_value=sum(la.val(n) for n in mine if la.is_army(n)),
+                comp=dict(Counter(n for n in mine if is_combat_unit(n))),
+                prod=sum(1 for n in mine if n in PRODUCTION),
+                tech=sum(1 for n in mine if n in TECH),
+                upg_structs=sum(1 for n in mine if n in UPGRADE_STRUCTURES),
+                static=sum(1 for n in mine if n in STATIC_DEFENSE),
+                gas=sum(1 for n in mine if n in GAS),
+                upgrades=upgrades[pid],
+                killed=float(killed), lost=float(lost),
+                air=seen_air[pid], cloak=seen_cloak[pid],
+                massing_light=light >= 16,
+            ))
+
+    # ground truth: opening families, winner, fights
+    length = int(r.game_length.seconds)
+    players = {}
+    for p in humans:
+        try:
+            op = ex.extract_player(r, p.pid, p.play_race, ex.WINDOW)
+            family = ex.classify(op)
+            buildings = [(b["s"], b["t"], b["zone"]) for b in op["buildings"]]
+        except Exception:
+            family, buildings, op = None, [], {"first_gas": None, "expand": None}
+        players[p.pid] = dict(
+            race=p.play_race, name=p.name, result=getattr(p, "result", None),
+            family=family, buildings=buildings,
+            first_gas=op["first_gas"], expand=op["expand"],
+            ticks=ticks[p.pid], home_hits=sorted(home_hits[p.pid]))
+    fights = []
+    for t0 in range(0, length, 30):
+        lost = {pid: la.deaths_in(units, pid, t0, t0 + 30)[0] for pid in pids}
+        if max(lost.values()) >= FIGHT_MIN:
+            fights.append(dict(t=t0, lost={str(k): v for k, v in lost.items()}))
+    return dict(file=os.path.basename(path), map=r.map_name, length=length,
+                players={str(k): v for k, v in players.items()}, fights=fights)
+
+
+# ---- snapshots (pure Python, no sc2reader) --------------------------------
+
+def _last_scout(t):
+    if t < SCOUT_FIRST:
+        return None
+    return SCOUT_FIRST + ((t - SCOUT_FIRST) // SCOUT_EVERY) * SCOUT_EVERY
+
+
+def snapshots(game, pid):
+    """``(GameState, scouted_structures, scout_t, tick)`` for every tick of ``pid``."""
+    me = game["players"][pid]
+    (eid, enemy), = [(k, v) for k, v in game["players"].items() if k != pid]
+    etimes = [x["t"] for x in enemy["ticks"]]
+    hits = me["home_hits"]
+    for tick in me["ticks"]:
+        t = tick["t"]
+        scout_t = _last_scout(t)
+        seen = None
+        if scout_t is not None and etimes:
+            i = bisect.bisect_right(etimes, scout_t) - 1
+            seen = enemy["ticks"][i] if i >= 0 else None
+        j = bisect.bisect_right(hits, t - HOME_DELAY)
+        moving_out = j > 0 and hits[j - 1] >= t - 30
+        proxy = any(z == "forward" and s + HOME_DELAY <= t
+                    for _n, s, z in enemy["buildings"])
+        st = GameState(
+            game_time=t,
+            worker_count=tick["workers"], base_count=max(1, tick["bases"]),
+            minerals=tick["minerals"], vespene=tick["vespene"],
+            mineral_income=tick["income"],
+            supply_used=tick["supply_used"], supply_cap=tick["supply_cap"],
+            supply_left=max(0, tick["supply_cap"] - tick["supply_used"]),
+            army_supply=tick["army"], army_units=tick["comp"] or None,
+            production_structures=tick["prod"], tech_structures=tick["tech"],
+            upgrade_structures=tick["upg_structs"],
+            upgrades_done=tick["upgrades"],
+            has_harass_units=tick["air"],
+            value_killed=tick["killed"], value_lost=tick["lost"],
+            enemy_race=enemy["race"],
+            enemy_proxy=proxy, enemy_army_moving_out=moving_out,
+        )
+        if seen is not None:
+            st.last_scouted_time = scout_t
+            st.enemy_base_count = max(1, seen["bases"])
+            st.enemy_worker_count = seen["workers"]
+            st.enemy_army_supply = seen["army"]
+            st.enemy_army_units = seen["comp"] or None
+            st.enemy_production_structures = seen["prod"]
+            st.enemy_tech_structures = seen["tech"]
+            st.enemy_static_defense = seen["static"]
+            st.enemy_gas_count = seen["gas"]
+            st.enemy_upgrades = seen["upgrades"]
+            st.enemy_has_air = seen["air"]
+            st.enemy_has_cloak = seen["cloak"]
+            st.enemy_massing_light = seen["massing_light"]
+        scouted = [b for b in enemy["buildings"]
+                   if (scout_t is not None and b[1] <= scout_t)
+                   or (b[2] == "forward" and b[1] + HOME_DELAY <= t)]
+        yield st, scouted, scout_t, tick
+
+
+# ---- scoring ---------------------------------------------------------------
+
+class Score:
+    """hit/total tallies keyed by (metric, bucket)."""
+
+    def __init__(self):
+        self.hit = Counter()
+        self.total = Counter()
+
+    def add(self, key, ok):
+        self.total[key] += 1
+        self.hit[key] += bool(ok)
+
+    def rate(self, key):
+        return self.hit[key] / self.total[key] if self.total[key] else None
+
+
+def _minute_bucket(t):
+    return "00-04m" if t < 240 else "04-08m" if t < 480 else "08-12m" if t < 720 else "12m+"
+
+
+def evaluate(games, advisor=None):
+    """Run the engine over every snapshot of every game; return (Score, n, seconds)."""
+    advisor = advisor or StrategicAdvisor()
+    sc = Score()
+    confusion = Counter()
+    n = 0
+    start = time.perf_counter()
+    for game in games:
+        for pid, me in game["players"].items():
+            enemy = next(v for k, v in game["players"].items() if k != pid)
+            won = {"Win": True, "Loss": False}.get(me["result"])
+            truth_allin = enemy["family"] in ALLIN_FAMILIES
+            reads = []                      # (t, engagement verdict) per snapshot
+            for st, scouted, scout_t, tick in snapshots(game, pid):
+                n += 1
+                t = tick["t"]
+                advice = advisor.advise(st)
+                # opening read, on what the scout has shown so far
+                if enemy["family"] and scout_t is not None and t <= 240:
+                    fg = enemy["first_gas"]
+                    xp = enemy["expand"]
+                    guess = classify_opening(
+                        enemy["race"], scouted,
+                        fg if fg is not None and fg <= scout_t else None,
+                        xp if xp is not None and xp <= scout_t else None)
+                    b = t // 30 * 30
+                    sc.add(("opening", f"@{b // 60}:{b % 60:02d}"), guess == enemy["family"])
+                    if b == 180:
+                        confusion[(enemy["family"], guess)] += 1
+                # aggression alarm (only meaningful in the first 5 minutes)
+                if t <= 300 and enemy["family"]:
+                    alarm = advice.classification.archetype in (
+                        Archetype.CHEESE_ALLIN, Archetype.TIMING_ATTACK)
+                    key = "allin->alarm" if truth_allin else "macro->no-alarm"
+                    sc.add(("aggression", key), alarm == truth_allin)
+                # winner read
+                if won is not None:
+                    b = _minute_bucket(t)
+                    eff = advice.efficiency.verdict
+                    if eff in (TradeVerdict.TRADING_UP, TradeVerdict.TRADING_DOWN):
+                        sc.add(("winner/efficiency", b),
+                               (eff == TradeVerdict.TRADING_UP) == won)
+                    if advice.timing in (PowerTiming.AHEAD_NOW, PowerTiming.AHEAD_LATER):
+                        sc.add(("winner/timing-ahead", b), won)
+                reads.append((t, advice.engagement.verdict))
+            # engagement: the last read going into each fight window
+            times = [t for t, _v in reads]
+            for f in game["fights"]:
+                i = bisect.bisect_right(times, f["t"]) - 1
+                if i < 0:
+                    continue
+                ours = f["lost"][pid]
+                theirs = next(v for k, v in f["lost"].items() if k != pid)
+                won_fight = theirs >= ours
+                v = reads[i][1]
+                if v in (Engagement.ENGAGE, Engagement.DEFEND):
+                    sc.add(("engagement", "engage/defend->won"), won_fight)
+                elif v == Engagement.AVOID:
+                    sc.add(("engagement", "avoid->lost"), not won_fight)
+    return sc, confusion, n, time.perf_counter() - start
+
+
+def render(sc, confusion, n, secs, n_games, failed):
+    out = []
+    p = out.append
+    p(f"# Advisor offline eval: {n_games} replays, {n} snapshots "
+      f"({n / secs if secs else 0:,.0f} snapshots/s)")
+    p("")
+    p(f"visibility: first scout {SCOUT_FIRST}s, re-scout every {SCOUT_EVERY}s, "
+      f"home delay {HOME_DELAY}s")
+    p("")
+    p("| metric | bucket | accuracy | n |")
+    p("|--------|--------|:--------:|:-:|")
+    for key in sorted(sc.total):
+        p(f"| {key[0]} | {key[1]} | {sc.rate(key):.0%} | {sc.total[key]} |")
+    p("")
+    wrong = [(k, v) for k, v in confusion.most_common() if k[0] != k[1]]
+    if wrong:
+        p("## Opening misreads @3:00 (true -> read)")
+        p("")
+        for (truth, guess), c in wrong[:10]:
+            p(f"- {truth} -> {guess}: {c}")
+        p("")
+    if failed:
+        p(f"skipped {len(failed)} replay(s): "
+          + "; ".join(f"{n}: {e}" for n, e in failed[:5]))
+    return "\n".join(out)
+
+
+def main():
+    argv = sys.argv[1:]
+    jobs, out_path, args = None, None, []
+    i = 0
+    while i < len(argv):
+        if argv[i] == "--jobs":
+            jobs = int(argv[i + 1]); i += 2
+        elif argv[i] == "--out":
+            out_path = argv[i + 1]; i += 2
+        else:
+            args.append(argv[i]); i += 1
+    if not args:
+        print(__doc__)
+        sys.exit(1)
+
+    games, failed = [], []
+    for path, res, _hit in rb.cached_map("advisor_eval", rb.expand_replays(args),
+                                         reconstruct, jobs=jobs, version=CACHE_VERSION):
+        if "error" in res:
+            failed.append((os.path.basename(path), res["error"]))
+        else:
+            games.append(res)
+    sc, confusion, n, secs = evaluate(games)
+    text = render(sc, confusion, n, secs, len(games), failed)
+    if out_path:
+        with open(out_path, "w") as f:
+            f.write(text)
+        print(f"wrote {out_path}")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
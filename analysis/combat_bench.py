@@ -0,0 +1,174 @@
+"""Accuracy and cost of ``strategy_engine.combat_sim`` against replay fights.
+
+Every fight ``advisor_eval.py`` mines (a 30s bucket where a side lost at least
+``FIGHT_MIN`` resources) is replayed through the simulator with both players'
+true army compositions at the last PlayerStatsEvent before it, and scored
+against what happened in the bucket:
+
+    | predictor | winner | decisive winner | loss-share MAE |
+
+- winner: the side that lost less value (ties skipped);
+- decisive: fights where the loser lost at least twice as much;
+- loss-share MAE: |predicted - real| share of the bucket's losses that were ours.
+
+The supply-ratio read ``assess_engagement`` used before the simulator is scored
+alongside as the baseline. Whole armies are compared, not just the units that
+fought, so both predictors are handicapped equally.
+
+    python analysis/combat_bench.py                       # timing on built-in matchups
+    python analysis/combat_bench.py <dir|replay ...> [--jobs N] [--out FILE]
+
+Reconstruction is shared with advisor_eval (same cache).
+"""
+import bisect
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+import advisor_eval as ae  # noqa: E402
+import replay_batch as rb  # noqa: E402
+
+from strategy_engine import combat_sim as cs  # noqa: E402
+
+MATCHUPS = [
+    ({"Marine": 20}, {"Zergling": 40}),
+    ({"Marine": 20, "Medivac": 2}, {"Baneling": 10, "Zergling": 30}),
+    ({"Stalker": 10}, {"Roach": 13}),
+    ({"Roach": 20}, {"Mutalisk": 10}),
+    ({"Zergling": 20}, {"Zealot": 8}),
+    ({"Hydralisk": 20}, {"VoidRay": 6}),
+    ({"Marine": 30, "Marauder": 10, "SiegeTankSieged": 3},
+     {"Roach": 20, "Ravager": 5, "Hydralisk": 10}),
+    ({"Roach": 16, "Hydralisk": 8}, {"Stalker": 8, "Immortal": 2, "Zealot": 6}),
+    ({"Zealot": 10, "Archon": 2}, {"Hydralisk": 12, "Roach": 8}),
+    ({"Ultralisk": 4}, {"Marine": 30}),
+]
+
+
+def timing(repeat=200):
+    """Uncached cost per fight over ``MATCHUPS`` (in us), plus each result."""
+    rows = []
+    for ours, theirs in MATCHUPS:
+        a, b = tuple(sorted(ours.items())), tuple(sorted(theirs.items()))
+        t0 = time.perf_counter()
+        for _ in range(repeat):
+            res = cs._resolve(a, b, 0, 0)
+        rows.append((ours, theirs, res, (time.perf_counter() - t0) / repeat * 1e6))
+    return rows
+
+
+def _comp_before(ticks, times, t):
+    i = bisect.bisect_right(times, t) - 1
+    return ticks[i] if i >= 0 else None
+
+
+def score(games):
+    """Per-predictor tallies over every fight of every game."""
+    tally = {name: dict(n=0, hit=0, dn=0, dhit=0, err=0.0) for name in ("sim", "supply")}
+    for game in games:
+        (pa, a), (pb, b) = sorted(game["players"].items())
+        ta, tb = [x["t"] for x in a["ticks"]], [x["t"] for x in b["ticks"]]
+        for f in game["fights"]:
+            xa, xb = _comp_before(a["ticks"], ta, f["t"]), _comp_before(b["ticks"], tb, f["t"])
+            if not xa or not xb or not xa["comp"] or not xb["comp"]:
+                continue
+            lost_a, lost_b = f["lost"][pa], f["lost"][pb]
+            if lost_a == lost_b:
+                continue
+            real_share = lost_a / (lost_a + lost_b)
+            a_won = lost_a < lost_b
+            decisive = max(lost_a, lost_b) >= 2 * min(lost_a, lost_b)
+
+            fight = cs.simulate_fight(xa["comp"], xb["comp"])
+            lost = fight.our_value_lost + fight.their_value_lost
+            preds = {
+                "sim": (fight.winner == "ours",
+                        fight.our_value_lost / lost if lost else 0.5),
+                "supply": (xa["army"] >= xb["army"],
+                           xb["army"] / max(1e-6, xa["army"] + xb["army"])),
+            }
+            for name, (pred_a, share) in preds.items():
+                t = tally[name]
+                t["n"] += 1
+                t["hit"] += pred_a == a_won
+                t["err"] += abs(share - real_share)
+                if decisive:
+                    t["dn"] += 1
+                    t["dhit"] += pred_a == a_won
+    return tally
+
+
+def render(tally, n_games, n_cached, failed, rows):
+    out = []
+    p = out.append
+    p(f"# combat_sim vs replay fights: {n_games} replays ({n_cached} cached)")
+    p("")
+    p("| predictor | fights | winner | decisive winner | loss-share MAE |")
+    p("|-----------|:------:|:------:|:---------------:|:--------------:|")
+    for name, t in tally.items():
+        if not t["n"]:
+            continue
+        dec = f"{t['dhit'] / t['dn']:.0%} ({t['dn']})" if t["dn"] else "-"
+        p(f"| {name} | {t['n']} | {t['hit'] / t['n']:.0%} | {dec} | {t['err'] / t['n']:.2f} |")
+    p("")
+    p(render_timing(rows))
+    if failed:
+        p(f"skipped {len(failed)} replay(s): "
+          + "; ".join(f"{n}: {e}" for n, e in failed[:5]))
+    return "\n".join(out)
+
+
+def render_timing(rows):
+    def fmt(comp):
+        return " ".join(f"{n} {name}" for name, n in comp.items())
+
+    out = ["| ours | theirs | result | ratio | us/fight |",
+           "|------|--------|--------|:-----:|:--------:|"]
+    for ours, theirs, res, us in rows:
+        out.append(f"| {fmt(ours)} | {fmt(theirs)} | {res.summary()} | "
+                   f"{res.strength_ratio:.2f} | {us:.0f} |")
+    mean = sum(r[3] for r in rows) / len(rows)
+    out.append("")
+    out.append(f"mean {mean:.0f} us per uncached fight; repeats are served by the memo")
+    return "\n".join(out)
+
+
+def main():
+    argv = sys.argv[1:]
+    jobs, out_path, args = None, None, []
+    i = 0
+    while i < len(argv):
+        if argv[i] == "--jobs":
+            jobs = int(argv[i + 1]); i += 2
+        elif argv[i] == "--out":
+            out_path = argv[i + 1]; i += 2
+        else:
+            args.append(argv[i]); i += 1
+    rows = timing()
+    if not args:
+        print(render_timing(rows))
+        return
+
+    games, failed = [], []
+    n_cached = 0
+    for path, res, hit in rb.cached_map("advisor_eval", rb.expand_replays(args),
+                                        ae.reconstruct, jobs=jobs, version=ae.CACHE_VERSION):
+        n_cached += hit
+        if "error" in res:
+            failed.append((os.path.basename(path), res["error"]))
+        else:
+            games.append(res)
+    tally = score(games)
+    text = render(tally, len(games) + len(failed), n_cached, failed, rows)
+    if out_path:
+        with open(out_path, "w") as f:
+            f.write(text)
+        print(f"wrote {out_path}")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+"""Validate ``strategy_engine.economy`` against PlayerStatsEvent curves.
+
+For every player and every anchor minute of each replay, the economy simulator
+is started from that moment's true state (workers, bases, bank, supply, army,
+production -- the same reconstruction ``advisor_eval.py`` caches) and given the
+plan the player actually followed: their worker count and production count at
+the end of the window, and an expansion wherever their townhall count rose. Its
+curves are then compared with the real ones 1-5 minutes later:
+
+    | horizon | workers | mineral income | supply used | army supply |
+
+each as median absolute error, median signed error (sim - real; the bias a
+constant should absorb) and the share of anchors within 15%.
+
+    python analysis/econ_validate.py <dir|replay ...> [--jobs N] [--out FILE]
+
+Reconstruction is shared with advisor_eval (same cache), so after one run of
+either tool this one is pure Python.
+"""
+import os
+import sys
+from collections import defaultdict
+from statistics import median
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+import advisor_eval as ae  # noqa: E402
+import replay_batch as rb  # noqa: E402
+
+from strategy_engine import GameState  # noqa: E402
+from strategy_engine.economy import EconPlan, rollout  # noqa: E402
+
+HORIZONS = (60, 120, 180, 240, 300)
+ANCHOR_EVERY = 60
+FIRST_ANCHOR = 120
+METRICS = (("workers", "workers"), ("mineral_income", "income"),
+           ("supply_used", "supply_used"), ("army_supply", "army"))
+
+
+def _tick_at(ticks, t):
+    best = None
+    for x in ticks:
+        if x["t"] > t:
+            break
+        best = x
+    return best
+
+
+def state_of(tick):
+    return GameState(
+        game_time=tick["t"], worker_count=tick["workers"], base_count=max(1, tick["bases"]),
+        minerals=tick["minerals"], vespene=tick["vespene"], mineral_income=tick["income"],
+        supply_used=tick["supply_used"], supply_cap=tick["supply_cap"],
+        supply_left=max(0, tick["supply_cap"] - tick["supply_used"]),
+        army_supply=tick["army"], production_structures=tick["prod"])
+
+
+def followed_plan(ticks, t0, horizon):
+    """The plan the player actually executed over ``(t0, t0 + horizon]``."""
+    end = _tick_at(ticks, t0 + horizon)
+    expand, bases = [], None
+    for x in ticks:
+        if x["t"] <= t0:
+            bases = x["bases"]
+            continue
+        if x["t"] > t0 + horizon:
+            break
+        if bases is not None and x["bases"] > bases:
+            expand += [x["t"] - t0] * (x["bases"] - bases)   # started (UnitInit) here
+        bases = x["bases"]
+    return EconPlan(worker_target=end["workers"], production=end["prod"],
+                    expand_at=tuple(expand))
+
+
+def validate(game):
+    """``{horizon: {metric: [(sim, real)]}}`` over every anchor of one game."""
+    out = defaultdict(lambda: defaultdict(list))
+    for pid, p in game["players"].items():
+        ticks = p["ticks"]
+        if not ticks:
+            continue
+        last = ticks[-1]["t"]
+        for t0 in range(FIRST_ANCHOR, int(last) - HORIZONS[0] + 1, ANCHOR_EVERY):
+            start = _tick_at(ticks, t0)
+            if start is None:
+                continue
+            span = min(HORIZONS[-1], int(last - t0))
+            sim = rollout(state_of(start), followed_plan(ticks, t0, span), span)
+            for h in HORIZONS:
+                if h > span:
+                    break
+                real = _tick_at(ticks, t0 + h)
+                got = sim.at(h)
+                for sim_key, tick_key in METRICS:
+                    out[h][sim_key].append((got[sim_key], real[tick_key]))
+    return out
+
+
+def render(per_h, n_games, n_cached, failed):
+    out = []
+    p = out.append
+    p(f"# Economy simulator vs PlayerStatsEvent: {n_games} replays ({n_cached} cached)")
+    p("")
+    p("Each cell: median |sim - real| / median (sim - real) / share within 15%.")
+    p("")
+    p("| horizon | anchors | " + " | ".join(k for k, _ in METRICS) + " |")
+    p("|---------|:-------:|" + "|".join(":---:" for _ in METRICS) + "|")
+    for h in HORIZONS:
+        rows = per_h.get(h)
+        if not rows:
+            continue
+        cells = []
+        for key, _ in METRICS:
+            pairs = rows[key]
+            err = [s - r for s, r in pairs]
+            close = sum(abs(s - r) <= 0.15 * max(1.0, abs(r)) for s, r in pairs) / len(pairs)
+            cells.append(f"{median(abs(e) for e in err):.1f} / {median(err):+.1f} / {close:.0%}")
+        p(f"| {h // 60} min | {len(rows[METRICS[0][0]])} | " + " | ".join(cells) + " |")
+    if failed:
+        p("")
+        p("## Skipped")
+        p("")
+        for name, why in failed:
+            p(f"- {name}: {why}")
+    return "\n".join(out) + "\n"
+
+
+def main():
+    argv = sys.argv[1:]
+    opts = {"--jobs": None, "--out": None}
+    args = []
+    i = 0
+    while i < len(argv):
+        if argv[i] in opts:
+            opts[argv[i]] = argv[i + 1]; i += 2
+        else:
+            args.append(argv[i]); i += 1
+    if not args:
+        print(__doc__)
+        sys.exit(1)
+    jobs = int(opts["--jobs"]) if opts["--jobs"] else None
+
+    per_h = defaultdict(lambda: defaultdict(list))
+    failed = []
+    n = n_cached = 0
+    for path, game, hit in rb.cached_map("advisor_eval", rb.expand_replays(args),
+                                         ae.reconstruct, jobs=jobs, version=ae.CACHE_VERSION):
+        n += 1
+        n_cached += hit
+        if "error" in game:
+            failed.append((os.path.basename(path), game["error"]))
+            continue
+        for h, rows in validate(game).items():
+            for key, pairs in rows.items():
+                per_h[h][key] += pairs
+
+    text = render(per_h, n, n_cached, failed)
+    if opts["--out"]:
+        with open(opts["--out"], "w") as f:
+            f.write(text)
+        print(f"wrote {opts['--out']}")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
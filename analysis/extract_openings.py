@@ -16,7 +16,17 @@ modal placement zone per building, and economy/unit reference bands) written to
 ``strategy_engine/data/openings.json`` -- the data the reusable
 ``strategy_engine.openings`` library loads.
 
-    python analysis/extract_openings.py <replay_dir> [--window 150]
+The per-family statistics are kept as mergeable sketches (``opening_sketch``)
+in ``strategy_engine/data/openings_sketch.json``. A run folds in only the
+replays not already in the sketch and re-serves every band from it, so adding
+a handful of replays doesn't reparse the corpus. ``--rebuild`` starts over
+(needed after changing the classification rules or the window, and for the
+first run: without a sketch for the window an incremental run refuses to write,
+since it would replace openings.json with only the new replays). ``--validate``
+rebuilds in memory, checks the sketch-served bands against exact medians and
+writes nothing.
+
+    python analysis/extract_openings.py <replay_dir> [--window 150] [--rebuild] [--validate]
 """
 import sys
 import glob
@@ -29,6 +39,9 @@ from statistics import median
 import principle_analyzer as pa  # sc2reader arena shim
 import sc2reader
 
+from opening_sketch import FamilyStats, SketchStore, SKETCH_PATH
+from replay_batch import replay_id
+
 WINDOW = 210  # through the first expansion/tech commitment (~3:30) -- the
               # natural nexus/CC/hatch is a *defining* feature of an opening, and
               # it often lands after 2:00, so the window must reach it.
@@ -207,6 +220,18 @@ def band(xs):
 
 
 def aggregate(ops_by_family):
+    """Per-family canonical spec, served from mergeable sketches."""
+    out = {}
+    for fam, ops in ops_by_family.items():
+        fs = FamilyStats()
+        for op in ops:
+            fs.fold(op)
+        out[fam] = fs.finalize()
+    return out
+
+
+def aggregate_exact(ops_by_family):
+    """Reference implementation over the full op lists (for ``--validate``)."""
     out = {}
     for fam, ops in ops_by_family.items():
         n = len(ops)
@@ -267,26 +292,49 @@ def aggregate(ops_by_family):
     return out
 
 
+def diff_specs(exact, got, path=""):
+    """Paths where two ``aggregate`` outputs disagree (empty == identical)."""
+    if isinstance(exact, dict) and isinstance(got, dict):
+        out = []
+        for k in exact.keys() | got.keys():
+            out += diff_specs(exact.get(k), got.get(k), f"{path}/{k}")
+        return out
+    return [] if exact == got else [f"{path}: exact={exact} sketch={got}"]
+
+
 def main():
     args = [a for a in sys.argv[1:] if not a.startswith("--")]
     window = WINDOW
     if "--window" in sys.argv:
         window = int(sys.argv[sys.argv.index("--window") + 1])
     replay_dir = args[0] if args else "."
-
+    validate = "--validate" in sys.argv
+    rebuild = validate or "--rebuild" in sys.argv
+
+    store = SketchStore(window) if rebuild else SketchStore.load(SKETCH_PATH, window)
+    if not rebuild and not store.seen:
+        # no sketch for this window: folding only <replay_dir> would replace
+        # openings.json with just those replays
+        sys.exit(f"no sketch for window {window}s at {SKETCH_PATH}; run once with "
+                 f"--rebuild over the full corpus before folding in new replays")
     files = sorted(glob.glob(os.path.join(replay_dir, "*.SC2Replay")))
-    ops_by_family = defaultdict(list)
-    ops_by_race = Counter()
-    n_ok = 0
+    ops_by_family = defaultdict(list)     # only kept for --validate
+    n_new = n_skipped = 0
     for f in files:
+        rid = replay_id(f)
+        if rid in store.seen:
+            n_skipped += 1
+            continue
         try:
             r = sc2reader.load_replay(f, load_level=4)
         except Exception:
             continue
+        store.seen.add(rid)
         ok, humans = eligible(r)
         if not ok:
             continue
-        n_ok += 1
+        store.n_replays += 1
+        n_new += 1
         for p in humans:
             if p.play_race not in RACE_TH:
                 continue
@@ -295,16 +343,17 @@ def main():
             except Exception:
                 continue
             fam = classify(op)
-            op["result"] = getattr(p, "result", None)
-            ops_by_family[fam].append(op)
-            ops_by_race[p.play_race] += 1
+            store.fold(fam, op, won=getattr(p, "result", None) == "Win")
+            if validate:
+                ops_by_family[fam].append(op)
 
-    agg = aggregate(ops_by_family)
+    agg = store.finalize()
 
-    print(f"# Opening extraction -- {n_ok} replays, window {window}s\n")
+    print(f"# Opening extraction -- {store.n_replays} replays ({n_new} new, "
+          f"{n_skipped} already folded in), window {window}s\n")
     for fam in sorted(agg, key=lambda k: -agg[k]["n"]):
         s = agg[fam]
-        wins = sum(op["result"] == "Win" for op in ops_by_family[fam])
+        wins = store.families[fam].wins
         print(f"## {fam}  (n={s['n']}, wins={wins}, expand={s['expand_pct']}%)")
         print(f"   order: {' > '.join(s['modal_order'])}")
         for st, d in s["structures"].items():
@@ -317,12 +366,25 @@ def main():
                   f"supply~{e120['supply']['median']} mins/min~{e120['mins_rate']['median']}")
         print()
 
+    if validate:
+        # a check only: nothing is written, so it can run on any replay dir
+        bad = diff_specs(aggregate_exact(ops_by_family), agg)
+        n_ops = sum(len(ops) for ops in ops_by_family.values())
+        print(f"validate: {len(bad)} field(s) differ from the exact aggregate "
+              f"over {n_ops} openings in {len(agg)} families")
+        for line in sorted(bad)[:20]:
+            print(f"   {line}")
+        sys.exit(1 if bad else 0)
+
     out_dir = os.path.join(os.path.dirname(__file__), "..", "strategy_engine", "data")
     os.makedirs(out_dir, exist_ok=True)
     out_path = os.path.abspath(os.path.join(out_dir, "openings.json"))
     with open(out_path, "w") as f:
-        json.dump({"window": window, "n_replays": n_ok, "families": agg}, f, indent=2)
+        json.dump({"window": window, "n_replays": store.n_replays, "families": agg},
+                  f, indent=2)
+    store.save(SKETCH_PATH)
     print(f"wrote {out_path}")
+    print(f"wrote {SKETCH_PATH}")
 
 
 if __name__ == "__main__":
@@ -11,9 +11,17 @@ This is the one command to run after a loss. It reuses the metric functions in
   5. the decisive **engagements** and the **peak composition + upgrades**.
 
     python analysis/investigate.py <replay> [replay2 ...] [--our N] [--out FILE]
+    python analysis/investigate.py --batch <dir|replay ...> [--our N] [--jobs N]
+                                   [--out FILE] [--reports DIR]
 
 Default our_pid is 1. Without --out the report prints to stdout; with --out it
-is written to that path (and, for a batch, each report is concatenated).
+is written to that path (and, for several replays, each report is concatenated).
+
+``--batch`` (implied when an argument is a directory) is for a whole loss
+folder: replays are parsed in parallel (``--jobs``, default all cores), each
+replay's verdict + report is cached by content hash (``replay_batch``), and the
+output is ONE cross-game summary ranking root causes overall, by opponent and
+by map. Per-game reports are written on demand with ``--reports DIR``.
 
 The debugging discipline it encodes: *first* ask "did production run and did the
 economy look good?" (section 2), and only if macro was fine attribute the loss to
@@ -21,9 +29,14 @@ combat (sections 1, 3, 4). The verdict block states which it was.
 """
 import sys
 import os
+import re
+from collections import Counter, defaultdict
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 import loss_analysis as la  # noqa: E402  (needs analysis/ on sys.path first)
+import replay_batch as rb  # noqa: E402
+
+CACHE_VERSION = 1  # bump when report()/verdict() output changes
 
 
 def infer_result(stats, pid):
@@ -112,13 +125,35 @@ def verdict(units, stats, ours, theirs, length):
     return head, bullets
 
 
-def report(path, ours, out):
+def cause_of(head):
+    """The root-cause label of a verdict headline ('COMBAT LOSS', 'MIXED', ...)."""
+    return head.split(" — ")[0].strip()
+
+
+def opponent_of(r, path, theirs):
+    """Opponent name from the replay, else from a ``loss_<name>_<match>`` file name."""
+    player = getattr(r, "player", {}).get(theirs)
+    if player is not None and getattr(player, "name", None):
+        return player.name
+    m = re.match(r"(?:win|loss|tie)_(.+)_\d+$", os.path.splitext(os.path.basename(path))[0])
+    return m.group(1) if m else "?"
+
+
+def report(path, ours, out, meta=None):
+    """Append the markdown report to ``out``; return the verdict headline.
+
+    ``meta``, if given, is filled with the game facts the batch summary groups
+    by (map, opponent, length, result).
+    """
     theirs = 2 if ours == 1 else 1
     r, units, stats, upgrades = la.load(path)
     length = int(r.game_length.seconds)
     marks = list(range(60, length + 1, 60))
     res = infer_result(stats, ours)
     head, bullets = verdict(units, stats, ours, theirs, length)
+    if meta is not None:
+        meta.update(map=r.map_name, opponent=opponent_of(r, path, theirs),
+                    length=length, result=res)
 
     p = out.append
     p(f"# Investigation: {os.path.basename(path)}")
@@ -235,10 +270,105 @@ def report(path, ours, out):
     return head
 
 
+def analyze(path, ours):
+    """One replay's verdict + full report, JSON-serializable for the cache."""
+    lines, meta = [], {}
+    head = report(path, ours, lines, meta)
+    meta.update(file=os.path.basename(path), head=head, cause=cause_of(head),
+                report="\n".join(lines))
+    return meta
+
+
+def _rank(rows, key):
+    """``[(group, games, Counter(cause))]`` most-games first."""
+    groups = defaultdict(Counter)
+    for g in rows:
+        groups[g[key]][g["cause"]] += 1
+    return sorted(((k, sum(c.values()), c) for k, c in groups.items()),
+                  key=lambda x: (-x[1], str(x[0])))
+
+
+def _causes(counter):
+    return ", ".join(f"{c} ×{n}" for c, n in counter.most_common())
+
+
+def summarize(games, failed, n_cached):
+    """The cross-game markdown summary over analyzed replays."""
+    out = []
+    p = out.append
+    n = len(games)
+    p(f"# Batch investigation: {n} replays "
+      f"({n_cached} cached, {len(failed)} failed)")
+    p("")
+    causes = Counter(g["cause"] for g in games)
+    results = Counter(g["result"] for g in games)
+    p("- results: " + ", ".join(f"{k} {v}" for k, v in results.most_common()))
+    p("")
+    p("## Root causes (most frequent first)")
+    p("")
+    p("| cause | games | share |")
+    p("|-------|:-----:|:-----:|")
+    for c, k in causes.most_common():
+        p(f"| {c} | {k} | {k / n:.0%} |")
+    p("")
+    for title, key in (("opponent", "opponent"), ("map", "map")):
+        p(f"## By {title}")
+        p("")
+        p(f"| {title} | games | top cause | all causes |")
+        p("|------|:-----:|-----------|------------|")
+        for k, cnt, c in _rank(games, key):
+            p(f"| {k} | {cnt} | {c.most_common(1)[0][0]} | {_causes(c)} |")
+        p("")
+    p("## Games")
+    p("")
+    p("| replay | opponent | map | length | result | verdict |")
+    p("|--------|----------|-----|:------:|:------:|---------|")
+    for g in sorted(games, key=lambda g: (g["cause"], g["opponent"], g["file"])):
+        p(f"| {g['file']} | {g['opponent']} | {g['map']} | {la.mmss(g['length'])} | "
+          f"{g['result']} | {g['head']} |")
+    if failed:
+        p("")
+        p("## Failed to parse")
+        p("")
+        for name, err in failed:
+            p(f"- {name}: {err}")
+    p("")
+    return "\n".join(out)
+
+
+def batch(replays, ours, jobs, out_path, reports_dir):
+    games, failed = [], []
+    n_cached = 0
+    for path, res, hit in rb.cached_map("investigate", replays, analyze, ours,
+                                        jobs=jobs, version=CACHE_VERSION):
+        n_cached += hit
+        if "error" in res:
+            failed.append((os.path.basename(path), res["error"]))
+            continue
+        games.append(res)
+        if reports_dir:
+            os.makedirs(reports_dir, exist_ok=True)
+            name = os.path.splitext(res["file"])[0] + ".md"
+            with open(os.path.join(reports_dir, name), "w") as f:
+                f.write(res["report"])
+    text = summarize(games, failed, n_cached)
+    if out_path:
+        with open(out_path, "w") as f:
+            f.write(text)
+        print(f"wrote {out_path}")
+    else:
+        print(text)
+    if reports_dir:
+        print(f"wrote {len(games)} per-game reports to {reports_dir}")
+
+
 def main():
     argv = sys.argv[1:]
     ours = 1
     out_path = None
+    reports_dir = None
+    jobs = None
+    batch_mode = False
     replays = []
     i = 0
     while i < len(argv):
@@ -247,12 +377,23 @@ def main():
             ours = int(argv[i + 1]); i += 2
         elif a == "--out":
             out_path = argv[i + 1]; i += 2
+        elif a == "--jobs":
+            jobs = int(argv[i + 1]); i += 2
+        elif a == "--reports":
+            reports_dir = argv[i + 1]; i += 2
+        elif a == "--batch":
+            batch_mode = True; i += 1
         else:
+            batch_mode = batch_mode or os.path.isdir(a)
             replays.append(a); i += 1
     if not replays:
         print(__doc__)
         sys.exit(1)
 
+    if batch_mode:
+        batch(rb.expand_replays(replays), ours, jobs, out_path, reports_dir)
+        return
+
     lines = []
     summary = []
     for path in replays:
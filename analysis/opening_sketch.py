@@ -0,0 +1,251 @@
+"""Mergeable per-family opening statistics, for incremental openings.json rebuilds.
+
+``extract_openings.aggregate`` needs every opening of a family at once to take
+medians, so refreshing ``strategy_engine/data/openings.json`` with ten new
+replays used to mean reparsing the whole corpus. This module keeps the same
+statistics as mergeable sketches instead, persisted beside ``openings.json``:
+
+  - ``QuantileSketch`` -- a fixed-bin histogram (bin width ``RES``) that answers
+    the same quantiles as ``extract_openings.band``. Every value the pipeline
+    records is a whole game second or an integer count, so at ``RES = 1`` each
+    bin holds exactly one value and the bands are exact, not approximate.
+  - ``FamilyStats`` -- the counters + sketches behind one family's entry:
+    modal-order counts, per-structure timing sketch and zone counts, economy
+    sketches per mark, per-unit count/first-seen sketches, wins.
+  - ``SketchStore`` -- every family plus the ids of the replays already folded
+    in, saved as ``data/openings_sketch.json``.
+
+Folding one opening costs O(its buildings + units); ``finalize`` costs O(bins),
+independent of corpus size. ``extract_openings.py --validate`` checks the
+sketch-served bands against the exact ones.
+"""
+import json
+import os
+from collections import Counter
+
+RES = 1            # bin width: seconds for timings, units for counts
+MARKS = (30, 60, 90, 120, 150, 180)
+ECON_METRICS = ("workers", "supply", "mins_rate")
+SKETCH_PATH = os.path.abspath(os.path.join(
+    os.path.dirname(__file__), "..", "strategy_engine", "data", "openings_sketch.json"))
+
+
+class QuantileSketch:
+    """Fixed-bin histogram answering ``band()``-style quantiles; merges by adding."""
+
+    __slots__ = ("bins", "n")
+
+    def __init__(self, bins=None):
+        self.bins = Counter()
+        for k, c in (bins or {}).items():
+            self.bins[int(k)] += c
+        self.n = sum(self.bins.values())
+
+    def add(self, x, k=1):
+        if x is None:
+            return
+        self.bins[int(round(x / RES))] += k
+        self.n += k
+
+    def merge(self, other):
+        self.bins.update(other.bins)
+        self.n += other.n
+        return self
+
+    def _at(self, rank):
+        """Value of the ``rank``-th smallest sample (0-based)."""
+        seen = 0
+        for key in sorted(self.bins):
+            seen += self.bins[key]
+            if seen > rank:
+                return key * RES
+        raise IndexError(rank)
+
+    def band(self, zeros=0):
+        """``dict(n, median, p25, p75)`` like ``extract_openings.band``.
+
+        ``zeros`` adds that many implicit 0 samples without storing them (unit
+        counts include the openings that never made the unit).
+        """
+        s = self
+        if zeros:
+            s = QuantileSketch(self.bins)
+            s.add(0, zeros)
+        n = s.n
+        if not n:
+            return None
+        if n % 2:
+            med = s._at(n // 2)
+        else:
+            med = (s._at(n // 2 - 1) + s._at(n // 2)) / 2
+        return dict(n=n, median=med, p25=s._at(n // 4), p75=s._at(min(n - 1, 3 * n // 4)))
+
+    def to_json(self):
+        return {str(k): c for k, c in sorted(self.bins.items())}
+
+    @classmethod
+    def from_json(cls, d):
+        return cls(d)
+
+
+class FamilyStats:
+    """Everything ``aggregate`` needs for one family, as mergeable counters."""
+
+    def __init__(self):
+        self.n = 0
+        self.wins = 0
+        self.seqs = Counter()        # first-5-distinct order tuple -> count
+        self.timing = {}             # structure -> QuantileSketch of first init
+        self.zones = {}              # structure -> Counter of first-init zone
+        self.econ = {m: {k: QuantileSketch() for k in ECON_METRICS} for m in MARKS}
+        self.first_gas = QuantileSketch()
+        self.expand = QuantileSketch()
+        self.unit_count = {}         # unit -> QuantileSketch of count (when made)
+        self.unit_first = {}         # unit -> QuantileSketch of first-seen second
+
+    def fold(self, op, won=False):
+        """Add one ``extract_player`` opening."""
+        self.n += 1
+        self.wins += bool(won)
+        distinct = []
+        for s in op["order"]:
+            if s not in distinct:
+                distinct.append(s)
+            if len(distinct) >= 5:
+                break
+        self.seqs[tuple(distinct)] += 1
+        firsts = {}
+        for b in op["buildings"]:
+            firsts.setdefault(b["s"], b)
+        for s, b in firsts.items():
+            self.timing.setdefault(s, QuantileSketch()).add(b["t"])
+            self.zones.setdefault(s, Counter())[b["zone"]] += 1
+        for m in MARKS:
+            for k in ECON_METRICS:
+                self.econ[m][k].add(op["economy"][m][k])
+        self.first_gas.add(op["first_gas"])
+        self.expand.add(op["expand"])
+        for u, c in op["units"].items():
+            self.unit_count.setdefault(u, QuantileSketch()).add(c)
+        for u, t in op["unit_first"].items():
+            self.unit_first.setdefault(u, QuantileSketch()).add(t)
+        return self
+
+    def merge(self, other):
+        self.n += other.n
+        self.wins += other.wins
+        self.seqs.update(other.seqs)
+        for mine, theirs in ((self.timing, other.timing),
+                             (self.unit_count, other.unit_count),
+                             (self.unit_first, other.unit_first)):
+            for k, sk in theirs.items():
+                mine.setdefault(k, QuantileSketch()).merge(sk)
+        for k, z in other.zones.items():
+            self.zones.setdefault(k, Counter()).update(z)
+        for m in MARKS:
+            for k in ECON_METRICS:
+                self.econ[m][k].merge(other.econ[m][k])
+        self.first_gas.merge(other.first_gas)
+        self.expand.merge(other.expand)
+        return self
+
+    def finalize(self):
+        """The family's ``openings.json`` entry, same shape as ``aggregate``."""
+        n = self.n
+        modal_order = list(self.seqs.most_common(1)[0][0]) if self.seqs else []
+        struct_stats = {}
+        for s, sk in self.timing.items():
+            zones = self.zones.get(s, Counter())
+            struct_stats[s] = dict(
+                pct=round(100 * sk.n / n), timing=sk.band(),
+                zone=zones.most_common(1)[0][0] if zones else None)
+        units = {}
+        for u, sk in self.unit_count.items():
+            seen = sk.n
+            if seen >= max(2, n // 3):     # only units most openings actually make
+                first = self.unit_first.get(u)
+                units[u] = dict(pct=round(100 * seen / n),
+                                count=sk.band(zeros=n - seen),
+                                first=first.band() if first else None)
+        return dict(
+            n=n,
+            modal_order=modal_order,
+            structures=dict(sorted(
+                struct_stats.items(),
+                key=lambda kv: (kv[1]["timing"]["median"] if kv[1]["timing"] else 999))),
+            first_gas=self.first_gas.band(),
+            expand=self.expand.band(),
+            expand_pct=round(100 * self.expand.n / n) if n else 0,
+            economy={m: {k: self.econ[m][k].band() for k in ECON_METRICS} for m in MARKS},
+            units=units,
+        )
+
+    def to_json(self):
+        return dict(
+            n=self.n, wins=self.wins,
+            seqs=[[list(k), c] for k, c in self.seqs.items()],
+            timing={k: v.to_json() for k, v in self.timing.items()},
+            zones={k: dict(v) for k, v in self.zones.items()},
+            econ={str(m): {k: v.to_json() for k, v in d.items()} for m, d in self.econ.items()},
+            first_gas=self.first_gas.to_json(),
+            expand=self.expand.to_json(),
+            unit_count={k: v.to_json() for k, v in self.unit_count.items()},
+            unit_first={k: v.to_json() for k, v in self.unit_first.items()},
+        )
+
+    @classmethod
+    def from_json(cls, d):
+        fs = cls()
+        fs.n, fs.wins = d["n"], d.get("wins", 0)
+        fs.seqs = Counter({tuple(k): c for k, c in d["seqs"]})
+        fs.timing = {k: QuantileSketch(v) for k, v in d["timing"].items()}
+        fs.zones = {k: Counter(v) for k, v in d["zones"].items()}
+        for m, metrics in d["econ"].items():
+            for k, v in metrics.items():
+                fs.econ[int(m)][k] = QuantileSketch(v)
+        fs.first_gas = QuantileSketch(d["first_gas"])
+        fs.expand = QuantileSketch(d["expand"])
+        fs.unit_count = {k: QuantileSketch(v) for k, v in d["unit_count"].items()}
+        fs.unit_first = {k: QuantileSketch(v) for k, v in d["unit_first"].items()}
+        return fs
+
+
+class SketchStore:
+    """All family sketches plus which replays are already folded in."""
+
+    def __init__(self, window):
+        self.window = window
+        self.n_replays = 0           # eligible replays folded in
+        self.seen = set()            # replay_id of every replay examined
+        self.families = {}           # family -> FamilyStats
+
+    def fold(self, family, op, won=False):
+        self.families.setdefault(family, FamilyStats()).fold(op, won)
+
+    def finalize(self):
+        return {fam: fs.finalize() for fam, fs in self.families.items()}
+
+    @classmethod
+    def load(cls, path=SKETCH_PATH, window=None):
+        """The persisted store, or a fresh one if missing or built for another window."""
+        try:
+            with open(path) as f:
+                d = json.load(f)
+        except (OSError, ValueError):
+            return cls(window)
+        if window is not None and d.get("window") != window:
+            return cls(window)
+        st = cls(d["window"])
+        st.n_replays = d.get("n_replays", 0)
+        st.seen = set(d.get("seen", []))
+        st.families = {k: FamilyStats.from_json(v) for k, v in d["families"].items()}
+        return st
+
+    def save(self, path=SKETCH_PATH):
+        tmp = path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump({"window": self.window, "n_replays": self.n_replays,
+                       "seen": sorted(self.seen),
+                       "families": {k: v.to_json() for k, v in self.families.items()}},
+                      f, separators=(",", ":"))
+        os.replace(tmp, path)
@@ -0,0 +1,106 @@
+"""Shared plumbing for the batch replay tools.
+
+Parsing a replay with sc2reader dominates every analysis script, so the batch
+modes (``investigate.py --batch``, ...) share three things from here:
+
+  - ``replay_id`` -- a content hash, so a renamed/copied replay is recognized;
+  - a per-replay JSON result cache under ``analysis/reports/.cache/<kind>/``,
+    keyed by that hash plus the tool's arguments and a format version;
+  - ``cached_map`` -- run a per-replay function over many replays in a process
+    pool, serving cache hits without touching sc2reader at all.
+
+    for path, result, hit in cached_map("investigate", files, analyze, 1, jobs=8):
+        ...
+"""
+import glob
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "reports", ".cache")
+
+
+def replay_id(path):
+    """Content hash of a replay file, so a renamed copy isn't processed twice."""
+    h = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            h.update(chunk)
+    return h.hexdigest()[:16]
+
+
+def expand_replays(args):
+    """Replay paths from a mix of files and directories (dirs: ``*.SC2Replay``)."""
+    out = []
+    for a in args:
+        if os.path.isdir(a):
+            out += sorted(glob.glob(os.path.join(a, "*.SC2Replay")))
+        else:
+            out.append(a)
+    return out
+
+
+def _cache_path(kind, rid, args, version):
+    tag = "-".join(str(a) for a in args)
+    name = f"{rid}-{tag}.json" if tag else f"{rid}.json"
+    return os.path.join(CACHE_DIR, f"{kind}.v{version}", name)
+
+
+def cache_get(kind, rid, args=(), version=1):
+    try:
+        with open(_cache_path(kind, rid, args, version)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def cache_put(kind, rid, result, args=(), version=1):
+    path = _cache_path(kind, rid, args, version)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w") as f:
+        json.dump(result, f)
+    os.replace(tmp, path)
+
+
+def _call(fn, path, args):
+    try:
+        return fn(path, *args)
+    except Exception as exc:  # one bad replay must not sink the batch
+        return {"error": f"{type(exc).__name__}: {exc}"}
+
+
+def cached_map(kind, paths, fn, *args, jobs=None, version=1):
+    """Yield ``(path, result, cache_hit)`` for ``fn(path, *args)`` over ``paths``.
+
+    ``fn`` must be a module-level function returning a JSON-serializable dict.
+    Cache hits are yielded first, then fresh results as workers finish; a
+    failed replay yields ``{"error": ...}`` and is not cached. ``jobs`` defaults
+    to the CPU count; ``jobs=1`` runs in-process (handy under a debugger).
+    """
+    todo = []
+    for path in paths:
+        rid = replay_id(path)
+        hit = cache_get(kind, rid, args, version)
+        if hit is not None:
+            yield path, hit, True
+        else:
+            todo.append((path, rid))
+    if not todo:
+        return
+    if jobs == 1 or len(todo) == 1:
+        for path, rid in todo:
+            res = _call(fn, path, args)
+            if "error" not in res:
+                cache_put(kind, rid, res, args, version)
+            yield path, res, False
+        return
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = {pool.submit(_call, fn, path, args): (path, rid) for path, rid in todo}
+        for fut in as_completed(futures):
+            path, rid = futures[fut]
+            res = fut.result()
+            if "error" not in res:
+                cache_put(kind, rid, res, args, version)
+            yield path, res, False
@@ -1,326 +1,268 @@
 #!/usr/bin/env python3
+"""Per-player build order, unit production and upgrades from SC2 replays.
+
+    python analysis/sc2reader_analyzer.py <replay|dir> [--plots] [--jobs N] [--profile]
+
+Writes ``<replay>.<player>.build_order.txt`` / ``.units.txt`` / ``.upgrades.txt``
+next to each replay. All three come from ONE pass over the tracker events (the
+event list is never printed or walked twice); ``--plots`` additionally draws the
+resource-rate and unit-count charts, importing matplotlib (Agg backend) only
+then. Given a directory, every ``*.SC2Replay`` in it is analyzed in parallel.
+``--profile`` prints wall time and peak RSS.
+"""
 import argparse
 import os
 import sys
-from pathlib import Path
+import time
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import timedelta
+from pathlib import Path
 
 try:
     import sc2reader
-    from sc2reader.engine.plugins import SelectionTracker, APMTracker
-    import matplotlib.pyplot as plt
-    import numpy as np
 except ImportError:
     print("Required packages not installed. Please install them with:")
-    print("pip install sc2reader matplotlib numpy")
+    print("pip install sc2reader  (and matplotlib for --plots)")
     sys.exit(1)
 
+WORKERS = {"SCV", "Probe", "Drone"}
+COMMON_UNITS = WORKERS | {"Larva", "Egg", "Overlord"}  # left off the units graph
+
 
 def format_time(seconds):
     """Format seconds into MM:SS format."""
     return str(timedelta(seconds=seconds))[2:7]
 
 
-def write_build_orders(replay, replay_path):
-    """Extract and write build orders to text files."""
-    # Extract build orders
-    build_orders = defaultdict(list)
-    canceled_units = set()  # Track canceled units by tag
-
-    print(replay.events)
-    
-    # First pass: identify canceled units
-    for event in replay.events:
-        if event.name == "UnitDiedEvent" and hasattr(event, 'unit') and hasattr(event.unit, 'tag'):
-            # If a unit died while still under construction, mark it as canceled
-            if hasattr(event.unit, 'is_building') and event.unit.is_building:
-                canceled_units.add(event.unit.tag)
-    
-    # Second pass: collect successful builds
-    for event in replay.events:
-        if event.name == "UnitBornEvent" and event.control_pid > 0:
-            # Skip units that were canceled
-            if hasattr(event.unit, 'tag') and event.unit.tag in canceled_units:
+def _plt():
+    """matplotlib.pyplot on the Agg backend, imported only when plotting."""
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    return plt
+
+
+def scan(replay):
+    """Collect every output's data in a single pass over the tracker events."""
+    names = {p.pid: p.name for p in replay.players}
+    minutes = int(replay.game_length.total_seconds()) // 60 + 1
+    born = defaultdict(list)        # player -> [(second, unit, unit_id)]
+    canceled = set()                # unit_ids of buildings that died
+    counts = defaultdict(lambda: defaultdict(int))
+    upgrades = defaultdict(list)    # player -> [(second, upgrade)]
+    stats = defaultdict(list)       # player -> [(minute, minerals/min, gas/min)]
+    deltas = defaultdict(lambda: defaultdict(lambda: [0] * (minutes + 1)))
+
+    for e in replay.tracker_events:
+        name = e.name
+        if name == "UnitBornEvent":
+            if not e.control_pid:
                 continue
-                
-            player = replay.player[event.control_pid]
-            game_time = format_time(event.second)
-            unit_name = event.unit.name
-            
-            # Skip worker units after early game (optional)
-            if event.second > 300 and unit_name in ["SCV", "Probe", "Drone"]:
+            player = names.get(e.control_pid, str(e.control_pid))
+            unit = e.unit.name
+            born[player].append((e.second, unit, e.unit_id))
+            counts[player][unit] += 1
+            deltas[player][unit][min(minutes, e.second // 60)] += 1
+        elif name == "UnitDiedEvent":
+            unit = getattr(e, "unit", None)
+            if unit is None:
                 continue
-                
-            # Supply information isn't directly available in UnitBornEvent
-            build_orders[player.name].append((event.second, game_time, unit_name))
-    
-    print("\n=== Build Orders (Successful Builds Only) ===")
-    
-    for player_name, builds in build_orders.items():
-        # Sort by time
-        sorted_builds = sorted(builds, key=lambda x: x[0])
-        
-        # Write to text file
+            if getattr(unit, "is_building", False):
+                canceled.add(e.unit_id)
+            owner = getattr(unit, "owner", None)
+            if owner:
+                deltas[owner.name][unit.name][min(minutes, e.second // 60)] -= 1
+        elif name == "UpgradeCompleteEvent":
+            upgrades[names.get(e.pid, str(e.pid))].append((e.second, e.upgrade_type_name))
+        elif name == "PlayerStatsEvent":
+            stats[names.get(e.pid, str(e.pid))].append(
+                (e.second / 60.0, e.minerals_collection_rate, e.vespene_collection_rate))
+    return dict(born=born, canceled=canceled, counts=counts, upgrades=upgrades,
+                stats=stats, deltas=deltas, minutes=minutes)
+
+
+def _race(replay, player_name):
+    return next((p.play_race for p in replay.players if p.name == player_name), "Unknown")
+
+
+def write_build_orders(replay, replay_path, data, log):
+    """Successful builds per player (drops buildings that died, late workers)."""
+    for player_name, builds in data["born"].items():
         output_file = Path(replay_path).with_suffix(f'.{player_name}.build_order.txt')
         with open(output_file, 'w') as f:
             f.write(f"Build Order for {player_name} - {replay.map_name}\n")
             f.write(f"Game Date: {replay.date}\n")
-            f.write(f"Race: {next((p.play_race for p in replay.players if p.name == player_name), 'Unknown')}\n\n")
+            f.write(f"Race: {_race(replay, player_name)}\n\n")
             f.write(f"{'Time':8} {'Unit':25}\n")
             f.write("-" * 35 + "\n")
-            
-            for _, game_time, unit_name in sorted_builds:
-                f.write(f"{game_time:8} {unit_name:25}\n")
-                
-        print(f"Build order written to: {output_file}")
-
-
-def write_unit_production(replay, replay_path):
-    # Analyze unit production
-    unit_counts = defaultdict(lambda: defaultdict(int))
-    
-    for event in replay.events:
-        if event.name == "UnitBornEvent" and event.control_pid > 0:
-            player = replay.player[event.control_pid]
-            unit_counts[player.name][event.unit.name] += 1
-    
-    """Write unit production summary and file."""
-    for player_name, units in unit_counts.items():
-        # Sort units by count (descending) then name
+            for second, unit_name, uid in sorted(builds, key=lambda x: x[0]):
+                if uid in data["canceled"]:
+                    continue
+                if second > 300 and unit_name in WORKERS:
+                    continue
+                f.write(f"{format_time(second):8} {unit_name:25}\n")
+        log(f"Build order written to: {output_file}")
+
+
+def write_unit_production(replay, replay_path, data, log):
+    """Unit production summary per player, most-produced first."""
+    for player_name, units in data["counts"].items():
         sorted_units = sorted(units.items(), key=lambda x: (-x[1], x[0]))
-        
-        # Write to text file
         output_file = Path(replay_path).with_suffix(f'.{player_name}.units.txt')
         with open(output_file, 'w') as f:
             f.write(f"Unit Production Summary for {player_name}\n\n")
             f.write(f"{'Unit':25} {'Count':8}\n")
             f.write("-" * 35 + "\n")
-            
             for unit_name, count in sorted_units:
                 f.write(f"{unit_name:25} {count:8}\n")
-                
-        print(f"Unit production written to: {output_file}")
-
-
-def write_upgrades(replay, replay_path):
-    # Analyze upgrades
-    upgrades = defaultdict(list)
-    
-    for event in replay.events:
-        if event.name == "UpgradeCompleteEvent":
-            player = replay.player[event.pid]
-            game_time = format_time(event.second)
-            upgrade_name = event.upgrade_type_name
-            
-            upgrades[player.name].append((event.second, game_time, upgrade_name))
-    
-    """Write upgrades to console and file."""
-    for player_name, player_upgrades in upgrades.items():
-        # Sort by time
-        sorted_upgrades = sorted(player_upgrades, key=lambda x: x[0])
-        
-        # Write to text file
+        log(f"Unit production written to: {output_file}")
+
+
+def write_upgrades(replay, replay_path, data, log):
+    """Completed upgrades per player, in order."""
+    for player_name, player_upgrades in data["upgrades"].items():
         output_file = Path(replay_path).with_suffix(f'.{player_name}.upgrades.txt')
         with open(output_file, 'w') as f:
             f.write(f"Upgrades for {player_name} - {replay.map_name}\n")
             f.write(f"Game Date: {replay.date}\n")
-            f.write(f"Race: {next((p.play_race for p in replay.players if p.name == player_name), 'Unknown')}\n\n")
+            f.write(f"Race: {_race(replay, player_name)}\n\n")
             f.write(f"{'Time':8} {'Upgrade':30}\n")
             f.write("-" * 40 + "\n")
-            
-            for _, game_time, upgrade_name in sorted_upgrades:
-                f.write(f"{game_time:8} {upgrade_name:30}\n")
-                
-        print(f"Upgrades written to: {output_file}")
-
-
-def analyze_replay(replay_path, generate_graphs=True):
-    """Analyze a replay file using sc2reader."""
-    print(f"Analyzing replay: {replay_path}")
-    
-    # Load the replay
-    replay = sc2reader.load_replay(str(replay_path), load_level=3)
-    #replay.load_map()
-    #replay.load_all_details()
-    
-    # Add tracker plugins
-    sc2reader.engine.register_plugin(SelectionTracker())
-    sc2reader.engine.register_plugin(APMTracker())
-    
-    # Basic replay info
-    print("\n=== Replay Information ===")
-    print(f"Map: {replay.map_name}")
-    print(f"Game Length: {format_time(replay.game_length.seconds)}")
-    print(f"Game Version: {replay.release_string}")
-    print(f"Game Date: {replay.date}")
-    
-    # Player information
-    print("\n=== Players ===")
-    for player in replay.players:
-        print(f"Player: {player.name} ({player.play_race})")
-        print(f"  Result: {player.result}")
-        
-    # Write build orders to files and print to console
-    #write_build_orders(replay, replay_path)
-    
-    # Write unit production to files and print to console
-    #write_unit_production(replay, replay_path)
-    
-    # Write upgrades to files and print to console
-    #write_upgrades(replay, replay_path)
-
-    # Generate graphs if requested
-    if generate_graphs:
-        generate_resource_graph(replay)
-        generate_units_graph(replay)
-
-def get_player_name_by_pid(replay, pid):
-    for player in replay.players:
-        if player.pid == pid:
-            return player.name
-    return str(pid)
-
-def generate_resource_graph(replay):
-    """Generate a graph showing resource collection over time."""
-    print("\n=== Generating Resource Graph ===")
-    
-    # Initialize data structures
-    timestamps = []
-    minerals_by_player = defaultdict(list)
-    vespene_by_player = defaultdict(list)
-    
-    print(replay.player)
-    # Collect resource data
-    for event in replay.events:
-        if event.name == "PlayerStatsEvent":
-            print(event)
-            print(f'event.second: {event.second}')
-            print(f"pid: {event.pid}")
-            print(f"minerals_collection_rate: {event.minerals_collection_rate}")
-            print(f"vespene_collection_rate: {event.vespene_collection_rate}")
-            player_name = get_player_name_by_pid(replay, event.pid)
-            print(f"player_name: {player_name}")
-            timestamps.append(event.second / 60.0)  # Convert to minutes
-            minerals_by_player[player_name].append(event.minerals_collection_rate)
-            vespene_by_player[player_name].append(event.vespene_collection_rate)
-    
-    # Create the plot
-    plt.figure(figsize=(12, 6))
-    
-    # Plot minerals
-    plt.subplot(1, 2, 1)
-    for player_name, minerals in minerals_by_player.items():
-        plt.plot(timestamps[:len(minerals)], minerals, label=f"{player_name} Minerals")
-    
-    plt.title("Mineral Collection Rate")
-    plt.xlabel("Game Time (minutes)")
-    plt.ylabel("Collection Rate")
-    plt.legend()
-    plt.grid(True)
-    
-    # Plot vespene
-    plt.subplot(1, 2, 2)
-    for player_name, vespene in vespene_by_player.items():
-        plt.plot(timestamps[:len(vespene)], vespene, label=f"{player_name} Vespene")
-    
-    plt.title("Vespene Collection Rate")
-    plt.xlabel("Game Time (minutes)")
-    plt.ylabel("Collection Rate")
-    plt.legend()
-    plt.grid(True)
-    
+            for second, upgrade_name in sorted(player_upgrades, key=lambda x: x[0]):
+                f.write(f"{format_time(second):8} {upgrade_name:30}\n")
+        log(f"Upgrades written to: {output_file}")
+
+
+def generate_resource_graph(replay_path, data, log):
+    """Mineral / vespene collection rate over time, one line per player."""
+    plt = _plt()
+    fig = plt.figure(figsize=(12, 6))
+    for col, (title, label) in enumerate((("Mineral Collection Rate", "Minerals"),
+                                          ("Vespene Collection Rate", "Vespene"))):
+        plt.subplot(1, 2, col + 1)
+        for player_name, rows in data["stats"].items():
+            plt.plot([r[0] for r in rows], [r[col + 1] for r in rows],
+                     label=f"{player_name} {label}")
+        plt.title(title)
+        plt.xlabel("Game Time (minutes)")
+        plt.ylabel("Collection Rate")
+        plt.legend()
+        plt.grid(True)
     plt.tight_layout()
-    output_path = Path(replay.filename).with_suffix('.resources.png')
+    output_path = Path(replay_path).with_suffix('.resources.png')
     plt.savefig(output_path)
-    plt.close()
-    print(f"Resource graph saved to: {output_path}")
-
-
-def generate_units_graph(replay):
-    """Generate a graph showing unit counts over time."""
-    print("\n=== Generating Units Graph ===")
-    
-    # Initialize data structures
-    max_time = int(replay.game_length.total_seconds())
-    time_points = list(range(0, max_time + 60, 60))  # Every minute
-    
-    # Track units by player and type over time
-    units_over_time = defaultdict(lambda: defaultdict(lambda: [0] * len(time_points)))
-    
-    # Process unit creation and destruction events
-    for event in replay.events:
-        if event.name == "UnitBornEvent" and event.control_pid > 0:
-            print(event)
-            print(f"event.control_pid: {event.control_pid}")
-            print(f"event.unit: {event.unit}")
-            player_name = get_player_name_by_pid(replay, event.control_pid)
-            unit_name = event.unit.name
-            time_index = min(len(time_points) - 1, event.second // 60)
-            
-            # Increment unit count for all time points after this one
-            for i in range(time_index, len(time_points)):
-                units_over_time[player_name][unit_name][i] += 1
-                
-        elif event.name == "UnitDiedEvent" and hasattr(event, 'unit') and hasattr(event.unit, 'owner'):
-            if event.unit.owner:
-                player_name = event.unit.owner.name
-                unit_name = event.unit.name
-                time_index = min(len(time_points) - 1, event.second // 60)
-                
-                # Decrement unit count for all time points after this one
-                for i in range(time_index, len(time_points)):
-                    if units_over_time[player_name][unit_name][i] > 0:
-                        units_over_time[player_name][unit_name][i] -= 1
-    
-    # Filter out worker units and common units to make the graph more readable
-    common_units = {"SCV", "Probe", "Drone", "Larva", "Egg", "Overlord"}
-    
-    # Create a plot for each player
-    for player_name, unit_data in units_over_time.items():
-        plt.figure(figsize=(14, 8))
-        
-        # Filter to important units (exclude workers and have at least 1 at some point)
-        important_units = {unit: counts for unit, counts in unit_data.items() 
-                          if unit not in common_units and max(counts) > 0}
-        
-        # Sort units by their maximum count
-        sorted_units = sorted(important_units.items(), key=lambda x: max(x[1]), reverse=True)
-        
-        # Limit to top 10 units for readability
-        for unit_name, counts in sorted_units[:10]:
-            plt.plot(np.array(time_points) / 60, counts, label=unit_name)
-        
+    plt.close(fig)
+    log(f"Resource graph saved to: {output_path}")
+
+
+def generate_units_graph(replay_path, data, log):
+    """Alive count per minute of each player's top-10 non-worker units."""
+    plt = _plt()
+    minutes = list(range(data["minutes"] + 1))
+    for player_name, unit_deltas in data["deltas"].items():
+        series = {}
+        for unit_name, d in unit_deltas.items():
+            if unit_name in COMMON_UNITS:
+                continue
+            alive, counts = 0, []
+            for x in d:
+                alive = max(0, alive + x)
+                counts.append(alive)
+            if max(counts) > 0:
+                series[unit_name] = counts
+        fig = plt.figure(figsize=(14, 8))
+        for unit_name, counts in sorted(series.items(), key=lambda x: max(x[1]),
+                                        reverse=True)[:10]:
+            plt.plot(minutes, counts, label=unit_name)
         plt.title(f"Unit Counts Over Time for {player_name}")
         plt.xlabel("Game Time (minutes)")
         plt.ylabel("Unit Count")
         plt.legend()
         plt.grid(True)
-        
-        output_path = Path(replay.filename).with_suffix(f'.{player_name}.units.png')
+        output_path = Path(replay_path).with_suffix(f'.{player_name}.units.png')
         plt.savefig(output_path)
-        plt.close()
-        print(f"Units graph for {player_name} saved to: {output_path}")
+        plt.close(fig)
+        log(f"Units graph for {player_name} saved to: {output_path}")
+
+
+def analyze_replay(replay_path, plots=False):
+    """Analyze one replay; returns its console log as a list of lines."""
+    lines = []
+    log = lines.append
+    log(f"Analyzing replay: {replay_path}")
+    replay = sc2reader.load_replay(str(replay_path), load_level=3)
+
+    log("\n=== Replay Information ===")
+    log(f"Map: {replay.map_name}")
+    log(f"Game Length: {format_time(replay.game_length.seconds)}")
+    log(f"Game Version: {replay.release_string}")
+    log(f"Game Date: {replay.date}")
+    log("\n=== Players ===")
+    for player in replay.players:
+        log(f"Player: {player.name} ({player.play_race})")
+        log(f"  Result: {player.result}")
+
+    data = scan(replay)
+    log("\n=== Outputs ===")
+    write_build_orders(replay, replay_path, data, log)
+    write_unit_production(replay, replay_path, data, log)
+    write_upgrades(replay, replay_path, data, log)
+    if plots:
+        generate_resource_graph(replay_path, data, log)
+        generate_units_graph(replay_path, data, log)
+    return lines
+
+
+def _analyze_safe(replay_path, plots):
+    try:
+        return analyze_replay(replay_path, plots)
+    except Exception as exc:  # one bad replay must not sink a directory run
+        return [f"Analyzing replay: {replay_path}", f"  FAILED: {type(exc).__name__}: {exc}"]
+
+
+def _peak_rss_mb():
+    """Peak RSS of this process and (for directory mode) its largest worker."""
+    import resource  # Unix only; needed just for --profile
+    me = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    kids = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    scale = 1 / (1024 * 1024) if sys.platform == "darwin" else 1 / 1024  # bytes vs KiB
+    return me * scale, kids * scale
 
 
 def main():
     parser = argparse.ArgumentParser(description="Analyze StarCraft II replays using sc2reader")
-    parser.add_argument("replay_path", help="Path to the SC2Replay file")
-    parser.add_argument("--no-graphs", action="store_true", help="Skip generating graphs")
-    
+    parser.add_argument("replay_path", help="Path to an SC2Replay file or a directory of them")
+    parser.add_argument("--plots", action="store_true", help="Also draw resource/unit graphs")
+    parser.add_argument("--jobs", type=int, default=None,
+                        help="worker processes for a directory (default: all cores)")
+    parser.add_argument("--profile", action="store_true", help="Print wall time and peak RSS")
+    parser.add_argument("--no-graphs", action="store_true", help=argparse.SUPPRESS)  # old default
     args = parser.parse_args()
-    
-    # Convert to absolute path if needed
+
     replay_path = Path(args.replay_path)
     if not replay_path.is_absolute():
         replay_path = Path(os.getcwd()) / replay_path
-    
     if not replay_path.exists():
         print(f"Error: Replay file not found at {replay_path}")
         sys.exit(1)
-    
-    analyze_replay(replay_path, not args.no_graphs)
+
+    start = time.perf_counter()
+    if replay_path.is_dir():
+        files = sorted(replay_path.glob("*.SC2Replay"))
+        with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+            for lines in pool.map(_analyze_safe, files, [args.plots] * len(files)):
+                print("\n".join(lines) + "\n")
+        n = len(files)
+    else:
+        print("\n".join(analyze_replay(replay_path, args.plots)))
+        n = 1
+
+    if args.profile:
+        me, kids = _peak_rss_mb()
+        print(f"\n{n} replay(s) in {time.perf_counter() - start:.2f}s wall, "
+              f"peak RSS {me:.0f} MB (largest worker {kids:.0f} MB)")
 
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
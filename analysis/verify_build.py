@@ -8,6 +8,9 @@ at what game time, and the overall reproduction fraction.
 
     python analysis/verify_build.py <replay> <build_id> [player_name_or_race]
 
+For a sweep of scripted-build games use ``verify_sweep.py`` (many replays in
+parallel, reproduction matrix across builds and maps).
+
 Names are matched by canonicalising to the sc2 id token (upper-case, alnum only,
 morphs folded: WarpGate->Gateway, Lair->Hatchery, Orbital->CommandCenter), which
 is exactly how build_guides tokens are spelled.
@@ -96,26 +99,13 @@ def actual_build(r, pid):
     return events
 
 
-def main():
-    if len(sys.argv) < 3:
-        sys.exit(__doc__)
-    replay_path, build_id = sys.argv[1], int(sys.argv[2])
-    hint = sys.argv[3] if len(sys.argv) > 3 else None
-
-    build = get_build(build_id)
-    if build is None:
-        sys.exit(f"build {build_id} not ingested")
-    # level 3 = tracker events only (Init/Born/UpgradeComplete); level 4 adds
-    # game events whose sc2reader plugins crash on vs-AI replays.
-    r = sc2reader.load_replay(replay_path, load_level=3)
-    pid, name = pick_pid(r, hint)
-    actual = actual_build(r, pid)
-    supply_pts = supply_timeline(r, pid)
-
-    print(f"# Reproduction check: {build.title} [{build.matchup}]")
-    print(f"# replay: {os.path.basename(replay_path)}  player: {name} (pid {pid})\n")
+def diff_build(build, actual, supply_pts):
+    """Match the script's steps to the replay's events, in order.
 
-    # walk intended build steps in order; consume actual events greedily
+    Walks the intended steps and consumes actual events greedily per token.
+    Returns ``(rows, hit, supply_devs)`` with rows of
+    ``(step, actual_second, actual_supply, "OK" | "MISS")``.
+    """
     used = defaultdict(int)
     rows, hit = [], 0
     supply_devs = []
@@ -133,10 +123,32 @@ def main():
             asup = supply_at(supply_pts, t)
             if a.at_supply is not None:
                 supply_devs.append(abs(asup - a.at_supply))
-            rows.append((a.at_supply, a.name, t, asup, "OK"))
+            rows.append((a, t, asup, "OK"))
         else:
-            rows.append((a.at_supply, a.name, None, None, "MISS"))
+            rows.append((a, None, None, "MISS"))
+    return rows, hit, supply_devs
+
+
+def main():
+    if len(sys.argv) < 3:
+        sys.exit(__doc__)
+    replay_path, build_id = sys.argv[1], int(sys.argv[2])
+    hint = sys.argv[3] if len(sys.argv) > 3 else None
+
+    build = get_build(build_id)
+    if build is None:
+        sys.exit(f"build {build_id} not ingested")
+    # level 3 = tracker events only (Init/Born/UpgradeComplete); level 4 adds
+    # game events whose sc2reader plugins crash on vs-AI replays.
+    r = sc2reader.load_replay(replay_path, load_level=3)
+    pid, name = pick_pid(r, hint)
+    actual = actual_build(r, pid)
+    supply_pts = supply_timeline(r, pid)
+
+    print(f"# Reproduction check: {build.title} [{build.matchup}]")
+    print(f"# replay: {os.path.basename(replay_path)}  player: {name} (pid {pid})\n")
 
+    rows, hit, supply_devs = diff_build(build, actual, supply_pts)
     total = sum(1 for a in build.build_steps() if a.token)
     # "actual @sup" is the bot's supply WHEN it made the step -- the fidelity
     # measure for a supply-triggered build (wall-clock lags with a slower
@@ -144,7 +156,8 @@ def main():
     # was followed).
     print(f"{'step':<26} {'intended':>9} {'actual':>7} {'actual':>8}  status")
     print(f"{'':<26} {'@supply':>9} {'@supply':>7} {'time':>8}")
-    for sup, nm, t, asup, status in rows:
+    for a, t, asup, status in rows:
+        sup, nm = a.at_supply, a.name
         isup = f"@{sup}" if sup else ""
         print(f"{nm[:26]:<26} {isup:>9} {('@'+str(asup)) if asup is not None else '':>7} "
               f"{mmss(t):>8}  {status}")
@@ -154,7 +167,7 @@ def main():
         within = sum(1 for d in supply_devs if d <= 4)
         print(f"supply fidelity: median |Δsupply| = {med}, "
               f"{within}/{len(supply_devs)} steps within 4 supply of the benchmark")
-    seq = [t for *_, t, s in rows if s == "OK"]
+    seq = [t for _a, t, _sup, s in rows if s == "OK"]
     inversions = sum(1 for i in range(1, len(seq)) if seq[i] < seq[i - 1] - 5)
     print(f"order: {len(seq)} reproduced steps, {inversions} out-of-order by time (>5s)")
 
@@ -0,0 +1,267 @@
+"""Batch reproduction check for a sweep of scripted-build games.
+
+``verify_build.py`` checks one replay against one build; this checks a whole
+folder. Every replay is parsed in parallel and its *actual* build sequence
+(``verify_build.actual_build`` + supply timeline, and the opening telemetry from
+``extract_openings.extract_player``) is cached by content hash -- the cache does
+not depend on the intended script, so re-verifying after a script tweak skips
+sc2reader entirely. Each replay is then diffed against its intended target:
+
+  - a ``build_guides`` script (``build:<id>``), step by step as verify_build; or
+  - an ``openings`` family (``opening:<name>``), structure by structure.
+
+and the output is a matrix per target: per-step reproduction rate and median
+timing delta (actual - intended) by map, plus a target x map overview.
+
+    python analysis/verify_sweep.py <dir|replay ...> [--build ID | --family NAME]
+                                    [--manifest FILE] [--player HINT] [--jobs N] [--out FILE]
+
+The intended target per replay comes from ``--build`` / ``--family`` (whole
+sweep), else a ``--manifest`` (JSON list or JSONL of ``{"replay"|"file": ...,
+"build"|"family": ...}``, e.g. a harness history file), else the file name
+(``..._b203087_...`` or an opening family name such as ``protoss_gate_expand``).
+"""
+import json
+import os
+import re
+import sys
+from collections import defaultdict
+from statistics import median
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+import replay_batch as rb  # noqa: E402
+
+from strategy_engine import OPENINGS, get_build, get_opening  # noqa: E402
+
+CACHE_VERSION = 1  # bump when parse() output changes
+
+
+def parse(path):
+    """Script-independent build facts for every player (cached per replay)."""
+    import sc2reader
+    import extract_openings as ex
+    import verify_build as vb
+
+    r = sc2reader.load_replay(path, load_level=3)
+    players = []
+    for p in (x for x in r.players if not x.is_observer):
+        try:
+            op = ex.extract_player(r, p.pid, p.play_race, ex.WINDOW)
+            buildings = [(b["s"], b["t"], b["zone"]) for b in op["buildings"]]
+        except Exception:
+            buildings = []
+        players.append(dict(
+            pid=p.pid, name=str(p.name), race=p.play_race,
+            actual=dict(vb.actual_build(r, p.pid)),
+            supply=vb.supply_timeline(r, p.pid),
+            buildings=buildings))
+    return dict(file=os.path.basename(path), map=r.map_name, players=players)
+
+
+def pick_player(players, hint):
+    """Same rule as ``verify_build.pick_pid``, over cached players."""
+    if hint:
+        for p in players:
+            if hint.lower() in p["name"].lower() or hint.lower() == p["race"].lower():
+                return p
+    for p in players:
+        if not p["name"].startswith("A.I."):
+            return p
+    return players[0] if players else None
+
+
+# ---- intended targets ------------------------------------------------------
+
+def load_manifest(path):
+    """basename -> target string, from a JSON list or JSONL of records."""
+    with open(path) as f:
+        text = f.read()
+    try:
+        records = json.loads(text)
+    except ValueError:
+        records = [json.loads(line) for line in text.splitlines() if line.strip()]
+    out = {}
+    for rec in records if isinstance(records, list) else []:
+        name = rec.get("replay") or rec.get("file")
+        if not name:
+            continue
+        build = rec.get("build") or rec.get("build_id")
+        family = rec.get("family") or rec.get("opening")
+        if build:
+            out[os.path.basename(name)] = f"build:{int(build)}"
+        elif family:
+            out[os.path.basename(name)] = f"opening:{family}"
+    return out
+
+
+def target_for(path, build=None, family=None, manifest=None):
+    if build:
+        return f"build:{int(build)}"
+    if family:
+        return f"opening:{family}"
+    name = os.path.basename(path)
+    if manifest and name in manifest:
+        return manifest[name]
+    m = re.search(r"(?:^|_)b(?:uild)?(\d{5,})(?:_|\.|$)", name)
+    if m:
+        return f"build:{int(m.group(1))}"
+    for fam in sorted(OPENINGS, key=len, reverse=True):
+        if fam in name:
+            return f"opening:{fam}"
+    return None
+
+
+# ---- diffs -----------------------------------------------------------------
+
+def diff_build_steps(build, player):
+    """``[(step_label, reproduced, dt_seconds|None, dsupply|None)]`` for a script."""
+    import verify_build as vb
+    rows, _hit, _devs = vb.diff_build(build, player["actual"], player["supply"])
+    out = []
+    for a, t, asup, status in rows:
+        label = f"{a.index + 1:>2}. {a.name}" + (f" @{a.at_supply}" if a.at_supply else "")
+        ok = status == "OK"
+        dt = (t - a.at_second) if ok and a.at_second is not None else None
+        dsup = (asup - a.at_supply) if ok and a.at_supply is not None else None
+        out.append((label, ok, dt, dsup))
+    return out
+
+
+def diff_opening_steps(opening, player):
+    """Same shape as ``diff_build_steps``, against an opening family's steps."""
+    times = defaultdict(list)
+    for name, sec, _zone in player["buildings"]:
+        times[name].append(sec)
+    seen = defaultdict(int)
+    out = []
+    for s in opening.steps:
+        k = seen[s.structure]
+        seen[s.structure] += 1
+        ok = k < len(times[s.structure])
+        t = times[s.structure][k] if ok else None
+        dt = (t - s.at_second) if ok and s.at_second is not None else None
+        out.append((f"{s.index + 1:>2}. {s.structure}", ok, dt, None))
+    return out
+
+
+def diff_target(target, player):
+    kind, _, key = target.partition(":")
+    if kind == "build":
+        build = get_build(int(key))
+        return (build.title, diff_build_steps(build, player)) if build else (None, None)
+    opening = get_opening(key)
+    return (opening.summary(), diff_opening_steps(opening, player)) if opening else (None, None)
+
+
+# ---- matrix ----------------------------------------------------------------
+
+def _cell(results):
+    """'83% +4s' -- reproduction rate and median timing (or supply) delta."""
+    if not results:
+        return ""
+    rate = sum(ok for ok, _dt, _ds in results) / len(results)
+    dts = [dt for ok, dt, _ds in results if dt is not None]
+    dss = [ds for ok, _dt, ds in results if ds is not None]
+    if dts:
+        return f"{rate:.0%} {median(dts):+.0f}s"
+    if dss:
+        return f"{rate:.0%} {median(dss):+.0f}sup"
+    return f"{rate:.0%}"
+
+
+def render(per_target, titles, failed, n_replays, n_cached):
+    out = []
+    p = out.append
+    p(f"# Reproduction sweep: {n_replays} replays ({n_cached} cached)")
+    p("")
+    p("| target | map | replays | steps reproduced | median Δt |")
+    p("|--------|-----|:-------:|:----------------:|:---------:|")
+    for target in sorted(per_target):
+        for mp in sorted(per_target[target]):
+            games = per_target[target][mp]
+            steps = [s for g in games for s in g]
+            rate = sum(ok for _l, ok, _dt, _ds in steps) / max(1, len(steps))
+            dts = [dt for _l, ok, dt, _ds in steps if dt is not None]
+            p(f"| {target} | {mp} | {len(games)} | {rate:.0%} | "
+              f"{f'{median(dts):+.0f}s' if dts else '-'} |")
+    p("")
+    for target in sorted(per_target):
+        maps = sorted(per_target[target])
+        p(f"## {target} — {titles[target]}")
+        p("")
+        p("| step | " + " | ".join(maps) + " | all |")
+        p("|------|" + "|".join(":---:" for _ in maps) + "|:---:|")
+        labels = []
+        cells = defaultdict(lambda: defaultdict(list))
+        for mp in maps:
+            for game in per_target[target][mp]:
+                for label, ok, dt, ds in game:
+                    if label not in cells:
+                        labels.append(label)
+                    cells[label][mp].append((ok, dt, ds))
+        for label in labels:
+            everything = [x for mp in maps for x in cells[label][mp]]
+            p(f"| {label} | " + " | ".join(_cell(cells[label][mp]) for mp in maps)
+              + f" | {_cell(everything)} |")
+        p("")
+    if failed:
+        p("## Skipped")
+        p("")
+        for name, why in failed:
+            p(f"- {name}: {why}")
+        p("")
+    return "\n".join(out)
+
+
+def main():
+    argv = sys.argv[1:]
+    opts = {"--build": None, "--family": None, "--manifest": None, "--player": None,
+            "--jobs": None, "--out": None}
+    args = []
+    i = 0
+    while i < len(argv):
+        if argv[i] in opts:
+            opts[argv[i]] = argv[i + 1]; i += 2
+        else:
+            args.append(argv[i]); i += 1
+    if not args:
+        print(__doc__)
+        sys.exit(1)
+    manifest = load_manifest(opts["--manifest"]) if opts["--manifest"] else None
+    jobs = int(opts["--jobs"]) if opts["--jobs"] else None
+
+    per_target = defaultdict(lambda: defaultdict(list))  # target -> map -> [steps]
+    titles, failed = {}, []
+    n = n_cached = 0
+    for path, res, hit in rb.cached_map("verify_sweep", rb.expand_replays(args), parse,
+                                        jobs=jobs, version=CACHE_VERSION):
+        n += 1
+        n_cached += hit
+        name = os.path.basename(path)
+        if "error" in res:
+            failed.append((name, res["error"]))
+            continue
+        target = target_for(path, opts["--build"], opts["--family"], manifest)
+        player = pick_player(res["players"], opts["--player"])
+        if target is None or player is None:
+            failed.append((name, "no intended build/family" if target is None else "no player"))
+            continue
+        title, steps = diff_target(target, player)
+        if steps is None:
+            failed.append((name, f"unknown target {target}"))
+            continue
+        titles[target] = title
+        per_target[target][res["map"]].append(steps)
+
+    text = render(per_target, titles, failed, n, n_cached)
+    if opts["--out"]:
+        with open(opts["--out"], "w") as f:
+            f.write(text)
+        print(f"wrote {opts['--out']}")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
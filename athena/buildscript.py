@@ -9,6 +9,18 @@ The script OWNS tech/army structure decisions while active; the defense advisor
 still overrides it (an emergency pauses the script so the anti-rush behaviour we
 built isn't undone), and once the script completes the normal production manager
 resumes.
+
+Bookkeeping is incremental so a step costs about the same at action 3 as at
+action 40. Tokens are resolved to unit/upgrade ids once, at construction.
+Counts per token are kept as *built* plus *in flight*:
+- built moves on the bot's construction-started, unit-created, destroyed and
+  upgrade-complete events (``on_event`` hooks below);
+- in flight counts orders the script issued that have not landed yet.
+
+A full recount every ``RESYNC_SECONDS`` corrects anything the events miss,
+such as a build order whose worker died on the way. ``step`` keeps a cursor
+at the first unmet action and stops scanning once no later action can be due
+yet.
 """
 
 from sc2.ids.ability_id import AbilityId
@@ -22,49 +34,122 @@ GATEWAY_UNITS = {"ZEALOT", "STALKER", "ADEPT", "SENTRY", "HIGHTEMPLAR", "DARKTEM
 ROBO_UNITS = {"IMMORTAL", "OBSERVER", "COLOSSUS", "WARPPRISM"}
 STARGATE_UNITS = {"ORACLE", "PHOENIX", "VOIDRAY", "CARRIER", "TEMPEST"}
 
+RESYNC_SECONDS = 10.0   # full recount cadence (events are the fast path)
+_NEVER = float("inf")
+
 
 class BuildScript:
     def __init__(self, build_id):
         self.build = get_build(int(build_id)) if build_id is not None else None
         self.executor = BuildExecutor(self.build) if self.build else None
         self.active = self.executor is not None
+        # token -> UnitTypeId / UpgradeId, resolved once
+        self._units = {}
+        self._upgrades = {}
+        self._token_of = {}              # UnitTypeId -> token, for events
+        self._built = {}                 # token -> landed count
+        self._inflight = {}              # token -> orders issued, not landed yet
+        self._tags = {}                  # tag -> token, to count losses
+        self._synced = None
+        self._cursor = 0
+        if not self.active:
+            return
+        researched = {a.token for a in self.executor.actions if a.action == "research"}
+        for token in {a.token for a in self.executor.actions if a.token}:
+            up = (getattr(Up, token, None)
+                  if token in _UPGRADE_TOKENS or token in researched else None)
+            if up is not None:
+                self._upgrades[token] = up
+                continue
+            uid = getattr(U, token, None)
+            if uid is not None:
+                self._units[token] = uid
+                self._token_of[uid] = token
+        # WarpGate morphs from Gateway -- count both toward GATEWAY
+        if "GATEWAY" in self._units:
+            self._token_of[U.WARPGATE] = "GATEWAY"
+        required = self.executor._required
+        self._first = {}
+        for i, (_a, key, _n) in enumerate(required):
+            self._first.setdefault(key, i)
+        # earliest supply / time any action from i on can fall due (see _due)
+        self._due_supply = [_NEVER] * (len(required) + 1)
+        self._due_time = [_NEVER] * (len(required) + 1)
+        for i in range(len(required) - 1, -1, -1):
+            s, t = self._due_at(required[i][0])
+            self._due_supply[i] = min(s, self._due_supply[i + 1])
+            self._due_time[i] = min(t, self._due_time[i + 1])
 
     def _unit(self, token):
-        try:
-            return getattr(U, token)
-        except AttributeError:
-            return None
+        return self._units.get(token)
 
     def _upgrade(self, token):
-        try:
-            return getattr(Up, token)
-        except AttributeError:
-            return None
+        return self._upgrades.get(token)
 
-    def _have(self, bot):
-        """Counts (built + pending) per token, so the executor advances."""
-        have = {}
-        for token in set(a.token for a in self.executor.actions if a.token):
-            up = self._upgrade(token) if token in _UPGRADE_TOKENS else None
-            if up is not None:
-                have[token] = (1 if up in bot.state.upgrades
-                               or bot.already_pending_upgrade(up) > 0 else 0)
-                continue
-            uid = self._unit(token)
-            if uid is None:
-                continue
-            count = (bot.structures(uid).amount + bot.units(uid).amount
-                     + bot.already_pending(uid))
-            # A NEXUS build step means "expand" -- the starting base pre-exists
-            # and is not a build step, so don't let it satisfy the first expand
-            # (otherwise we never take the natural and later gas/steps deadlock).
-            if token == "NEXUS":
-                count = max(0, bot.townhalls.amount + bot.already_pending(U.NEXUS) - 1)
-            have[token] = count
-        # WarpGate morphs from Gateway -- count both toward GATEWAY
-        if "GATEWAY" in have:
-            have["GATEWAY"] += bot.structures(U.WARPGATE).amount
-        return have
+    # -- counts ----------------------------------------------------------
+    def _have(self, key):
+        n = self._built.get(key, 0) + self._inflight.get(key, 0)
+        return min(1, n) if key in self._upgrades else n
+
+    def _lost(self, key):
+        """A count went down: the action that produced it is unmet again."""
+        self._cursor = min(self._cursor, self._first.get(key, self._cursor))
+
+    def _resync(self, bot):
+        """Recount every token from the bot's state."""
+        before = {k: self._have(k) for k in self._first}
+        self._built, self._inflight, self._tags = {}, {}, {}
+        for token, up in self._upgrades.items():
+            self._built[token] = 1 if up in bot.state.upgrades else 0
+            self._inflight[token] = 1 if bot.already_pending_upgrade(up) > 0 else 0
+        for token, uid in self._units.items():
+            own = bot.structures(uid) | bot.units(uid)
+            if token == "GATEWAY":
+                own = own | bot.structures(U.WARPGATE)
+            # already_pending also counts what is warping in / under
+            # construction, which ``own`` already has
+            self._inflight[token] = max(
+                0, bot.already_pending(uid) - own.not_ready.amount)
+            self._built[token] = own.amount
+            for u in own:
+                self._tags[u.tag] = token
+        # A NEXUS build step means "expand" -- the starting base pre-exists
+        # and is not a build step, so don't let it satisfy the first expand
+        # (otherwise we never take the natural and later gas/steps deadlock).
+        if "NEXUS" in self._built:
+            self._built["NEXUS"] = max(0, self._built["NEXUS"] - 1)
+        for key, n in before.items():
+            if self._have(key) < n:
+                self._lost(key)
+        self._synced = bot.time
+
+    def _landed(self, unit):
+        token = self._token_of.get(unit.type_id)
+        if token is None or unit.tag in self._tags:
+            return
+        self._tags[unit.tag] = token
+        self._built[token] = self._built.get(token, 0) + 1
+        if self._inflight.get(token):
+            self._inflight[token] -= 1
+
+    # event hooks, forwarded by AthenaBot while the script is active
+    def on_unit_created(self, unit):
+        self._landed(unit)
+
+    def on_building_construction_started(self, unit):
+        self._landed(unit)
+
+    def on_unit_destroyed(self, tag):
+        token = self._tags.pop(tag, None)
+        if token is not None:
+            self._built[token] = max(0, self._built.get(token, 0) - 1)
+            self._lost(token)
+
+    def on_upgrade_complete(self, upgrade):
+        for token, up in self._upgrades.items():
+            if up == upgrade:
+                self._built[token] = 1
+                self._inflight[token] = 0
 
     async def step(self, bot, advice):
         if not self.active:
@@ -77,7 +162,8 @@ class BuildScript:
         # a scouted all-in pauses the script; the defense manager takes over
         if advice.defense.emergency:
             return True
-        have = dict(self._have(bot))
+        if self._synced is None or bot.time - self._synced >= RESYNC_SECONDS:
+            self._resync(bot)
         # Issue EVERY due + issuable step this tick (skipping blocked ones:
         # unaffordable, prereq/producer missing, no free geyser, can't expand),
         # tracking a running mineral/gas budget so we don't over-commit. Strict
@@ -85,13 +171,21 @@ class BuildScript:
         # the natural) otherwise cascade-delays everything after it, and firing
         # only one step per tick makes e.g. Warp Gate (on the core) queue behind
         # Adept production (on the gateway) though they're independent.
+        required = self.executor._required
+        while self._cursor < len(required) and \
+                self._have(required[self._cursor][1]) >= required[self._cursor][2]:
+            self._cursor += 1
+        if self._cursor >= len(required):
+            self.active = False
+            return True
         spent_m = spent_v = 0
-        pending = False
         issued = set()
-        for action, key, need in self.executor._required:
-            if have.get(key, 0) >= need:
+        for i in range(self._cursor, len(required)):
+            if bot.supply_used < self._due_supply[i] and bot.time < self._due_time[i]:
+                break                      # nothing from here on is due yet
+            action, key, need = required[i]
+            if self._have(key) >= need:
                 continue
-            pending = True
             if key in issued or not self._due(action, bot):
                 continue
             cost = self._cost(bot, action)
@@ -103,8 +197,7 @@ class BuildScript:
                 spent_m += cost[0]
                 spent_v += cost[1]
                 issued.add(key)
-        if not pending:
-            self.active = False
+                self._inflight[key] = self._inflight.get(key, 0) + 1
         return True
 
     def _cost(self, bot, action):
@@ -115,6 +208,14 @@ class BuildScript:
         c = bot.calculate_cost(ent)
         return (c.minerals, c.vespene)
 
+    @staticmethod
+    def _due_at(action):
+        """(supply, time) at either of which ``action`` is due, per ``_due``."""
+        s, t = action.at_supply, action.at_second
+        if s is None and t is None:
+            return (-_NEVER, -_NEVER)
+        return (_NEVER if s is None else s, _NEVER if t is None else t)
+
     @staticmethod
     def _due(action, bot):
         # fire at the EARLIER of the supply or time benchmark (max timing
@@ -131,7 +232,7 @@ class BuildScript:
             if up is None or not bot.can_afford(up) or bot.already_pending_upgrade(up):
                 return False
             for s in _RESEARCH_FROM.get(action.token, []):
-                st = bot.structures(getattr(U, s)).ready.idle
+                st = bot.structures(s).ready.idle
                 if st:
                     st.first.research(up)
                     if action.chrono:
@@ -226,7 +327,7 @@ class BuildScript:
 _UPGRADE_TOKENS = {"WARPGATERESEARCH", "CHARGE", "BLINKTECH",
                    "PROTOSSGROUNDWEAPONSLEVEL1", "PROTOSSGROUNDARMORSLEVEL1"}
 _RESEARCH_FROM = {
-    "WARPGATERESEARCH": ["CYBERNETICSCORE"],
-    "CHARGE": ["TWILIGHTCOUNCIL"], "BLINKTECH": ["TWILIGHTCOUNCIL"],
-    "PROTOSSGROUNDWEAPONSLEVEL1": ["FORGE"], "PROTOSSGROUNDARMORSLEVEL1": ["FORGE"],
+    "WARPGATERESEARCH": [U.CYBERNETICSCORE],
+    "CHARGE": [U.TWILIGHTCOUNCIL], "BLINKTECH": [U.TWILIGHTCOUNCIL],
+    "PROTOSSGROUNDWEAPONSLEVEL1": [U.FORGE], "PROTOSSGROUNDARMORSLEVEL1": [U.FORGE],
 }
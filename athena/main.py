@@ -14,7 +14,8 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from sc2.bot_ai import BotAI
 from sc2.data import Result
 
-from strategy_engine import Archetype
+from strategy_engine import Archetype, maps
+from strategy_engine.orders import OrderBuffer
 from perception import Perception
 from strategy import Strategy
 from economy import Economy
@@ -37,6 +38,18 @@ class AthenaBot(BotAI):
         self.production = Production()
         self.army = Army()
         self.last_log = 0
+        self.order_buffer = OrderBuffer()
+
+    def _find_expansion_locations(self):
+        # the shipped per-map cache (strategy_engine/maps.py) when this map and
+        # spawn are in it; python-sc2's live resource clustering otherwise
+        if not maps.apply_expansions(self):
+            super()._find_expansion_locations()
+
+    async def _after_step(self):
+        # compact this step's orders before python-sc2 sends them (strategy_engine/orders.py)
+        self.order_buffer.flush(self)
+        return await super()._after_step()
 
     async def on_start(self):
         self.client.game_step = 4  # responsive without being wasteful
@@ -46,6 +59,23 @@ class AthenaBot(BotAI):
             if self.build_script.active:
                 print(f"reproducing build: {self.build_script.build.title}")
 
+    # the scripted build counts from these events instead of rescanning
+    async def on_unit_created(self, unit):
+        if self.build_script is not None and self.build_script.active:
+            self.build_script.on_unit_created(unit)
+
+    async def on_building_construction_started(self, unit):
+        if self.build_script is not None and self.build_script.active:
+            self.build_script.on_building_construction_started(unit)
+
+    async def on_unit_destroyed(self, unit_tag):
+        if self.build_script is not None and self.build_script.active:
+            self.build_script.on_unit_destroyed(unit_tag)
+
+    async def on_upgrade_complete(self, upgrade):
+        if self.build_script is not None and self.build_script.active:
+            self.build_script.on_upgrade_complete(upgrade)
+
     async def on_step(self, iteration):
         if not self.townhalls:
             # last-ditch: everything attacks
@@ -112,3 +142,4 @@ class AthenaBot(BotAI):
 
     async def on_end(self, result: Result):
         print(f"AthenaBot game ended: {result}")
+        print(self.order_buffer.stats.summary())
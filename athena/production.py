@@ -10,6 +10,9 @@ from sc2.ids.ability_id import AbilityId
 from sc2.ids.unit_typeid import UnitTypeId as U
 from sc2.ids.upgrade_id import UpgradeId
 from sc2.data import Race
+from sc2.position import Point2
+
+from strategy_engine import maps
 
 
 class Production:
@@ -174,6 +177,9 @@ class Production:
         return base.position.towards(bot.game_info.map_center, -3)
 
     def _choke_pos(self, bot, base):
+        spawn = maps.for_bot(bot)
+        if spawn is not None and spawn.ramp_top is not None:
+            return Point2(spawn.ramp_top).towards(base.position, 3)
         try:
             return bot.main_base_ramp.top_center.towards(base.position, 3)
         except Exception:
@@ -2,12 +2,16 @@
 
 The classic Protoss hold: a Pylon + two buildings (gateway, cyber) on the ramp
 leave a one-unit gap that a zealot plugs. python-sc2 computes the exact tiles;
-we just place our first buildings there and post a unit at the gap.
+we just place our first buildings there and post a unit at the gap. Maps in the
+shipped cache (strategy_engine/maps.py) skip that computation.
 
 This is *execution* of the library's DefensePlan ("defend"), not a new decision.
 """
 
 from sc2.ids.unit_typeid import UnitTypeId as U
+from sc2.position import Point2
+
+from strategy_engine import maps
 
 
 class Wall:
@@ -18,6 +22,12 @@ class Wall:
         """(pylon_pos, [building_pos, building_pos], hold_pos) or (None, [], None)."""
         if self._cache is not None:
             return self._cache
+        spawn = maps.for_bot(bot)
+        if spawn is not None and spawn.protoss_wall[0] is not None:
+            pylon, builds, hold = spawn.protoss_wall
+            self._cache = (Point2(pylon), [Point2(p) for p in builds],
+                           Point2(hold) if hold else None)
+            return self._cache
         try:
             ramp = bot.main_base_ramp
             pylon = ramp.protoss_wall_pylon
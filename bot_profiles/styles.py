@@ -0,0 +1,56 @@
+"""One-line play-style per profiled bot.
+
+Shown in the profile index (``_generate_objective.py``) and bucketed into an
+opponent style by ``opponent_intel/build_map.py``. Kept apart from the profile
+generator so the opponent_intel build step can read it without loading all the
+hand-written analysis.
+"""
+
+STYLE = {
+ "Deimos": "Macro Protoss, adept/phoenix harass", "Eris": "Macro Zerg (roach/ling)",
+ "Phobos": "Terran bio (MMM)", "BenBotBC": "Terran bio, marine micro",
+ "Zozo": "Macro Protoss", "Xena": "Random, adaptive macro",
+ "MicroMachine": "Terran marine-micro specialist", "ArgoBot": "Skytoss (cannon+tempest)",
+ "GPT": "Terran bio-tank", "SharpenedEdge": "Macro Protoss",
+ "tito": "Macro Zerg", "who": "Random cheese/proxy specialist",
+ "Caninana": "Micro macro Zerg", "smallBly": "Zerg",
+ "DominionDog": "Terran bio", "chito": "Speedling macro Zerg",
+ "VeTerran-revived": "Terran bio/mech macro", "WickedBot": "Terran bio",
+ "TyrP": "Protoss macro", "WoundMaker": "Mutalisk Zerg",
+ "Roro": "Terran", "PhantomBot": "Zerg",
+ "BotTato": "Terran mech/reaper", "sharkbot": "Protoss macro",
+ "whalemean": "Random", "JimmyBotP": "Protoss (stalker/immortal/oracle)",
+ "TyrT": "Terran macro", "LunaxVRR": "Skytoss (cannon+tempest)",
+ "WaterLeak": "Roach/ling Zerg", "JimmyBot": "Random (Zerg-leaning)",
+ "JimmyBotT": "Terran bio-tank", "12PoolBot": "12-pool speedling macro Zerg",
+}
+STYLE.update({
+ "MechaShark": "Terran macro (mech-leaning)", "ArgoTest": "Skytoss cannon+tempest (ArgoBot dev)",
+ "Sharkling": "Zerg", "LunaxVRRTest": "Skytoss void/tempest (LunaxVRR dev)",
+ "JimmyBotZ": "Roach/drone macro Zerg", "ZeratulsRevengeTest": "Protoss zealot (dev, unstable)",
+ "Aeolus": "Stalker/blink macro Protoss", "zig-spudde": "Terran bio-tank",
+ "Cyne": "Protoss gateway/robo (weak form)", "LordSuperKing": "Protoss stalker+tempest",
+ "AvocaDOS": "Terran bio", "Battler": "Terran reaper bio/mech",
+ "Apidae": "Protoss cannon turtle/rush", "Clicadinha": "Roach macro Zerg",
+ "Arpy": "Protoss gateway zealot/adept", "muravevtest": "Speedling macro Zerg (muravev dev)",
+ "BigDaddy": "Terran bio (marine/medivac)", "norman": "Broken/losing (current)",
+ "AvocaDEV": "Terran bio (dev)", "Mulebot": "Terran bio-mech",
+ "Dovahkiin": "Zerg macro", "72Tortoises": "Roach/ling macro Zerg",
+ "FlowerPrincess": "Ling-flood Zerg", "Dodo": "Drone macro Zerg (Nydus)",
+ "CynEX": "Skytoss/stalker macro Protoss", "PerilousProtossBot": "Protoss zealot/cannon (weak form)",
+ "Voltron": "Terran bio-tank", "Forgefiend": "Protoss cannon turtle/rush",
+ "Creepy_duo_canon": "Protoss double cannon rush", "nida": "Protoss gateway stalker/phoenix",
+ "clone": "Terran reaper/starport", "PiG_Bot": "Protoss gateway/robo macro",
+})
+STYLE.update({
+ "Asteria": "Stargate skytoss (carrier/tempest)", "ArtZerg": "Ling/roach aggro Zerg",
+ "Terranosaur": "Terran mass-marine bio", "kas": "Over-drone macro Zerg",
+ "Persephone": "Ling/roach macro Zerg", "Horizon": "Terran bio/air macro",
+ "muravev": "Speedling macro Zerg", "ZEALOCALYPSE": "Protoss zealot flood",
+ "TheLAW": "Terran bio macro", "OneBaseStalkerBot": "Protoss one-base stalker",
+ "QueenBot": "Queen/creep macro Zerg", "Hellcannon": "Protoss cannon+zealot",
+ "smokinggunbot": "Terran bio-tank turtle", "zig-reapers": "Terran mass-reaper all-in",
+ "sharpy_protoss_test1": "Protoss gateway/stargate", "PhantomTest": "Zerg (dev, weak form)",
+ "OmegaZ": "Zerg ling (weak form)", "ur_moms_a_ho": "Zerg (small sample)",
+ "Krillin": "Zerg macro/aggro",
+})
@@ -0,0 +1,299 @@
+"""Time HanBot's per-step queries on recorded observations, against an older han.py.
+
+    python han/bench_step.py --obs recordings/game1                  # current han.py only
+    python han/bench_step.py --obs recordings/game1 --baseline HEAD~1
+    python han/bench_step.py --synthetic --baseline HEAD~1           # no recording needed
+
+Record observations from a real game with ``HAN_RECORD_OBS=<dir>``: HanBot writes
+the game's static data once (``game_data.bin``, ``game_info.bin``) and the raw
+observation every 10 game seconds (``obs_<gameloop>.bin``). ``--synthetic``
+builds one late-game frame instead (5 bases each, ~150 units a side, a fight at
+our third), which is enough to compare two versions without StarCraft II.
+
+Each frame is fed to a fresh bot through python-sc2's own ``_prepare_step``;
+then the part of ``on_step`` that reads the world -- ``manage_army`` (defense,
+attack, medivacs, ravens), ``manage_mules``, ``should_expand_base`` and the
+expansion scoring in ``expand_base`` -- is run ``--repeat`` times and timed.
+Commands are built but never queued or sent. ``--baseline REV`` loads ``han/han.py`` at
+that git revision and times it on the same frames.
+"""
+import argparse
+import asyncio
+import contextlib
+import importlib.util
+import io
+import math
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent
+sys.path.insert(0, str(ROOT.parent))
+
+from s2clientprotocol import common_pb2, data_pb2, raw_pb2, sc2api_pb2 as sc_pb
+from sc2.data import Race
+from sc2.game_data import GameData
+from sc2.game_info import GameInfo
+from sc2.game_state import GameState
+from sc2.ids.unit_typeid import UnitTypeId as U
+
+
+def load_han(path: Path, name: str):
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    with contextlib.redirect_stdout(io.StringIO()):
+        spec.loader.exec_module(module)
+    return module
+
+
+def baseline_han(rev: str):
+    src = subprocess.run(["git", "show", f"{rev}:han/han.py"], cwd=ROOT.parent,
+                         check=True, capture_output=True, text=True).stdout
+    tmp = Path(tempfile.mkdtemp()) / "han_baseline.py"
+    tmp.write_text(src)
+    return load_han(tmp, "han_baseline")
+
+
+def recorded_frames(obs_dir: Path):
+    game_data = sc_pb.Response.FromString((obs_dir / "game_data.bin").read_bytes())
+    game_info = sc_pb.Response.FromString((obs_dir / "game_info.bin").read_bytes())
+    frames = [sc_pb.ResponseObservation.FromString(p.read_bytes())
+              for p in sorted(obs_dir.glob("obs_*.bin"))]
+    return game_data.data, game_info, frames
+
+
+# ----------------------------------------------------------------------------
+# Synthetic late-game frame
+# ----------------------------------------------------------------------------
+
+SIZE = 176
+STRUCTURE, ARMORED, LIGHT, BIOLOGICAL, MECHANICAL = 8, 2, 1, 3, 4
+# type -> (minerals, gas, attributes, ground range or 0, air range or 0, radius)
+TYPES = {
+    U.COMMANDCENTER: (400, 0, [STRUCTURE, ARMORED], 0, 0, 2.75),
+    U.ORBITALCOMMAND: (550, 0, [STRUCTURE, ARMORED], 0, 0, 2.75),
+    U.SCV: (50, 0, [LIGHT, BIOLOGICAL], 0.1, 0, 0.375),
+    U.MARINE: (50, 0, [LIGHT, BIOLOGICAL], 5, 5, 0.375),
+    U.MARAUDER: (100, 25, [ARMORED, BIOLOGICAL], 6, 0, 0.5625),
+    U.SIEGETANK: (150, 125, [ARMORED, MECHANICAL], 7, 0, 0.875),
+    U.SIEGETANKSIEGED: (150, 125, [ARMORED, MECHANICAL], 13, 0, 0.875),
+    U.MEDIVAC: (100, 100, [ARMORED, MECHANICAL], 0, 0, 0.75),
+    U.RAVEN: (100, 200, [LIGHT, MECHANICAL], 0, 0, 0.625),
+    U.BARRACKS: (150, 0, [STRUCTURE, ARMORED], 0, 0, 1.8125),
+    U.HATCHERY: (300, 0, [STRUCTURE, ARMORED, BIOLOGICAL], 0, 0, 2.75),
+    U.SPINECRAWLER: (100, 0, [STRUCTURE, ARMORED, BIOLOGICAL], 7, 0, 1.0),
+    U.SPORECRAWLER: (75, 0, [STRUCTURE, ARMORED, BIOLOGICAL], 0, 7, 1.0),
+    U.EXTRACTOR: (25, 0, [STRUCTURE, ARMORED, BIOLOGICAL], 0, 0, 1.5),
+    U.DRONE: (50, 0, [LIGHT, BIOLOGICAL], 0.1, 0, 0.375),
+    U.ZERGLING: (25, 0, [LIGHT, BIOLOGICAL], 0.1, 0, 0.375),
+    U.ROACH: (75, 25, [ARMORED, BIOLOGICAL], 4, 0, 0.625),
+    U.HYDRALISK: (100, 50, [LIGHT, BIOLOGICAL], 5, 5, 0.625),
+    U.OVERLORD: (100, 0, [ARMORED, BIOLOGICAL], 0, 0, 1.0),
+    U.MINERALFIELD: (0, 0, [STRUCTURE], 0, 0, 1.125),
+    U.VESPENEGEYSER: (0, 0, [STRUCTURE], 0, 0, 1.8125),
+}
+
+
+def synthetic_data():
+    units = []
+    for t, (m, g, attrs, ground, air, _r) in TYPES.items():
+        weapons = []
+        if ground:
+            weapons.append(data_pb2.Weapon(type=data_pb2.Weapon.Ground, damage=6, attacks=1,
+                                           range=ground, speed=0.86))
+        if air:
+            weapons.append(data_pb2.Weapon(type=data_pb2.Weapon.Air, damage=6, attacks=1,
+                                           range=air, speed=0.86))
+        units.append(data_pb2.UnitTypeData(
+            unit_id=t.value, name=t.name.title(), available=True, mineral_cost=m,
+            vespene_cost=g, attributes=attrs, weapons=weapons,
+            has_minerals=t == U.MINERALFIELD, has_vespene=t == U.VESPENEGEYSER))
+    return sc_pb.ResponseData(units=units)
+
+
+def _grid(value: int, bits: bool) -> common_pb2.ImageData:
+    if bits:
+        return common_pb2.ImageData(bits_per_pixel=1, size=common_pb2.Size2DI(x=SIZE, y=SIZE),
+                                    data=bytes([255 if value else 0]) * (SIZE * SIZE // 8))
+    return common_pb2.ImageData(bits_per_pixel=8, size=common_pb2.Size2DI(x=SIZE, y=SIZE),
+                                data=bytes([value]) * (SIZE * SIZE))
+
+
+def expansion_centers():
+    """16 bases: two mirrored rows of 8 along the diagonal."""
+    ours = [(30.5, 30.5), (30.5, 62.5), (62.5, 30.5), (30.5, 96.5), (96.5, 30.5),
+            (62.5, 66.5), (30.5, 130.5), (130.5, 30.5)]
+    return ours + [(SIZE - x, SIZE - y) for x, y in ours]
+
+
+def synthetic_game_info():
+    raw = raw_pb2.StartRaw(
+        map_size=common_pb2.Size2DI(x=SIZE, y=SIZE),
+        pathing_grid=_grid(1, True), placement_grid=_grid(1, True),
+        terrain_height=_grid(128, False),
+        playable_area=common_pb2.RectangleI(p0=common_pb2.PointI(x=0, y=0),
+                                           p1=common_pb2.PointI(x=SIZE, y=SIZE)),
+        start_locations=[common_pb2.Point2D(x=SIZE - 30.5, y=SIZE - 30.5)])
+    info = sc_pb.ResponseGameInfo(
+        map_name="Synthetic", start_raw=raw,
+        player_info=[sc_pb.PlayerInfo(player_id=1, type=sc_pb.Participant,
+                                      race_requested=Race.Terran.value),
+                     sc_pb.PlayerInfo(player_id=2, type=sc_pb.Computer,
+                                      race_requested=Race.Zerg.value,
+                                      difficulty=sc_pb.VeryHard, ai_build=sc_pb.Macro)])
+    return sc_pb.Response(game_info=info)
+
+
+def synthetic_frame(seed: int = 7) -> sc_pb.ResponseObservation:
+    rng = random.Random(seed)
+    units = []
+
+    def add(t, pos, alliance, **kw):
+        r = TYPES[t][5]
+        owner = {1: 1, 4: 2}.get(alliance, 16)
+        units.append(raw_pb2.Unit(
+            display_type=raw_pb2.Visible, alliance=alliance, tag=len(units) + 1,
+            unit_type=t.value, owner=owner, radius=r, build_progress=1.0,
+            health=kw.pop("health", 100), health_max=100, is_on_screen=False,
+            pos=common_pb2.Point(x=pos[0], y=pos[1], z=12), **kw))
+
+    def near(p, spread):
+        return (p[0] + rng.uniform(-spread, spread), p[1] + rng.uniform(-spread, spread))
+
+    centers = expansion_centers()
+    mid = (SIZE / 2, SIZE / 2)
+    for cx, cy in centers:
+        # mineral arc away from the map centre, two geysers at its ends
+        away = math.atan2(cy - mid[1], cx - mid[0])
+        for k in range(8):
+            a = away + (k - 3.5) * 0.22
+            add(U.MINERALFIELD, (round(cx + 7 * math.cos(a)) + 0.0, round(cy + 7 * math.sin(a)) + 0.5),
+                3, mineral_contents=rng.choice((900, 1350, 1800)))
+        for sign in (-1, 1):
+            a = away + sign * 1.35
+            add(U.VESPENEGEYSER, (round(cx + 7 * math.cos(a)) + 0.5, round(cy + 7 * math.sin(a)) + 0.5),
+                3, vespene_contents=2250)
+
+    ours, theirs = centers[:5], centers[8:13]
+    for i, c in enumerate(ours):
+        add(U.ORBITALCOMMAND if i < 3 else U.COMMANDCENTER, c, 1, energy=60)
+        for _ in range(14):
+            add(U.SCV, near(c, 6), 1)
+        add(U.BARRACKS, (c[0] + 6, c[1] + 9), 1)
+    army_at = (ours[2][0] + 10, ours[2][1] + 12)      # our third, under attack
+    for t, n in ((U.MARINE, 60), (U.MARAUDER, 20), (U.SIEGETANK, 5), (U.SIEGETANKSIEGED, 3),
+                 (U.MEDIVAC, 6), (U.RAVEN, 2)):
+        for _ in range(n):
+            add(t, near(army_at, 9), 1, health=rng.randint(30, 100), energy=60)
+    for c in theirs:
+        add(U.HATCHERY, c, 4)
+        for _ in range(12):
+            add(U.DRONE, near(c, 6), 4)
+        add(U.SPINECRAWLER, (c[0] - 6, c[1] - 6), 4)
+        add(U.SPORECRAWLER, (c[0] - 4, c[1] + 5), 4)
+        add(U.EXTRACTOR, (c[0] + 7, c[1] - 2), 4)
+    attack_at = (army_at[0] + 16, army_at[1] + 12)
+    for t, n in ((U.ZERGLING, 60), (U.ROACH, 30), (U.HYDRALISK, 15)):
+        for _ in range(n):
+            add(t, near(attack_at, 10), 4)
+    for _ in range(20):
+        add(U.OVERLORD, (rng.uniform(20, SIZE - 20), rng.uniform(20, SIZE - 20)), 4, is_flying=True)
+
+    obs = sc_pb.Observation(
+        game_loop=int(22.4 * 60 * 12),
+        player_common=sc_pb.PlayerCommon(player_id=1, minerals=800, vespene=400,
+                                         food_used=186, food_cap=200, food_army=116,
+                                         food_workers=70),
+        raw_data=raw_pb2.ObservationRaw(units=units))
+    return sc_pb.ResponseObservation(observation=obs)
+
+
+# ----------------------------------------------------------------------------
+# Timing
+# ----------------------------------------------------------------------------
+
+def make_bot(module, data, info, frame):
+    bot = module.HanBot()
+    bot._initialize_variables()
+    bot._prepare_start(client=None, player_id=1, game_info=GameInfo(info.game_info),
+                       game_data=GameData(data))
+    bot._prepare_step(GameState(frame), info)
+    bot._prepare_first_step()
+
+    async def no_expand(*_a, **_k):
+        return None
+
+    bot.expand_now = no_expand          # the scoring is what we time, not the order
+    bot.unit_command_uses_self_do = True  # build commands, don't queue them
+    bot.can_afford = lambda *_a, **_k: True
+    return bot
+
+
+async def queries(bot):
+    update = getattr(bot, "update_world", None)
+    if update is not None:
+        update()
+    await bot.manage_army()
+    await bot.manage_mules()
+    bot.should_expand_base()
+    await bot.expand_base()
+
+
+def time_frame(module, data, info, frame, repeat):
+    with contextlib.redirect_stdout(io.StringIO()):
+        bot = make_bot(module, data, info, frame)
+    loop = asyncio.new_event_loop()
+    samples = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(repeat):
+            random.seed(0)
+            # a fresh world each step, as in a game (mineral ownership persists on the bot)
+            t = time.perf_counter()
+            loop.run_until_complete(queries(bot))
+            samples.append(time.perf_counter() - t)
+    loop.close()
+    return statistics.median(samples) * 1000, len(bot.all_units)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--obs", type=Path, help="directory recorded with HAN_RECORD_OBS")
+    parser.add_argument("--synthetic", action="store_true", help="one generated late-game frame")
+    parser.add_argument("--baseline", default=None, help="git revision of han/han.py to compare")
+    parser.add_argument("--repeat", type=int, default=30)
+    args = parser.parse_args()
+    if args.synthetic:
+        data, info, frames = synthetic_data(), synthetic_game_info(), [synthetic_frame()]
+    elif args.obs:
+        data, info, frames = recorded_frames(args.obs)
+    else:
+        parser.error("--obs DIR or --synthetic")
+
+    versions = [("current", load_han(ROOT / "han.py", "han_current"))]
+    if args.baseline:
+        versions.insert(0, (args.baseline, baseline_han(args.baseline)))
+
+    print(f"{'frame':>8} {'units':>6} " + " ".join(f"{name:>12}" for name, _ in versions)
+          + ("   speedup" if len(versions) > 1 else ""))
+    totals = [0.0] * len(versions)
+    for frame in frames:
+        row = []
+        for i, (_name, module) in enumerate(versions):
+            ms, n = time_frame(module, data, info, frame, args.repeat)
+            totals[i] += ms
+            row.append(ms)
+        t = frame.observation.game_loop / 22.4
+        line = f"{int(t // 60):>5}:{int(t % 60):02d} {n:>6} " + " ".join(f"{ms:>9.2f} ms" for ms in row)
+        if len(row) > 1:
+            line += f"   {row[0] / row[-1]:>6.1f}x"
+        print(line)
+    if len(frames) > 1:
+        print(f"{'mean':>15} " + " ".join(f"{ms / len(frames):>9.2f} ms" for ms in totals))
+
+
+if __name__ == "__main__":
+    main()
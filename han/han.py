@@ -11,7 +11,209 @@ from sc2.ids.ability_id import AbilityId
 import random
 from sc2.ids.upgrade_id import UpgradeId
 import math
+import os
+import sys
 import time
+from collections import defaultdict
+
+from sc2.units import Units
+
+# the repo-root strategy_engine (map cache, order buffer), when run from the repo
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+try:
+    from strategy_engine.orders import OrderBuffer
+except ImportError:
+    OrderBuffer = None
+
+# enemy types the attack logic never targets
+IGNORED_ENEMY_TYPES = {
+    UnitTypeId.EGG,
+    UnitTypeId.LARVA,
+    UnitTypeId.OVERLORD,
+    UnitTypeId.OVERLORDCOCOON,
+    UnitTypeId.OVERSEER,
+    UnitTypeId.OVERSEERSIEGEMODE,
+    UnitTypeId.CHANGELING,
+    UnitTypeId.CHANGELINGMARINE,
+    UnitTypeId.CHANGELINGMARINESHIELD,
+    UnitTypeId.CHANGELINGZEALOT,
+    UnitTypeId.CHANGELINGZERGLING,
+    UnitTypeId.CHANGELINGZERGLINGWINGS
+}
+WORKER_TYPES = {UnitTypeId.PROBE, UnitTypeId.SCV, UnitTypeId.DRONE}
+# structures that shoot back (plus anything with a weapon, see StepWorld)
+STATIC_DEFENSE_TYPES = {
+    # Protoss
+    UnitTypeId.PHOTONCANNON, UnitTypeId.SHIELDBATTERY,
+    # Terran
+    UnitTypeId.MISSILETURRET, UnitTypeId.BUNKER, UnitTypeId.PLANETARYFORTRESS,
+    # Zerg
+    UnitTypeId.SPINECRAWLER, UnitTypeId.SPORECRAWLER
+}
+# the early-game defense only prioritises these
+EARLY_DEFENSE_TYPES = {
+    UnitTypeId.PHOTONCANNON, UnitTypeId.SPINECRAWLER,
+    UnitTypeId.SPORECRAWLER, UnitTypeId.BUNKER,
+    UnitTypeId.PLANETARYFORTRESS
+}
+BASE_RADIUS = 30     # an enemy this close to a townhall is "at" that base
+MINERAL_RADIUS = 10  # mineral fields this close to a base belong to it
+
+
+class UnitGrid:
+    """Units hashed into square cells, so "what is within r of here" reads a few
+    cells instead of every unit."""
+
+    def __init__(self, units, cell=15):
+        self.cell = cell
+        self.cells = defaultdict(list)
+        for unit in units:
+            x, y = unit.position_tuple
+            self.cells[(int(x // cell), int(y // cell))].append(unit)
+
+    def _candidates(self, x, y, radius):
+        reach = int(math.ceil(radius / self.cell))
+        cx, cy = int(x // self.cell), int(y // self.cell)
+        for i in range(cx - reach, cx + reach + 1):
+            for j in range(cy - reach, cy + reach + 1):
+                yield from self.cells.get((i, j), ())
+
+    def within(self, position, radius):
+        """Units closer than ``radius`` to ``position`` (a unit or a point)."""
+        x, y = position.position_tuple if hasattr(position, "position_tuple") else position
+        limit = radius * radius
+        out = []
+        for unit in self._candidates(x, y, radius):
+            ux, uy = unit.position_tuple
+            if (ux - x) ** 2 + (uy - y) ** 2 < limit:
+                out.append(unit)
+        return out
+
+    def any_within(self, position, radius):
+        x, y = position.position_tuple if hasattr(position, "position_tuple") else position
+        limit = radius * radius
+        for unit in self._candidates(x, y, radius):
+            ux, uy = unit.position_tuple
+            if (ux - x) ** 2 + (uy - y) ** 2 < limit:
+                return True
+        return False
+
+
+class StepWorld:
+    """What the managers ask about the enemy and the minerals, computed once per step.
+
+    - each enemy unit/structure is bucketed by our nearest townhall (kept if
+      within BASE_RADIUS), for manage_army, should_attack and the early-game
+      defense;
+    - the attack lists (attackable units, offensive and other structures) are
+      split once and shared by execute_attack and the ravens;
+    - "threats within r of this unit" reads a UnitGrid, and the "forward" army
+      units (an enemy within 15) are found once for both medivacs and ravens;
+    - mineral fields are grouped per expansion location through
+      ``bot.mineral_owner`` (position -> expansion, filled once per field since
+      fields never move), so a step only sums contents.
+    """
+
+    def __init__(self, bot):
+        self.bot = bot
+        self.townhalls = bot.townhalls
+        enemy_units = bot.enemy_units
+        enemy_structures = bot.enemy_structures
+        self.all_enemies = enemy_units | enemy_structures
+
+        # execute_attack's target lists
+        self.attackable = enemy_units.filter(lambda u: u.type_id not in IGNORED_ENEMY_TYPES)
+        self.combat_units = enemy_units.filter(
+            lambda u: not u.is_structure and u.type_id not in WORKER_TYPES and u.type_id != UnitTypeId.MULE
+        )
+        self.offensive_structures = enemy_structures.filter(
+            lambda s: s.can_attack or s.type_id in STATIC_DEFENSE_TYPES
+        )
+        offensive_tags = self.offensive_structures.tags
+        self.other_structures = enemy_structures.filter(lambda s: s.tag not in offensive_tags)
+        self.threats = self.attackable + self.offensive_structures
+
+        self._units_at = self._bucket(enemy_units)
+        self._structures_at = self._bucket(enemy_structures)
+        self._threat_grid = None
+        self._enemy_grid = None
+        self._forward = None
+        self._minerals = None
+
+    def _bucket(self, units):
+        """{townhall tag: [units]} -- each unit under its nearest townhall within BASE_RADIUS."""
+        out = defaultdict(list)
+        if not self.townhalls:
+            return out
+        bases = [(th.tag, th.position_tuple) for th in self.townhalls]
+        limit = BASE_RADIUS ** 2
+        for unit in units:
+            x, y = unit.position_tuple
+            best_tag, best = None, limit
+            for tag, (bx, by) in bases:
+                d = (x - bx) ** 2 + (y - by) ** 2
+                if d < best:
+                    best_tag, best = tag, d
+            if best_tag is not None:
+                out[best_tag].append(unit)
+        return out
+
+    def enemies_at(self, base):
+        """Enemy units bucketed to this townhall."""
+        return Units(self._units_at.get(base.tag, []), self.bot)
+
+    def structures_at(self, base):
+        """Enemy structures bucketed to this townhall."""
+        return Units(self._structures_at.get(base.tag, []), self.bot)
+
+    def threats_near(self, unit, radius):
+        """Attackable enemy units and offensive structures closer than ``radius``."""
+        if self._threat_grid is None:
+            self._threat_grid = UnitGrid(self.threats)
+        return Units(self._threat_grid.within(unit, radius), self.bot)
+
+    def forward_units(self, military_units):
+        """Army units with an enemy (unit or structure) within 15; shared by medivacs and ravens."""
+        if self._forward is None:
+            if self._enemy_grid is None:
+                self._enemy_grid = UnitGrid(self.all_enemies)
+            grid = self._enemy_grid
+            self._forward = military_units.filter(lambda unit: grid.any_within(unit, 15))
+        return self._forward
+
+    def _mineral_groups(self):
+        if self._minerals is None:
+            bot = self.bot
+            owner = bot.mineral_owner
+            expansions = None
+            groups = defaultdict(list)
+            for mf in bot.mineral_field:
+                key = mf.position_tuple
+                if key not in owner:
+                    if expansions is None:
+                        expansions = bot.expansion_locations_list
+                    near = [loc for loc in expansions if mf.distance_to(loc) < MINERAL_RADIUS]
+                    owner[key] = min(near, key=mf.distance_to) if near else None
+                if owner[key] is not None:
+                    groups[owner[key]].append(mf)
+            self._minerals = groups
+        return self._minerals
+
+    def mineral_fields_near(self, position):
+        """Mineral fields within MINERAL_RADIUS of an expansion location (or of any
+        other position, by a direct scan)."""
+        position = position.position if hasattr(position, "position") else position
+        groups = self._mineral_groups()
+        if position in groups:
+            return Units(groups[position], self.bot)
+        if position in self.bot.expansion_locations_list:
+            return Units([], self.bot)
+        return self.bot.mineral_field.closer_than(MINERAL_RADIUS, position)
+
+    def minerals_near(self, position):
+        """Remaining minerals around a base or expansion location."""
+        return sum(mf.mineral_contents for mf in self.mineral_fields_near(position))
+
 
 class HanBot(BotAI):
     def __init__(self):
@@ -27,10 +229,43 @@ class HanBot(BotAI):
         self.worker_scout_tag = None  # Track the early game worker scout
         self.worker_scout_sent = False  # Track if we've sent the worker scout
         self.worker_scout_target = None  # Track current patrol target
+        self.world = None  # StepWorld, rebuilt at the start of every step
+        self.mineral_owner = {}  # mineral field position -> expansion location (or None)
+        self.record_dir = os.environ.get("HAN_RECORD_OBS")  # see bench_step.py
+        self.next_record_time = 0
+        self.order_buffer = OrderBuffer() if OrderBuffer is not None else None
         print(f"HanBot V2.0 initialized")
         # Any other initialization you need
     
+    def _find_expansion_locations(self):
+        # the shipped per-map cache (strategy_engine/maps.py) when the repo root
+        # is importable and has this map; python-sc2's live clustering otherwise
+        try:
+            from strategy_engine import maps
+        except ImportError:
+            maps = None
+        if maps is None or not maps.apply_expansions(self):
+            super()._find_expansion_locations()
+
+    async def _after_step(self):
+        # compact this step's orders before python-sc2 sends them (strategy_engine/orders.py)
+        if self.order_buffer is not None:
+            self.order_buffer.flush(self)
+        return await super()._after_step()
+
+    async def on_start(self):
+        if self.record_dir:
+            await self.record_start()
+
+    async def on_end(self, game_result):
+        if self.order_buffer is not None:
+            print(self.order_buffer.stats.summary())
+
     async def on_step(self, iteration):
+        self.update_world()
+        if self.record_dir and self.time >= self.next_record_time:
+            self.record_observation()
+            self.next_record_time = self.time + 10
         await self.manage_army()
         await self.build_supply_depot_if_needed()
         await self.manage_economy()
@@ -42,6 +277,27 @@ class HanBot(BotAI):
         if iteration % 15 == 0:
             await self.train_military_units()
 
+    def update_world(self):
+        self.world = StepWorld(self)
+
+    async def record_start(self):
+        """Save this game's static protos next to the observations (HAN_RECORD_OBS=dir)."""
+        from s2clientprotocol import sc2api_pb2 as sc_pb
+
+        os.makedirs(self.record_dir, exist_ok=True)
+        game_data = await self.client._execute(data=sc_pb.RequestData(
+            ability_id=True, unit_type_id=True, upgrade_id=True, buff_id=True, effect_id=True))
+        game_info = await self.client._execute(game_info=sc_pb.RequestGameInfo())
+        with open(os.path.join(self.record_dir, "game_data.bin"), "wb") as f:
+            f.write(game_data.SerializeToString())
+        with open(os.path.join(self.record_dir, "game_info.bin"), "wb") as f:
+            f.write(game_info.SerializeToString())
+
+    def record_observation(self):
+        path = os.path.join(self.record_dir, f"obs_{self.state.game_loop:06d}.bin")
+        with open(path, "wb") as f:
+            f.write(self.state.response_observation.SerializeToString())
+
     async def manage_economy(self):
         await self.distribute_workers()
         await self.manage_mules()
@@ -73,7 +329,7 @@ class HanBot(BotAI):
                 return
 
             # Find the best mineral field to drop MULE on
-            mineral_fields = self.mineral_field.closer_than(10, oc)
+            mineral_fields = self.world.mineral_fields_near(oc)
             if mineral_fields:
                 # Prioritize mineral fields with more minerals remaining
                 best_mineral = max(
@@ -136,9 +392,7 @@ class HanBot(BotAI):
         self.base_is_under_attack = False
         if self.townhalls:
             for base in self.townhalls:
-                nearby_enemies = self.enemy_units.filter(
-                    lambda unit: unit.distance_to(base) < 30
-                )
+                nearby_enemies = self.world.enemies_at(base)
                 if nearby_enemies:
                     print(f"Defending against enemies near base!")
                     self.base_is_under_attack = True
@@ -363,18 +617,9 @@ class HanBot(BotAI):
         
         th = self.start_location
 
-        # Check for both enemy units and structures
-        nearby_enemies = self.enemy_units.filter(
-            lambda unit: (
-                unit.distance_to(th) < 30 and  # Close to our base
-                not unit.is_structure and      # Not a building
-                unit.type_id not in {UnitTypeId.PROBE, UnitTypeId.SCV, UnitTypeId.DRONE}  # Not a worker
-            )
-        )
-        
-        nearby_structures = self.enemy_structures.filter(
-            lambda structure: structure.distance_to(th) < 30  # Close to our base
-        )
+        # Check for both enemy units (not workers) and structures
+        nearby_enemies = self.world.combat_units.closer_than(BASE_RADIUS, th)
+        nearby_structures = self.enemy_structures.closer_than(BASE_RADIUS, th)
         
         # If we spot enemy units or structures near our base
         if nearby_enemies or nearby_structures:
@@ -385,45 +630,20 @@ class HanBot(BotAI):
     async def handle_early_game_defense(self, military_units, tanks):
         """Handle early game defense while maintaining economy and counter-attacking."""
         for th in self.townhalls:
-            # Check for both enemy units and structures
-            nearby_enemies = self.enemy_units.filter(
-                lambda unit: (
-                    unit.distance_to(th) < 30 and
-                    not unit.is_structure and
-                    unit.type_id not in {UnitTypeId.PROBE, UnitTypeId.SCV, UnitTypeId.DRONE}
-                )
-            )
-            
-            # Separate workers from other enemy units
-            nearby_enemy_workers = self.enemy_units.filter(
-                lambda unit: (
-                    unit.distance_to(th) < 30 and
-                    unit.type_id in {UnitTypeId.PROBE, UnitTypeId.SCV, UnitTypeId.DRONE}
-                )
+            # Enemy units and structures at this base, split into workers / others
+            enemies_here = self.world.enemies_at(th)
+            nearby_enemies = enemies_here.filter(
+                lambda unit: not unit.is_structure and unit.type_id not in WORKER_TYPES
             )
-            
-            # Identify offensive structures (those that can attack)
-            offensive_structures = self.enemy_structures.filter(
-                lambda structure: (
-                    structure.distance_to(th) < 30 and
-                    structure.type_id in {
-                        UnitTypeId.PHOTONCANNON, UnitTypeId.SPINECRAWLER, 
-                        UnitTypeId.SPORECRAWLER, UnitTypeId.BUNKER,
-                        UnitTypeId.PLANETARYFORTRESS
-                    }
-                )
+            nearby_enemy_workers = enemies_here.filter(lambda unit: unit.type_id in WORKER_TYPES)
+
+            # Identify offensive structures (those that can attack) and the rest
+            structures_here = self.world.structures_at(th)
+            offensive_structures = structures_here.filter(
+                lambda structure: structure.type_id in EARLY_DEFENSE_TYPES
             )
-            
-            # Other nearby structures
-            other_structures = self.enemy_structures.filter(
-                lambda structure: (
-                    structure.distance_to(th) < 30 and
-                    structure.type_id not in {
-                        UnitTypeId.PHOTONCANNON, UnitTypeId.SPINECRAWLER, 
-                        UnitTypeId.SPORECRAWLER, UnitTypeId.BUNKER,
-                        UnitTypeId.PLANETARYFORTRESS
-                    }
-                )
+            other_structures = structures_here.filter(
+                lambda structure: structure.type_id not in EARLY_DEFENSE_TYPES
             )
             
             # If we spot any threats near our base
@@ -575,52 +795,17 @@ class HanBot(BotAI):
             if current_time - retreat_time < 10
         }
         
-        # Filter out eggs and overlords from enemy units
-        enemy_units = self.enemy_units.filter(
-            lambda unit: unit.type_id not in {
-                UnitTypeId.EGG,
-                UnitTypeId.LARVA,
-                UnitTypeId.OVERLORD,
-                UnitTypeId.OVERLORDCOCOON,
-                UnitTypeId.OVERSEER,
-                UnitTypeId.OVERSEERSIEGEMODE,
-                UnitTypeId.CHANGELING,
-                UnitTypeId.CHANGELINGMARINE,
-                UnitTypeId.CHANGELINGMARINESHIELD,
-                UnitTypeId.CHANGELINGZEALOT,
-                UnitTypeId.CHANGELINGZERGLING,
-                UnitTypeId.CHANGELINGZERGLINGWINGS
-            }
-        )
-        
-        # Identify offensive structures (those that can attack)
-        offensive_structures = self.enemy_structures.filter(
-            lambda structure: structure.can_attack or structure.type_id in {
-                # Protoss
-                UnitTypeId.PHOTONCANNON, UnitTypeId.SHIELDBATTERY,
-                # Terran
-                UnitTypeId.MISSILETURRET, UnitTypeId.BUNKER, UnitTypeId.PLANETARYFORTRESS,
-                # Zerg
-                UnitTypeId.SPINECRAWLER, UnitTypeId.SPORECRAWLER
-            }
-        )
-        
-        # Combine enemy units with offensive structures for targeting
-        enemy_threats = enemy_units + offensive_structures
-        
-        # Other enemy structures
-        other_structures = self.enemy_structures.filter(
-            lambda structure: structure not in offensive_structures
-        )
+        # Enemy units without eggs and overlords, offensive structures (those that
+        # can attack) and the rest, split once per step in StepWorld
+        enemy_units = self.world.attackable
+        other_structures = self.world.other_structures
         
         enemy_start = self.enemy_start_locations[0]
         
         # Rest of the attack logic for military units
         for unit in military_units:
             # Find nearby enemies including offensive structures
-            nearby_threats = enemy_threats.filter(
-                lambda enemy: enemy.distance_to(unit) < 15
-            )
+            nearby_threats = self.world.threats_near(unit, 15)
             
             # Check if unit is currently retreating
             if unit.tag in self.retreating_units:
@@ -664,9 +849,7 @@ class HanBot(BotAI):
         for tank in tanks:
             target = enemy_start
             # Find nearby enemies including offensive structures
-            nearby_threats = enemy_threats.filter(
-                lambda enemy: enemy.distance_to(tank) < 25
-            )
+            nearby_threats = self.world.threats_near(tank, 25)
             if nearby_threats:
                 target = nearby_threats.closest_to(tank)
             elif other_structures:
@@ -700,9 +883,7 @@ class HanBot(BotAI):
         # Handle Raven auto-turrets
         for raven in ravens:
             if raven.energy >= 50:  # Auto-Turret costs 50 energy
-                nearby_enemies = enemy_units.filter(
-                    lambda unit: unit.distance_to(raven) < 15
-                )
+                nearby_enemies = enemy_units.closer_than(15, raven)
                 
                 if nearby_enemies:
                     # Find the best position for the turret
@@ -726,8 +907,7 @@ class HanBot(BotAI):
         if not medivacs or not military_units:
             return
 
-        enemies = self.enemy_units | self.enemy_structures
-        if not enemies:
+        if not self.world.all_enemies:
             # If no enemies, follow army center as before
             center = military_units.center
             for medivac in medivacs:
@@ -736,9 +916,7 @@ class HanBot(BotAI):
             return
 
         # Get units that are close to enemies
-        forward_units = military_units.filter(
-            lambda unit: enemies.closest_to(unit).distance_to(unit) < 15
-        )
+        forward_units = self.world.forward_units(military_units)
 
         if not forward_units:
             # If no units close to enemies, follow army center
@@ -759,8 +937,7 @@ class HanBot(BotAI):
         if not ravens or not military_units:
             return
 
-        enemies = self.enemy_units | self.enemy_structures
-        if not enemies:
+        if not self.world.all_enemies:
             # If no enemies, follow army center
             center = military_units.center
             for raven in ravens:
@@ -769,9 +946,7 @@ class HanBot(BotAI):
             return
 
         # Get units that are close to enemies
-        forward_units = military_units.filter(
-            lambda unit: enemies.closest_to(unit).distance_to(unit) < 15
-        )
+        forward_units = self.world.forward_units(military_units)
 
         if not forward_units:
             # If no units close to enemies, follow army center
@@ -1082,24 +1257,15 @@ class HanBot(BotAI):
             }
         )
         
-        # Define worker unit types
-        worker_types = {
-            UnitTypeId.SCV,
-            UnitTypeId.PROBE,
-            UnitTypeId.DRONE,
-            UnitTypeId.MULE
-        }
-        
-        # Filter out workers and structures from enemy units
-        enemy_combat_units = self.enemy_units.filter(
-            lambda unit: not unit.is_structure and unit.type_id not in worker_types
-        )
+        # Enemy units without workers and structures
+        enemy_combat_units = self.world.combat_units
+        combat_tags = enemy_combat_units.tags
         
         # Check for enemies near our bases first
         if self.townhalls:
             for base in self.townhalls:
-                nearby_enemies = enemy_combat_units.filter(
-                    lambda unit: unit.distance_to(base) < 30
+                nearby_enemies = self.world.enemies_at(base).filter(
+                    lambda unit: unit.tag in combat_tags
                 )
                 if nearby_enemies:
                     # If we have a significant force near the threatened base, counter-attack
@@ -1260,11 +1426,8 @@ class HanBot(BotAI):
 
         # Check if current bases are saturated (16 workers per base is optimal)
         for th in self.townhalls.ready:
-            # Get nearby mineral fields
-            mineral_fields = self.mineral_field.closer_than(10, th)
-            
             # Skip this base if it's nearly mined out
-            total_minerals = sum(mf.mineral_contents for mf in mineral_fields)
+            total_minerals = self.world.minerals_near(th)
             if total_minerals < 2000:  # Skip bases with less than 2000 minerals remaining
                 continue
             
@@ -1301,9 +1464,8 @@ class HanBot(BotAI):
         best_score = -1
         
         for loc in available_locations:
-            # Get mineral fields near this location
-            nearby_minerals = self.mineral_field.closer_than(10, loc)
-            mineral_value = sum(mf.mineral_contents for mf in nearby_minerals)
+            # Minerals left near this location
+            mineral_value = self.world.minerals_near(loc)
             
             # Calculate distance from our main base
             distance_to_main = loc.distance_to(self.start_location)
@@ -0,0 +1,62 @@
+"""Print HydraBot's per-opponent opening bandit (hydra/bot/bandit.py).
+
+    python harness/bandit_report.py                      # hydra/data/strategy_bandit.json
+    python harness/bandit_report.py --state path/to/strategy_bandit.json
+    python harness/bandit_report.py --opponent Bot_Stardust
+
+One table per opponent: games and posterior win rate per starting strategy, and
+P(best) -- the share of posterior draws it wins, i.e. how often the next game
+against that opponent would open with it. Ladder opponent UUIDs are resolved to
+names through opponent_intel. Pull the ladder's data dir down first to report on
+ladder learning; locally, gauntlet/versus games update hydra/data directly.
+"""
+import argparse
+import json
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+sys.path.insert(0, str(REPO_ROOT / "hydra"))
+
+from bot.bandit import summarize  # noqa: E402
+
+DEFAULT_STATE = REPO_ROOT / "hydra" / "data" / "strategy_bandit.json"
+
+
+def opponent_label(key: str) -> str:
+    try:
+        from opponent_intel import resolve
+        entry = resolve(key)
+    except Exception:  # noqa: BLE001 - labels are cosmetic
+        entry = None
+    return f"{entry['name']} ({key})" if entry and entry.get("name") != key else key
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--state", type=Path, default=DEFAULT_STATE)
+    parser.add_argument("--opponent", default=None, help="only this opponent id/name")
+    parser.add_argument("--samples", type=int, default=2000)
+    args = parser.parse_args()
+
+    try:
+        state = json.loads(args.state.read_text())
+    except (OSError, ValueError) as exc:
+        sys.exit(f"no bandit state at {args.state} ({exc})")
+
+    table = summarize(state, samples=args.samples)
+    print(f"=== HydraBot opening bandit: {state.get('games', 0)} games, "
+          f"{len(table)} opponents ({args.state}) ===")
+    for opponent, rows in table.items():
+        if args.opponent and args.opponent.lower() not in opponent_label(opponent).lower():
+            continue
+        games = sum(r[1] for r in rows)
+        print(f"\n{opponent_label(opponent)}  [{games} games]")
+        print(f"  {'strategy':<20} {'games':>5} {'win%':>6} {'P(best)':>8}")
+        for arm, n, mean, p_best in rows:
+            print(f"  {arm:<20} {n:>5} {mean:>6.0%} {p_best:>8.0%}")
+
+
+if __name__ == "__main__":
+    main()
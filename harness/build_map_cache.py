@@ -0,0 +1,159 @@
+"""Build the per-map analysis cache (strategy_engine/data/maps/) offline.
+
+The bots load it at game start instead of recomputing expansions, ramps, walls
+and scout routes (see strategy_engine/maps.py). This script plays one short game
+per map (headless, against a VeryEasy AI) with a bot that does nothing but
+compute the analysis for *every* start location on the map, write it, and
+leave.
+
+    python harness/build_map_cache.py                      # every map in map_pool.txt
+    python harness/build_map_cache.py --maps PylonAIE,TorchesAIE
+    python harness/build_map_cache.py --check              # list cached maps/spawns
+
+Re-run it whenever map_pool.txt gains a map or a map is re-published. A
+variant whose size or start locations no longer match is simply never used.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+sys.path.insert(0, str(REPO_ROOT / "harness"))
+
+from strategy_engine import maps as map_cache  # noqa: E402
+
+
+def _xy(p):
+    return None if p is None else [float(p.x), float(p.y)]
+
+
+def _main_ramp(bot, start):
+    """python-sc2's ``main_base_ramp`` rule, for any start location."""
+    ramps = bot.game_info.map_ramps
+    for sizes in ({2, 5}, {4, 9}):
+        cands = [r for r in ramps if len(r.upper) in sizes]
+        if cands:
+            return min(cands, key=lambda r: start.distance_to(r.top_center))
+    return None
+
+
+def make_bot():
+    from sc2.bot_ai import BotAI
+
+    class MapCacheBot(BotAI):
+        written: str = ""
+
+        async def ground_order(self, origin, targets):
+            """``targets`` sorted by ground distance from ``origin``
+            (straight-line for anything the pathing query can't reach)."""
+            center = self.game_info.map_center
+            src = origin.towards(center, 5)    # step off the townhall footprint
+            dists = await self.client.query_pathings([[src, t.towards(center, 4)] for t in targets])
+            return [t for _d, t in sorted(
+                zip(dists, targets),
+                key=lambda x: (x[0] if x[0] else 1e6 + origin.distance_to(x[1]),
+                               x[1].x, x[1].y))]
+
+        async def on_start(self):
+            gi = self.game_info
+            starts = [self.start_location] + list(self.enemy_start_locations)
+            exps = list(self.expansion_locations_list)
+            resources = self._resource_location_to_expansion_position_dict
+            variant = {
+                "size": [gi.map_size[0], gi.map_size[1]],
+                "expansions": [
+                    {"pos": _xy(e),
+                     "resources": sorted(_xy(r) for r, owners in resources.items() if e in owners)}
+                    for e in sorted(exps, key=lambda p: (p.x, p.y))],
+                "spawns": [],
+            }
+            for start in starts:
+                ordered = await self.ground_order(start, exps)
+                enemy = min((s for s in starts if s != start),
+                            key=lambda s: start.distance_to(s), default=None)
+                route = []
+                if enemy is not None:
+                    theirs = await self.ground_order(enemy, exps)
+                    route = [enemy] + [e for e in theirs if e.distance_to(enemy) > 6]
+                spawn = {"start": _xy(start), "expansions": [_xy(e) for e in ordered],
+                         "scout_route": [_xy(p) for p in route]}
+                ramp = _main_ramp(self, start)
+                if ramp is not None:
+                    # the wall helpers measure from player_start_location
+                    saved = gi.player_start_location
+                    gi.player_start_location = start
+                    try:
+                        spawn.update(
+                            ramp_top=_xy(ramp.top_center), ramp_bottom=_xy(ramp.bottom_center),
+                            wall_pylon=_xy(ramp.protoss_wall_pylon),
+                            # same order the bots' live _wall_layout uses
+                            wall_buildings=[_xy(p) for p in sorted(
+                                ramp.protoss_wall_buildings,
+                                key=lambda p: (round(p.x), round(p.y)))],
+                            wall_warpin=_xy(ramp.protoss_wall_warpin),
+                            depots=sorted(_xy(p) for p in ramp.corner_depots),
+                            barracks=_xy(ramp.barracks_correct_placement))
+                    except Exception as exc:  # noqa: BLE001 - odd ramps: keep the rest
+                        print(f"  {gi.map_name} {start}: no wall ({exc})")
+                    finally:
+                        gi.player_start_location = saved
+                variant["spawns"].append(spawn)
+            MapCacheBot.written = map_cache.save_variant(gi.map_name, variant)
+            await self.client.leave()
+
+        async def on_step(self, iteration):
+            pass
+
+    return MapCacheBot
+
+
+def build(map_name: str) -> str:
+    from sc2 import maps
+    from sc2.data import Difficulty, Race
+    from sc2.main import run_game
+    from sc2.player import Bot, Computer
+
+    bot_cls = make_bot()
+    run_game(maps.get(map_name),
+             [Bot(Race.Protoss, bot_cls()), Computer(Race.Zerg, Difficulty.VeryEasy)],
+             realtime=False)
+    return bot_cls.written
+
+
+def check() -> None:
+    files = sorted(Path(map_cache.MAP_DIR).glob("*.json"))
+    if not files:
+        sys.exit(f"no cached maps in {map_cache.MAP_DIR}")
+    for path in files:
+        for info in map_cache.load(path.stem):
+            walls = sum(1 for s in info.spawns.values() if s.protoss_wall[0])
+            print(f"{info.name:<24} {info.size[0]}x{info.size[1]} "
+                  f"{len(info.expansions):>2} expansions, {len(info.spawns)} spawns "
+                  f"({walls} with a wall)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--maps", default=None, help="comma-separated, default: map_pool.txt")
+    parser.add_argument("--check", action="store_true", help="list the cache and exit")
+    args = parser.parse_args()
+    if args.check:
+        check()
+        return
+    pool = REPO_ROOT / "harness" / "map_pool.txt"
+    names = args.maps.split(",") if args.maps else pool.read_text().split()
+    failed = []
+    for name in names:
+        try:
+            print(f"{name}: {build(name) or 'nothing written'}")
+        except Exception as exc:  # noqa: BLE001 - one bad map must not stop the rest
+            failed.append(name)
+            print(f"{name}: failed ({type(exc).__name__}: {exc})")
+    if failed:
+        sys.exit(f"{len(failed)} map(s) failed: {', '.join(failed)}")
+
+
+if __name__ == "__main__":
+    main()
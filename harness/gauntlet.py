@@ -89,7 +89,9 @@ def build_matchups(args) -> list[dict]:
     ]
 
 
-def play(matchup: dict, wall_timeout: int) -> dict:
+def play(matchup: dict, wall_timeout: int, env: dict | None = None) -> dict:
+    """Play one matchup in a play_one.py subprocess; ``env`` adds variables
+    (e.g. parameter overrides) to the game's environment."""
     with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as tf:
         result_file = tf.name
     cmd = [
@@ -104,7 +106,8 @@ def play(matchup: dict, wall_timeout: int) -> dict:
     record = dict(matchup)
     try:
         proc = subprocess.run(
-            cmd, capture_output=True, text=True, timeout=wall_timeout
+            cmd, capture_output=True, text=True, timeout=wall_timeout,
+            env={**environ, **env} if env else None,
         )
         payload = Path(result_file).read_text().strip()
         if payload:
@@ -52,6 +52,14 @@ _game_stats: dict = {}
 
 
 class HarnessBot(BotClass):
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        # request sizes for the result file; off on the ladder (it costs a
+        # serialization per step)
+        orders = getattr(self, "order_buffer", None)
+        if orders is not None:
+            orders.measure_bytes = True
+
     async def on_end(self, game_result) -> None:
         _game_stats["game_time"] = round(self.time, 1)
         _game_stats["workers"] = self.workers.amount
@@ -59,6 +67,18 @@ class HarnessBot(BotClass):
         _game_stats["army_supply"] = round(
             self.supply_used - self.supply_workers, 1
         )
+        # value traded, for harness/tune.py's efficiency tiebreak
+        score = self.state.score
+        _game_stats["killed_value"] = float(
+            (score.killed_value_units or 0) + (score.killed_value_structures or 0)
+        )
+        _game_stats["lost_value"] = float(
+            (score.lost_minerals_army or 0) + (score.lost_vespene_army or 0)
+        )
+        # strategy_engine/orders.py: actions and bytes per step
+        orders = getattr(self, "order_buffer", None)
+        if orders is not None:
+            _game_stats["orders"] = orders.stats.as_dict()
         await super(HarnessBot, self).on_end(game_result)
 
 
@@ -0,0 +1,290 @@
+"""Offline parallel parameter search: CEM batches played through the gauntlet.
+
+The in-bot Tuner (phoenix/bot/tuning.py) learns one game at a time. This
+driver runs the same diagonal-Gaussian CEM from the harness side: each
+generation draws `--batch` parameter samples per matchup, plays them all in
+parallel (gauntlet.play, one SC2 instance per game) with the sample injected
+through the bot's override hook, scores every game lexicographically
+(outcome, then log killed/lost value) and moves each matchup's distribution
+toward its elite half.
+
+Parameter surfaces:
+- phoenix: the Tuner SCHEMA, injected as PHOENIX_PARAM_OVERRIDE with the
+  in-bot Tuner off (PHOENIX_TUNER=0; untuned knobs play the SCHEMA defaults);
+- hydra: the numeric knobs of one zerg_strategies.yml profile (`--strategy`),
+  injected as HYDRA_PARAM_OVERRIDE with the profile forced and locked
+  (HYDRA_STRATEGY / HYDRA_LOCK) and the opening bandit off.
+
+Every finished game is checkpointed to <bot>/results/tune_<name>.json (drawn
+samples are written before they are played), so an interrupted search resumes
+by replaying only the games it has no result for. Tuning games do not go to
+the history.jsonl scoreboard: their parameters are not the bot's.
+
+    python harness/tune.py --bot phoenix --batch 8 --concurrency 8 --generations 5
+    python harness/tune.py --bot hydra --strategy RoachTiming --races zerg,terran
+    python harness/tune.py --bot hydra --strategy RoachTiming --knobs attack_supply,max_drones
+    python harness/tune.py --bot hydra --strategy RoachTiming --report
+"""
+
+import argparse
+import importlib.util
+import json
+import math
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+import yaml
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+import gauntlet  # noqa: E402
+
+REPO_ROOT = gauntlet.REPO_ROOT
+CHECKPOINT_VERSION = 1
+
+# phoenix's Tuner is plain Python; load it by path so its `bot` package never
+# shadows another bot's (it needs strategy_engine from the repo root)
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+_spec = importlib.util.spec_from_file_location(
+    "phoenix_tuning", REPO_ROOT / "phoenix" / "bot" / "tuning.py")
+tuning = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(tuning)
+
+HYDRA_LIBRARY = REPO_ROOT / "hydra" / "zerg_strategies.yml"
+# hydra profile knob -> (StrategyProfile default, initial scale, lo, hi, integer)
+HYDRA_KNOBS = {
+    "drones_per_base": (20, 3.0, 12, 24, True),
+    "max_drones": (66, 8.0, 16, 85, True),
+    "queens_per_base": (1, 0.7, 1, 3, True),
+    "gas_per_base": (2, 0.5, 0, 2, True),
+    "expand_to": (3, 1.0, 1, 5, True),
+    "spines_per_base": (0.0, 0.5, 0.0, 3.0, False),
+    "spores_per_base": (0.0, 0.5, 0.0, 2.0, False),
+    "attack_supply": (40.0, 8.0, 4.0, 150.0, False),
+    "regroup_supply": (10.0, 4.0, 0.0, 60.0, False),
+}
+
+
+def search_space(args) -> list[dict]:
+    """[{name, mean, scale, lo, hi, integer}] for the chosen bot."""
+    if args.bot == "phoenix":
+        space = [dict(name=p.name, mean=p.mean, scale=p.scale, lo=p.lo, hi=p.hi,
+                      integer=False) for p in tuning.SCHEMA]
+    else:
+        profiles = yaml.safe_load(HYDRA_LIBRARY.read_text())["strategies"]
+        if args.strategy not in profiles:
+            sys.exit(f"--strategy must be one of {', '.join(profiles)}")
+        profile = profiles[args.strategy]
+        space = []
+        for name, (default, scale, lo, hi, integer) in HYDRA_KNOBS.items():
+            mean = min(hi, max(lo, float(profile.get(name, default))))
+            space.append(dict(name=name, mean=mean, scale=scale, lo=lo, hi=hi,
+                              integer=integer))
+    if args.knobs:
+        wanted = args.knobs.split(",")
+        unknown = set(wanted) - {p["name"] for p in space}
+        if unknown:
+            sys.exit(f"unknown knob(s) {sorted(unknown)}")
+        space = [p for p in space if p["name"] in wanted]
+    return space
+
+
+def override_env(args, sample: dict) -> dict:
+    """Environment that makes the game play ``sample``."""
+    if args.bot == "phoenix":
+        # the in-bot Tuner off, so harness samples never reach tuning.json
+        return {"PHOENIX_PARAM_OVERRIDE": json.dumps(sample), "PHOENIX_TUNER": "0"}
+    return {
+        "HYDRA_PARAM_OVERRIDE": json.dumps({args.strategy: sample}),
+        "HYDRA_STRATEGY": args.strategy,
+        "HYDRA_LOCK": "1",
+        "HYDRA_BANDIT": "0",
+    }
+
+
+# --------------------------------------------------------------------------- #
+# checkpoint
+# --------------------------------------------------------------------------- #
+def checkpoint_path(args) -> Path:
+    name = args.bot if args.bot == "phoenix" else f"hydra_{args.strategy}"
+    return REPO_ROOT / args.bot / "results" / f"tune_{name}.json"
+
+
+def load_checkpoint(path: Path, space: list[dict], matchups: list[str]) -> dict:
+    try:
+        state = json.loads(path.read_text())
+    except (OSError, ValueError):
+        state = {}
+    if state.get("version") != CHECKPOINT_VERSION or state.get("knobs") != [
+            p["name"] for p in space]:
+        state = {"version": CHECKPOINT_VERSION, "knobs": [p["name"] for p in space],
+                 "matchups": {}}
+    for key in matchups:
+        state["matchups"].setdefault(key, {
+            "params": {p["name"]: {"mean": p["mean"], "scale": p["scale"]} for p in space},
+            "start": {p["name"]: p["mean"] for p in space},
+            "batch": [],        # this generation: {"sample", "result"?, "outcome"?, "eff"?}
+            "generations": [],  # finished: {"mean", "win_rate", "games"}
+        })
+    return state
+
+
+def save_checkpoint(path: Path, state: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=str(path.parent), suffix=".tmp")
+    with os.fdopen(fd, "w") as f:
+        json.dump(state, f, indent=1)
+    os.replace(tmp, path)
+
+
+# --------------------------------------------------------------------------- #
+# CEM (same update as the in-bot Tuner)
+# --------------------------------------------------------------------------- #
+def draw(space: list[dict], params: dict, rng: random.Random) -> dict:
+    sample = {}
+    for p in space:
+        entry = params[p["name"]]
+        value = min(p["hi"], max(p["lo"], rng.gauss(entry["mean"], entry["scale"])))
+        sample[p["name"]] = round(value) if p["integer"] else round(value, 3)
+    return sample
+
+
+def update(space: list[dict], m: dict) -> None:
+    done = [b for b in m["batch"] if "outcome" in b]
+    done.sort(key=lambda b: (b["outcome"], b["eff"]), reverse=True)
+    elites = done[: max(2, int(len(done) * tuning.ELITE_FRAC))]
+    for p in space:
+        values = [e["sample"][p["name"]] for e in elites]
+        mean = sum(values) / len(values)
+        var = sum((v - mean) ** 2 for v in values) / len(values)
+        m["params"][p["name"]] = {
+            "mean": mean,
+            "scale": max(p["scale"] * tuning.MIN_SCALE_FRAC, math.sqrt(var)),
+        }
+    m["generations"].append({
+        "mean": {k: round(v["mean"], 2) for k, v in m["params"].items()},
+        "win_rate": sum(b["outcome"] for b in done) / len(done),
+        "games": len(done),
+    })
+    m["batch"] = []
+
+
+def score(record: dict) -> tuple[float, float]:
+    result = record.get("result")
+    outcome = 1.0 if result == gauntlet.WIN else (0.5 if result == gauntlet.TIE else 0.0)
+    eff = (math.log1p(max(0.0, record.get("killed_value", 0.0)))
+           - math.log1p(max(0.0, record.get("lost_value", 0.0))))
+    return outcome, eff
+
+
+# --------------------------------------------------------------------------- #
+# driver
+# --------------------------------------------------------------------------- #
+def run(args, space: list[dict], state: dict, path: Path) -> None:
+    rng = random.Random(args.seed)
+    maps_pool = args.maps.split(",") if args.maps else gauntlet.available_maps()
+    if not maps_pool:
+        sys.exit("No maps found - run scripts/setup_env.sh first")
+    lock = threading.Lock()
+
+    while True:
+        jobs = []
+        for key, m in state["matchups"].items():
+            if len(m["generations"]) >= args.generations:
+                continue
+            while len(m["batch"]) < args.batch:
+                m["batch"].append({"sample": draw(space, m["params"], rng)})
+            race, difficulty = key.split("/")
+            jobs += [(key, entry, {"bot": args.bot, "race": race, "difficulty": difficulty,
+                                   "map": rng.choice(maps_pool)})
+                     for entry in m["batch"] if "outcome" not in entry]
+        if not jobs:
+            break
+        save_checkpoint(path, state)
+        gen = min(len(m["generations"]) for m in state["matchups"].values()) + 1
+        print(f"generation {gen}: {len(jobs)} games, concurrency {args.concurrency}")
+
+        errors = 0
+        start = time.time()
+        with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+            futures = {pool.submit(gauntlet.play, matchup, args.wall_timeout,
+                                   override_env(args, entry["sample"])): (key, entry)
+                       for key, entry, matchup in jobs}
+            for future in as_completed(futures):
+                key, entry = futures[future]
+                record = future.result()
+                with lock:
+                    if record.get("result") == "Error":
+                        errors += 1
+                        # redrawn next round: a crash says nothing about the sample
+                        state["matchups"][key]["batch"].remove(entry)
+                        print(f"  {key}: Error {record.get('error', '?')[:160]}")
+                    else:
+                        entry["result"] = record.get("result")
+                        entry["outcome"], entry["eff"] = score(record)
+                        entry["map"] = record.get("map")
+                        print(f"  {key}: {entry['result']:<8} eff {entry['eff']:+.2f} "
+                              f"{entry['sample']}")
+                    save_checkpoint(path, state)
+        print(f"  wall time {time.time() - start:.0f}s")
+        if errors == len(jobs):
+            sys.exit("every game in the round failed; see the errors above")
+
+        for m in state["matchups"].values():
+            if len(m["batch"]) >= args.batch and all("outcome" in b for b in m["batch"]):
+                update(space, m)
+        save_checkpoint(path, state)
+
+
+def report(state: dict, path: Path) -> None:
+    print(f"=== parameter search ({path.relative_to(REPO_ROOT)}) ===")
+    for key, m in state["matchups"].items():
+        gens = m["generations"]
+        games = sum(g["games"] for g in gens)
+        trend = " ".join(f"{g['win_rate']:.0%}" for g in gens) or "-"
+        print(f"\n{key}: {len(gens)} generations, {games} games; "
+              f"win rate by generation: {trend}")
+        print(f"  {'knob':<28} {'start':>8} {'best':>8} {'scale':>7}")
+        for name, entry in m["params"].items():
+            print(f"  {name:<28} {m['start'][name]:>8.2f} {entry['mean']:>8.2f} "
+                  f"{entry['scale']:>7.2f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--bot", default="phoenix", choices=["phoenix", "hydra"])
+    parser.add_argument("--strategy", default="MacroRoachHydra",
+                        help="hydra: zerg_strategies.yml profile to tune")
+    parser.add_argument("--knobs", default=None, help="comma-separated subset to tune")
+    parser.add_argument("--batch", type=int, default=tuning.BATCH_SIZE,
+                        help="samples per matchup per generation")
+    parser.add_argument("--generations", type=int, default=5,
+                        help="total generations per matchup (resume counts earlier ones)")
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--races", default="zerg,terran,protoss")
+    parser.add_argument("--difficulties", default="CheatVision")
+    parser.add_argument("--maps", default=None, help="comma-separated, default: all installed")
+    parser.add_argument("--wall-timeout", type=int, default=1800)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--report", action="store_true",
+                        help="print the checkpoint's best parameters per matchup and exit")
+    args = parser.parse_args()
+
+    space = search_space(args)
+    matchups = [f"{r}/{d}" for r in args.races.split(",")
+                for d in args.difficulties.split(",")]
+    path = checkpoint_path(args)
+    state = load_checkpoint(path, space, [] if args.report else matchups)
+    if not args.report:
+        run(args, space, state, path)
+    report(state, path)
+
+
+if __name__ == "__main__":
+    main()
@@ -320,6 +320,10 @@ async def run_match(opponent: dict, map_name: str, timeout: int) -> dict:
                 # contain e.g. "EngagementResult.VICTORY_EMPHATIC"
                 m = re.search(r"\bResult\.(Victory|Defeat|Tie)\b", text)
                 record["result"] = m.group(1) if m else "Unknown"
+                # HydraBot's on_end: "(opened <strategy>, final strategy ...)"
+                m = re.search(r"\(opened (\w+)", text)
+                if m:
+                    record["strategy"] = m.group(1)
                 if record["result"] == "Unknown" and ours.returncode != 0:
                     record["result"] = "Error"
                     record["error"] = text[-800:]
@@ -433,6 +437,14 @@ def main() -> None:
               f"on {map_name} ({record['wall_seconds']}s wall)")
         if record.get("error"):
             print("    error:", record["error"][:300])
+        # fold the game into opponent_intel's learned overlay
+        try:
+            if str(REPO_ROOT) not in sys.path:
+                sys.path.insert(0, str(REPO_ROOT))
+            from opponent_intel import learn
+            learn.update()
+        except Exception as exc:  # noqa: BLE001 - learning must not stop the run
+            print(f"    opponent_intel/learn.py: {exc}")
 
 
 if __name__ == "__main__":
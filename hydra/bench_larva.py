@@ -0,0 +1,182 @@
+"""Compare the larva allocator (bot/larva.py) with the old greedy split, offline.
+
+    python hydra/bench_larva.py                       # synthetic starts from the library
+    python hydra/bench_larva.py --states larva.jsonl  # starts recorded by the bot
+    python hydra/bench_larva.py --seconds 120 --horizon 30
+
+Each start state is rolled forward ``--seconds`` of game time under both policies
+by a coarse Zerg economy model (income per drone and extractor, larva per
+hatchery + injects, egg and Overlord build times, supply held by eggs), calling
+the policy every 0.5s like the bot's step loop. Per policy it reports:
+
+  - idle larva: larva-seconds left unspent after the policy ran;
+  - supply blocked: seconds with larva and money but no supply for the plan;
+  - floated: mean unspent minerals + gas;
+  - army supply / drones at the end, and the policy's mean cost per call.
+
+Record start states from real games with ``HYDRA_RECORD_LARVA=larva.jsonl``
+(HydraBot appends its ``LarvaState`` every ~5s of game time).
+"""
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT.parent))
+
+from sc2.ids.unit_typeid import UnitTypeId as U
+
+from bot import zerg_data as zd
+from bot.larva import INJECT_PERIOD, LARVA_PERIOD, LarvaState, allocate, greedy_split
+from bot.strategies import load_library
+
+DT = 0.5
+BUILD_TIME = {U.DRONE: 12, U.OVERLORD: 18, U.ZERGLING: 17, U.ROACH: 19,
+              U.HYDRALISK: 24, U.MUTALISK: 24, U.CORRUPTOR: 29, U.INFESTOR: 36,
+              U.ULTRALISK: 39}
+MINERALS_PER_DRONE = 0.93     # per second, up to 16 drones per base
+GAS_PER_EXTRACTOR = 2.7       # per second with 3 drones
+
+
+def synthetic_starts():
+    """A start per library profile at 3, 6 and 9 minutes (drones, bases, bank)."""
+    out = []
+    for profile in load_library().values():
+        weights = {u: w for u, w in profile.army.items() if not zd.UNITS[u].morph_from}
+        weights = weights or {U.ZERGLING: 1.0}
+        for minute, drones, bases, bank in ((3, 28, 2, 150), (6, 44, 3, 400), (9, 60, 3, 900)):
+            bases = min(bases, profile.expand_to)
+            drones = min(drones, profile.max_drones)
+            target = min(profile.max_drones, profile.drones_per_base * bases)
+            army = {u: (6 * minute) // len(weights) for u in weights}
+            used = drones + sum(n * zd.larva_cost(u)[2] for u, n in army.items())
+            cap = min(200, (int(used) // 8 + 2) * 8)
+            out.append(dict(
+                label=f"{profile.name}@{minute}m",
+                state=LarvaState(
+                    larva=3 * bases, minerals=bank, gas=bank / 3, supply_left=cap - used,
+                    supply_cap=cap, overlords_pending=0, income_minerals=0, income_gas=0,
+                    hatcheries=bases, drones_wanted=max(0, target - drones),
+                    econ_share=0.7 if drones < target else 0.15,
+                    army_weights=weights, army_counts=army),
+                drones=drones, target=target))
+    return out
+
+
+def recorded_starts(path):
+    out = []
+    for i, line in enumerate(Path(path).read_text().splitlines()):
+        if not line.strip():
+            continue
+        d = json.loads(line)
+        st = LarvaState.from_json(d)
+        drones = max(12, int(st.income_minerals / MINERALS_PER_DRONE))
+        out.append(dict(label=f"rec{i}@{d.get('t', 0):.0f}s", state=st, drones=drones,
+                        target=drones + max(0, st.drones_wanted)))
+    return out
+
+
+def simulate(start, policy, seconds, horizon):
+    st0 = start["state"]
+    bases, drones, target = st0.hatcheries, start["drones"], start["target"]
+    m, g, larva = st0.minerals, st0.gas, st0.larva
+    cap, used = st0.supply_cap, st0.supply_cap - st0.supply_left
+    army = dict(st0.army_counts)
+    eggs = []                       # (done_at, unit, n)
+    larva_clock = inject_clock = 0.0
+    idle = blocked = floated = cost_us = 0.0
+    calls = 0
+    t = 0.0
+    while t < seconds:
+        # income and larva
+        extractors = min(2 * bases, drones // 16)
+        mining = min(drones - 3 * extractors, 16 * bases)
+        m += mining * MINERALS_PER_DRONE * DT
+        g += extractors * GAS_PER_EXTRACTOR * DT
+        larva_clock += DT
+        inject_clock += DT
+        if larva_clock >= LARVA_PERIOD:
+            larva_clock = 0.0
+            larva = min(larva + bases, max(larva, 3 * bases))
+        if inject_clock >= INJECT_PERIOD:
+            inject_clock = 0.0
+            larva += 3 * bases
+        # hatch finished eggs
+        for egg in [e for e in eggs if e[0] <= t]:
+            eggs.remove(egg)
+            _, unit, n = egg
+            if unit == U.OVERLORD:
+                cap = min(200, cap + zd.OVERLORD_SUPPLY)
+            elif unit == U.DRONE:
+                drones += n
+            else:
+                army[unit] = army.get(unit, 0) + n
+        pending_ol = sum(1 for e in eggs if e[1] == U.OVERLORD)
+        pending_dr = sum(1 for e in eggs if e[1] == U.DRONE)
+        st = LarvaState(
+            larva=larva, minerals=m, gas=g, supply_left=cap - used, supply_cap=cap,
+            overlords_pending=pending_ol,
+            income_minerals=mining * MINERALS_PER_DRONE,
+            income_gas=extractors * GAS_PER_EXTRACTOR, hatcheries=bases,
+            drones_wanted=target - drones - pending_dr,
+            econ_share=st0.econ_share if drones < target else 0.0,
+            army_weights=st0.army_weights, army_counts=army)
+        t0 = time.perf_counter()
+        spend = policy(st, horizon)
+        cost_us += (time.perf_counter() - t0) * 1e6
+        calls += 1
+        for unit, n in spend.items():
+            cm, cg, cs = zd.larva_cost(unit)
+            m, g, used, larva = m - cm * n, g - cg * n, used + cs * n, larva - n
+            eggs.append((t + BUILD_TIME.get(unit, 20), unit, zd.LARVA_YIELD.get(unit, 1) * n))
+        # metrics (after the policy acted)
+        idle += larva * DT
+        floated += (m + g) * DT
+        cheapest = min((zd.larva_cost(u) for u in st0.army_weights), default=(50, 0, 1))
+        if (larva and cap < 200 and cap - used < cheapest[2]
+                and m >= cheapest[0] and g >= cheapest[1]):
+            blocked += DT
+        t += DT
+    army_supply = sum(zd.UNITS[u].supply * n for u, n in army.items())
+    return dict(idle=idle, blocked=blocked, floated=floated / seconds,
+                army=army_supply, drones=drones, us=cost_us / max(1, calls))
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--states", help="JSONL of recorded LarvaState (HYDRA_RECORD_LARVA)")
+    ap.add_argument("--seconds", type=float, default=90.0)
+    ap.add_argument("--horizon", type=float, default=20.0)
+    ap.add_argument("--verbose", action="store_true", help="one line per start state")
+    args = ap.parse_args()
+
+    starts = recorded_starts(args.states) if args.states else synthetic_starts()
+    policies = {"greedy": lambda st, h: greedy_split(st),
+                "knapsack": lambda st, h: allocate(st, h)}
+    totals = {name: dict(idle=0.0, blocked=0.0, floated=0.0, army=0.0, drones=0.0, us=0.0)
+              for name in policies}
+    for start in starts:
+        row = []
+        for name, policy in policies.items():
+            r = simulate(start, policy, args.seconds, args.horizon)
+            for k, v in r.items():
+                totals[name][k] += v / len(starts)
+            row.append(f"{name} idle={r['idle']:5.0f} blk={r['blocked']:4.0f}s "
+                       f"float={r['floated']:5.0f}")
+        if args.verbose:
+            print(f"{start['label']:<28} " + " | ".join(row))
+
+    print(f"{len(starts)} start states x {args.seconds:.0f}s, horizon {args.horizon:.0f}s "
+          f"(means per start)")
+    print(f"{'policy':<10} {'idle larva-s':>12} {'blocked s':>10} {'floated':>8} "
+          f"{'army sup':>9} {'drones':>7} {'us/call':>8}")
+    for name, r in totals.items():
+        print(f"{name:<10} {r['idle']:12.0f} {r['blocked']:10.1f} {r['floated']:8.0f} "
+              f"{r['army']:9.1f} {r['drones']:7.1f} {r['us']:8.1f}")
+
+
+if __name__ == "__main__":
+    main()
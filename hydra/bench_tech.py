@@ -0,0 +1,94 @@
+"""Check and time zerg_data's precompiled tech-tree index against the tree walk.
+
+    python hydra/bench_tech.py            # equivalence check + microbenchmark
+    python hydra/bench_tech.py --n 50000
+
+Equivalence: for every ordered pair of roster units and every strategy's
+``army_units`` (plus the planner's Overseer/Hydralisk/Zergling additions),
+``all_prerequisite_structures`` / ``tier_required`` must match the reference DFS
+(``_walk_prerequisites`` / ``_walk_tier``) exactly, order included. Then both are
+timed on the tech lists the planner actually resolves each step.
+"""
+import argparse
+import itertools
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT.parent))
+
+from sc2.ids.unit_typeid import UnitTypeId as U
+
+from bot import zerg_data as zd
+from bot.strategies import load_library
+
+
+def cases():
+    units = list(zd.UNITS)
+    out = [[]] + [[u] for u in units] + [list(p) for p in itertools.permutations(units, 2)]
+    for profile in load_library().values():
+        tech = list(profile.army_units)
+        out.append(tech)
+        for extra in (U.OVERSEER, U.HYDRALISK, U.ZERGLING):
+            out.append(tech + [extra])
+        out.append(tech + [U.OVERSEER, U.HYDRALISK, U.RAVAGER, U.CORRUPTOR, U.ZERGLING])
+    return out
+
+
+def check(all_cases):
+    bad = 0
+    for tech in all_cases:
+        if zd.all_prerequisite_structures(tech) != zd._walk_prerequisites(tech):
+            print(f"MISMATCH order {tech}")
+            bad += 1
+        if zd.tier_required(tech) != zd._walk_tier(tech):
+            print(f"MISMATCH tier  {tech}")
+            bad += 1
+        want = frozenset(zd._walk_prerequisites(tech))
+        if zd.resolve(frozenset(tech)).structures != want:
+            print(f"MISMATCH set   {tech}")
+            bad += 1
+    return bad
+
+
+def bench(label, fn, techs, n):
+    t0 = time.perf_counter()
+    for i in range(n):
+        fn(techs[i % len(techs)])
+    us = (time.perf_counter() - t0) / n * 1e6
+    print(f"  {label:<10} {us:7.2f} us/plan")
+    return us
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--n", type=int, default=20000)
+    args = ap.parse_args()
+
+    all_cases = cases()
+    bad = check(all_cases)
+    print(f"equivalence: {len(all_cases)} tech lists, {bad} mismatches")
+
+    # What Planner.plan resolves per step: the profile's tech (+ extras).
+    techs = [t for t in all_cases if len(t) >= 3] or all_cases
+
+    def walk(tech):
+        zd._walk_prerequisites(tech)
+        zd._walk_prerequisites(tech + [U.ZERGLING])   # old opening-safety re-walk
+        zd._walk_tier(tech)
+
+    def indexed(tech):
+        zd.all_prerequisite_structures(tech)
+        zd.tier_required(tech)
+
+    print(f"per-step resolution over {len(techs)} tech lists, {args.n} plans:")
+    a = bench("tree walk", walk, techs, args.n)
+    b = bench("indexed", indexed, techs, args.n)
+    print(f"  speedup    {a / max(b, 1e-9):7.1f}x")
+    sys.exit(1 if bad else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -7,12 +7,19 @@ detachment, or hold and keep macroing. It also runs the early overlord/drone
 scout so perception has something to feed the classifier, and handles the small
 amount of unit-specific control Zerg needs (lurker burrow, keeping overlords
 safe).
+
+The orders it repeats every step (rally, attack-move, harass and focus targets)
+go through ``bot.order_buffer`` (strategy_engine/orders.py), which skips an
+order the unit is already carrying out.
 """
 
 from __future__ import annotations
 
 from sc2.ids.ability_id import AbilityId
 from sc2.ids.unit_typeid import UnitTypeId as U
+from sc2.position import Point2
+
+from strategy_engine import maps
 
 from . import micro
 from .planner import ATTACK, DEFEND, HARASS, HOLD
@@ -81,7 +88,7 @@ class Army:
         # Queens hold the base too rather than idling on inject duty while it
         # burns -- they have a strong ground/air attack at close range.
         for q in bot.units(U.QUEEN).closer_than(20, base):
-            q.attack(tpos)
+            bot.order_buffer.attack(q, tpos)
         if enemies and plan.pull_workers:
             self._pull_workers(bot, base, tpos)
 
@@ -101,9 +108,9 @@ class Army:
         else:
             for u in others:
                 if u.distance_to(staging) > 8:
-                    u.move(staging)
+                    bot.order_buffer.move(u, staging)
                 else:
-                    u.attack(target)
+                    bot.order_buffer.attack(u, target)
 
     def _harass(self, bot, army) -> None:
         raiders = army.of_type(RAIDERS)
@@ -111,7 +118,7 @@ class Army:
         if raiders:
             tgt = self._harass_target(bot)
             for u in raiders:
-                u.attack(tgt)
+                bot.order_buffer.attack(u, tgt)
         for u in main:
             self._rally_unit(bot, u)
 
@@ -126,7 +133,7 @@ class Army:
     def _rally_unit(self, bot, u) -> None:
         rally = self._rally(bot)
         if u.distance_to(rally) > 7:
-            u.move(rally)
+            bot.order_buffer.move(u, rally)
 
     def _lurker(self, bot, u, target, hold: bool) -> None:
         near = bot.enemy_units.closer_than(9, u)
@@ -136,7 +143,7 @@ class Army:
         elif not near and burrowed and not hold:
             u(AbilityId.BURROWUP_LURKER)
         elif not burrowed:
-            u.attack(target)
+            bot.order_buffer.attack(u, target)
 
     def _staging(self, bot):
         if bot.townhalls:
@@ -184,7 +191,7 @@ class Army:
             home = bot.start_location.towards(bot.game_info.map_center, -6)
             for ov in bot.units(U.OVERLORD):
                 if ov.tag != self.scout_tag and ov.distance_to(home) > 18:
-                    ov.move(home)
+                    bot.order_buffer.move(ov, home)
 
     def _scout(self, bot) -> None:
         # send the first overlord toward the enemy for an early read
@@ -219,9 +226,14 @@ class Army:
 
     def _next_scout_target(self, bot):
         if self._scout_targets is None:
-            enemy = bot.enemy_start_locations[0]
-            exps = sorted(bot.expansion_locations_list, key=lambda p: p.distance_to(enemy))
-            # enemy main + its two nearest expansions
-            self._scout_targets = [enemy] + exps[1:3]
+            spawn = maps.for_bot(bot)
+            if spawn is not None and spawn.scout_route:
+                # cached: enemy main + its two nearest expansions by ground distance
+                self._scout_targets = [Point2(p) for p in spawn.scout_route[:3]]
+            else:
+                enemy = bot.enemy_start_locations[0]
+                exps = sorted(bot.expansion_locations_list, key=lambda p: p.distance_to(enemy))
+                # enemy main + its two nearest expansions
+                self._scout_targets = [enemy] + exps[1:3]
         self._scout_idx = (self._scout_idx + 1) % len(self._scout_targets)
         return self._scout_targets[self._scout_idx]
@@ -0,0 +1,112 @@
+"""bandit: per-opponent Thompson sampling over the starting strategy.
+
+``opponent_intel`` gives a static prior (the counter for the opponent's profiled
+style) and the ``StrategySelector`` adapts from live reads, but nothing learned
+from our own results against a given opponent. This keeps a Beta(wins, losses)
+posterior per (opponent, strategy) and, before each game, starts the strategy
+with the highest draw from its posterior:
+
+* until there is a result against an opponent, the game opens with the
+  ``opponent_intel`` recommendation itself (a Beta(3, 1) arm among four
+  Beta(1, 1) arms would win the draw well under half the time);
+* after that the posterior is seeded from the prior -- the recommendation
+  starts at ``PRIOR_WINS`` pseudo-wins, the other strategies at Beta(1, 1) --
+  so the bot still leans on it, and a few losses are enough to move off it;
+* ties count half a win and half a loss;
+* the selector is unchanged: the bandit only picks where the game *starts*.
+
+State lives in the bot data dir (``data/strategy_bandit.json``), which AI Arena
+persists between ladder games. Parallel harness games share that dir, so every
+update is a locked, atomic read-modify-write (``strategy_engine.statefile``).
+``harness/bandit_report.py`` prints the posteriors.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+from strategy_engine import statefile
+
+SCHEMA_VERSION = 1
+PRIOR_WINS = 2.0        # pseudo-wins for the opponent_intel recommendation
+DEFAULT_OPPONENT = "default"
+
+
+class StrategyBandit:
+    def __init__(self, data_dir: Path, arms: Iterable[str]):
+        self.path = Path(data_dir) / "strategy_bandit.json"
+        self.arms = list(arms)
+
+    # -- persistence ---------------------------------------------------
+    def load(self) -> dict:
+        try:
+            state = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            return {"version": SCHEMA_VERSION, "opponents": {}, "games": 0}
+        if state.get("version") != SCHEMA_VERSION:
+            return {"version": SCHEMA_VERSION, "opponents": {}, "games": 0}
+        return state
+
+    def _row(self, state: dict, opponent: str, prior: Optional[str]) -> Dict[str, dict]:
+        """The opponent's posteriors, seeded from ``prior`` on first sight and
+        reconciled with the current library (new arms at Beta(1, 1))."""
+        row = state["opponents"].get(opponent)
+        if row is None:
+            row = state["opponents"][opponent] = {
+                arm: {"wins": PRIOR_WINS if arm == prior else 0.0, "losses": 0.0, "games": 0}
+                for arm in self.arms}
+        for arm in self.arms:
+            row.setdefault(arm, {"wins": 0.0, "losses": 0.0, "games": 0})
+        for arm in [a for a in row if a not in self.arms]:
+            del row[arm]
+        return row
+
+    # -- bandit --------------------------------------------------------
+    def choose(self, opponent_id: Optional[str], prior: Optional[str] = None,
+               rng: Optional[random.Random] = None) -> str:
+        """Thompson draw for this game's starting strategy; the prior itself
+        while nothing has been recorded against this opponent."""
+        rng = rng or random
+        state = self.load()
+        row = self._row(state, opponent_id or DEFAULT_OPPONENT, prior)
+        if prior in row and not any(v["games"] for v in row.values()):
+            return prior
+        draws = {arm: rng.betavariate(1.0 + v["wins"], 1.0 + v["losses"])
+                 for arm, v in row.items()}
+        return max(draws, key=draws.get)
+
+    def record(self, opponent_id: Optional[str], arm: str, won: bool, tied: bool,
+               prior: Optional[str] = None) -> None:
+        """Fold one finished game into the posterior (safe across processes)."""
+        if arm not in self.arms:
+            return
+        with statefile.transaction(self.path, self.load, indent=1, sort_keys=True) as state:
+            v = self._row(state, opponent_id or DEFAULT_OPPONENT, prior)[arm]
+            v["wins"] += 0.5 if tied else float(won)
+            v["losses"] += 0.5 if tied else float(not won)
+            v["games"] += 1
+            state["games"] = state.get("games", 0) + 1
+
+
+def summarize(state: dict, samples: int = 2000, seed: int = 0) -> Dict[str, list]:
+    """Per opponent: ``[(arm, games, mean, p_best), ...]`` best first.
+
+    ``p_best`` is the Monte Carlo share of posterior draws in which the arm wins,
+    i.e. how often Thompson sampling would start it next game.
+    """
+    rng = random.Random(seed)
+    out: Dict[str, list] = {}
+    for opponent, row in sorted(state.get("opponents", {}).items()):
+        best = dict.fromkeys(row, 0)
+        for _ in range(samples):
+            draws = {arm: rng.betavariate(1.0 + v["wins"], 1.0 + v["losses"])
+                     for arm, v in row.items()}
+            best[max(draws, key=draws.get)] += 1
+        out[opponent] = sorted(
+            ((arm, v["games"], (1.0 + v["wins"]) / (2.0 + v["wins"] + v["losses"]),
+              best[arm] / samples) for arm, v in row.items()),
+            key=lambda r: r[3], reverse=True)
+    return out
@@ -0,0 +1,87 @@
+"""census: one per-step count of our structures and units, shared by the executors.
+
+The executors ask the same handful of questions many times a step -- "is a ready
+Lair up?", "how many spines, counting ones in progress?", "how many queens plus
+queued?" -- and each ``bot.structures(X).ready.exists`` / ``bot.units(X).amount``
+re-filters the whole Units collection. ``Census`` walks ``bot.structures`` and
+``bot.units`` once when built (``HydraBot.on_step`` makes a fresh one every step)
+and answers from per-type counters; ``already_pending`` is memoised per type for
+the step, since it reads order state the counters don't cover.
+
+It holds counts only. Anything that needs the actual units to issue orders
+(idle production, morph candidates) still goes to the bot.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from typing import Dict, Iterable
+
+from sc2.ids.unit_typeid import UnitTypeId as U
+
+# Tier morphs count upward: a Hive still satisfies "needs a Lair", etc.
+_SATISFIED_BY: Dict[U, tuple] = {
+    U.HATCHERY: (U.HATCHERY, U.LAIR, U.HIVE),
+    U.LAIR: (U.LAIR, U.HIVE),
+    U.SPIRE: (U.SPIRE, U.GREATERSPIRE),
+}
+
+
+class Census:
+    def __init__(self, bot):
+        self._bot = bot
+        self._structures: Counter = Counter()
+        self._structures_ready: Counter = Counter()
+        self._units: Counter = Counter()
+        self._units_ready: Counter = Counter()
+        self._pending: Dict[U, float] = {}
+        self.served = 0   # lookups answered here instead of by a Units filter
+        for s in bot.structures:
+            self._structures[s.type_id] += 1
+            if s.is_ready:
+                self._structures_ready[s.type_id] += 1
+        for u in bot.units:
+            self._units[u.type_id] += 1
+            if u.is_ready:
+                self._units_ready[u.type_id] += 1
+
+    # ------------------------------------------------------------ structures
+    def structures(self, struct: U) -> int:
+        """``bot.structures(struct).amount`` (in-progress included)."""
+        self.served += 1
+        return self._structures[struct]
+
+    def structures_of(self, types: Iterable[U]) -> int:
+        """``bot.structures.of_type(types).amount``."""
+        self.served += 1
+        return sum(self._structures[t] for t in types)
+
+    def ready(self, struct: U) -> int:
+        """``bot.structures(struct).ready.amount``."""
+        self.served += 1
+        return self._structures_ready[struct]
+
+    def available(self, struct: U) -> bool:
+        """Is a ready ``struct`` up, counting tier morphs upward (Hive => Lair)?"""
+        self.served += 1
+        return any(self._structures_ready[t] for t in _SATISFIED_BY.get(struct, (struct,)))
+
+    # ----------------------------------------------------------------- units
+    def units(self, unit: U) -> int:
+        """``bot.units(unit).amount``."""
+        self.served += 1
+        return self._units[unit]
+
+    def units_ready(self, unit: U) -> int:
+        """``bot.units(unit).ready.amount``."""
+        self.served += 1
+        return self._units_ready[unit]
+
+    # --------------------------------------------------------------- pending
+    def pending(self, type_id: U) -> float:
+        """``bot.already_pending(type_id)``, computed at most once per step."""
+        if type_id not in self._pending:
+            self._pending[type_id] = self._bot.already_pending(type_id)
+        else:
+            self.served += 1
+        return self._pending[type_id]
@@ -0,0 +1,238 @@
+"""larva: spend each step's larva as one small knapsack instead of three queues.
+
+Without this, larva is split by executor order: ``Macro`` pops one Overlord when
+supply is within a fixed lead, spends ``plan.larva_econ_share`` of what is left
+on drones, and ``Tech`` spends the rest on the composition. Each stage sees only
+the bank *now*, so the bot supply-blocks when production outpaces one Overlord
+per step, sits on minerals when the composition is gas-bound, and spends on a
+cheap unit the moment before the one it actually wants becomes affordable.
+
+``allocate`` solves the step as a greedy knapsack over Overlords, drones and the
+composition's larva units under mineral, gas, supply and larva limits, looking
+``horizon`` seconds ahead with the current income:
+
+1. Overlords to cover the supply the larva + income can consume over the horizon
+   (not a fixed lead), several at once if needed; an unaffordable one reserves
+   its minerals so nothing cheaper delays it.
+2. Drones up to the planner's economy share of the larva, as before.
+3. Composition units by deficit against their target share; if the most wanted
+   unit is not affordable now but will be within the horizon, its cost is
+   reserved rather than spent on the next-best unit.
+4. Leftover larva and bank overflow into drones (below the drone target) so a
+   gas-bound composition doesn't float minerals.
+
+The allocation is planned from the bank at the start of the step, before
+queens, gas, expansions and structures spend from it, so ``train_spend`` checks
+every allocated train against the live bank and supply and drops the rest of
+the step's allocation at the first one that no longer fits.
+
+The allocator is opt-in (``HYDRA_LARVA=knapsack``) until games confirm what
+the synthetic bench shows; the executor-order split stays the default.
+
+``LarvaState`` is the whole input in plain numbers, so the same function runs in
+the bot and in ``hydra/bench_larva.py``, which compares it offline with the old
+split (``greedy_split``). Each call is a few dozen dict operations -- ~10-20 us.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional
+
+from sc2.ids.unit_typeid import UnitTypeId as U
+
+from . import zerg_data
+
+HORIZON = 20.0          # seconds of income the allocator plans over
+LARVA_PERIOD = 11.0     # one natural larva per hatchery every this many seconds
+INJECT_PERIOD = 29.0    # a queen inject adds 3 larva per hatchery this often
+FLOAT_MINERALS = 300    # bank above which leftover larva overflows into drones
+
+
+@dataclass
+class LarvaState:
+    """One step's larva decision, in plain numbers (recordable as JSON)."""
+
+    larva: int
+    minerals: float
+    gas: float
+    supply_left: float
+    supply_cap: float
+    overlords_pending: int
+    income_minerals: float          # per second
+    income_gas: float               # per second
+    hatcheries: int
+    drones_wanted: int              # plan.drone_target - workers - pending drones
+    econ_share: float               # plan.larva_econ_share
+    army_weights: Dict[U, float] = field(default_factory=dict)  # buildable larva units
+    army_counts: Dict[U, int] = field(default_factory=dict)
+
+    @classmethod
+    def from_bot(cls, bot, plan, larva: int, weights: Dict[U, float]) -> "LarvaState":
+        score = bot.state.score
+        census = bot.census
+        return cls(
+            larva=larva, minerals=bot.minerals, gas=bot.vespene,
+            supply_left=bot.supply_left, supply_cap=bot.supply_cap,
+            overlords_pending=int(census.pending(U.OVERLORD)),
+            income_minerals=score.collection_rate_minerals / 60.0,
+            income_gas=score.collection_rate_vespene / 60.0,
+            hatcheries=bot.townhalls.amount,
+            drones_wanted=int(plan.drone_target - bot.supply_workers - census.pending(U.DRONE)),
+            econ_share=plan.larva_econ_share,
+            army_weights=dict(weights),
+            army_counts={u: census.units(u) for u in weights},
+        )
+
+    def to_json(self) -> dict:
+        d = dict(self.__dict__)
+        d["army_weights"] = {u.name: w for u, w in self.army_weights.items()}
+        d["army_counts"] = {u.name: c for u, c in self.army_counts.items()}
+        return d
+
+    @classmethod
+    def from_json(cls, d: dict) -> "LarvaState":
+        d = {k: v for k, v in d.items() if k in cls.__dataclass_fields__}
+        d["army_weights"] = {U[k]: w for k, w in d.get("army_weights", {}).items()}
+        d["army_counts"] = {U[k]: c for k, c in d.get("army_counts", {}).items()}
+        return cls(**d)
+
+
+CostFn = Callable[[U], tuple]
+
+
+def _overlords_needed(st: LarvaState, cost: CostFn, horizon: float) -> int:
+    """Overlords to start now so the horizon's spending never hits the cap."""
+    if st.supply_cap >= 200:
+        return 0
+    larva = st.larva + st.hatcheries * horizon * (1 / LARVA_PERIOD + 3 / INJECT_PERIOD)
+    minerals = st.minerals + st.income_minerals * horizon
+    # what an average larva of this plan costs and uses
+    mix = {U.DRONE: st.econ_share} if st.drones_wanted > 0 else {}
+    army_share = 1.0 - sum(mix.values())
+    for u, w in st.army_weights.items():
+        mix[u] = mix.get(u, 0.0) + army_share * w
+    total = sum(mix.values()) or 1.0
+    m_per = sum(cost(u)[0] * w for u, w in mix.items()) / total or 50.0
+    s_per = sum(cost(u)[2] * w for u, w in mix.items()) / total or 1.0
+    demand = min(larva, minerals / m_per) * s_per
+    covered = st.supply_left + st.overlords_pending * zerg_data.OVERLORD_SUPPLY
+    short = demand - covered
+    room = (200 - st.supply_cap) / zerg_data.OVERLORD_SUPPLY - st.overlords_pending
+    return max(0, min(math.ceil(short / zerg_data.OVERLORD_SUPPLY), math.ceil(room)))
+
+
+def allocate(st: LarvaState, horizon: float = HORIZON,
+             cost: CostFn = zerg_data.larva_cost) -> Dict[U, int]:
+    """Units to train from larva this step, in training order (Overlords first)."""
+    out: Dict[U, int] = {}
+    m, g, sup, larva = st.minerals, st.gas, st.supply_left, st.larva
+    inflow_m, inflow_g = st.income_minerals * horizon, st.income_gas * horizon
+
+    def fits(u) -> bool:
+        cm, cg, cs = cost(u)
+        return larva > 0 and m >= cm and g >= cg and sup >= cs
+
+    def take(u) -> None:
+        nonlocal m, g, sup, larva
+        cm, cg, cs = cost(u)
+        m, g, sup, larva = m - cm, g - cg, sup - cs, larva - 1
+        out[u] = out.get(u, 0) + 1
+
+    # 1. supply for the horizon
+    ov_m = cost(U.OVERLORD)[0]
+    for _ in range(_overlords_needed(st, cost, horizon)):
+        if larva <= 0:
+            break
+        if m < ov_m:
+            m -= ov_m   # reserve: nothing else may delay the Overlord
+            break
+        take(U.OVERLORD)
+
+    # 2. the planner's economy share of the larva
+    drones = st.drones_wanted
+    budget = larva if st.econ_share >= 1.0 else math.ceil(larva * st.econ_share)
+    while drones > 0 and budget > 0 and fits(U.DRONE):
+        take(U.DRONE)
+        drones -= 1
+        budget -= 1
+
+    # 3. composition by deficit, with one look-ahead reservation
+    counts = dict(st.army_counts)
+    total = max(1, sum(counts.values()))
+    wanted = dict(st.army_weights)
+    while larva > 0 and wanted:
+        best = max(wanted, key=lambda u: wanted[u] - counts.get(u, 0) / total)
+        if fits(best):
+            take(best)
+            counts[best] = counts.get(best, 0) + 1
+            total += 1
+            continue
+        cm, cg, cs = cost(best)
+        if sup >= cs and m + inflow_m >= cm and g + inflow_g >= cg:
+            m, g = m - cm, g - cg      # affordable soon: save for it
+            break
+        del wanted[best]               # out of reach this horizon; next-best
+
+    # 4. overflow: idle larva + floated minerals -> drones below the target
+    while drones > 0 and m > FLOAT_MINERALS and fits(U.DRONE):
+        take(U.DRONE)
+        drones -= 1
+    return out
+
+
+def train_spend(bot, larvae: List, spend: Dict[U, int], units: Iterable[U]) -> None:
+    """Train ``units`` of ``spend`` from ``larvae`` while the live bank covers them.
+
+    The first train the bot can no longer afford (or supply) clears ``spend``, so
+    the executor that runs next trains nothing cheaper in its place.
+    """
+    for unit in list(units):
+        for _ in range(spend.get(unit, 0)):
+            if not larvae:
+                return
+            if not (bot.can_afford(unit)
+                    and (unit == U.OVERLORD or bot.supply_left > 0)):
+                spend.clear()
+                return
+            larvae.pop().train(unit)
+
+
+def greedy_split(st: LarvaState, cost: CostFn = zerg_data.larva_cost) -> Dict[U, int]:
+    """The executor-order split the allocator replaces (``HYDRA_LARVA=greedy``)."""
+    out: Dict[U, int] = {}
+    m, g, sup, larva = st.minerals, st.gas, st.supply_left, st.larva
+
+    def take(u) -> None:
+        nonlocal m, g, sup, larva
+        cm, cg, cs = cost(u)
+        m, g, sup, larva = m - cm, g - cg, sup - cs, larva - 1
+        out[u] = out.get(u, 0) + 1
+
+    if st.supply_cap < 200:
+        lead = 2 + st.hatcheries * 2
+        if (sup + st.overlords_pending * zerg_data.OVERLORD_SUPPLY <= lead
+                and larva and m >= cost(U.OVERLORD)[0]):
+            take(U.OVERLORD)
+    want = st.drones_wanted
+    budget = larva if st.econ_share >= 1.0 else math.ceil(larva * st.econ_share)
+    built = 0
+    while want > 0 and built < budget and larva and m >= cost(U.DRONE)[0] and sup > 0:
+        take(U.DRONE)
+        want -= 1
+        built += 1
+    counts = dict(st.army_counts)
+    total = max(1, sum(counts.values()))
+    while larva:
+        def deficit(u):
+            return st.army_weights[u] - counts.get(u, 0) / total
+        affordable = [u for u in st.army_weights
+                      if m >= cost(u)[0] and g >= cost(u)[1]]
+        pick: Optional[U] = max(affordable, key=deficit, default=None)
+        if pick is None or sup <= 0:
+            break
+        take(pick)
+        counts[pick] = counts.get(pick, 0) + 1
+        total += 1
+    return out
@@ -6,26 +6,36 @@ the Zerg orders that move toward them. It holds no strategy: swap the plan and t
 same code saturates to a different drone count, expands to a different base count,
 etc.
 
-Larva is a shared, scarce resource, so the bot allocates it once per step: this
-executor runs first and spends larva on overlords (supply) and drones (economy)
-up to the plan's targets; whatever remains is handed to the army executor.
+Larva is a shared, scarce resource. By default this executor runs first and
+spends larva on overlords (supply) and drones (economy) up to the plan's
+targets, and whatever remains is handed to the army executor. With
+``HYDRA_LARVA=knapsack`` the bot allocates it once per step (``bot/larva.py``)
+instead: this executor trains the Overlords and drones of that allocation and
+the army executor trains the rest.
 """
 
 from __future__ import annotations
 
 import math
-from typing import List
+from typing import Dict, List, Optional
 
 from sc2.ids.ability_id import AbilityId
 from sc2.ids.buff_id import BuffId
 from sc2.ids.unit_typeid import UnitTypeId as U
 from sc2.unit import Unit
 
+from .larva import train_spend
+
 
 class Macro:
-    async def step(self, bot, plan, larvae: List[Unit]) -> None:
-        self._overlords(bot, plan, larvae)
-        self._drones(bot, plan, larvae)
+    async def step(self, bot, plan, larvae: List[Unit],
+                   spend: Optional[Dict[U, int]] = None) -> None:
+        if spend is not None:
+            # the larva allocator chose this step's Overlords and drones
+            train_spend(bot, larvae, spend, (U.OVERLORD, U.DRONE))
+        else:
+            self._overlords(bot, plan, larvae)
+            self._drones(bot, plan, larvae)
         await self._queens(bot, plan)
         self._inject(bot)
         await self._gas(bot, plan)
@@ -38,13 +48,13 @@ class Macro:
         # Larva is precious; get ahead of the block but don't over-make. Scale the
         # lead with how fast we're spending supply (more bases/production = faster).
         lead = 2 + bot.townhalls.amount * 2
-        pending = bot.already_pending(U.OVERLORD)
+        pending = bot.census.pending(U.OVERLORD)
         if bot.supply_left + pending * 8 <= lead and larvae and bot.can_afford(U.OVERLORD):
             larvae.pop().train(U.OVERLORD)
 
     # ------------------------------------------------------------------ drones
     def _drones(self, bot, plan, larvae: List[Unit]) -> None:
-        want = plan.drone_target - bot.supply_workers - bot.already_pending(U.DRONE)
+        want = plan.drone_target - bot.supply_workers - bot.census.pending(U.DRONE)
         # Spend only the planned economy share of this step's larva on drones so
         # the army executor keeps getting larva -- never hoard the whole larva
         # bank into drones (which starves army until full saturation).
@@ -59,9 +69,9 @@ class Macro:
 
     # ------------------------------------------------------------------ queens
     async def _queens(self, bot, plan) -> None:
-        if not bot.structures(U.SPAWNINGPOOL).ready:
+        if not bot.census.ready(U.SPAWNINGPOOL):
             return
-        have = bot.units(U.QUEEN).amount + bot.already_pending(U.QUEEN)
+        have = bot.census.units(U.QUEEN) + bot.census.pending(U.QUEEN)
         if have >= plan.queen_target:
             return
         for hatch in bot.townhalls.ready.idle:
@@ -101,9 +111,9 @@ class Macro:
         return min(plan.gas_target, ramp)
 
     async def _gas(self, bot, plan) -> None:
-        if not bot.structures(U.SPAWNINGPOOL).ready:
+        if not bot.census.ready(U.SPAWNINGPOOL):
             return  # no point on gas before the pool (nothing needs it yet)
-        have = bot.gas_buildings.amount + bot.already_pending(U.EXTRACTOR)
+        have = bot.gas_buildings.amount + bot.census.pending(U.EXTRACTOR)
         if have >= self._desired_gas(bot, plan) or not bot.can_afford(U.EXTRACTOR):
             return
         for hatch in bot.townhalls.ready:
@@ -119,9 +129,10 @@ class Macro:
     async def _expand(self, bot, plan) -> None:
         if not plan.expand_now_ok:
             return
-        if not bot.can_afford(U.HATCHERY) or bot.already_pending(U.HATCHERY):
+        census = bot.census
+        if not bot.can_afford(U.HATCHERY) or census.pending(U.HATCHERY):
             return
-        bases = bot.townhalls.amount + bot.already_pending(U.HATCHERY)
+        bases = bot.townhalls.amount + census.pending(U.HATCHERY)
         saturated = bot.supply_workers >= 0.80 * 16 * bot.townhalls.amount
         take_natural = bot.townhalls.amount < 2 and bot.supply_workers >= 13
 
@@ -139,8 +150,8 @@ class Macro:
         # a float of *either* resource on a maxed economy means we're
         # larva-limited (can't convert income to army fast enough)
         floating_hard = (bot.minerals > 450 or bot.vespene > 500) and saturated
-        total_hatch = bot.structures.of_type(
-            {U.HATCHERY, U.LAIR, U.HIVE}).amount + bot.already_pending(U.HATCHERY)
+        total_hatch = census.structures_of(
+            (U.HATCHERY, U.LAIR, U.HIVE)) + census.pending(U.HATCHERY)
         if floating_hard and total_hatch < plan.base_target + 3:
             base = bot.townhalls.ready.random if bot.townhalls.ready else bot.townhalls.first
             try:
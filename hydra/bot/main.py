@@ -19,8 +19,10 @@ low-level code.
 
 from __future__ import annotations
 
+import json
 import os
 import sys
+from pathlib import Path
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
@@ -31,7 +33,12 @@ from sc2.data import Race, Result
 from sc2.ids.unit_typeid import UnitTypeId as U
 
 from strategy_engine import StrategicAdvisor, GameState
+from strategy_engine import maps
+from strategy_engine.orders import OrderBuffer
 
+from bot.bandit import StrategyBandit
+from bot.census import Census
+from bot.larva import LarvaState, allocate
 from bot.compat import patch_creation_abilities
 from bot.perception import Perception
 from bot.strategies import load_library
@@ -54,7 +61,10 @@ class HydraBot(BotAI):
         self.enemy_memory: dict = {}
         self.perception = Perception()
         self.advisor = StrategicAdvisor()
-        self.library = load_library()
+        # harness/tune.py hook: JSON {profile | "*": {knob: value}} laid over the
+        # YAML library. Unset on the ladder.
+        override = os.environ.get("HYDRA_PARAM_OVERRIDE")
+        self.library = load_library(overrides=json.loads(override) if override else None)
         initial = strategy or os.environ.get("HYDRA_STRATEGY") or "MacroRoachHydra"
         if initial not in self.library:
             initial = "MacroRoachHydra"
@@ -67,6 +77,32 @@ class HydraBot(BotAI):
         self.tech = Tech()
         self.army = Army()
         self._last_log = 0.0
+        self.census: Census | None = None
+        self._census_served = 0
+        self._census_steps = 0
+        # larva allocator (bot/larva.py), opt-in with HYDRA_LARVA=knapsack until
+        # games confirm bench_larva; the default is the executor-order split
+        self._allocate_larva = os.environ.get("HYDRA_LARVA", "greedy") == "knapsack"
+        self._last_record = -5.0
+        # per-opponent Thompson sampling over the opening (bot/bandit.py);
+        # HYDRA_BANDIT=0 starts from the opponent_intel prior alone
+        self.bandit = (StrategyBandit(Path("data"), self.library)
+                       if os.environ.get("HYDRA_BANDIT", "1") != "0" else None)
+        self._bandit_prior: str | None = None
+        self._bandit_opened = False     # the bandit picked this game's opening
+        self._start_strategy = self.selector.current.name
+        self.order_buffer = OrderBuffer()
+
+    def _find_expansion_locations(self) -> None:
+        # the shipped per-map cache (strategy_engine/maps.py) when this map and
+        # spawn are in it; python-sc2's live resource clustering otherwise
+        if not maps.apply_expansions(self):
+            super()._find_expansion_locations()
+
+    async def _after_step(self) -> int:
+        # compact this step's orders before python-sc2 sends them (strategy_engine/orders.py)
+        self.order_buffer.flush(self)
+        return await super()._after_step()
 
     async def on_start(self) -> None:
         self.client.game_step = 4  # responsive without being wasteful
@@ -85,6 +121,11 @@ class HydraBot(BotAI):
         recommends one of our five strategies. The mid-game ``StrategySelector``
         still refines this by live scouting -- the prior just sets a better
         opening than a blind default (see OPPONENTS.md, "load the prior first").
+        The prior seeds the per-opponent bandit (``bot/bandit.py``), which then
+        picks the opening by Thompson sampling over our own results against this
+        opponent; ``HYDRA_BANDIT=0`` opens with the prior directly. A locked
+        selector (``HYDRA_LOCK``) also opens with the prior and records nothing:
+        its results say nothing about an opening the bandit would play adapted.
 
         Fully guarded: any failure leaves the default opening untouched (a crash
         here would forfeit the game).
@@ -92,19 +133,31 @@ class HydraBot(BotAI):
         if self._forced_initial:
             return
         opp_id = getattr(self, "opponent_id", None)
+        rec = None
         try:
             from opponent_intel import recommend_for
             rec = recommend_for(opp_id)
+            logger.info(f"[opponent_intel] {rec.summary()}")
         except Exception as exc:  # pragma: no cover - defensive
             logger.warning(f"[opponent_intel] unavailable ({exc}); using default opening")
+        self._bandit_prior = rec.hydra_strategy if rec is not None else None
+        start = self._bandit_prior
+        if self.bandit is not None and not self.selector.locked:
+            try:
+                start = self.bandit.choose(opp_id, self._bandit_prior)
+                self._bandit_opened = True
+                logger.info(f"[bandit] opening {start} (prior {self._bandit_prior})")
+            except Exception as exc:  # pragma: no cover - a bad state file must not cost the game
+                logger.warning(f"[bandit] unavailable ({exc}); using the prior")
+        if start and start != self.selector.current.name:
+            self.selector.set_initial(start)
+        self._start_strategy = self.selector.current.name
+        if rec is None:
             return
-        if rec.hydra_strategy != self.selector.current.name:
-            self.selector.set_initial(rec.hydra_strategy)
-        logger.info(f"[opponent_intel] {rec.summary()}")
         try:
             tag = rec.name if rec.known else "unknown opponent"
             await self.chat_send(
-                f"(scouting) vs {tag}: opening {rec.hydra_strategy} [{rec.opp_style}]")
+                f"(scouting) vs {tag}: opening {self._start_strategy} [{rec.opp_style}]")
         except Exception:  # pragma: no cover - chat is best-effort
             pass
 
@@ -118,17 +171,24 @@ class HydraBot(BotAI):
         # extractors sit unmanned and the army starves for gas
         await self.distribute_workers(resource_ratio=2)
 
+        # one pass over our units/structures; executors read counts from it
+        self.census = Census(self)
+
         # perceive -> advise -> select -> plan
         self.perception.update(self)
         advice = self.advisor.advise(self._game_state())
         profile = self.selector.select(self, advice)
         plan = self.planner.plan(self, profile, advice)
 
-        # execute: macro spends larva first (supply + drones), army gets the rest
+        # execute: macro trains supply + drones, army gets the rest of the larva
+        # (one allocation for the step with HYDRA_LARVA=knapsack)
         larvae = list(self.larva)
-        await self.macro.step(self, plan, larvae)
-        await self.tech.step(self, plan, larvae)
+        spend = self._larva_spend(plan, len(larvae)) if larvae else None
+        await self.macro.step(self, plan, larvae, spend)
+        await self.tech.step(self, plan, larvae, spend)
         self.army.step(self, plan, advice)
+        self._census_served += self.census.served
+        self._census_steps += 1
 
         if self.time - self._last_log > 45:
             self._last_log = self.time
@@ -141,12 +201,36 @@ class HydraBot(BotAI):
                 f"| minc={int(sc.collection_rate_minerals)} gasc={int(sc.collection_rate_vespene)} "
                 f"gasW={gas_workers} idleW={self.workers.idle.amount} "
                 f"bank={self.minerals}/{self.vespene} gasBld={self.gas_buildings.amount} "
-                f"| opp={advice.classification.archetype.value}"
+                f"| opp={advice.classification.archetype.value} "
+                f"census={self._census_served / max(1, self._census_steps):.0f}/step"
             )
+            self._census_served = self._census_steps = 0
 
     async def on_end(self, result: Result) -> None:
         logger.info(f"HydraBot game ended: {result} "
-                    f"(final strategy {self.selector.current.name})")
+                    f"(opened {self._start_strategy}, final strategy {self.selector.current.name})")
+        logger.info(self.order_buffer.stats.summary())
+        # only openings the bandit chose feed its posterior: a forced
+        # (HYDRA_STRATEGY) or locked game never reaches choose()
+        if self.bandit is not None and self._bandit_opened:
+            try:
+                self.bandit.record(getattr(self, "opponent_id", None), self._start_strategy,
+                                   won=result == Result.Victory, tied=result == Result.Tie,
+                                   prior=self._bandit_prior)
+            except Exception as exc:  # pragma: no cover - never crash on_end
+                logger.warning(f"[bandit] could not record result ({exc})")
+
+    def _larva_spend(self, plan, n_larva: int):
+        if not self._allocate_larva:
+            return None
+        st = LarvaState.from_bot(self, plan, n_larva, self.tech.trainable_demand(self, plan))
+        record = os.environ.get("HYDRA_RECORD_LARVA")
+        if record and self.time - self._last_record >= 5:
+            # states for hydra/bench_larva.py (one per ~5s of game time)
+            self._last_record = self.time
+            with open(record, "a") as f:
+                f.write(json.dumps(dict(t=round(self.time, 1), **st.to_json())) + "\n")
+        return allocate(st)
 
     # ------------------------------------------------------------------ brain
     def _game_state(self) -> GameState:
@@ -158,18 +242,18 @@ class HydraBot(BotAI):
 
         state = GameState.from_bot(self, mem)
         # Zerg "production" is larva generation: hatcheries + queens (injects).
-        state.production_structures = self.townhalls.amount + self.units(U.QUEEN).amount
+        census = self.census
+        state.production_structures = self.townhalls.amount + census.units(U.QUEEN)
         # larva sitting unused with money is our idle-production signal
         state.idle_production = self.larva.amount if self.minerals > 200 else 0
-        state.tech_structures = self.structures.of_type(
-            {U.LAIR, U.HIVE, U.HYDRALISKDEN, U.LURKERDENMP, U.SPIRE, U.GREATERSPIRE,
-             U.INFESTATIONPIT, U.ULTRALISKCAVERN, U.ROACHWARREN, U.BANELINGNEST}
-        ).amount
-        state.upgrade_structures = self.structures(U.EVOLUTIONCHAMBER).ready.amount
+        state.tech_structures = census.structures_of(
+            (U.LAIR, U.HIVE, U.HYDRALISKDEN, U.LURKERDENMP, U.SPIRE, U.GREATERSPIRE,
+             U.INFESTATIONPIT, U.ULTRALISKCAVERN, U.ROACHWARREN, U.BANELINGNEST))
+        state.upgrade_structures = census.ready(U.EVOLUTIONCHAMBER)
         state.idle_upgrade_structures = self.structures(U.EVOLUTIONCHAMBER).ready.idle.amount
         state.upgrades_done = len(self.state.upgrades) if self.state.upgrades else 0
         state.have_detection = (
-            self.units(U.OVERSEER).amount + self.structures(U.SPORECRAWLER).ready.amount > 0
+            census.units(U.OVERSEER) + census.ready(U.SPORECRAWLER) > 0
         )
         state.has_harass_units = self.units.of_type(HARASS_UNITS).amount > 0
         # bases without a spine/spore or nearby army are exposed
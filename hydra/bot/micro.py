@@ -13,6 +13,10 @@ Two levers, both cheap and robust in python-sc2 (no pathing grid needed):
   land instead of spreading thinly -- the single biggest trade-efficiency win.
 * **Kiting.** A ranged unit that out-ranges the nearest threat and is mid-reload
   steps back instead of standing still, so it takes free hits off melee chasers.
+
+Attack orders go through ``orders`` (the bot's ``OrderBuffer``) when given, so a
+unit already attacking the focus target or the fallback point isn't re-ordered
+every step. Kite steps are always sent: each is a fresh point behind the unit.
 """
 
 from __future__ import annotations
@@ -51,8 +55,15 @@ def _in_range(unit: Unit, target: Unit) -> bool:
     return unit.distance_to(target) <= rng + unit.radius + target.radius
 
 
+def _attack(unit: Unit, target, orders) -> None:
+    if orders is not None:
+        orders.attack(unit, target)
+    else:
+        unit.attack(target)
+
+
 def command_unit(unit: Unit, focus: Unit, enemies: List[Unit], fallback,
-                 kite: bool = True) -> None:
+                 kite: bool = True, orders=None) -> None:
     """Micro a single unit toward the focus target (or fallback if none).
 
     ``kite=False`` makes ranged units hold ground and focus-fire instead of
@@ -61,7 +72,7 @@ def command_unit(unit: Unit, focus: Unit, enemies: List[Unit], fallback,
     """
     if focus is None or not _hittable(unit, focus):
         # nothing this unit can shoot -- advance on the position
-        unit.attack(fallback if not hasattr(focus, "position") else focus.position)
+        _attack(unit, fallback if not hasattr(focus, "position") else focus.position, orders)
         return
 
     ranged = unit.type_id in RANGED and kite
@@ -70,7 +81,7 @@ def command_unit(unit: Unit, focus: Unit, enemies: List[Unit], fallback,
         threats = [e for e in enemies if e.can_attack]
         nearest = min(threats, key=unit.distance_to) if threats else None
         if unit.weapon_cooldown == 0 and _in_range(unit, focus):
-            unit.attack(focus)                       # ready + in range: fire
+            _attack(unit, focus, orders)             # ready + in range: fire
         elif nearest is not None:
             enemy_rng = (nearest.air_range if unit.is_flying
                          else nearest.ground_range)
@@ -79,24 +90,25 @@ def command_unit(unit: Unit, focus: Unit, enemies: List[Unit], fallback,
             if outrange and close and unit.weapon_cooldown > 0:
                 unit.move(unit.position.towards(nearest.position, -2.5))  # kite
             else:
-                unit.attack(focus)
+                _attack(unit, focus, orders)
         else:
-            unit.attack(focus)
+            _attack(unit, focus, orders)
     else:
-        unit.attack(focus)                           # melee: commit to focus
+        _attack(unit, focus, orders)                 # melee: commit to focus
 
 
 def command_army(bot, army, fallback_pos, kite: bool = True) -> None:
     """Focus-fire the whole army against the enemies near it (kiting when
     ``kite`` and attacking in the open); if none are near, advance on
     ``fallback_pos``."""
+    orders = getattr(bot, "order_buffer", None)
     center = army.center
     enemies = [e for e in bot.enemy_units.closer_than(14, center)
                if not e.is_memory]
     if not enemies:
         for u in army:
-            u.attack(fallback_pos)
+            _attack(u, fallback_pos, orders)
         return
     focus = army_focus(list(army), enemies)
     for u in army:
-        command_unit(u, focus, enemies, fallback_pos, kite=kite)
+        command_unit(u, focus, enemies, fallback_pos, kite=kite, orders=orders)
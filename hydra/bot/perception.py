@@ -14,6 +14,8 @@ from __future__ import annotations
 
 from sc2.ids.unit_typeid import UnitTypeId as U
 
+from strategy_engine import combat
+
 TOWNHALLS = {U.NEXUS, U.HATCHERY, U.LAIR, U.HIVE, U.COMMANDCENTER,
              U.ORBITALCOMMAND, U.PLANETARYFORTRESS}
 PRODUCTION = {U.GATEWAY, U.WARPGATE, U.ROBOTICSFACILITY, U.STARGATE,
@@ -74,6 +76,16 @@ class Perception:
                    if u.type_id not in WORKERS)
         if bot.enemy_units:
             mem["enemy_army_supply"] = army
+        if bot.enemy_units and combat.SIMULATE_FIGHTS:
+            # ... and by type, for the engine's fight simulation (when it is on)
+            from strategy_engine.combat_sim import is_combat_unit
+
+            comp: dict = {}
+            for u in bot.enemy_units:
+                name = u.type_id.name
+                if u.type_id not in WORKERS and is_combat_unit(name):
+                    comp[name] = comp.get(name, 0) + 1
+            mem["enemy_army_units"] = comp
 
         # enemy combat unit types ever seen -- drives the counter-composition
         # overlay in the planner. Ever-seen (not current) so a scouted threat
@@ -2,12 +2,14 @@
 
 The ``Planner`` is the bridge between *strategy* (a declarative
 ``StrategyProfile``) and *execution* (what the managers do this step). Every
-planning tick it produces a fresh ``ExecutionPlan`` -- a flat set of targets
+planning tick it produces an ``ExecutionPlan`` -- a flat set of targets
 (drone count, army composition, tech/upgrade targets, expansions, static
 defense, and a combat stance). Because the plan is regenerated from the live
-game state each time, the bot's behaviour is fully **dynamic**: the same profile
+game state, the bot's behaviour is fully **dynamic**: the same profile
 yields a different plan as the game changes, and swapping the profile mid-game
-(the selector's job) immediately reshapes the plan.
+(the selector's job) immediately reshapes the plan. Steps whose inputs haven't
+moved (same fingerprint) get the previous plan back unchanged, and
+``Planner.diff`` says which targets moved when they did.
 
 The planner is also where *adaptation* happens. It starts from the profile's
 knobs and then overlays the strategy_engine's reads -- defense emergencies,
@@ -19,8 +21,8 @@ ad-hoc rules through the executors.
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Dict, List
+from dataclasses import dataclass, field, fields
+from typing import Dict, List, Optional, Tuple
 
 from sc2.ids.unit_typeid import UnitTypeId as U
 from sc2.ids.upgrade_id import UpgradeId
@@ -60,6 +62,8 @@ _COUNTERS: Dict[U, tuple] = {
 }
 # how much of the composition counters may add in total (keep our core intact)
 _COUNTER_BUDGET = 0.6
+# a cached plan is rebuilt at least this often (seconds), even on a steady read
+_PLAN_TIME_BUCKET = 10.0
 
 
 @dataclass
@@ -98,14 +102,99 @@ class ExecutionPlan:
     reasons: List[str] = field(default_factory=list)
 
 
+@dataclass
+class PlanDiff:
+    """What moved between two consecutive plans: field name -> (old, new).
+
+    Empty (falsy) when the planner served its cached plan, so an executor can
+    skip target-derived work with ``if not planner.diff.touches(...)``.
+    """
+
+    changed: Dict[str, Tuple[object, object]] = field(default_factory=dict)
+
+    def __bool__(self) -> bool:
+        return bool(self.changed)
+
+    def touches(self, *names: str) -> bool:
+        return any(n in self.changed for n in names)
+
+    @staticmethod
+    def between(old: Optional[ExecutionPlan], new: ExecutionPlan) -> "PlanDiff":
+        changed = {}
+        for f in fields(ExecutionPlan):
+            a = getattr(old, f.name, None) if old is not None else None
+            b = getattr(new, f.name)
+            if old is None or a != b:
+                changed[f.name] = (a, b)
+        return PlanDiff(changed)
+
+
 class Planner:
     def __init__(self):
         # power-spike tracking: an upgrade finishing makes us briefly stronger,
         # which is a moment to press an attack (PRINCIPLES.md "power spikes").
         self._prev_upgrades: int = 0
         self._spike_until: float = 0.0
+        # plan cache: the last plan and the fingerprint of the inputs it came from
+        self._key: Optional[tuple] = None
+        self._plan: Optional[ExecutionPlan] = None
+        self.diff: PlanDiff = PlanDiff()
 
     def plan(self, bot, profile: StrategyProfile, advice: Advice) -> ExecutionPlan:
+        """The plan for this step -- the previous one, untouched, if no input moved.
+
+        ``self.diff`` records which fields changed versus the last step's plan.
+        """
+        spike = self._on_power_spike(bot)   # stateful: must run every step
+        self._opening_safe = self._is_opening_safe(bot, profile, advice)
+        key = self._fingerprint(bot, profile, advice, spike)
+        if key == self._key and self._plan is not None:
+            self.diff = PlanDiff()
+            return self._plan
+        plan = self._build(bot, profile, advice, spike)
+        self.diff = PlanDiff.between(self._plan, plan)
+        self._key, self._plan = key, plan
+        return plan
+
+    def _fingerprint(self, bot, profile, advice, spike) -> tuple:
+        """Every input ``_build`` reads, reduced to what its decisions compare.
+
+        Army supply only matters against the thresholds below, so those enter as
+        booleans; worker count feeds the larva split directly, so it enters as
+        is. ``enemy_unit_types`` only grows, so its size versions it.
+        """
+        d = advice.defense
+        army = bot.supply_army
+        return (
+            profile.name, max(1, bot.townhalls.amount), bot.supply_workers,
+            int(bot.time // _PLAN_TIME_BUCKET), self._opening_safe, spike,
+            d.emergency, d.prioritize_army, d.static_defense, d.need_detection,
+            d.hold_position, d.pull_workers,
+            army < max(8.0, (advice.enemy_estimate.army_supply or 0) * 0.8),
+            army >= profile.attack_supply,
+            army >= max(8.0, 0.5 * profile.attack_supply),
+            army >= 8, bot.supply_used >= 190,
+            advice.engagement.verdict, advice.timing, advice.harass.should_harass,
+            bool(bot.enemy_memory.get("enemy_has_cloak")),
+            bool(bot.enemy_memory.get("enemy_has_air")),
+            len(bot.enemy_memory.get("enemy_unit_types") or ()),
+        )
+
+    @staticmethod
+    def _is_opening_safe(bot, profile, advice) -> bool:
+        # Opening safety: a pure-drone opening dies to early aggression, so until
+        # we can rule a rush out, keep some defenders in the mix.
+        return (
+            not profile.all_in and bot.time < 240.0
+            and (bot.enemy_race is None
+                 or getattr(bot.enemy_race, "name", "") in ("Zerg", "Random")
+                 or advice.classification.archetype.value
+                 in ("unknown", "cheese_allin", "timing_attack")
+                 or advice.defense.static_defense > 0)
+        )
+
+    def _build(self, bot, profile: StrategyProfile, advice: Advice,
+               spike: bool) -> ExecutionPlan:
         bases = max(1, bot.townhalls.amount)
         reasons: List[str] = []
 
@@ -128,18 +217,6 @@ class Planner:
             plan.expand_now_ok = False
             reasons.append("emergency+thin: freeze economy, larva -> army")
 
-        # Opening safety: a pure-drone opening dies to early aggression, so until
-        # we can rule a rush out, keep some defenders in the mix. Computed here so
-        # the larva split and composition below both see it.
-        self._opening_safe = (
-            not profile.all_in and bot.time < 240.0
-            and (bot.enemy_race is None
-                 or getattr(bot.enemy_race, "name", "") in ("Zerg", "Random")
-                 or advice.classification.archetype.value
-                 in ("unknown", "cheese_allin", "timing_attack")
-                 or advice.defense.static_defense > 0)
-        )
-
         # Larva split: how much of each step's larva goes to drones vs army.
         # Rushing the *initial* economy pays off, so drone hard until a baseline
         # is up; after that, split by stance so army grows alongside the economy
@@ -173,8 +250,6 @@ class Planner:
 
         plan.army_composition = _normalise(comp)
         plan.tech_targets = tech
-        plan.prerequisite_structures = zerg_data.all_prerequisite_structures(tech)
-        plan.tier_target = zerg_data.tier_required(tech)
         plan.upgrade_targets = list(profile.upgrades)
 
         # Opening safety: keep a floor of cheap defenders (lings) in the mix
@@ -185,8 +260,11 @@ class Planner:
             plan.army_composition = _normalise(comp)
             if U.ZERGLING not in plan.tech_targets:
                 plan.tech_targets.append(U.ZERGLING)
-                plan.prerequisite_structures = zerg_data.all_prerequisite_structures(
-                    plan.tech_targets)
+
+        # Resolve the final tech targets once (both calls hit zerg_data's index).
+        plan.prerequisite_structures = zerg_data.all_prerequisite_structures(
+            plan.tech_targets)
+        plan.tier_target = zerg_data.tier_required(plan.tech_targets)
 
         # ---- static defense ------------------------------------------------
         # Start from the profile's per-base intent, then take the max with the
@@ -226,7 +304,7 @@ class Planner:
 
         # Power-spike nudge: an upgrade just finished -> we're momentarily
         # stronger; press the attack while the spike lasts.
-        if self._on_power_spike(bot) and not profile.all_in:
+        if spike and not profile.all_in:
             plan.attack_supply = min(plan.attack_supply,
                                      max(profile.regroup_supply + 6,
                                          profile.attack_supply * 0.75))
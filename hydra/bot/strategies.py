@@ -21,10 +21,11 @@ from enum import Enum
 from pathlib import Path
 from typing import Dict, List, Optional
 
-import yaml
 from sc2.ids.unit_typeid import UnitTypeId as U
 from sc2.ids.upgrade_id import UpgradeId
 
+from strategy_engine.cache import cached_build
+
 
 class Stance(Enum):
     """Where a strategy sits on the cheese->turtle spectrum.
@@ -134,12 +135,28 @@ def _profile_from_dict(name: str, d: dict) -> StrategyProfile:
 DEFAULT_LIBRARY = Path(__file__).resolve().parent.parent / "zerg_strategies.yml"
 
 
-def load_library(path: Optional[Path] = None) -> Dict[str, StrategyProfile]:
-    """Load the strategy library, keyed by profile name."""
-    path = path or DEFAULT_LIBRARY
-    data = yaml.safe_load(Path(path).read_text())
+def _parse(path: Path) -> dict:
+    # yaml is imported here: with a warm cache the game never loads it
+    import yaml
+
+    return yaml.safe_load(path.read_text())
+
+
+def load_library(path: Optional[Path] = None,
+                 overrides: Optional[Dict[str, dict]] = None) -> Dict[str, StrategyProfile]:
+    """Load the strategy library, keyed by profile name.
+
+    ``overrides`` maps a profile name (or ``"*"`` for every profile) to knob
+    values laid over its YAML entry -- the hook ``harness/tune.py`` searches
+    through.
+    """
+    path = Path(path or DEFAULT_LIBRARY)
+    data = cached_build(f"strategies_{path.stem}", [str(path)], lambda: _parse(path),
+                        __file__, cache_dir=str(path.parent / "__pycache__"))
+    overrides = overrides or {}
     profiles = {
-        name: _profile_from_dict(name, d)
+        name: _profile_from_dict(
+            name, {**d, **overrides.get("*", {}), **overrides.get(name, {})})
         for name, d in data["strategies"].items()
     }
     return profiles
@@ -20,13 +20,14 @@ Change the plan (or the tables) and the behaviour changes with zero edits here.
 
 from __future__ import annotations
 
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 from sc2.ids.unit_typeid import UnitTypeId as U
 from sc2.ids.upgrade_id import UpgradeId
 from sc2.unit import Unit
 
 from . import zerg_data
+from .larva import train_spend
 from .zerg_data import STRUCTURES, UNITS, Tier
 
 # Which structure researches which upgrade. Only the upgrades the library uses
@@ -47,10 +48,11 @@ _UPGRADE_SOURCE: Dict[UpgradeId, U] = {
 
 
 class Tech:
-    async def step(self, bot, plan, larvae: List[Unit]) -> None:
+    async def step(self, bot, plan, larvae: List[Unit],
+                   spend: Optional[Dict[U, int]] = None) -> None:
         await self._structures(bot, plan)
         await self._tier(bot, plan)
-        self._train_army(bot, plan, larvae)
+        self._train_army(bot, plan, larvae, spend)
         self._morphs(bot, plan)
         self._upgrades(bot, plan)
         await self._static_defense(bot, plan)
@@ -59,19 +61,11 @@ class Tech:
     @staticmethod
     def _ready(bot, struct: U) -> bool:
         """Is a prerequisite structure available (tier morphs count upward)?"""
-        if struct == U.HATCHERY:
-            return bot.townhalls.ready.exists
-        if struct == U.LAIR:
-            return bot.structures(U.LAIR).ready.exists or bot.structures(U.HIVE).ready.exists
-        if struct == U.HIVE:
-            return bot.structures(U.HIVE).ready.exists
-        if struct == U.SPIRE:
-            return bot.structures(U.SPIRE).ready.exists or bot.structures(U.GREATERSPIRE).ready.exists
-        return bot.structures(struct).ready.exists
+        return bot.census.available(struct)
 
     @staticmethod
     def _count(bot, struct: U) -> int:
-        return bot.structures(struct).amount + bot.already_pending(struct)
+        return bot.census.structures(struct) + bot.census.pending(struct)
 
     def _prereqs_ready(self, bot, struct: U) -> bool:
         spec = STRUCTURES.get(struct)
@@ -112,13 +106,14 @@ class Tech:
 
     # ------------------------------------------------------------ tech tiers
     async def _tier(self, bot, plan) -> None:
+        census = bot.census
         target = plan.tier_target
-        has_lair = bot.structures(U.LAIR).ready.exists or bot.structures(U.HIVE).exists
-        has_hive = bot.structures(U.HIVE).exists
+        has_lair = census.ready(U.LAIR) > 0 or census.structures(U.HIVE) > 0
+        has_hive = census.structures(U.HIVE) > 0
 
         # Hatchery -> Lair
-        if target.value >= Tier.LAIR.value and not (has_lair or bot.already_pending(U.LAIR)):
-            if bot.structures(U.SPAWNINGPOOL).ready and bot.can_afford(U.LAIR):
+        if target.value >= Tier.LAIR.value and not (has_lair or census.pending(U.LAIR)):
+            if census.ready(U.SPAWNINGPOOL) and bot.can_afford(U.LAIR):
                 hatch = next((h for h in bot.townhalls.ready.idle), None) or (
                     bot.townhalls.ready.first if bot.townhalls.ready else None)
                 if hatch:
@@ -127,32 +122,31 @@ class Tech:
 
         # Lair -> Hive (needs an Infestation Pit)
         if (target.value >= Tier.HIVE.value and not has_hive
-                and not bot.already_pending(U.HIVE)
-                and bot.structures(U.INFESTATIONPIT).ready
-                and bot.structures(U.LAIR).ready and bot.can_afford(U.HIVE)):
+                and not census.pending(U.HIVE)
+                and census.ready(U.INFESTATIONPIT)
+                and census.ready(U.LAIR) and bot.can_afford(U.HIVE)):
             lair = bot.structures(U.LAIR).ready.first
             lair(zerg_data.STRUCTURES[U.HIVE].morph_ability)
             return
 
         # Spire -> Greater Spire (broodlord tech), when the plan needs it
         if (U.GREATERSPIRE in plan.prerequisite_structures and has_hive
-                and bot.structures(U.SPIRE).ready
-                and not bot.structures(U.GREATERSPIRE).exists
-                and not bot.already_pending(U.GREATERSPIRE)
+                and census.ready(U.SPIRE)
+                and not census.structures(U.GREATERSPIRE)
+                and not census.pending(U.GREATERSPIRE)
                 and bot.can_afford(U.GREATERSPIRE)):
             bot.structures(U.SPIRE).ready.first(
                 zerg_data.STRUCTURES[U.GREATERSPIRE].morph_ability)
 
     # -------------------------------------------------------------- army/larva
-    def _train_army(self, bot, plan, larvae: List[Unit]) -> None:
-        comp = plan.army_composition
-        if not comp or not larvae:
-            return
+    def larva_demand(self, plan) -> Dict[U, float]:
+        """Composition weight per larva unit, morph demand folded onto its base.
 
-        # Redirect each morph unit's demand onto the larva unit it morphs from
-        # (bane<-ling, ravager<-roach, lurker<-hydra, brood<-corruptor).
+        Redirects each morph unit's demand onto the larva unit it morphs from
+        (bane<-ling, ravager<-roach, lurker<-hydra, brood<-corruptor).
+        """
         larva_weights: Dict[U, float] = {}
-        for unit, weight in comp.items():
+        for unit, weight in plan.army_composition.items():
             spec = UNITS[unit]
             base = unit
             if spec.morph_from and spec.morph_from != U.OVERLORD:
@@ -161,12 +155,30 @@ class Tech:
                 if base_spec is None or base_spec.morph_from:  # only larva bases
                     continue
             larva_weights[base] = larva_weights.get(base, 0.0) + weight
+        return larva_weights
+
+    def trainable_demand(self, bot, plan) -> Dict[U, float]:
+        """``larva_demand`` limited to what a larva can make right now."""
+        return {u: w for u, w in self.larva_demand(plan).items()
+                if not UNITS[u].morph_from and self._buildable(bot, u)}
+
+    def _train_army(self, bot, plan, larvae: List[Unit],
+                    spend: Optional[Dict[U, int]] = None) -> None:
+        comp = plan.army_composition
+        if not comp or not larvae:
+            return
+        if spend is not None:
+            # the larva allocator already chose (Overlords/drones went to Macro)
+            train_spend(bot, larvae, spend,
+                        [u for u in spend if u not in (U.OVERLORD, U.DRONE)])
+            return
 
+        larva_weights = self.larva_demand(plan)
         buildable = [u for u in larva_weights if self._buildable(bot, u)]
         if not buildable:
             return
 
-        counts = {u: bot.units(u).amount for u in larva_weights}
+        counts = {u: bot.census.units(u) for u in larva_weights}
         total = max(1, sum(counts.values()))
 
         while larvae:
@@ -189,7 +201,8 @@ class Tech:
 
     def _morphs(self, bot, plan) -> None:
         comp = plan.army_composition
-        army_count = max(1, sum(bot.units(u).amount for u in comp))
+        census = bot.census
+        army_count = max(1, sum(census.units(u) for u in comp))
         for unit, weight in comp.items():
             spec = UNITS[unit]
             if not spec.morph_from or spec.morph_from == U.OVERLORD:
@@ -198,7 +211,7 @@ class Tech:
                 continue
             if not bot.can_afford(unit):
                 continue
-            have = bot.units(unit).amount + bot.already_pending(unit)
+            have = census.units(unit) + census.pending(unit)
             want = max(1, round(weight * army_count))
             bases = bot.units(spec.morph_from).ready
             morphed = 0
@@ -212,7 +225,7 @@ class Tech:
 
         # Overseer for detection: morph one overlord when the plan needs it.
         if plan.need_detection and self._ready(bot, U.LAIR):
-            have_os = bot.units(U.OVERSEER).amount + bot.already_pending(U.OVERSEER)
+            have_os = census.units(U.OVERSEER) + census.pending(U.OVERSEER)
             spare = bot.units(U.OVERLORD).ready
             if have_os == 0 and spare and bot.can_afford(U.OVERSEER):
                 spare.random(UNITS[U.OVERSEER].morph_ability)
@@ -232,7 +245,7 @@ class Tech:
 
     # ---------------------------------------------------------- static defense
     async def _static_defense(self, bot, plan) -> None:
-        if not bot.structures(U.SPAWNINGPOOL).ready:
+        if not bot.census.ready(U.SPAWNINGPOOL):
             return
         base = self._forward_base(bot)
         if base is None:
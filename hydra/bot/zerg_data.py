@@ -15,6 +15,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
 from typing import Dict, List, Optional
 
 from sc2.ids.ability_id import AbilityId
@@ -69,13 +70,15 @@ STRUCTURES: Dict[U, StructureSpec] = {
 
 
 # --------------------------------------------------------------------------- #
-# Units: supply, and how each is produced. "larva" units are trained from a
-# larva; "morph" units are morphed from a base unit (which is itself a larva
+# Units: supply, cost, and how each is produced. "larva" units are trained from
+# a larva; "morph" units are morphed from a base unit (which is itself a larva
 # unit). Each carries the structure that unlocks it and the tier it needs.
 # --------------------------------------------------------------------------- #
 @dataclass(frozen=True)
 class UnitSpec:
     supply: float
+    minerals: int = 0                               # per unit (morphs: the morph)
+    gas: int = 0
     needs: List[U] = field(default_factory=list)    # unlocking structures
     tier: Tier = Tier.HATCHERY
     morph_from: Optional[U] = None                  # None -> trained from larva
@@ -86,36 +89,36 @@ class UnitSpec:
 
 UNITS: Dict[U, UnitSpec] = {
     # larva line
-    U.DRONE: UnitSpec(1, needs=[U.HATCHERY]),
-    U.OVERLORD: UnitSpec(0, needs=[U.HATCHERY]),
-    U.ZERGLING: UnitSpec(0.5, needs=[U.SPAWNINGPOOL]),
-    U.ROACH: UnitSpec(2, needs=[U.ROACHWARREN]),
-    U.HYDRALISK: UnitSpec(2, needs=[U.HYDRALISKDEN], tier=Tier.LAIR),
-    U.MUTALISK: UnitSpec(2, needs=[U.SPIRE], tier=Tier.LAIR, is_air=True),
-    U.CORRUPTOR: UnitSpec(2, needs=[U.SPIRE], tier=Tier.LAIR, is_air=True),
-    U.INFESTOR: UnitSpec(2, needs=[U.INFESTATIONPIT], tier=Tier.LAIR),
-    U.ULTRALISK: UnitSpec(6, needs=[U.ULTRALISKCAVERN], tier=Tier.HIVE),
+    U.DRONE: UnitSpec(1, 50, needs=[U.HATCHERY]),
+    U.OVERLORD: UnitSpec(0, 100, needs=[U.HATCHERY]),
+    U.ZERGLING: UnitSpec(0.5, 25, needs=[U.SPAWNINGPOOL]),   # two per larva
+    U.ROACH: UnitSpec(2, 75, 25, needs=[U.ROACHWARREN]),
+    U.HYDRALISK: UnitSpec(2, 100, 50, needs=[U.HYDRALISKDEN], tier=Tier.LAIR),
+    U.MUTALISK: UnitSpec(2, 100, 100, needs=[U.SPIRE], tier=Tier.LAIR, is_air=True),
+    U.CORRUPTOR: UnitSpec(2, 150, 100, needs=[U.SPIRE], tier=Tier.LAIR, is_air=True),
+    U.INFESTOR: UnitSpec(2, 100, 150, needs=[U.INFESTATIONPIT], tier=Tier.LAIR),
+    U.ULTRALISK: UnitSpec(6, 275, 200, needs=[U.ULTRALISKCAVERN], tier=Tier.HIVE),
     # queen is trained from a hatchery (not larva); handled specially
-    U.QUEEN: UnitSpec(2, needs=[U.SPAWNINGPOOL]),
+    U.QUEEN: UnitSpec(2, 150, needs=[U.SPAWNINGPOOL]),
     # morph line
     U.BANELING: UnitSpec(
-        0.5, needs=[U.BANELINGNEST], morph_from=U.ZERGLING,
+        0.5, 25, 25, needs=[U.BANELINGNEST], morph_from=U.ZERGLING,
         morph_ability=AbilityId.MORPHZERGLINGTOBANELING_BANELING,
     ),
     U.RAVAGER: UnitSpec(
-        3, needs=[U.ROACHWARREN], morph_from=U.ROACH,
+        3, 25, 75, needs=[U.ROACHWARREN], morph_from=U.ROACH,
         morph_ability=AbilityId.MORPHTORAVAGER_RAVAGER,
     ),
     U.LURKERMP: UnitSpec(
-        3, needs=[U.LURKERDENMP], tier=Tier.LAIR, morph_from=U.HYDRALISK,
+        3, 50, 100, needs=[U.LURKERDENMP], tier=Tier.LAIR, morph_from=U.HYDRALISK,
         morph_ability=AbilityId.MORPH_LURKER,
     ),
     U.BROODLORD: UnitSpec(
-        4, needs=[U.GREATERSPIRE], tier=Tier.HIVE, morph_from=U.CORRUPTOR,
+        4, 150, 150, needs=[U.GREATERSPIRE], tier=Tier.HIVE, morph_from=U.CORRUPTOR,
         morph_ability=AbilityId.MORPHTOBROODLORD_BROODLORD, is_air=True,
     ),
     U.OVERSEER: UnitSpec(
-        0, needs=[U.LAIR], tier=Tier.LAIR, morph_from=U.OVERLORD,
+        0, 50, 50, needs=[U.LAIR], tier=Tier.LAIR, morph_from=U.OVERLORD,
         morph_ability=AbilityId.MORPH_OVERSEER, is_detector=True, is_air=True,
     ),
 }
@@ -126,16 +129,22 @@ DETECTOR_STRUCTURES = {U.SPORECRAWLER}
 # Anti-air static defense / anti-air capable units, for the react-to-air rule.
 ANTIAIR_UNITS = {U.HYDRALISK, U.MUTALISK, U.CORRUPTOR, U.QUEEN}
 
+# Units hatched per larva (everything else is one).
+LARVA_YIELD = {U.ZERGLING: 2}
 
-def all_prerequisite_structures(units: List[U]) -> List[U]:
-    """Ordered, de-duplicated list of every structure needed to build ``units``.
+# Supply an Overlord provides.
+OVERLORD_SUPPLY = 8
 
-    Walks each unit's unlocking structures and their transitive structure
-    prerequisites. The result is ordered so that a structure never appears
-    before something it depends on -- the executor can build straight down the
-    list. Lair/Hive tier morphs are represented as structures here too, so
-    "needs Lair" naturally shows up as an item to satisfy.
-    """
+
+def larva_cost(unit: U) -> tuple:
+    """``(minerals, gas, supply)`` one larva spends to make ``unit``."""
+    spec = UNITS[unit]
+    k = LARVA_YIELD.get(unit, 1)
+    return spec.minerals * k, spec.gas * k, spec.supply * k
+
+
+def _walk_prerequisites(units: List[U]) -> List[U]:
+    """Reference DFS behind the precompiled index (see ``all_prerequisite_structures``)."""
     ordered: List[U] = []
     seen: set = set()
 
@@ -158,15 +167,81 @@ def all_prerequisite_structures(units: List[U]) -> List[U]:
     return ordered
 
 
-def tier_required(units: List[U]) -> Tier:
-    """Highest base tier any of ``units`` needs (Hatchery/Lair/Hive)."""
+def _walk_tier(units: List[U]) -> Tier:
+    """Reference for ``tier_required``: walk the units and their prerequisites."""
     tier = Tier.HATCHERY
     for unit in units:
         spec = UNITS.get(unit)
         if spec and spec.tier.value > tier.value:
             tier = spec.tier
-    for struct in all_prerequisite_structures(units):
+    for struct in _walk_prerequisites(units):
         spec = STRUCTURES.get(struct)
         if spec and spec.tier.value > tier.value:
             tier = spec.tier
     return tier
+
+
+# --------------------------------------------------------------------------- #
+# Precompiled tech-tree index. The tables are static, so each unit's prerequisite
+# order (its own DFS post-order), closure and tier are computed once at import;
+# resolving a target list is then a merge of per-unit rows, not a tree walk.
+# --------------------------------------------------------------------------- #
+PREREQ_ORDER: Dict[U, tuple] = {u: tuple(_walk_prerequisites([u])) for u in UNITS}
+PREREQ_CLOSURE: Dict[U, frozenset] = {u: frozenset(o) for u, o in PREREQ_ORDER.items()}
+UNIT_TIER: Dict[U, Tier] = {u: _walk_tier([u]) for u in UNITS}
+
+
+@dataclass(frozen=True)
+class TechResolution:
+    """Everything needed to unlock a set of units: structure closure + base tier."""
+
+    structures: frozenset
+    tier: Tier
+
+
+@lru_cache(maxsize=256)
+def resolve(targets: frozenset) -> TechResolution:
+    """Order-independent resolution of ``targets`` (cached on the target set)."""
+    structures: set = set()
+    tier = Tier.HATCHERY
+    for unit in targets:
+        if unit not in UNITS:
+            continue
+        structures |= PREREQ_CLOSURE[unit]
+        if UNIT_TIER[unit].value > tier.value:
+            tier = UNIT_TIER[unit]
+    return TechResolution(frozenset(structures), tier)
+
+
+@lru_cache(maxsize=256)
+def _ordered(units: tuple) -> tuple:
+    ordered: List[U] = []
+    seen: set = set()
+    for unit in units:
+        for struct in PREREQ_ORDER.get(unit, ()):
+            if struct not in seen:
+                seen.add(struct)
+                ordered.append(struct)
+    return tuple(ordered)
+
+
+def all_prerequisite_structures(units: List[U]) -> List[U]:
+    """Ordered, de-duplicated list of every structure needed to build ``units``.
+
+    Walks each unit's unlocking structures and their transitive structure
+    prerequisites. The result is ordered so that a structure never appears
+    before something it depends on -- the executor can build straight down the
+    list. Lair/Hive tier morphs are represented as structures here too, so
+    "needs Lair" naturally shows up as an item to satisfy.
+
+    Served from the precompiled index: merging the per-unit DFS orders in input
+    order, skipping repeats, yields exactly the list one shared DFS would (a
+    structure already seen has its whole closure seen too). Input order decides
+    build priority, so this is cached on the tuple rather than the set.
+    """
+    return list(_ordered(tuple(units)))
+
+
+def tier_required(units: List[U]) -> Tier:
+    """Highest base tier any of ``units`` needs (Hatchery/Lair/Hive)."""
+    return resolve(frozenset(units)).tier
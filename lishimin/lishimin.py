@@ -1,7 +1,16 @@
+import os
+import random
+import sys
+
 from sc2.bot_ai import BotAI
 from sc2.data import Result
 
-import random
+# the repo-root strategy_engine (order buffer), when run from the repo
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+try:
+    from strategy_engine.orders import OrderBuffer
+except ImportError:
+    OrderBuffer = None
 
 from sc2 import maps
 from sc2.bot_ai import BotAI
@@ -14,12 +23,24 @@ from sc2.unit import Unit
 
 class LiShiMinBot(BotAI):
 
+    def __init__(self):
+        super().__init__()
+        self.order_buffer = OrderBuffer() if OrderBuffer is not None else None
+
+    async def _after_step(self):
+        # compact this step's orders before python-sc2 sends them (strategy_engine/orders.py)
+        if self.order_buffer is not None:
+            self.order_buffer.flush(self)
+        return await super()._after_step()
+
     async def on_start(self):
         print("Game started")
         # Do things here before the game starts
 
     async def on_end(self, game_result: Result):
         print("Game ended.")
+        if self.order_buffer is not None:
+            print(self.order_buffer.stats.summary())
         # Do things here after the game ends
 
     # pylint: disable=R0912
@@ -11,7 +11,8 @@ table is also indexed by lowercased name — the resolver accepts either form.
 
 Reads the profiled bots from bot_profiles/data/*.json, fetches each one's
 game_display_id from the AI Arena API, classifies its STYLE, and writes
-opponent_intel/opponent_map.json.
+opponent_intel/opponent_map.json plus the compiled opponent_table.py the bots
+read (compile_table.py).
 """
 import json
 import os
@@ -25,18 +26,14 @@ sys.path.insert(0, ROOT)
 sys.path.insert(0, os.path.join(ROOT, "bot_profiles"))
 
 from opponent_intel.classify import classify_style  # noqa: E402
+from opponent_intel.compile_table import write_table  # noqa: E402
 
 TOKEN = os.environ.get("AA_API_TOKEN")
 if not TOKEN:
     sys.exit("set AA_API_TOKEN")
 
-# STYLE strings live in the profile generator (single source of truth).
-import importlib.util  # noqa: E402
-spec = importlib.util.spec_from_file_location(
-    "_genobj", os.path.join(ROOT, "bot_profiles", "_generate_objective.py"))
-_gen = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(_gen)
-STYLE = _gen.STYLE
+# STYLE strings live in bot_profiles/styles.py (shared with the profile generator).
+from styles import STYLE  # noqa: E402
 
 
 def api(path):
@@ -95,4 +92,5 @@ result = {
 }
 with open(os.path.join(HERE, "opponent_map.json"), "w") as f:
     json.dump(result, f, indent=1, sort_keys=True)
-print(f"WROTE opponent_map.json ({len(out_bots)} bots)", file=sys.stderr)
+write_table(result)
+print(f"WROTE opponent_map.json and opponent_table.py ({len(out_bots)} bots)", file=sys.stderr)
@@ -13,6 +13,9 @@ bot's ``on_start`` with zero overhead.
 """
 from __future__ import annotations
 
+import re
+from functools import lru_cache
+
 # The opponent play-styles we bucket every bot into.
 OPP_STYLES = (
     "allin",          # rushes / floods / one-base timings — beat us before ~8 min
@@ -41,17 +44,49 @@ _RULES = [
 ]
 
 
+@lru_cache(maxsize=None)
+def _patterns():
+    """One compiled alternation per bucket (compiled on first use: the ladder
+    path reads the precomputed opp_style and never classifies)."""
+    return tuple((opp_style, re.compile("|".join(re.escape(k) for k in keys)))
+                 for opp_style, keys in _RULES)
+
+
 def classify_style(style: str, race: str = "") -> str:
     """Bucket a profile STYLE string into one OPP_STYLE."""
     s = (style or "").lower()
     if not s:
         return "unknown"
-    for opp_style, keys in _RULES:
-        if any(k in s for k in keys):
+    for opp_style, pattern in _patterns():
+        if pattern.search(s):
             return opp_style
     return "unknown"
 
 
+# Opening family (strategy_engine.openings.classify_opening, read from our own
+# replays by learn.py) -> OPP_STYLE. Standard expands read as macro_standard.
+# Families that don't commit to a style (protoss_one_base, terran_one_base,
+# zerg_standard) are left out. A learned style only fills an "unknown" profile.
+OPENING_STYLE = {
+    "zerg_pool_rush":      "allin",
+    "protoss_proxy":       "allin",
+    "protoss_gate_allin":  "allin",
+    "terran_proxy_rax":    "allin",
+    "terran_2rax":         "allin",
+    "zerg_hatch_first":    "macro_greedy",
+    "protoss_forge_fast":  "turtle",
+    "zerg_pool_first":     "macro_standard",
+    "zerg_gas_first":      "macro_standard",
+    "protoss_gate_expand": "macro_standard",
+    "terran_rax_expand":   "macro_standard",
+}
+
+
+def opening_style(family: str | None) -> str | None:
+    """The OPP_STYLE an observed opening family implies, or None."""
+    return OPENING_STYLE.get(family or "")
+
+
 # HydraBot (Zerg) counter — one of the five declarative strategies in
 # hydra/zerg_strategies.yml. Rationale in the comment on each line.
 HYDRA_STRATEGY = {
@@ -0,0 +1,61 @@
+"""Compile opponent_map.json into opponent_table.py, the lookup bots import.
+
+The JSON map is the readable, diffable record of what build_map.py fetched. A
+bot only needs "UUID or name -> profile", so this writes the same data as a
+plain Python module of tuples: it loads from its cached .pyc with no parsing,
+and the play-style is already classified, so the ladder path never touches
+``classify_style`` or the profile sources.
+
+    python opponent_intel/compile_table.py      # after editing opponent_map.json
+
+build_map.py runs this itself after writing the map.
+"""
+import json
+import os
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+MAP_PATH = os.path.join(HERE, "opponent_map.json")
+TABLE_PATH = os.path.join(HERE, "opponent_table.py")
+
+# record layout; intel.py zips these back into a dict
+FIELDS = ("name", "race", "elo", "style", "opp_style")
+
+
+def render(data: dict) -> str:
+    bots = data.get("bots", {})
+    names = data.get("names", {})
+    lines = [
+        '"""Generated by opponent_intel/compile_table.py from opponent_map.json; do not edit."""',
+        "",
+        f"FIELDS = {FIELDS!r}",
+        "",
+        "BOTS = {",
+    ]
+    for uuid in sorted(bots):
+        e = bots[uuid]
+        rec = tuple(e.get(k) for k in FIELDS)
+        lines.append(f"    {uuid!r}: {rec!r},")
+    lines += ["}", "", "NAMES = {"]
+    for name in sorted(names):
+        lines.append(f"    {name!r}: {names[name]!r},")
+    lines += ["}", ""]
+    return "\n".join(lines)
+
+
+def write_table(data: dict, path: str = TABLE_PATH) -> str:
+    with open(path, "w") as f:
+        f.write(render(data))
+    return path
+
+
+def main() -> None:
+    with open(MAP_PATH) as f:
+        data = json.load(f)
+    write_table(data)
+    print(f"WROTE {os.path.basename(TABLE_PATH)} ({len(data.get('bots', {}))} bots)",
+          file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -9,29 +9,64 @@ Usage inside a bot (e.g. in on_start, after the ladder sets self.opponent_id):
     initial_strategy = rec.hydra_strategy          # for HydraBot
     stance = rec.stance                            # race-agnostic, for any bot
 
-`recommend_for` never raises and never needs the network: it loads the static
-opponent_map.json shipped alongside this module. An unknown/None opponent id
-yields a safe default recommendation (opp_style="unknown").
+`recommend_for` never raises and never needs the network. It reads the
+precompiled opponent_table.py (see compile_table.py), falling back to
+opponent_map.json if the table is missing. The table is loaded on first use and
+its play-styles are already classified. opponent_overlay.json, written by
+learn.py from our own match history, is merged over it per opponent. An
+unknown/None opponent id yields a safe default recommendation
+(opp_style="unknown").
 """
 from __future__ import annotations
 
-import json
 import os
 from dataclasses import dataclass
+from functools import lru_cache
 
 from opponent_intel import classify
 
 _HERE = os.path.dirname(os.path.abspath(__file__))
 _MAP_PATH = os.path.join(_HERE, "opponent_map.json")
+_OVERLAY_PATH = os.path.join(_HERE, "opponent_overlay.json")
 
-try:
-    with open(_MAP_PATH) as _f:
-        _MAP = json.load(_f)
-except Exception:  # missing/corrupt map -> resolver still works, just no hits
-    _MAP = {"bots": {}, "names": {}}
 
-_BOTS = _MAP.get("bots", {})
-_NAMES = _MAP.get("names", {})
+@lru_cache(maxsize=None)
+def _table() -> tuple:
+    """``(fields, uuid -> record tuple, lowercased name -> uuid)``."""
+    try:
+        from opponent_intel import opponent_table as t
+        return t.FIELDS, t.BOTS, t.NAMES
+    except ImportError:
+        pass
+    import json
+
+    from opponent_intel.compile_table import FIELDS
+    try:
+        with open(_MAP_PATH) as f:
+            data = json.load(f)
+    except Exception:  # missing/corrupt map -> resolver still works, just no hits
+        data = {}
+    bots = {u: tuple(e.get(k) for k in FIELDS) for u, e in data.get("bots", {}).items()}
+    return FIELDS, bots, data.get("names", {})
+
+
+@lru_cache(maxsize=None)
+def _overlay() -> tuple:
+    """``(key -> learned counter, lowercased name -> key)`` from learn.py."""
+    import json
+
+    try:
+        with open(_OVERLAY_PATH) as f:
+            data = json.load(f)
+    except Exception:  # no games learned yet -> the profile alone
+        return {}, {}
+    return data.get("bots", {}), data.get("names", {})
+
+
+def bots() -> dict:
+    """Every known profile, keyed by UUID."""
+    fields, table, _names = _table()
+    return {uuid: dict(zip(fields, rec)) for uuid, rec in table.items()}
 
 
 @dataclass(frozen=True)
@@ -45,6 +80,7 @@ class Recommendation:
     hydra_strategy: str          # HydraBot's counter (one of its 5 strategies)
     stance: str                  # race-agnostic stance (see classify.STANCE)
     reason: str                  # why this counter
+    learned_games: int = 0       # our own games folded in by learn.py
 
     def summary(self) -> str:
         who = f"{self.name} [{self.race}]" if self.known else f"unknown ({self.opponent_id})"
@@ -57,37 +93,56 @@ def resolve(opponent_id: str | None) -> dict | None:
     or None if we have no prior on it. Case-insensitive for names."""
     if not opponent_id:
         return None
+    fields, table, names = _table()
+    key = opponent_id.strip()
+    rec = table.get(key)                   # exact UUID (ladder)
+    if rec is None:
+        uuid = names.get(key.lower())      # name (local harness / manual)
+        rec = table.get(uuid) if uuid else None
+    return dict(zip(fields, rec)) if rec is not None else None
+
+
+def learned(opponent_id: str | None) -> dict | None:
+    """learn.py's counter for this opponent from our own games, or None.
+    Keyed like the table (UUID, or lowercased name for unprofiled bots)."""
+    if not opponent_id:
+        return None
+    learned_bots, names = _overlay()
     key = opponent_id.strip()
-    if key in _BOTS:                       # exact UUID (ladder)
-        return _BOTS[key]
-    uuid = _NAMES.get(key.lower())         # name (local harness / manual)
-    if uuid:
-        return _BOTS.get(uuid)
-    return None
+    return learned_bots.get(key) or learned_bots.get(names.get(key.lower(), ""))
 
 
 def recommend_for(opponent_id: str | None) -> Recommendation:
-    """Resolve an OpponentId and recommend a counter-strategy. Never raises."""
+    """Resolve an OpponentId and recommend a counter-strategy. Never raises.
+
+    The profile gives the prior; what we learned from our own games against
+    this opponent (learn.py) fills in an unknown style and, once there are
+    enough results, picks the counter that has actually won."""
     entry = resolve(opponent_id)
+    opp_style = entry.get("opp_style", "unknown") if entry else "unknown"
+    seen = learned(opponent_id)
+    games = 0
+    note = ""
+    if seen:
+        games = seen.get("games", 0)
+        if opp_style == "unknown" and seen.get("opp_style"):
+            opp_style = seen["opp_style"]
+            note = f"; opens {seen.get('opening')} in our games"
+    hydra = classify.hydra_strategy(opp_style)
+    if seen and seen.get("hydra_strategy"):
+        hydra = seen["hydra_strategy"]
+        note += f"; {hydra} has done best in our {games} games"
+    common = dict(
+        opponent_id=opponent_id, opp_style=opp_style, hydra_strategy=hydra,
+        stance=classify.stance(opp_style), reason=classify.explain(opp_style) + note,
+        learned_games=games,
+    )
     if entry is None:
-        opp_style = "unknown"
-        return Recommendation(
-            opponent_id=opponent_id, known=False, name="<unknown>", race="?",
-            opp_style=opp_style, style="",
-            hydra_strategy=classify.hydra_strategy(opp_style),
-            stance=classify.stance(opp_style),
-            reason=classify.explain(opp_style),
-        )
-    opp_style = entry.get("opp_style", "unknown")
+        return Recommendation(known=False, name="<unknown>", race="?", style="", **common)
     return Recommendation(
-        opponent_id=opponent_id, known=True,
-        name=entry.get("name", "?"), race=entry.get("race", "?"),
-        opp_style=opp_style, style=entry.get("style", ""),
-        hydra_strategy=classify.hydra_strategy(opp_style),
-        stance=classify.stance(opp_style),
-        reason=classify.explain(opp_style),
-    )
+        known=True, name=entry.get("name", "?"), race=entry.get("race", "?"),
+        style=entry.get("style", ""), **common)
 
 
 def known_count() -> int:
-    return len(_BOTS)
+    return len(_table()[1])
@@ -0,0 +1,214 @@
+"""Learn per-opponent counters from our own match history.
+
+opponent_map.json is a static prior built from profile STYLE strings, and many
+profiled bots have no style at all ("unknown"). harness/versus.py appends every
+bot-vs-bot game to ``<bot>/results/history.jsonl``. This folds those games into
+per-opponent statistics and writes ``opponent_overlay.json``, which
+``recommend_for`` merges over the profile:
+
+- the opponent's opening family, read from the game's replay with the same
+  ``classify_opening`` rules the bots use live (needs sc2reader). Once the same
+  family is seen in at least ``MIN_OPENINGS`` games and in at least half of the
+  classified games, it sets ``opp_style`` for an opponent whose profile is
+  unknown (``classify.OPENING_STYLE``);
+- our results per HydraBot strategy (the ``strategy`` versus.py reads from the
+  bot's log). After ``MIN_GAMES`` games, the strategy with the best smoothed
+  win rate, (wins + 1) / (games + 2), becomes the recommended counter -- but
+  only if it beats the 1/2 that smoothing gives an untried strategy; a
+  strategy that has only lost leaves the profile's counter in place. Ties
+  count as half a win, like bot/bandit.py.
+
+The learner is incremental: the overlay remembers how far into each history
+file it has read, and a run folds in only the lines appended since. A file
+that shrank (rotated or rewritten) triggers a full rebuild. Each opponent's
+derived counter is stored ready to use, keyed like the table (UUID when the
+opponent is profiled, else its lowercased name), so the merge at load is one
+dict lookup per opponent.
+
+    python opponent_intel/learn.py              # fold in new games
+    python opponent_intel/learn.py --rebuild    # start over from every history file
+    python opponent_intel/learn.py --no-replays # results only, skip replay parsing
+
+versus.py runs the incremental update after each game. Parallel versus runs
+share the overlay, so an update is one locked read-fold-write
+(``strategy_engine.statefile``, the same lock as HydraBot's bandit).
+"""
+from __future__ import annotations
+
+import glob
+import json
+import os
+import sys
+from collections import Counter
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from opponent_intel import classify  # noqa: E402
+from opponent_intel.intel import _table  # noqa: E402
+from strategy_engine import statefile  # noqa: E402
+
+OVERLAY_PATH = os.path.join(HERE, "opponent_overlay.json")
+HISTORY_GLOB = os.path.join(ROOT, "*", "results", "history.jsonl")
+SCHEMA_VERSION = 1
+MIN_GAMES = 3          # results before a learned strategy overrides the prior
+MIN_OPENINGS = 2       # sightings before a learned opening sets the style
+UNTRIED = 0.5          # smoothed win rate of a strategy with no games
+RACES = {"P": "Protoss", "T": "Terran", "Z": "Zerg"}
+
+
+def empty() -> dict:
+    return {"version": SCHEMA_VERSION, "files": {}, "stats": {}, "bots": {}, "names": {}}
+
+
+def load(path: str = OVERLAY_PATH) -> dict:
+    try:
+        with open(path) as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return empty()
+    if state.get("version") != SCHEMA_VERSION:
+        return empty()
+    return state
+
+
+def save(state: dict, path: str = OVERLAY_PATH) -> None:
+    statefile.write_json(path, state, indent=1, sort_keys=True)
+
+
+def opponent_key(name: str) -> str:
+    """The table's UUID for a profiled opponent, else its lowercased name."""
+    _fields, _bots, names = _table()
+    return names.get(name.lower(), name.lower())
+
+
+def replay_opening(path: str | None, opponent: str, race: str | None) -> str | None:
+    """The opponent's opening family in one of our replays, or None."""
+    if not path or not os.path.isfile(path):
+        return None
+    analysis = os.path.join(ROOT, "analysis")
+    if analysis not in sys.path:
+        sys.path.insert(0, analysis)
+    try:
+        import sc2reader
+        import extract_openings as eo
+    except ImportError:
+        return None
+    try:
+        r = sc2reader.load_replay(path, load_level=4)
+    except Exception:  # noqa: BLE001 - a corrupt replay only costs its opening
+        return None
+    players = [p for p in r.players or () if not p.is_observer]
+    them = [p for p in players if str(p.name).lower() == opponent.lower()]
+    if not them and race:
+        them = [p for p in players if p.play_race == race]
+    if len(them) != 1 or them[0].play_race not in eo.RACE_TH:
+        return None
+    p = them[0]
+    try:
+        return eo.classify(eo.extract_player(r, p.pid, p.play_race, eo.WINDOW))
+    except Exception:  # noqa: BLE001
+        return None
+
+
+def fold(state: dict, record: dict, replays: bool = True) -> bool:
+    """Fold one history record into ``state["stats"]``. False if it isn't a
+    finished game against a named opponent."""
+    name = record.get("opponent_name")
+    result = record.get("result")
+    if not name or result not in ("Victory", "Defeat", "Tie"):
+        return False
+    key = opponent_key(name)
+    s = state["stats"].setdefault(key, {"name": name, "games": 0, "openings": {},
+                                        "strategies": {}, "bots": {}})
+    s["games"] += 1
+    won, tied = result == "Victory", result == "Tie"
+    win, loss = (0.5, 0.5) if tied else (float(won), float(not won))
+    for table, arm in ((s["bots"], record.get("bot", "?")),
+                       (s["strategies"], record.get("strategy"))):
+        if arm:
+            row = table.setdefault(arm, [0.0, 0.0])
+            row[0] += win
+            row[1] += loss
+    if replays:
+        fam = replay_opening(record.get("replay"), name,
+                             RACES.get(record.get("opponent_race", "")))
+        if fam:
+            s["openings"][fam] = s["openings"].get(fam, 0) + 1
+    return True
+
+
+def derive(s: dict) -> dict:
+    """The ready-to-merge counter for one opponent's statistics."""
+    out = {"name": s["name"], "games": s["games"], "opening": None,
+           "opp_style": None, "hydra_strategy": None}
+    openings = Counter(s["openings"])
+    if openings:
+        fam, n = openings.most_common(1)[0]
+        if n >= MIN_OPENINGS and 2 * n >= sum(openings.values()):
+            out["opening"] = fam
+            out["opp_style"] = classify.opening_style(fam)
+    strategies = s["strategies"]
+    if sum(sum(row) for row in strategies.values()) >= MIN_GAMES:
+        def smoothed(arm):
+            wins, losses = strategies[arm]
+            return (wins + 1) / (wins + losses + 2)
+        best = max(strategies, key=smoothed)
+        if smoothed(best) > UNTRIED:
+            out["hydra_strategy"] = best
+    return out
+
+
+def update(path: str = OVERLAY_PATH, rebuild: bool = False, replays: bool = True,
+           history_glob: str = HISTORY_GLOB) -> int:
+    """Fold every new history line into the overlay; returns games folded."""
+    with statefile.transaction(path, lambda: empty() if rebuild else load(path),
+                               indent=1, sort_keys=True) as state:
+        return _fold_new(state, replays, history_glob)
+
+
+def _fold_new(state: dict, replays: bool, history_glob: str) -> int:
+    files = sorted(glob.glob(history_glob))
+    rel = {f: os.path.relpath(f, ROOT) for f in files}
+    if any(os.path.getsize(f) < state["files"].get(rel[f], 0) for f in files):
+        state.clear()                        # a history file was rewritten
+        state.update(empty())
+    folded = 0
+    touched = set()
+    for f in files:
+        offset = state["files"].get(rel[f], 0)
+        with open(f, "rb") as fh:
+            fh.seek(offset)
+            for line in fh:
+                if not line.endswith(b"\n"):
+                    break                    # a game still being written
+                offset += len(line)
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                if fold(state, record, replays):
+                    folded += 1
+                    touched.add(opponent_key(record["opponent_name"]))
+        state["files"][rel[f]] = offset
+    for key in touched:
+        d = state["bots"][key] = derive(state["stats"][key])
+        state["names"][d["name"].lower()] = key
+    return folded
+
+
+def main() -> None:
+    n = update(rebuild="--rebuild" in sys.argv, replays="--no-replays" not in sys.argv)
+    state = load()
+    print(f"folded {n} new games; {len(state['bots'])} opponents in "
+          f"{os.path.basename(OVERLAY_PATH)}", file=sys.stderr)
+    for key, d in sorted(state["bots"].items(), key=lambda kv: -kv[1]["games"]):
+        if d["opp_style"] or d["hydra_strategy"]:
+            print(f"  {d['name']:<22} {d['games']:>3} games  opening={d['opening'] or '?'} "
+                  f"style={d['opp_style'] or '?'} hydra={d['hydra_strategy'] or '-'}")
+
+
+if __name__ == "__main__":
+    main()
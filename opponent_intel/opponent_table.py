@@ -0,0 +1,201 @@
+"""Generated by opponent_intel/compile_table.py from opponent_map.json; do not edit."""
+
+FIELDS = ('name', 'race', 'elo', 'style', 'opp_style')
+
+BOTS = {
+    '00080adf-b0f4-40f6-83b7-e70016d6da8d': ('Kauyon', 'P', 1600, '', 'unknown'),
+    '017e5191-2501-49c0-8b0c-b2352e1a5f76': ('Thssprtssbt_fan', 'P', 1600, '', 'unknown'),
+    '0c2751e6-834e-459c-be7b-bd96de3ed9ae': ('tito', 'Z', 2036, 'Macro Zerg', 'macro_standard'),
+    '0e5be8db-ecb8-4ae8-9189-21f69e74f5e7': ('72Tortoises', 'Z', 1691, 'Roach/ling macro Zerg', 'macro_standard'),
+    '0e882191-e6ec-44f9-a6ac-83fde616b31d': ('Battler', 'T', 1718, 'Terran reaper bio/mech', 'macro_standard'),
+    '0f184729-b618-47b7-976b-964da08f53ed': ('muravev', 'Z', 1624, 'Speedling macro Zerg', 'macro_standard'),
+    '109b56c8-fa6e-4aa1-b58d-071fc2271c19': ('OmegaZ', 'Z', 1600, 'Zerg ling (weak form)', 'broken'),
+    '152c8779-29fc-42f9-8972-43dfae27c6dd': ('Phobos', 'T', 2150, 'Terran bio (MMM)', 'macro_standard'),
+    '1807a35e-52ee-4a37-b427-0d9743096773': ('Hannibal', 'Z', 1600, '', 'unknown'),
+    '1d3bb697-b044-47ee-b050-773fe1411791': ('JimmyBot', 'R', 1860, 'Random (Zerg-leaning)', 'unknown'),
+    '2540c0f3-238f-40a7-9c39-2e4f3dca2e2f': ('sharkbot', 'P', 1903, 'Protoss macro', 'macro_standard'),
+    '2557ad1d-ee42-4aaa-aa1b-1b46d31153d2': ('BenBotBC', 'T', 2143, 'Terran bio, marine micro', 'macro_standard'),
+    '273591ef-79eb-413b-8535-b1861b02311b': ('NextProBot', 'Z', 1600, '', 'unknown'),
+    '28a2fada-a646-4ba7-80b2-9c3dee593512': ('Clicadinha', 'Z', 1716, 'Roach macro Zerg', 'macro_standard'),
+    '28dd7593-85be-4205-94e3-bb83961f9bf1': ('Voltron', 'T', 1661, 'Terran bio-tank', 'macro_standard'),
+    '2c516e8a-311c-479c-b556-ccead334c672': ('sharpy_protoss_test1', 'P', 1601, 'Protoss gateway/stargate', 'air_tech'),
+    '2fa0d156-1ae6-4914-9f83-dd6f70302c09': ('BigDaddy', 'T', 1705, 'Terran bio (marine/medivac)', 'macro_standard'),
+    '3006428d-206f-46b9-a732-b6f6fe6743e4': ('RU', 'Z', 1600, '', 'unknown'),
+    '30d24da1-c681-4e1e-94dd-57fc1b085180': ('who', 'R', 2033, 'Random cheese/proxy specialist', 'allin'),
+    '335e7765-298d-492f-9169-71fdac13563a': ('chito', 'Z', 1977, 'Speedling macro Zerg', 'macro_standard'),
+    '337ae0e1-7553-44be-ad04-8cd455d77e21': ('ZeratulsRevengeTest', 'P', 1794, 'Protoss zealot (dev, unstable)', 'broken'),
+    '3504fcd4-4858-464e-9c69-820979af5da5': ('BobbyBotV10', 'R', 1600, '', 'unknown'),
+    '356f2646-2a9f-4141-984f-5d35c0a8c97e': ('Chomppet', 'T', 1600, '', 'unknown'),
+    '360550d0-4659-417e-b0c0-184f74e6385e': ('Roro', 'T', 1922, 'Terran', 'unknown'),
+    '3634913c-46bb-4e01-9816-64ca0ba7a1db': ('AvocaDEV', 'T', 1700, 'Terran bio (dev)', 'broken'),
+    '39200814-3e2c-4dc1-a53c-ba872a138688': ('PhantomTest', 'Z', 1600, 'Zerg (dev, weak form)', 'broken'),
+    '3e393172-b926-4946-b57e-f1c3ffd24353': ('Hellcannon', 'P', 1609, 'Protoss cannon+zealot', 'turtle'),
+    '4730ecca-ea78-4bcf-b571-22b46d9fd4ec': ('PhantomBot', 'Z', 1921, 'Zerg', 'unknown'),
+    '487bff6a-ea78-4c92-a499-ee40b5ce98b1': ('ArgoTest', 'P', 1842, 'Skytoss cannon+tempest (ArgoBot dev)', 'broken'),
+    '48b23f2e-87ae-44be-bfce-d86386edadf7': ('norman', 'P', 1705, 'Broken/losing (current)', 'broken'),
+    '4a491758-76ff-40de-996c-018d49b6237f': ('12PoolBot', 'Z', 1858, '12-pool speedling macro Zerg', 'macro_standard'),
+    '4b6a9648-363f-4806-99d0-a9429777ac54': ('smallBly', 'Z', 1996, 'Zerg', 'unknown'),
+    '4b6b7f6f-a80f-422e-b486-1a77ceceb71b': ('ArgoBot', 'P', 2065, 'Skytoss (cannon+tempest)', 'air_tech'),
+    '4bb75d73-280f-4706-9d68-7935b8ab0fd6': ('BotTato', 'T', 1909, 'Terran mech/reaper', 'macro_standard'),
+    '526e6d51-7eff-4752-82a8-ba673771cd19': ('FlowerPrincess', 'Z', 1682, 'Ling-flood Zerg', 'allin'),
+    '56e2e4cd-4d7f-447b-abdb-40fb2a6c13f7': ('smokinggunbot', 'T', 1602, 'Terran bio-tank turtle', 'turtle'),
+    '56ed60c5-835e-4f67-9c66-8de10a5bafba': ('JimmyBotP', 'P', 1887, 'Protoss (stalker/immortal/oracle)', 'robo_timing'),
+    '5802c7e1-b9cc-45a9-830f-326aae08850e': ('ur_moms_a_ho', 'Z', 1600, 'Zerg (small sample)', 'unknown'),
+    '59b6cb6d-1b1f-47b1-84b5-ac2a96f71bf7': ('WickedBot', 'T', 1940, 'Terran bio', 'macro_standard'),
+    '5e14c537-b8e7-4cd8-8aa4-1d6fcdb376cd': ('Dovahkiin', 'Z', 1697, 'Zerg macro', 'macro_standard'),
+    '60337090-fa15-485d-9497-d9b1c28a86b5': ('Caninana', 'Z', 2025, 'Micro macro Zerg', 'macro_standard'),
+    '626d31f7-8dfb-4af9-af81-546c611f9907': ('Forgefiend', 'P', 1657, 'Protoss cannon turtle/rush', 'allin'),
+    '639a757c-8901-40b6-a49f-9e804949109b': ('MechaShark', 'T', 1849, 'Terran macro (mech-leaning)', 'macro_standard'),
+    '69c0bb31-2c9b-4f39-aebd-914a7da1511d': ('muravevtest', 'Z', 1710, 'Speedling macro Zerg (muravev dev)', 'broken'),
+    '6b075187-e187-40d0-8721-1dc362805db5': ('nida', 'P', 1653, 'Protoss gateway stalker/phoenix', 'air_tech'),
+    '6bcce16a-8139-4dc0-8e72-b7ee8b3da1d8': ('Eris', 'Z', 2283, 'Macro Zerg (roach/ling)', 'macro_standard'),
+    '6e570722-ceff-41a9-b07c-14041069a3d9': ('Dodo', 'Z', 1678, 'Drone macro Zerg (Nydus)', 'macro_greedy'),
+    '706be45e-c38c-4a38-b1f5-d4e17fac2e76': ('ArtZerg', 'Z', 1642, 'Ling/roach aggro Zerg', 'macro_standard'),
+    '74f93bef-2db4-46fb-a8b7-a40aeb3ef7d8': ('IntrusiveThoughts', 'Z', 1600, '', 'unknown'),
+    '75b6aa71-944c-4e59-84a5-4d85b3ad916b': ('DownedStar', 'P', 1600, '', 'unknown'),
+    '773aa535-3aeb-486f-a3df-8a62f21750c5': ('Terranosaur', 'T', 1641, 'Terran mass-marine bio', 'macro_standard'),
+    '7e234d60-12cf-46e0-ac7a-72e87f6edc53': ('Zozo', 'P', 2109, 'Macro Protoss', 'macro_standard'),
+    '81fa0acc-93ea-479c-9ba5-08ae63b9e3f5': ('MicroMachine', 'T', 2094, 'Terran marine-micro specialist', 'macro_standard'),
+    '88e40155-4383-479f-9c2a-0f68a99c9cb6': ('JimmyBotT', 'T', 1860, 'Terran bio-tank', 'macro_standard'),
+    '8c0d7c96-ac1b-4991-b4d0-19e64f426bd6': ('TheLAW', 'T', 1619, 'Terran bio macro', 'macro_standard'),
+    '8cad7b11-d554-43b3-a774-2b6f32596f30': ('PerilousProtossBot', 'P', 1666, 'Protoss zealot/cannon (weak form)', 'broken'),
+    '8ce24c62-319f-424f-89dd-d435a7bd731c': ('AvocaDOS', 'T', 1741, 'Terran bio', 'macro_standard'),
+    '8cfca4f8-2d6c-40b7-a317-c5ea1dce9fad': ('Arpy', 'P', 1713, 'Protoss gateway zealot/adept', 'macro_standard'),
+    '8f0925c7-e1eb-4fba-9bc2-8df2134743d5': ('Creepy_duo_canon', 'P', 1655, 'Protoss double cannon rush', 'allin'),
+    '8f94d1fd-e5ee-4563-96d1-619c9d81290e': ('DominionDog', 'T', 1987, 'Terran bio', 'macro_standard'),
+    '944bcdff-a18f-4ed0-a5fc-35764399ef05': ('Sharkling', 'Z', 1838, 'Zerg', 'unknown'),
+    '984f127a-5e1d-4b54-a1ac-42044cf4c52e': ('Deimos', 'P', 2295, 'Macro Protoss, adept/phoenix harass', 'air_tech'),
+    '99806709-9b28-487b-83bf-5bb45c241209': ('bilisaur', 'Z', 1600, '', 'unknown'),
+    '9c388878-6009-4bea-85e6-40de4d94f79a': ('PiG_Bot', 'P', 1646, 'Protoss gateway/robo macro', 'robo_timing'),
+    '9c83b32e-2e35-48c0-b051-ec134795b817': ('SunsetOrpheus', 'R', 1600, '', 'unknown'),
+    '9eaa34d2-3ee2-45b6-8c04-64a31b95ae25': ('ZEALOCALYPSE', 'P', 1623, 'Protoss zealot flood', 'allin'),
+    'a20e769c-fecf-46c7-b1d0-226b9774986d': ('Hello_world', 'Z', 1600, '', 'unknown'),
+    'a378fd89-7693-4445-a04c-ddb67e7bea8a': ('Persephone', 'Z', 1632, 'Ling/roach macro Zerg', 'macro_standard'),
+    'a51d7f01-0f4a-4b91-ada8-7bd1eeec2cda': ('Krillin', 'Z', 1600, 'Zerg macro/aggro', 'macro_standard'),
+    'aad42273-84e0-4ae8-8c68-366951ac5c5e': ('TyrT', 'T', 1884, 'Terran macro', 'macro_standard'),
+    'ae65989d-159d-4cc6-882a-c6a581396ea3': ('bottinger', 'Z', 1600, '', 'unknown'),
+    'aea70272-1c83-46a1-92a5-cdd5a25236af': ('Cyne', 'P', 1756, 'Protoss gateway/robo (weak form)', 'broken'),
+    'aebdab28-905d-4313-8183-eae212947860': ('clone', 'T', 1648, 'Terran reaper/starport', 'unknown'),
+    'af09f69e-a162-45a8-98e8-e36c80899144': ('Xena', 'R', 2103, 'Random, adaptive macro', 'macro_standard'),
+    'af9f3708-42b5-46fc-a071-f729f8355bcd': ('kas', 'Z', 1638, 'Over-drone macro Zerg', 'macro_greedy'),
+    'b0c3dbb7-a2f1-4185-8c06-db015162043f': ('zig-spudde', 'T', 1757, 'Terran bio-tank', 'macro_standard'),
+    'bd344d56-0874-4e6f-b229-ffde6269eff2': ('CynEX', 'P', 1677, 'Skytoss/stalker macro Protoss', 'air_tech'),
+    'bd9154be-e00f-4600-88ce-a0d2650ea716': ('LunaxVRR', 'P', 1883, 'Skytoss (cannon+tempest)', 'air_tech'),
+    'be47253f-5e5f-4c08-af24-a705d235f021': ('whalemean', 'R', 1896, 'Random', 'unknown'),
+    'c033a97a-667d-42e3-91e8-13528ac191ed': ('Apidae', 'P', 1718, 'Protoss cannon turtle/rush', 'allin'),
+    'c11fe18a-7ce5-4a0f-8900-17fc6dcc2243': ('Mulebot', 'T', 1697, 'Terran bio-mech', 'macro_standard'),
+    'c27b8734-4d5b-4475-9204-bf245c78226d': ('Asteria', 'P', 1642, 'Stargate skytoss (carrier/tempest)', 'air_tech'),
+    'c4256f70-963b-461a-8c0e-bdf83d4ff266': ('GPT', 'T', 2056, 'Terran bio-tank', 'macro_standard'),
+    'c5e0e203-bfa8-4f8f-a96d-5235a9a481af': ('SharpenedEdge', 'P', 2042, 'Macro Protoss', 'macro_standard'),
+    'c6a3b8c6-27c2-4e4c-b31f-c26d61195fff': ('WoundMaker', 'Z', 1932, 'Mutalisk Zerg', 'air_tech'),
+    'c6d0b3ef-6edc-4882-bc45-5dc4bd5be502': ('LunaxVRRTest', 'P', 1836, 'Skytoss void/tempest (LunaxVRR dev)', 'broken'),
+    'c8ed3d8b-3607-40e3-b7fe-075d9c08a5fd': ('QueenBot', 'Z', 1611, 'Queen/creep macro Zerg', 'turtle'),
+    'cd45a48d-3de9-48b0-b7c3-2daf20af8c04': ('Aeolus', 'P', 1774, 'Stalker/blink macro Protoss', 'macro_standard'),
+    'd0c3a668-1fa2-4e3d-ad02-7ba7f17a67ea': ('LordSuperKing', 'P', 1752, 'Protoss stalker+tempest', 'air_tech'),
+    'd6d98d5e-1ed9-42de-9831-f5ff6a4496a8': ('Horizon', 'T', 1625, 'Terran bio/air macro', 'air_tech'),
+    'd9767f0e-b2dc-48e7-ad8b-58dacaaeab98': ('WaterLeak', 'Z', 1876, 'Roach/ling Zerg', 'macro_standard'),
+    'd976d19d-89b8-4340-937c-4b16d72f9ff2': ('zig-reapers', 'T', 1602, 'Terran mass-reaper all-in', 'allin'),
+    'e3ea0dca-6dc0-40e0-ba05-4b7beb697d4f': ('OneBaseStalkerBot', 'P', 1614, 'Protoss one-base stalker', 'allin'),
+    'e7120c68-f3ee-4772-b20e-c877c8363b8c': ('TyrP', 'P', 1933, 'Protoss macro', 'macro_standard'),
+    'eaf8a4ce-8bde-42d6-82b3-2861c8a47930': ('VeTerran-revived', 'T', 1972, 'Terran bio/mech macro', 'macro_standard'),
+    'f3eb9d84-22e2-4dd9-bf6d-4a691f03e1b9': ('JimmyBotZ', 'Z', 1820, 'Roach/drone macro Zerg', 'macro_greedy'),
+}
+
+NAMES = {
+    '12poolbot': '4a491758-76ff-40de-996c-018d49b6237f',
+    '72tortoises': '0e5be8db-ecb8-4ae8-9189-21f69e74f5e7',
+    'aeolus': 'cd45a48d-3de9-48b0-b7c3-2daf20af8c04',
+    'apidae': 'c033a97a-667d-42e3-91e8-13528ac191ed',
+    'argobot': '4b6b7f6f-a80f-422e-b486-1a77ceceb71b',
+    'argotest': '487bff6a-ea78-4c92-a499-ee40b5ce98b1',
+    'arpy': '8cfca4f8-2d6c-40b7-a317-c5ea1dce9fad',
+    'artzerg': '706be45e-c38c-4a38-b1f5-d4e17fac2e76',
+    'asteria': 'c27b8734-4d5b-4475-9204-bf245c78226d',
+    'avocadev': '3634913c-46bb-4e01-9816-64ca0ba7a1db',
+    'avocados': '8ce24c62-319f-424f-89dd-d435a7bd731c',
+    'battler': '0e882191-e6ec-44f9-a6ac-83fde616b31d',
+    'benbotbc': '2557ad1d-ee42-4aaa-aa1b-1b46d31153d2',
+    'bigdaddy': '2fa0d156-1ae6-4914-9f83-dd6f70302c09',
+    'bilisaur': '99806709-9b28-487b-83bf-5bb45c241209',
+    'bobbybotv10': '3504fcd4-4858-464e-9c69-820979af5da5',
+    'bottato': '4bb75d73-280f-4706-9d68-7935b8ab0fd6',
+    'bottinger': 'ae65989d-159d-4cc6-882a-c6a581396ea3',
+    'caninana': '60337090-fa15-485d-9497-d9b1c28a86b5',
+    'chito': '335e7765-298d-492f-9169-71fdac13563a',
+    'chomppet': '356f2646-2a9f-4141-984f-5d35c0a8c97e',
+    'clicadinha': '28a2fada-a646-4ba7-80b2-9c3dee593512',
+    'clone': 'aebdab28-905d-4313-8183-eae212947860',
+    'creepy_duo_canon': '8f0925c7-e1eb-4fba-9bc2-8df2134743d5',
+    'cyne': 'aea70272-1c83-46a1-92a5-cdd5a25236af',
+    'cynex': 'bd344d56-0874-4e6f-b229-ffde6269eff2',
+    'deimos': '984f127a-5e1d-4b54-a1ac-42044cf4c52e',
+    'dodo': '6e570722-ceff-41a9-b07c-14041069a3d9',
+    'dominiondog': '8f94d1fd-e5ee-4563-96d1-619c9d81290e',
+    'dovahkiin': '5e14c537-b8e7-4cd8-8aa4-1d6fcdb376cd',
+    'downedstar': '75b6aa71-944c-4e59-84a5-4d85b3ad916b',
+    'eris': '6bcce16a-8139-4dc0-8e72-b7ee8b3da1d8',
+    'flowerprincess': '526e6d51-7eff-4752-82a8-ba673771cd19',
+    'forgefiend': '626d31f7-8dfb-4af9-af81-546c611f9907',
+    'gpt': 'c4256f70-963b-461a-8c0e-bdf83d4ff266',
+    'hannibal': '1807a35e-52ee-4a37-b427-0d9743096773',
+    'hellcannon': '3e393172-b926-4946-b57e-f1c3ffd24353',
+    'hello_world': 'a20e769c-fecf-46c7-b1d0-226b9774986d',
+    'horizon': 'd6d98d5e-1ed9-42de-9831-f5ff6a4496a8',
+    'intrusivethoughts': '74f93bef-2db4-46fb-a8b7-a40aeb3ef7d8',
+    'jimmybot': '1d3bb697-b044-47ee-b050-773fe1411791',
+    'jimmybotp': '56ed60c5-835e-4f67-9c66-8de10a5bafba',
+    'jimmybott': '88e40155-4383-479f-9c2a-0f68a99c9cb6',
+    'jimmybotz': 'f3eb9d84-22e2-4dd9-bf6d-4a691f03e1b9',
+    'kas': 'af9f3708-42b5-46fc-a071-f729f8355bcd',
+    'kauyon': '00080adf-b0f4-40f6-83b7-e70016d6da8d',
+    'krillin': 'a51d7f01-0f4a-4b91-ada8-7bd1eeec2cda',
+    'lordsuperking': 'd0c3a668-1fa2-4e3d-ad02-7ba7f17a67ea',
+    'lunaxvrr': 'bd9154be-e00f-4600-88ce-a0d2650ea716',
+    'lunaxvrrtest': 'c6d0b3ef-6edc-4882-bc45-5dc4bd5be502',
+    'mechashark': '639a757c-8901-40b6-a49f-9e804949109b',
+    'micromachine': '81fa0acc-93ea-479c-9ba5-08ae63b9e3f5',
+    'mulebot': 'c11fe18a-7ce5-4a0f-8900-17fc6dcc2243',
+    'muravev': '0f184729-b618-47b7-976b-964da08f53ed',
+    'muravevtest': '69c0bb31-2c9b-4f39-aebd-914a7da1511d',
+    'nextprobot': '273591ef-79eb-413b-8535-b1861b02311b',
+    'nida': '6b075187-e187-40d0-8721-1dc362805db5',
+    'norman': '48b23f2e-87ae-44be-bfce-d86386edadf7',
+    'omegaz': '109b56c8-fa6e-4aa1-b58d-071fc2271c19',
+    'onebasestalkerbot': 'e3ea0dca-6dc0-40e0-ba05-4b7beb697d4f',
+    'perilousprotossbot': '8cad7b11-d554-43b3-a774-2b6f32596f30',
+    'persephone': 'a378fd89-7693-4445-a04c-ddb67e7bea8a',
+    'phantombot': '4730ecca-ea78-4bcf-b571-22b46d9fd4ec',
+    'phantomtest': '39200814-3e2c-4dc1-a53c-ba872a138688',
+    'phobos': '152c8779-29fc-42f9-8972-43dfae27c6dd',
+    'pig_bot': '9c388878-6009-4bea-85e6-40de4d94f79a',
+    'queenbot': 'c8ed3d8b-3607-40e3-b7fe-075d9c08a5fd',
+    'roro': '360550d0-4659-417e-b0c0-184f74e6385e',
+    'ru': '3006428d-206f-46b9-a732-b6f6fe6743e4',
+    'sharkbot': '2540c0f3-238f-40a7-9c39-2e4f3dca2e2f',
+    'sharkling': '944bcdff-a18f-4ed0-a5fc-35764399ef05',
+    'sharpenededge': 'c5e0e203-bfa8-4f8f-a96d-5235a9a481af',
+    'sharpy_protoss_test1': '2c516e8a-311c-479c-b556-ccead334c672',
+    'smallbly': '4b6a9648-363f-4806-99d0-a9429777ac54',
+    'smokinggunbot': '56e2e4cd-4d7f-447b-abdb-40fb2a6c13f7',
+    'sunsetorpheus': '9c83b32e-2e35-48c0-b051-ec134795b817',
+    'terranosaur': '773aa535-3aeb-486f-a3df-8a62f21750c5',
+    'thelaw': '8c0d7c96-ac1b-4991-b4d0-19e64f426bd6',
+    'thssprtssbt_fan': '017e5191-2501-49c0-8b0c-b2352e1a5f76',
+    'tito': '0c2751e6-834e-459c-be7b-bd96de3ed9ae',
+    'tyrp': 'e7120c68-f3ee-4772-b20e-c877c8363b8c',
+    'tyrt': 'aad42273-84e0-4ae8-8c68-366951ac5c5e',
+    'ur_moms_a_ho': '5802c7e1-b9cc-45a9-830f-326aae08850e',
+    'veterran-revived': 'eaf8a4ce-8bde-42d6-82b3-2861c8a47930',
+    'voltron': '28dd7593-85be-4205-94e3-bb83961f9bf1',
+    'waterleak': 'd9767f0e-b2dc-48e7-ad8b-58dacaaeab98',
+    'whalemean': 'be47253f-5e5f-4c08-af24-a705d235f021',
+    'who': '30d24da1-c681-4e1e-94dd-57fc1b085180',
+    'wickedbot': '59b6cb6d-1b1f-47b1-84b5-ac2a96f71bf7',
+    'woundmaker': 'c6a3b8c6-27c2-4e4c-b31f-c26d61195fff',
+    'xena': 'af09f69e-a162-45a8-98e8-e36c80899144',
+    'zealocalypse': '9eaa34d2-3ee2-45b6-8c04-64a31b95ae25',
+    'zeratulsrevengetest': '337ae0e1-7553-44be-ad04-8cd455d77e21',
+    'zig-reapers': 'd976d19d-89b8-4340-937c-4b16d72f9ff2',
+    'zig-spudde': 'b0c3dbb7-a2f1-4185-8c06-db015162043f',
+    'zozo': '7e234d60-12cf-46e0-ac7a-72e87f6edc53',
+}
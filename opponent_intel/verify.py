@@ -9,6 +9,7 @@ This is the proof that a bot can turn the in-game --OpponentId into a strategy.
     # self-test: resolve every known bot and show the strategy distribution
     python opponent_intel/verify.py --all
 """
+import json
 import os
 import sys
 from collections import Counter
@@ -16,7 +17,8 @@ from collections import Counter
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from opponent_intel import recommend_for, known_count
-from opponent_intel.intel import _BOTS
+from opponent_intel.compile_table import FIELDS
+from opponent_intel.intel import _MAP_PATH, bots
 
 
 def show_one(opponent_id: str) -> None:
@@ -32,11 +34,20 @@ def show_one(opponent_id: str) -> None:
 
 def selftest() -> None:
     print(f"opponent_map: {known_count()} known bots\n")
+    # the compiled table must match the JSON map it was built from
+    with open(_MAP_PATH) as f:
+        source = json.load(f)["bots"]
+    table = bots()
+    stale = {u for u in set(source) | set(table)
+             if {k: source.get(u, {}).get(k) for k in FIELDS} != table.get(u)}
+    if stale:
+        print(f"  STALE opponent_table.py ({len(stale)} entries differ); "
+              "run python opponent_intel/compile_table.py")
     hydra = Counter()
     stance = Counter()
     # resolve each bot BOTH by its UUID and by its name; assert they agree
     mismatches = 0
-    for uuid, e in _BOTS.items():
+    for uuid, e in table.items():
         by_uuid = recommend_for(uuid)
         by_name = recommend_for(e["name"])
         if by_uuid.hydra_strategy != by_name.hydra_strategy:
@@ -55,9 +66,63 @@ def selftest() -> None:
     print(f"\nunknown UUID -> known={unk.known}, hydra={unk.hydra_strategy}, stance={unk.stance}")
     assert not unk.known and unk.hydra_strategy == "MacroRoachHydra"
     assert mismatches == 0, f"{mismatches} uuid/name mismatches"
+    assert not stale, "opponent_table.py is out of date with opponent_map.json"
+    check_overlay_merge()
+    check_overlay_losing()
+
     print("\nOK: UUID and name resolve identically; unknown falls back safely.")
 
 
+def _learned_rec(name: str, games, openings=None):
+    """``recommend_for(name)`` with an overlay learned from ``games`` alone."""
+    import tempfile
+    from opponent_intel import intel, learn
+
+    state = learn.empty()
+    for result, strategy in games:
+        learn.fold(state, {"opponent_name": name, "result": result, "bot": "hydra",
+                           "strategy": strategy}, replays=False)
+    key = learn.opponent_key(name)
+    state["stats"][key]["openings"] = openings or {}
+    state["bots"][key] = learn.derive(state["stats"][key])
+    state["names"][name.lower()] = key
+    saved = intel._OVERLAY_PATH
+    with tempfile.TemporaryDirectory() as d:
+        intel._OVERLAY_PATH = os.path.join(d, "overlay.json")
+        learn.save(state, intel._OVERLAY_PATH)
+        intel._overlay.cache_clear()
+        try:
+            rec = recommend_for(name)
+        finally:
+            intel._OVERLAY_PATH = saved
+            intel._overlay.cache_clear()
+    return rec
+
+
+def check_overlay_merge() -> None:
+    """A learned overlay fills in an unknown style and picks the counter that won."""
+    name = next(e["name"] for e in bots().values() if e["opp_style"] == "unknown")
+    rec = _learned_rec(name, (("Defeat", "MacroRoachHydra"), ("Victory", "RoachTiming"),
+                              ("Victory", "RoachTiming"), ("Tie", "MacroRoachHydra")),
+                       {"protoss_proxy": 2, "protoss_gate_expand": 1})
+    print(f"\nlearned overlay: {rec.summary()}")
+    assert rec.opp_style == "allin" and rec.hydra_strategy == "RoachTiming"
+    assert rec.learned_games == 4
+
+
+def check_overlay_losing() -> None:
+    """A strategy that has only lost never overrides the profile's counter."""
+    from opponent_intel import classify
+
+    name, style = next((e["name"], e["opp_style"]) for e in bots().values()
+                       if e["opp_style"] != "unknown")
+    prior = classify.hydra_strategy(style)
+    tried = next(s for s in ("RoachTiming", "MacroRoachHydra") if s != prior)
+    rec = _learned_rec(name, [("Defeat", tried)] * 3)
+    print(f"learned overlay, 0-3 with {tried}: {rec.summary()}")
+    assert rec.learned_games == 3 and rec.hydra_strategy == prior
+
+
 def main() -> None:
     args = sys.argv[1:]
     if not args or args[0] in ("--all", "-a", "--selftest"):
@@ -19,7 +19,7 @@ import numpy as np
 from loguru import logger
 
 import bot.compat  # noqa: F401 - 4.10 linux client compatibility patches
-from bot.tuning import Tuner
+from bot.tuning import SCHEMA, Tuner
 from ares import AresBot
 from ares.behaviors.combat import CombatManeuver
 from ares.behaviors.combat.individual import (
@@ -198,14 +198,19 @@ class PhoenixBot(AresBot):
 
         # continuous parameter learning: draw this game's strategy knobs
         # from the persisted search distribution (data dir survives between
-        # ladder games, so learning continues on the arena)
+        # ladder games, so learning continues on the arena).
+        # PHOENIX_TUNER=0 (harness/tune.py) plays the SCHEMA defaults and
+        # records nothing: the harness owns those games' parameters.
         from pathlib import Path
 
-        self._tuner = Tuner(Path("data"))
-        p = self._tuner.ask()
+        self._tuner = (Tuner(Path("data"))
+                       if os.environ.get("PHOENIX_TUNER", "1") != "0" else None)
+        p = (self._tuner.ask() if self._tuner is not None
+             else {q.name: q.mean for q in SCHEMA})
         # controlled-experiment hook: pin any subset of params to fixed
         # values (JSON) so an A/B can isolate one knob. Does not affect the
-        # ladder (env var unset there); tell() still records the real result.
+        # ladder (env var unset there); tell() still records the real result
+        # unless the tuner is off.
         override = os.environ.get("PHOENIX_PARAM_OVERRIDE")
         if override:
             p.update(json.loads(override))
@@ -226,17 +231,16 @@ class PhoenixBot(AresBot):
             (score.killed_value_units or 0)
             + (score.killed_value_structures or 0)
         )
-        proto = score._proto
         lost = float(
-            getattr(proto, "lost_minerals_army", 0)
-            + getattr(proto, "lost_vespene_army", 0)
-        )
-        self._tuner.tell(
-            won=str(game_result) == "Result.Victory",
-            tied=str(game_result) == "Result.Tie",
-            killed_value=killed,
-            lost_value=lost,
+            (score.lost_minerals_army or 0) + (score.lost_vespene_army or 0)
         )
+        if self._tuner is not None:
+            self._tuner.tell(
+                won=str(game_result) == "Result.Victory",
+                tied=str(game_result) == "Result.Tie",
+                killed_value=killed,
+                lost_value=lost,
+            )
         await super(PhoenixBot, self).on_end(game_result)
 
     def _enemy_committed_one_base(self) -> bool:
@@ -8,17 +8,24 @@ distribution moves toward the elite half. State lives in the bot data dir
 (`data/tuning.json`), which AI Arena persists between ladder games, so the
 bot keeps learning on the ladder as well as locally.
 
-Serial access only: concurrent games sharing one data dir will race.
+Parallel games may share one data dir (gauntlet `--concurrency N`): `tell()`
+re-reads the state under an exclusive lock, appends its result to the batch,
+moves the distribution if the batch is full, and replaces the JSON atomically
+before releasing the lock (`strategy_engine.statefile`). No result is lost,
+and a batch of 8 fills from 8 concurrent games, so the distribution moves once
+per batch-time rather than once per 8 sequential games. A result whose sample
+was drawn from a distribution that has since moved still counts toward the
+next batch; CEM only needs the samples, not the distribution that drew them.
 """
 
 import json
 import math
-import os
 import random
-import tempfile
 from dataclasses import dataclass
 from pathlib import Path
 
+from strategy_engine import statefile
+
 BATCH_SIZE = 8
 ELITE_FRAC = 0.5
 MIN_SCALE_FRAC = 0.15  # never shrink exploration below this fraction of init
@@ -100,21 +107,6 @@ class Tuner:
         ]
         return state
 
-    def _save(self) -> None:
-        self.path.parent.mkdir(parents=True, exist_ok=True)
-        fd, tmp = tempfile.mkstemp(dir=str(self.path.parent), suffix=".tmp")
-        try:
-            with os.fdopen(fd, "w") as f:
-                json.dump(self.state, f)
-                f.flush()
-                os.fsync(f.fileno())
-            os.replace(tmp, self.path)
-        except OSError:
-            try:
-                os.unlink(tmp)
-            except OSError:
-                pass
-
     # -- optimizer -----------------------------------------------------
     def ask(self) -> dict[str, float]:
         """Draw one parameter sample for this game."""
@@ -129,23 +121,25 @@ class Tuner:
     def tell(self, won: bool, tied: bool, killed_value: float,
              lost_value: float) -> None:
         """Report this game's result and update the distribution if the
-        batch is complete."""
+        batch is complete. Safe against concurrent games on one data dir."""
         if self._sample is None:
             return
         outcome = 1.0 if won else (0.5 if tied else 0.0)
         eff = math.log1p(max(0.0, killed_value)) - math.log1p(
             max(0.0, lost_value)
         )
-        self.state["batch"].append(
-            {"sample": self._sample, "outcome": outcome, "eff": eff}
-        )
-        self.state["games"] += 1
+        # other games may have reported since our ask(): build on the state
+        # as it is now, not as it was when this game started
+        with statefile.transaction(self.path, self._load) as state:
+            self.state = state
+            state["batch"].append(
+                {"sample": self._sample, "outcome": outcome, "eff": eff}
+            )
+            state["games"] += 1
+            if len(state["batch"]) >= BATCH_SIZE:
+                self._update()
         self._sample = None
 
-        if len(self.state["batch"]) >= BATCH_SIZE:
-            self._update()
-        self._save()
-
     def _update(self) -> None:
         batch = self.state["batch"]
         # lexicographic: outcome dominates, efficiency breaks ties
@@ -15,6 +15,8 @@ from pathlib import Path
 # ares reads config.yml from the working directory
 ROOT_DIR = Path(__file__).parent
 sys.path.insert(0, str(ROOT_DIR))
+# strategy_engine: beside run.py in the ladder zip, at the repo root locally
+sys.path.insert(1, str(ROOT_DIR.resolve().parent))
 
 import yaml
 from sc2 import maps
@@ -9,14 +9,44 @@ AI Arena ladder (currently 3.12):
     python scripts/create_ladder_zip.py --site-packages \
         /root/venv312/lib/python3.12/site-packages
     python scripts/create_ladder_zip.py --bot griffin
+    python scripts/create_ladder_zip.py --bot griffin --slim
 
 Output: <BotName>.zip in the repo root.
+
+``--slim`` ships only what the bot actually imports:
+
+- the import closure of ``run.py`` is computed with the ladder Python: the
+  static closure (``modulefinder``, which also sees imports inside functions)
+  plus every module that importing ``run`` really loads. Dependency modules
+  outside it are dropped, along with docs, type stubs and test dirs the
+  closure does not reach; a module in the closure is never dropped. Other
+  data files are always kept. ``--keep`` adds a module (and everything under
+  it) that is only imported dynamically;
+- extension modules are stripped of debug symbols (``strip``, when present);
+- every module is byte-compiled for the ladder Python with unchecked-hash
+  ``.pyc`` files, which stay valid after the arena extracts the zip with new
+  mtimes, so the first game imports without compiling;
+- data files of ``--store-min-kb`` or more are stored uncompressed, so they
+  can be read or mmapped straight out of the archive;
+- files with identical content are reported, so a package vendored twice
+  shows up.
+
+It also builds the full zip and prints both sizes and both cold-import times.
+A cold import is the first ``import run`` in a fresh extraction, measured
+with ``--python``. The slim zip is then smoke-tested in a fresh extraction
+(``run.py --help`` and constructing the bot); a failure exits nonzero. That
+does not play a game: a module first imported mid-game is not checked, so
+play one from the slim zip before uploading.
 """
 
 import argparse
+import hashlib
+import json
 import shutil
+import subprocess
 import sys
 import tempfile
+import time
 import zipfile
 from pathlib import Path
 
@@ -30,6 +60,8 @@ BOT_REGISTRY = {
 
 BOT_FILES = ["run.py", "ladder.py", "config.yml"]
 BOT_PACKAGE = "bot"
+# repo packages the bot imports (bot/tuning.py -> strategy_engine.statefile)
+REPO_PACKAGES = ["strategy_engine"]
 
 # package dirs harvested from site-packages (ares installs under src/)
 DEPENDENCIES = {
@@ -42,6 +74,12 @@ DEPENDENCIES = {
 
 IGNORE_SUFFIXES = (".pyx", ".pyi", ".c", ".pyd", ".h")
 IGNORE_DIRS = {"__pycache__", "pickle_gameinfo", "tests", "docs"}
+# --slim: also dropped inside packages (the bot's own files are never slimmed)
+SLIM_SUFFIXES = (".md", ".rst", ".typed")
+SLIM_DIRS = {"test", "testing", "examples", "benchmarks"}
+# packages kept whole in --slim mode: loaded by path or by name at runtime
+SLIM_KEEP = {BOT_PACKAGE}
+STORE_SUFFIXES = (".npy", ".npz", ".pkl", ".pickle", ".bin", ".dat", ".gz", ".zip")
 # sc2_helper ships binaries for many platforms/versions; keep only the
 # linux one matching the target python
 SC2_HELPER_KEEP = "sc2_helper.cpython-{v}-x86_64-linux-gnu.so"
@@ -65,6 +103,226 @@ def copy_package(src: Path, dst: Path, py_tag: str) -> None:
     shutil.copytree(src, dst, ignore=ignore)
 
 
+def stage(bot: str, sp: Path, py_tag: str, staging: Path) -> None:
+    """Copy the bot and its dependency packages into ``staging``."""
+    _bot_name, builds_yml = BOT_REGISTRY[bot]
+    bot_dir = REPO_ROOT / bot
+    for name in [*BOT_FILES, builds_yml]:
+        shutil.copy2(bot_dir / name, staging / name)
+    copy_package(bot_dir / BOT_PACKAGE, staging / BOT_PACKAGE, py_tag)
+    for name in REPO_PACKAGES:
+        copy_package(REPO_ROOT / name, staging / name, py_tag)
+    for dst_name, rel_src in DEPENDENCIES.items():
+        copy_package(sp / rel_src, staging / dst_name, py_tag)
+
+
+# Run by the ladder Python inside the staging dir: the static closure of
+# run.py plus what importing it actually loads, as {module: file}.
+_PROBE = r"""
+import json, modulefinder, os, sys
+root = os.path.realpath(sys.argv[1])
+sys.path.insert(0, root)
+finder = modulefinder.ModuleFinder(path=sys.path)
+try:
+    finder.run_script(os.path.join(root, "run.py"))
+except Exception as exc:
+    print("modulefinder:", exc, file=sys.stderr)
+found = {n: m.__file__ for n, m in finder.modules.items() if m.__file__}
+error = None
+try:
+    import run  # noqa: F401
+except BaseException as exc:
+    error = f"{type(exc).__name__}: {exc}"
+for n, m in list(sys.modules.items()):
+    f = getattr(m, "__file__", None)
+    if f:
+        found.setdefault(n, f)
+found = {n: os.path.realpath(f) for n, f in found.items()}
+print(json.dumps({"modules": {n: f for n, f in found.items()
+                              if f.startswith(root + os.sep)},
+                  "error": error}))
+"""
+
+
+def import_closure(python: str, root: Path) -> dict:
+    """``{"modules": {name: file}, "error": str | None}`` for ``root/run.py``."""
+    proc = subprocess.run([python, "-c", _PROBE, str(root)], cwd=root,
+                          capture_output=True, text=True, timeout=600)
+    if proc.returncode != 0 or not proc.stdout.strip():
+        sys.exit(f"import probe failed:\n{proc.stderr[-2000:]}")
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def module_name(path: Path) -> str:
+    """Dotted module name of a .py / extension file relative to the zip root."""
+    parts = list(path.parts)
+    parts[-1] = parts[-1].split(".", 1)[0]
+    if parts[-1] == "__init__":
+        parts.pop()
+    return ".".join(parts)
+
+
+def slim(root: Path, closure: dict, keep: set) -> tuple:
+    """Drop dependency modules outside ``closure``; returns ``(files, bytes)`` dropped."""
+    root = root.resolve()
+    reached = {module_name(Path(f).relative_to(root)) for f in closure.values()}
+    reached_dirs = {Path(f).parent for f in closure.values()}
+    keep = keep | SLIM_KEEP
+
+    def kept(mod: str) -> bool:
+        return mod in reached or any(mod == k or mod.startswith(k + ".") for k in keep)
+
+    files = size = 0
+    for f in sorted(root.rglob("*")):
+        if not f.is_file() or f.parent == root:
+            continue                        # top-level bot files always ship
+        rel = f.relative_to(root)
+        if rel.parts[0] in keep:
+            continue
+        if f.suffix in (".py", ".so"):
+            drop = not kept(module_name(rel))
+        else:                               # a test dir the closure reaches keeps its data
+            drop = (f.name.endswith(SLIM_SUFFIXES)
+                    or (SLIM_DIRS.intersection(rel.parts[:-1])
+                        and f.parent not in reached_dirs))
+        if drop:
+            files += 1
+            size += f.stat().st_size
+            f.unlink()
+    for d in sorted((d for d in root.rglob("*") if d.is_dir()), reverse=True):
+        if not any(d.iterdir()):
+            d.rmdir()
+    return files, size
+
+
+def strip_extensions(root: Path) -> int:
+    """``strip --strip-unneeded`` every extension module; returns bytes saved."""
+    tool = shutil.which("strip")
+    if tool is None:
+        return 0
+    saved = 0
+    for so in root.rglob("*.so"):
+        before = so.stat().st_size
+        if subprocess.run([tool, "--strip-unneeded", str(so)],
+                          capture_output=True).returncode == 0:
+            saved += before - so.stat().st_size
+    return saved
+
+
+def duplicates(root: Path) -> list:
+    """Groups of identical files (same bytes), largest first."""
+    by_hash: dict = {}
+    for f in root.rglob("*"):
+        if f.is_file() and f.stat().st_size > 0:
+            by_hash.setdefault(hashlib.sha1(f.read_bytes()).hexdigest(), []).append(f)
+    groups = [g for g in by_hash.values() if len(g) > 1]
+    return sorted(groups, key=lambda g: -g[0].stat().st_size * (len(g) - 1))
+
+
+def compile_pyc(python: str, root: Path) -> None:
+    """Byte-compile for the ladder Python; unchecked-hash so extraction mtimes don't matter."""
+    proc = subprocess.run([python, "-m", "compileall", "-q", "-j", "0",
+                           "--invalidation-mode", "unchecked-hash", str(root)],
+                          capture_output=True, text=True)
+    if proc.returncode != 0:                # e.g. a module for another Python version
+        print(f"warning: compileall reported errors:\n{proc.stdout[-1000:]}")
+
+
+def write_zip(root: Path, out: Path, store_min: int = 0) -> None:
+    """Zip ``root``. With ``store_min``, data files at least that big are stored
+    uncompressed; code is always deflated."""
+    out.unlink(missing_ok=True)
+    with zipfile.ZipFile(out, "w", zipfile.ZIP_DEFLATED) as zf:
+        for f in sorted(root.rglob("*")):
+            if not f.is_file():
+                continue
+            stored = store_min and (f.suffix in STORE_SUFFIXES
+                                    or (f.suffix not in (".py", ".pyc", ".so")
+                                        and f.stat().st_size >= store_min))
+            zf.write(f, f.relative_to(root),
+                     zipfile.ZIP_STORED if stored else zipfile.ZIP_DEFLATED)
+
+
+def cold_import(python: str, archive: Path, runs: int = 3):
+    """Median seconds of a first ``import run`` in a fresh extraction, or the error."""
+    times = []
+    for _ in range(runs):
+        with tempfile.TemporaryDirectory(prefix="ladder_import_") as d:
+            with zipfile.ZipFile(archive) as zf:
+                zf.extractall(d)
+            t = time.perf_counter()
+            proc = subprocess.run([python, "-c", "import run"], cwd=d,
+                                  capture_output=True, text=True, timeout=600)
+            if proc.returncode != 0:
+                return proc.stderr.strip().splitlines()[-1] if proc.stderr else "failed"
+            times.append(time.perf_counter() - t)
+    return sorted(times)[len(times) // 2]
+
+
+_SMOKE_BOT = "import run, bot.main; getattr(bot.main, {cls!r})()"
+
+
+def smoke(python: str, archive: Path, bot_class: str) -> list:
+    """Failures of ``run.py --help`` and constructing the bot in a fresh extraction."""
+    failures = []
+    with tempfile.TemporaryDirectory(prefix="ladder_smoke_") as d:
+        with zipfile.ZipFile(archive) as zf:
+            zf.extractall(d)
+        for label, cmd in (("run.py --help", [python, "run.py", "--help"]),
+                           (f"{bot_class}()", [python, "-c", _SMOKE_BOT.format(cls=bot_class)])):
+            proc = subprocess.run(cmd, cwd=d, capture_output=True, text=True, timeout=600)
+            if proc.returncode != 0:
+                err = proc.stderr.strip().splitlines()
+                failures.append(f"{label}: {err[-1] if err else f'exit {proc.returncode}'}")
+    return failures
+
+
+def _fmt_import(t) -> str:
+    return f"{t:.2f} s" if isinstance(t, float) else f"n/a ({t})"
+
+
+def build_slim(args, sp: Path, out: Path) -> None:
+    full = Path(tempfile.mkdtemp(prefix="ladder_zip_full_"))
+    lean = Path(tempfile.mkdtemp(prefix="ladder_zip_slim_"))
+    full_zip = lean.parent / f"{out.stem}.full.zip"
+    try:
+        stage(args.bot, sp, args.py_tag, full)
+        write_zip(full, full_zip)
+        shutil.copytree(full, lean, dirs_exist_ok=True)
+
+        closure = import_closure(args.python, lean)
+        if closure["error"]:
+            print(f"warning: importing run.py failed ({closure['error']}); "
+                  "only the static closure is used")
+        dropped, dropped_bytes = slim(lean, closure["modules"], set(args.keep))
+        stripped = strip_extensions(lean)
+        compile_pyc(args.python, lean)
+        write_zip(lean, out, store_min=args.store_min_kb * 1024)
+
+        dups = duplicates(lean)
+        print(f"closure: {len(closure['modules'])} modules; dropped {dropped} files "
+              f"({dropped_bytes / 1e6:.1f} MB), strip saved {stripped / 1e6:.1f} MB")
+        for group in dups[:5]:
+            print(f"  duplicate ({group[0].stat().st_size} B): "
+                  + ", ".join(str(f.relative_to(lean)) for f in group))
+        print(f"full: {full_zip.stat().st_size / 1e6:.1f} MB, cold import "
+              f"{_fmt_import(cold_import(args.python, full_zip))}")
+        print(f"slim: {out.stat().st_size / 1e6:.1f} MB, cold import "
+              f"{_fmt_import(cold_import(args.python, out))}")
+        bot_class, _builds_yml = BOT_REGISTRY[args.bot]
+        failures = smoke(args.python, out, bot_class)
+        print(f"Wrote {out}")
+        print(f"checked: `run.py --help` and {bot_class}() from the slim zip. Modules "
+              "imported only mid-game (by name or path) are NOT checked; play a game "
+              "from it before uploading, and ship such modules with --keep.")
+        if failures:
+            sys.exit("slim zip smoke test FAILED:\n  " + "\n  ".join(failures))
+    finally:
+        shutil.rmtree(full, ignore_errors=True)
+        shutil.rmtree(lean, ignore_errors=True)
+        full_zip.unlink(missing_ok=True)
+
+
 def main() -> None:
     parser = argparse.ArgumentParser()
     parser.add_argument("--bot", default="phoenix", choices=sorted(BOT_REGISTRY),
@@ -77,30 +335,36 @@ def main() -> None:
     parser.add_argument("--py-tag", default="312", help="cpython tag, e.g. 312")
     parser.add_argument("--output", default=None,
                         help="default: <BotName>.zip in the repo root")
+    parser.add_argument("--slim", action="store_true",
+                        help="ship only run.py's import closure, precompiled")
+    parser.add_argument("--python", default=None,
+                        help="ladder interpreter for --slim (default: the "
+                             "site-packages venv's bin/python)")
+    parser.add_argument("--keep", action="append", default=[], metavar="MODULE",
+                        help="--slim: also ship MODULE and its submodules")
+    parser.add_argument("--store-min-kb", type=int, default=256,
+                        help="--slim: store data files this big uncompressed")
     args = parser.parse_args()
 
-    bot_name, builds_yml = BOT_REGISTRY[args.bot]
-    bot_dir = REPO_ROOT / args.bot
-    output = args.output or str(REPO_ROOT / f"{bot_name}.zip")
+    bot_name, _builds_yml = BOT_REGISTRY[args.bot]
+    out = Path(args.output or str(REPO_ROOT / f"{bot_name}.zip"))
 
     sp = Path(args.site_packages)
     if not (sp / "src" / "ares").is_dir():
         sys.exit(f"ares not found under {sp} - install ares-sc2 there first")
 
+    if args.slim:
+        if args.python is None:
+            # <venv>/lib/pythonX.Y/site-packages -> <venv>/bin/python
+            venv_python = sp.parents[2] / "bin" / "python"
+            args.python = str(venv_python) if venv_python.exists() else sys.executable
+        build_slim(args, sp, out)
+        return
+
     staging = Path(tempfile.mkdtemp(prefix="ladder_zip_"))
     try:
-        for name in [*BOT_FILES, builds_yml]:
-            shutil.copy2(bot_dir / name, staging / name)
-        copy_package(bot_dir / BOT_PACKAGE, staging / BOT_PACKAGE, args.py_tag)
-        for dst_name, rel_src in DEPENDENCIES.items():
-            copy_package(sp / rel_src, staging / dst_name, args.py_tag)
-
-        out = Path(output)
-        out.unlink(missing_ok=True)
-        with zipfile.ZipFile(out, "w", zipfile.ZIP_DEFLATED) as zf:
-            for f in sorted(staging.rglob("*")):
-                if f.is_file():
-                    zf.write(f, f.relative_to(staging))
+        stage(args.bot, sp, args.py_tag, staging)
+        write_zip(staging, out)
         print(f"Wrote {out} ({out.stat().st_size / 1e6:.1f} MB)")
     finally:
         shutil.rmtree(staging, ignore_errors=True)
@@ -0,0 +1,133 @@
+"""Audit each bot's startup import time (``python -X importtime``).
+
+Imports ``run`` from each bot dir in a fresh interpreter, the way the ladder
+and harness/versus.py start it (no game is launched: every run.py keeps its
+work behind ``if __name__ == "__main__"``). Then it prints the total and the
+worst offenders: the modules with the most self time and the top-level
+packages with the most cumulative time.
+
+    python scripts/import_audit.py                    # every bot with a run.py
+    python scripts/import_audit.py hydra athena --top 15
+    python scripts/import_audit.py hydra --budget-ms 1500   # exit 1 if over budget
+    python scripts/import_audit.py --budgets scripts/import_budgets.json --strict
+
+``--budget-ms`` makes this a CI check. Each bot's total (the median of
+``--runs`` runs) must stay within its budget. Budgets can be given per bot in
+a JSON file passed with ``--budgets``; scripts/import_budgets.json holds the
+checked-in ones, set with headroom over what the bots measure today. A
+bot whose import fails (say, ares is not installed) is reported and counts
+as a failure only with ``--strict``.
+"""
+
+import argparse
+import json
+import re
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path
+from statistics import median
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def bots() -> list:
+    return sorted(p.parent.name for p in REPO_ROOT.glob("*/run.py"))
+
+
+def profile(bot: str, python: str) -> dict:
+    """One cold ``import run``: ``{"total", "self": {mod: us}, "cumulative": {mod: us}}``
+    in microseconds, or ``{"error": ...}``."""
+    proc = subprocess.run([python, "-X", "importtime", "-c", "import run"],
+                          cwd=REPO_ROOT / bot, capture_output=True, text=True,
+                          timeout=600)
+    if proc.returncode != 0:
+        lines = [ln for ln in proc.stderr.splitlines() if not ln.startswith("import time:")]
+        return {"error": lines[-1] if lines else f"exit {proc.returncode}"}
+    self_us, cum_us = {}, {}
+    total = 0
+    for line in proc.stderr.splitlines():
+        m = LINE.match(line)
+        if not m:
+            continue
+        own, cum, indent, name = int(m[1]), int(m[2]), len(m[3]), m[4]
+        self_us[name] = own
+        cum_us[name] = cum
+        if indent == 1:                     # imported directly by the top level
+            total += cum
+    return {"total": total, "self": self_us, "cumulative": cum_us}
+
+
+def packages(cumulative: dict) -> dict:
+    """Cumulative time per top-level package (its first, outermost import),
+    leaving out the bot's own ``run`` entry module, which is the whole total."""
+    out = defaultdict(int)
+    for name, us in cumulative.items():
+        top = name.split(".")[0]
+        if top == "run":
+            continue
+        out[top] = max(out[top], us)
+    return out
+
+
+def audit(bot: str, python: str, runs: int) -> dict:
+    results = [profile(bot, python) for _ in range(runs)]
+    ok = [r for r in results if "error" not in r]
+    if not ok:
+        return results[0]
+    best = sorted(ok, key=lambda r: r["total"])[len(ok) // 2]
+    best["median_total"] = median(r["total"] for r in ok)
+    return best
+
+
+def report(bot: str, r: dict, top: int) -> None:
+    if "error" in r:
+        print(f"{bot}: import failed ({r['error']})")
+        return
+    print(f"{bot}: {r['median_total'] / 1000:.0f} ms")
+    worst = sorted(r["self"].items(), key=lambda kv: -kv[1])[:top]
+    print("  self time:")
+    for name, us in worst:
+        print(f"    {us / 1000:7.1f} ms  {name}")
+    print("  by package (cumulative):")
+    for name, us in sorted(packages(r["cumulative"]).items(), key=lambda kv: -kv[1])[:top]:
+        print(f"    {us / 1000:7.1f} ms  {name}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("bots", nargs="*", help="bot dirs (default: every */run.py)")
+    parser.add_argument("--python", default=sys.executable)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--budget-ms", type=float, default=None,
+                        help="fail if a bot's import takes longer")
+    parser.add_argument("--budgets", default=None,
+                        help='JSON file of per-bot budgets in ms, e.g. {"hydra": 1500, "*": 3000}')
+    parser.add_argument("--strict", action="store_true",
+                        help="with a budget, a bot that fails to import also fails")
+    args = parser.parse_args()
+
+    budgets = json.loads(Path(args.budgets).read_text()) if args.budgets else {}
+    if args.budget_ms is not None:
+        budgets.setdefault("*", args.budget_ms)
+    failed = []
+    for bot in args.bots or bots():
+        r = audit(bot, args.python, args.runs)
+        report(bot, r, args.top)
+        budget = budgets.get(bot, budgets.get("*"))
+        if budget is None:
+            continue
+        if "error" in r:
+            if args.strict:
+                failed.append(f"{bot}: import failed")
+        elif r["median_total"] / 1000 > budget:
+            failed.append(f"{bot}: {r['median_total'] / 1000:.0f} ms > {budget:.0f} ms")
+    if failed:
+        print("\nover budget:\n  " + "\n  ".join(failed))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -13,104 +13,105 @@ one module per layer of the docs:
                      (mirrors ``RULES.md``).
 - ``harassment``  -- harass and anti-harass decisions
                      (mirrors the harassment sections of the docs).
+- ``combat_sim``  -- a Lanchester-style fight estimator over unit compositions
+                     from a shipped unit-stats table (``simulate_fight``).
+- ``economy``     -- a deterministic forward economy simulator for comparing
+                     candidate macro plans (``rollout`` / ``compare_plans``).
+- ``maps``        -- precomputed per-map, per-spawn analysis (expansions, ramps,
+                     walls, scout routes) built offline by
+                     ``harness/build_map_cache.py``.
+- ``orders``      -- compacts a step's unit orders before python-sc2 sends them
+                     (last order per unit wins, no-ops dropped, identical
+                     orders merged) and skips re-giving an order a unit is
+                     already carrying out, with per-step counts and bytes.
+- ``statefile``   -- locked, atomic read-modify-write of a bot's persisted
+                     JSON state, shared by the bots' cross-game learners.
 - ``advisor``     -- ties the modules together into a single recommendation a
                      bot can query each step.
 
 Nothing here imports ``sc2`` at module load, so the package can be imported and
-unit-tested without StarCraft II or python-sc2 installed. The optional
+unit-tested without StarCraft II or python-sc2 installed. The names re-exported
+here load their submodule on first access. The optional
 ``GameState.from_bot`` adapter imports ``sc2`` lazily only when called.
 """
 
-from .state import GameState
-from .principles import (
-    Investment,
-    InvestmentAdvice,
-    PowerTiming,
-    TradeVerdict,
-    Efficiency,
-    recommend_investment,
-    power_timing,
-    assess_efficiency,
-)
-from .strategy import Archetype, Classification, classify_opponent, counter_stance
-from .rules import Rule, RuleHit, evaluate_rules
-from .harassment import HarassAdvice, harass_advice
-from .combat import Engagement, EngagementAdvice, assess_engagement
-from .defense import DefensePlan, assess_defense
-from .information import EnemyEstimate, estimate_enemy, project_enemy
-from .openings import (
-    Placement,
-    BuildStep,
-    Opening,
-    OpeningExecutor,
-    Deviation,
-    OPENINGS,
-    classify_opening,
-    openings_for_race,
-    get_opening,
-    best_opening,
-    verify_opening,
-)
-from .build_guides import (
-    ScriptedBuild,
-    BuildAction,
-    BuildExecutor,
-    BUILD_GUIDES,
-    guides_for,
-    get_build,
-)
-from .advisor import StrategicAdvisor, Advice
-from .macro import MacroPlan, recommend_macro
-from .tactics import Tactics, recommend_tactics
+from importlib import import_module
 
-__all__ = [
-    "GameState",
-    "Investment",
-    "InvestmentAdvice",
-    "PowerTiming",
-    "TradeVerdict",
-    "Efficiency",
-    "recommend_investment",
-    "power_timing",
-    "assess_efficiency",
-    "Archetype",
-    "Classification",
-    "classify_opponent",
-    "counter_stance",
-    "Rule",
-    "RuleHit",
-    "evaluate_rules",
-    "HarassAdvice",
-    "harass_advice",
-    "Engagement",
-    "EngagementAdvice",
-    "assess_engagement",
-    "DefensePlan",
-    "assess_defense",
-    "EnemyEstimate",
-    "estimate_enemy",
-    "project_enemy",
-    "Placement",
-    "BuildStep",
-    "Opening",
-    "OpeningExecutor",
-    "Deviation",
-    "OPENINGS",
-    "classify_opening",
-    "openings_for_race",
-    "get_opening",
-    "best_opening",
-    "verify_opening",
-    "ScriptedBuild",
-    "BuildAction",
-    "BuildExecutor",
-    "BUILD_GUIDES",
-    "guides_for",
-    "get_build",
-    "StrategicAdvisor",
-    "Advice",
-    "MacroPlan",
-    "recommend_macro",
-    "Tactics",
-    "recommend_tactics",
-]
+# public name -> defining submodule. Submodules are imported on first access
+# (PEP 562), so a bot that only needs the advisor never loads the opening and
+# build-guide libraries, the economy simulator, and so on.
+_EXPORTS = {
+    "GameState": "state",
+    "Investment": "principles",
+    "InvestmentAdvice": "principles",
+    "PowerTiming": "principles",
+    "TradeVerdict": "principles",
+    "Efficiency": "principles",
+    "recommend_investment": "principles",
+    "power_timing": "principles",
+    "assess_efficiency": "principles",
+    "Archetype": "strategy",
+    "Classification": "strategy",
+    "classify_opponent": "strategy",
+    "counter_stance": "strategy",
+    "Rule": "rules",
+    "RuleHit": "rules",
+    "evaluate_rules": "rules",
+    "HarassAdvice": "harassment",
+    "harass_advice": "harassment",
+    "Engagement": "combat",
+    "EngagementAdvice": "combat",
+    "assess_engagement": "combat",
+    "FightResult": "combat_sim",
+    "UnitStats": "combat_sim",
+    "simulate_fight": "combat_sim",
+    "unit_table": "combat_sim",
+    "DefensePlan": "defense",
+    "assess_defense": "defense",
+    "EnemyEstimate": "information",
+    "estimate_enemy": "information",
+    "project_enemy": "information",
+    "Placement": "openings",
+    "BuildStep": "openings",
+    "Opening": "openings",
+    "OpeningExecutor": "openings",
+    "Deviation": "openings",
+    "OPENINGS": "openings",
+    "classify_opening": "openings",
+    "openings_for_race": "openings",
+    "get_opening": "openings",
+    "best_opening": "openings",
+    "verify_opening": "openings",
+    "ScriptedBuild": "build_guides",
+    "BuildAction": "build_guides",
+    "BuildExecutor": "build_guides",
+    "BUILD_GUIDES": "build_guides",
+    "guides_for": "build_guides",
+    "get_build": "build_guides",
+    "StrategicAdvisor": "advisor",
+    "Advice": "advisor",
+    "MacroPlan": "macro",
+    "recommend_macro": "macro",
+    "Tactics": "tactics",
+    "recommend_tactics": "tactics",
+    "EconPlan": "economy",
+    "Rollout": "economy",
+    "rollout": "economy",
+    "compare_plans": "economy",
+    "best_plan": "economy",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
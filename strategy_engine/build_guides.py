@@ -28,6 +28,9 @@ import re
 from dataclasses import dataclass, field
 from typing import Mapping, Optional
 
+from .cache import LazyRegistry, cached_build
+from .openings import _StepIndex
+
 DATA_DIR = os.path.join(os.path.dirname(__file__), "data", "build_guides")
 
 # spawningtool display name -> sc2 UnitTypeId token (structures + units)
@@ -185,7 +188,14 @@ def _load(dir_path: str = DATA_DIR) -> dict:
     return out
 
 
-BUILD_GUIDES: dict = _load()
+def _load_cached() -> dict:
+    if __name__ != "strategy_engine.build_guides":   # pickles name classes by module
+        return _load()
+    sources = sorted(glob.glob(os.path.join(DATA_DIR, "*.json")))
+    return cached_build("build_guides", sources, _load, __file__)
+
+
+BUILD_GUIDES: Mapping = LazyRegistry(_load_cached)
 
 
 def guides_for(race: Optional[str] = None, matchup: Optional[str] = None) -> list:
@@ -208,7 +218,8 @@ class BuildExecutor:
     the sc2 token (preferred) or the display name; :meth:`next_action` returns
     the first script action not yet satisfied. ``is_due`` tells whether the
     current supply/time has reached that action's target, so a bot can pace to
-    the script's benchmarks rather than racing ahead.
+    the script's benchmarks rather than racing ahead. Lookups are indexed per
+    key (``openings._StepIndex``), so a call costs the same at step 40 as at 4.
     """
 
     def __init__(self, build: ScriptedBuild, reproducible_only: bool = True):
@@ -222,16 +233,14 @@ class BuildExecutor:
             key = a.token or a.name
             seen[key] = seen.get(key, 0) + a.count
             self._required.append((a, key, seen[key]))
-
-    def _have(self, have: Mapping, action: BuildAction) -> int:
-        return have.get(action.token, have.get(action.name, 0)) if action.token \
-            else have.get(action.name, 0)
+        # a token step falls back to its display name when the token isn't reported
+        self._index = _StepIndex([(key, a.name if a.token else None, need)
+                                  for a, key, need in self._required])
 
     def next_action(self, have: Mapping) -> Optional[BuildAction]:
-        for action, key, need in self._required:
-            if have.get(key, self._have(have, action)) < need:
-                return action
-        return None
+        self._index.sync(have)
+        i = self._index.first_unmet()
+        return None if i is None else self._required[i][0]
 
     @staticmethod
     def is_due(action: BuildAction, supply: Optional[int],
@@ -243,9 +252,8 @@ class BuildExecutor:
         return True
 
     def progress(self, have: Mapping) -> float:
-        done = sum(1 for a, key, need in self._required
-                   if have.get(key, self._have(have, a)) >= need)
-        return done / len(self._required) if self._required else 1.0
+        self._index.sync(have)
+        return self._index.met / len(self._required) if self._required else 1.0
 
     def is_complete(self, have: Mapping) -> bool:
         return self.next_action(have) is None
@@ -0,0 +1,121 @@
+"""Pickle caches for parsed reference data, and the lazy registry over them.
+
+``openings.OPENINGS``, ``build_guides.BUILD_GUIDES`` and HydraBot's strategy
+library parse JSON/YAML once and reuse a pickled copy after that. This module is
+kept separate from ``openings`` so a bot that only needs the cache does not
+import the openings code at startup.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+from typing import Callable, Iterator, Mapping, Optional, Sequence
+
+CACHE_DIR = os.path.join(os.path.dirname(__file__), "data", "__pycache__")
+
+
+def _stamp(paths: Sequence[str]) -> tuple:
+    out = []
+    for p in paths:
+        try:
+            st = os.stat(p)
+        except OSError:
+            continue
+        out.append((os.path.basename(p), st.st_mtime_ns, st.st_size))
+    return tuple(out)
+
+
+def _digest(paths: Sequence[str]) -> str:
+    import hashlib
+
+    h = hashlib.sha1()
+    for p in paths:
+        try:
+            with open(p, "rb") as f:
+                h.update(f.read())
+        except OSError:
+            continue
+    return h.hexdigest()
+
+
+def cached_build(name: str, sources: Sequence[str], build: Callable[[], dict],
+                 module_file: str, cache_dir: str = CACHE_DIR) -> dict:
+    """``build()``, or its pickled result from the last time the sources were parsed.
+
+    The cache is keyed by the sources' (name, mtime, size) and the defining
+    module's own stamp, so an edited JSON or a changed dataclass rebuilds it.
+    If only mtimes moved (a fresh checkout touches every file), a matching
+    content hash still accepts the cache and re-stamps it. Any failure to read
+    or write the cache just falls back to ``build()`` -- a read-only install
+    parses JSON as before. Imports are local: they only matter on first access.
+    """
+    import pickle
+
+    key = (name, sys.version_info[:2], _stamp([module_file]), _stamp(sources))
+    path = os.path.join(cache_dir, f"{name}.pickle")
+    digest = None
+    try:
+        with open(path, "rb") as f:
+            cached = pickle.load(f)
+        if cached["key"] == key:
+            return cached["data"]
+        if cached["key"][:3] == key[:3]:
+            digest = _digest(sources)
+            if cached["digest"] == digest:
+                _write_cache(path, {**cached, "key": key})
+                return cached["data"]
+    except Exception:  # noqa: BLE001 - missing, stale or unreadable: rebuild
+        pass
+    data = build()
+    _write_cache(path, {"key": key, "digest": digest or _digest(sources), "data": data})
+    return data
+
+
+def _write_cache(path: str, payload: dict) -> None:
+    import pickle
+    import tempfile
+
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+    except Exception:  # noqa: BLE001 - the cache is an optimisation only
+        pass
+
+
+class LazyRegistry(Mapping):
+    """A read-only mapping that runs its loader on first access.
+
+    ``OPENINGS`` and ``build_guides.BUILD_GUIDES`` are registries, so importing
+    ``strategy_engine`` (say, for ``GameState``) no longer parses reference data
+    the bot may never look at.
+    """
+
+    def __init__(self, loader: Callable[[], dict]):
+        self._loader = loader
+        self._data: Optional[dict] = None
+
+    def _get(self) -> dict:
+        if self._data is None:
+            self._data = self._loader()
+        return self._data
+
+    def __getitem__(self, key):
+        return self._get()[key]
+
+    def __iter__(self) -> Iterator:
+        return iter(self._get())
+
+    def __len__(self) -> int:
+        return len(self._get())
+
+    def __repr__(self) -> str:
+        state = "unloaded" if self._data is None else f"{len(self._data)} entries"
+        return f"<{type(self).__name__} {state}>"
@@ -6,17 +6,33 @@ structural and situational levers from the docs: tech/upgrade edge (efficiency
 bought in advance), terrain, defender's advantage, reinforcements, composition,
 and unmet detection needs. It also folds in the trade trend from
 ``assess_efficiency`` -- if we are already trading down, don't feed more.
+
+With ``SIMULATE_FIGHTS`` on (or ``simulate=True``) and both armies known by unit
+type (``army_units`` / ``enemy_army_units``), raw supply is replaced by a
+``combat_sim`` fight: its Lanchester strength ratio already accounts for who can
+hit whom, so the composition lever is not applied on top. It is off by default:
+the simulator ignores splash, spells and healing, and it stays opt-in until
+``analysis/combat_bench.py`` has scored it against the supply read on the replay
+corpus. While it is off, ``combat_sim`` is not imported and ``GameState.from_bot``
+does not count compositions.
 """
 
 from __future__ import annotations
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import List
+from typing import TYPE_CHECKING, List, Optional
 
 from .state import GameState
 from .principles import assess_efficiency, TradeVerdict
 
+if TYPE_CHECKING:
+    from .combat_sim import FightResult
+
+
+# replace the supply ratio with a simulated fight when compositions are known
+SIMULATE_FIGHTS = False
+
 
 class Engagement(Enum):
     ENGAGE = "engage"    # favorable -- seek/take the fight
@@ -30,6 +46,7 @@ class EngagementAdvice:
     verdict: Engagement
     effective_ratio: float  # our effective strength / enemy effective strength
     reasons: List[str] = field(default_factory=list)
+    fight: Optional[FightResult] = None  # the simulated fight, when compositions are known
 
     @property
     def should_engage(self) -> bool:
@@ -47,10 +64,13 @@ def _upgrade_multiplier(state: GameState) -> float:
     return max(0.7, min(1.4, 1.0 + 0.04 * diff))
 
 
-def assess_engagement(state: GameState) -> EngagementAdvice:
+def assess_engagement(state: GameState,
+                      simulate: Optional[bool] = None) -> EngagementAdvice:
     """Decide whether the current fight is favorable.
 
-    Effective strength = army supply x upgrade edge x situational multipliers.
+    Effective strength = army supply (or, with ``simulate`` / ``SIMULATE_FIGHTS``,
+    the simulated fight's strength ratio when both compositions are known) x
+    upgrade edge x situational multipliers.
     A ratio comfortably above 1 means engage; well below means avoid (or hold, if
     defender's advantage at home covers the gap). Trading down vetoes engaging.
     """
@@ -63,6 +83,18 @@ def assess_engagement(state: GameState) -> EngagementAdvice:
     reasons: List[str] = []
     our = max(0.1, state.army_supply)
     their = max(0.1, state.enemy_army_supply)
+    fight = None
+    if simulate is None:
+        simulate = SIMULATE_FIGHTS
+    if simulate and state.army_units and state.enemy_army_units:
+        from .combat_sim import simulate_fight
+
+        fight = simulate_fight(state.army_units, state.enemy_army_units)
+        if fight.our_value > 0 and fight.their_value > 0:
+            our, their = fight.strength_ratio, 1.0
+            reasons.append(f"simulated fight: {fight.summary()}")
+        else:
+            fight = None
 
     upg = _upgrade_multiplier(state)
     if upg > 1.0:
@@ -71,10 +103,11 @@ def assess_engagement(state: GameState) -> EngagementAdvice:
         reasons.append(f"upgrade deficit x{upg:.2f}")
 
     mult = 1.0
-    if state.composition_favorable is True:
+    # a simulated fight has already played the compositions against each other
+    if fight is None and state.composition_favorable is True:
         mult *= 1.2
         reasons.append("composition counters theirs (+)")
-    elif state.composition_favorable is False:
+    elif fight is None and state.composition_favorable is False:
         mult *= 0.8
         reasons.append("composition is countered (-)")
     if state.have_terrain_advantage:
@@ -118,4 +151,4 @@ def assess_engagement(state: GameState) -> EngagementAdvice:
             verdict = Engagement.AVOID
             reasons.append(f"even ratio {ratio:.2f}: don't take a coinflip in the open")
 
-    return EngagementAdvice(verdict, round(ratio, 2), reasons)
+    return EngagementAdvice(verdict, round(ratio, 2), reasons, fight)
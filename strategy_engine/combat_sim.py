@@ -0,0 +1,298 @@
+"""combat_sim: a fast Lanchester-style fight estimator over unit compositions.
+
+``assess_engagement`` weighs army *supply*; supply says nothing about whether the
+Stalkers can shoot the Mutalisks or the Zerglings ever reach the Marines. This
+module resolves a fight between two compositions (``{"Marine": 20, ...}``) from a
+shipped unit table (``data/unit_stats.json``: HP, shields, armor, attributes,
+air/ground weapons with damage, hits, cooldown, range and attribute bonuses):
+
+- units of a type are one pool (count x HP), so a step costs types x types, not
+  units x units -- the pure-Python form of vectorized time stepping;
+- each type spreads its DPS over the enemy types it can hit, in proportion to
+  their counts; per-hit armor and attribute bonuses are folded into a per-pair
+  DPS matrix once;
+- shorter-ranged types start shooting after closing the range gap, and melee
+  types are capped at ``MELEE_SURFACE`` attackers per target they can reach;
+- the fight ends when a side is wiped, nothing can hit anything, or after
+  ``MAX_TIME`` seconds.
+
+Splash, spells, healing and micro are not modelled; ``analysis/combat_bench.py``
+measures how far that gets against fights mined from the replay corpus.
+
+An uncached fight costs about 0.2-1.4 ms (``combat_bench.py`` with no args).
+``simulate_fight`` is memoised on the compositions, so a bot can call it every
+step and pay only when an army actually changes. Names are matched
+case-insensitively without underscores, so python-sc2 ``UnitTypeId`` names
+(``SIEGETANKSIEGED``) and sc2reader names (``SiegeTankSieged``) both work.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, Mapping, Optional, Tuple
+
+DATA_PATH = os.path.join(os.path.dirname(__file__), "data", "unit_stats.json")
+
+DT = 0.25               # seconds per step
+MAX_TIME = 60.0         # fights longer than this are scored where they stand
+CLOSE_SPEED = 3.0       # game units/s an out-ranged type closes the gap at
+MELEE_RANGE = 1.0       # at or below this a weapon is melee
+MELEE_SURFACE = 4.0     # melee attackers that fit around one target
+WIPED = 0.03            # a side down to this share of its armed units has lost
+
+
+@dataclass(frozen=True)
+class Weapon:
+    damage: float
+    hits: int
+    cooldown: float
+    range: float
+    bonus: Tuple[Tuple[str, float], ...] = ()
+
+
+@dataclass(frozen=True)
+class UnitStats:
+    name: str
+    race: str
+    hp: float
+    shields: float
+    armor: float
+    attributes: frozenset
+    flying: bool
+    minerals: int
+    gas: int
+    supply: float
+    ground: Optional[Weapon] = None
+    air: Optional[Weapon] = None
+    hit_by_air: bool = False    # ground unit tall enough for anti-air (Colossus)
+
+    @property
+    def life(self) -> float:
+        return self.hp + self.shields
+
+    @property
+    def value(self) -> int:
+        return self.minerals + self.gas
+
+    @property
+    def range(self) -> float:
+        return max((w.range for w in (self.ground, self.air) if w), default=0.0)
+
+
+def _key(name: str) -> str:
+    return name.replace("_", "").upper()
+
+
+def _weapon(d: Optional[dict]) -> Optional[Weapon]:
+    if not d:
+        return None
+    return Weapon(d["damage"], d.get("hits", 1), d["cooldown"], d["range"],
+                  tuple(sorted(d.get("bonus", {}).items())))
+
+
+@lru_cache(maxsize=1)
+def unit_table(path: str = DATA_PATH) -> Dict[str, UnitStats]:
+    """The shipped unit table, keyed by normalized name (aliases included)."""
+    try:
+        with open(path) as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    table: Dict[str, UnitStats] = {}
+    for name, d in data.get("units", {}).items():
+        st = UnitStats(
+            name=name, race=d["race"], hp=d["hp"], shields=d.get("shields", 0),
+            armor=d.get("armor", 0), attributes=frozenset(d.get("attributes", ())),
+            flying=d.get("flying", False), minerals=d.get("minerals", 0),
+            gas=d.get("gas", 0), supply=d.get("supply", 0),
+            ground=_weapon(d.get("ground")), air=_weapon(d.get("air")),
+            hit_by_air=d.get("hit_by_air", False))
+        for alias in (name, *d.get("aliases", ())):
+            table[_key(alias)] = st
+    return table
+
+
+def stats_for(name: str) -> Optional[UnitStats]:
+    return unit_table().get(_key(name))
+
+
+def is_combat_unit(name: str) -> bool:
+    """Is ``name`` in the unit table (i.e. counted by ``simulate_fight``)?"""
+    return _key(name) in unit_table()
+
+
+@lru_cache(maxsize=None)
+def _pair_dps(attacker_name: str, target_name: str, a_up: int, t_up: int) -> float:
+    """DPS one ``attacker`` deals to one ``target`` (0 if it can't hit it)."""
+    table = unit_table()
+    attacker, target = table[_key(attacker_name)], table[_key(target_name)]
+    if target.flying:
+        weapons = (attacker.air,)
+    elif target.hit_by_air:
+        weapons = (attacker.ground, attacker.air)
+    else:
+        weapons = (attacker.ground,)
+    best = 0.0
+    for w in weapons:
+        if w is None:
+            continue
+        dmg = w.damage + a_up + sum(b for attr, b in w.bonus if attr in target.attributes)
+        per_hit = max(0.5, dmg - (target.armor + t_up))
+        best = max(best, per_hit * w.hits / w.cooldown)
+    return best
+
+
+@dataclass(frozen=True)
+class FightResult:
+    """Outcome of one simulated fight; counts are (name, survivors) pairs."""
+
+    winner: str                         # "ours" | "theirs" | "draw"
+    duration: float
+    our_left: Tuple[Tuple[str, float], ...]
+    their_left: Tuple[Tuple[str, float], ...]
+    our_value: float                    # resources that entered the fight
+    their_value: float
+    our_value_lost: float
+    their_value_lost: float
+    unknown: Tuple[str, ...] = ()       # names not in the unit table (ignored)
+
+    @property
+    def strength_ratio(self) -> float:
+        """Our Lanchester strength over theirs, from the survivors.
+
+        Square law: ``R^2 = (1 - b^2) / (1 - a^2)`` with ``a``/``b`` the value
+        fractions we/they kept. 1.0 is even; >1 favours us. Clamped to [0.1, 10].
+        """
+        if self.our_value <= 0 or self.their_value <= 0:
+            return 10.0 if self.our_value > 0 else (0.1 if self.their_value > 0 else 1.0)
+        a = min(0.99, 1 - self.our_value_lost / self.our_value)
+        b = min(0.99, 1 - self.their_value_lost / self.their_value)
+        if a >= 0.99 and b >= 0.99:
+            return 1.0
+        return max(0.1, min(10.0, math.sqrt((1 - b * b) / (1 - a * a))))
+
+    def summary(self) -> str:
+        return (f"{self.winner} in {self.duration:.0f}s, we lose "
+                f"{self.our_value_lost:.0f}/{self.our_value:.0f}, they lose "
+                f"{self.their_value_lost:.0f}/{self.their_value:.0f}")
+
+
+def _side(units: Mapping[str, float]) -> Tuple[List[UnitStats], List[float], List[str]]:
+    table = unit_table()
+    stats, counts, unknown = [], [], []
+    merged: Dict[UnitStats, float] = {}
+    for name, n in units.items():
+        if n <= 0:
+            continue
+        st = table.get(_key(name))
+        if st is None:
+            unknown.append(name)
+        else:
+            merged[st] = merged.get(st, 0.0) + n
+    for st, n in merged.items():
+        stats.append(st)
+        counts.append(float(n))
+    return stats, counts, unknown
+
+
+def _resolve(ours: Tuple[Tuple[str, float], ...], theirs: Tuple[Tuple[str, float], ...],
+             our_up: int, their_up: int) -> FightResult:
+    sa, na, ua = _side(dict(ours))
+    sb, nb, ub = _side(dict(theirs))
+    va = sum(s.value * n for s, n in zip(sa, na))
+    vb = sum(s.value * n for s, n in zip(sb, nb))
+
+    # sparse per-pair DPS, both directions: targets[i] = [(j, dps), ...]
+    tgt_a = [[(j, d) for j, y in enumerate(sb) if (d := _pair_dps(x.name, y.name, our_up, their_up))]
+             for x in sa]
+    tgt_b = [[(i, d) for i, x in enumerate(sa) if (d := _pair_dps(y.name, x.name, their_up, our_up))]
+             for y in sb]
+    reach_a = max((s.range for s in sa), default=0.0)
+    reach_b = max((s.range for s in sb), default=0.0)
+    delay_a = [max(0.0, reach_b - s.range) / CLOSE_SPEED for s in sa]
+    delay_b = [max(0.0, reach_a - s.range) / CLOSE_SPEED for s in sb]
+    melee_a = [s.range <= MELEE_RANGE for s in sa]
+    melee_b = [s.range <= MELEE_RANGE for s in sb]
+    life_a = [s.life for s in sa]
+    life_b = [s.life for s in sb]
+    closing = max(delay_a + delay_b, default=0.0)
+
+    # a side is beaten once its armed units fall below WIPED of where they started
+    armed_a = [i for i, row in enumerate(tgt_a) if row]
+    armed_b = [j for j, row in enumerate(tgt_b) if row]
+    start_a, start_b = list(na), list(nb)
+    floor_a = WIPED * sum(na[i] for i in armed_a)
+    floor_b = WIPED * sum(nb[j] for j in armed_b)
+
+    def damage(n_att, tgt, delay, melee, n_def, t):
+        out = [0.0] * len(n_def)
+        for i, n in enumerate(n_att):
+            if n <= 0 or t < delay[i]:
+                continue
+            row = tgt[i]
+            total = sum(n_def[j] for j, _d in row)
+            if total <= 0:
+                continue
+            eff = (min(n, MELEE_SURFACE * total) if melee[i] else n) * DT / total
+            for j, d in row:            # dead targets (n_def == 0) take nothing
+                out[j] += eff * d * n_def[j]
+        return out
+
+    t = 0.0
+    while t < MAX_TIME:
+        hit_b = damage(na, tgt_a, delay_a, melee_a, nb, t)
+        hit_a = damage(nb, tgt_b, delay_b, melee_b, na, t)
+        if not any(hit_a) and not any(hit_b) and t >= closing:
+            break                                   # nothing can hit anything
+        na = [max(0.0, n - h / life) for n, h, life in zip(na, hit_a, life_a)]
+        nb = [max(0.0, n - h / life) for n, h, life in zip(nb, hit_b, life_b)]
+        t += DT
+        if (armed_a and sum(na[i] for i in armed_a) < floor_a
+                or armed_b and sum(nb[j] for j in armed_b) < floor_b):
+            break
+
+    na = [n if n >= WIPED * n0 else 0.0 for n, n0 in zip(na, start_a)]
+    nb = [n if n >= WIPED * n0 else 0.0 for n, n0 in zip(nb, start_b)]
+    left_a = sum(s.value * n for s, n in zip(sa, na))
+    left_b = sum(s.value * n for s, n in zip(sb, nb))
+    alive_a = any(na[i] for i in armed_a)
+    alive_b = any(nb[j] for j in armed_b)
+    if alive_a and not alive_b:
+        winner = "ours"
+    elif alive_b and not alive_a:
+        winner = "theirs"
+    else:   # both armed (timeout / can't reach) or neither: who kept more
+        fa = left_a / va if va else 0.0
+        fb = left_b / vb if vb else 0.0
+        winner = "ours" if fa > fb + 0.05 else "theirs" if fb > fa + 0.05 else "draw"
+    return FightResult(
+        winner=winner, duration=t,
+        our_left=tuple((s.name, round(n, 2)) for s, n in zip(sa, na)),
+        their_left=tuple((s.name, round(n, 2)) for s, n in zip(sb, nb)),
+        our_value=va, their_value=vb,
+        our_value_lost=va - left_a, their_value_lost=vb - left_b,
+        unknown=tuple(ua + ub))
+
+
+_resolve_cached = lru_cache(maxsize=4096)(_resolve)
+
+
+def simulate_fight(ours: Mapping[str, float], theirs: Mapping[str, float],
+                   our_upgrades: int = 0, their_upgrades: int = 0) -> FightResult:
+    """Resolve ``ours`` vs ``theirs`` (unit name -> count). Memoised.
+
+    ``*_upgrades`` are attack/armor levels (0-3), applied as +1 damage per hit
+    and +1 armor per level.
+    """
+    a = tuple(sorted((k, v) for k, v in ours.items() if v > 0))
+    b = tuple(sorted((k, v) for k, v in theirs.items() if v > 0))
+    return _resolve_cached(a, b, int(our_upgrades), int(their_upgrades))
+
+
+def cache_info():
+    """``lru_cache`` stats of the fight memo (hits = steps that paid nothing)."""
+    return _resolve_cached.cache_info()
@@ -89,9 +89,15 @@ def project_enemy(state: GameState) -> Tuple[GameState, EnemyEstimate]:
     est = estimate_enemy(state)
     if est.is_fresh or not est.has_data:
         return state, est
+    units = state.enemy_army_units
+    if units and est.army_supply and state.enemy_army_supply:
+        # the last-seen composition, grown in proportion to the projected supply
+        grow = est.army_supply / state.enemy_army_supply
+        units = {name: n * grow for name, n in units.items()}
     projected = replace(
         state,
         enemy_army_supply=est.army_supply if est.army_supply is not None else state.enemy_army_supply,
+        enemy_army_units=units,
         enemy_worker_count=est.worker_count,
         enemy_base_count=est.base_count,
         enemy_production_structures=est.production_structures,
@@ -0,0 +1,195 @@
+"""maps: precomputed per-map, per-spawn analysis shipped with the engine.
+
+python-sc2 works out expansion locations (resource clustering plus placement
+scoring) at game start, and the bots then derive ramps, walls, chokes and scout
+routes from it in-game. None of that changes between games on the same map, so
+``harness/build_map_cache.py`` computes it once for every map in
+``harness/map_pool.txt`` and writes ``data/maps/<key>.json``:
+
+- ``expansions``: each expansion position with the resource positions that
+  belong to it, which is exactly what ``BotAI._find_expansion_locations`` builds;
+- per spawn (keyed by start location):
+  - the expansions ordered by ground distance from that start;
+  - the main ramp (top and bottom centre);
+  - the Protoss wall (pylon, buildings, warp-in) and the Terran wall (corner
+    depots, barracks);
+  - a scout route: the enemy main, then its expansions by ground distance.
+
+A map file can hold several variants (same display name, different layout).
+A variant is used only when the live map size and our start location match,
+and ``apply_expansions`` also checks its resources against the live map; on a
+mismatch it drops the hit, so ``for_bot`` returns None from then on and a
+re-published map never picks up stale positions.
+
+Coordinates are plain ``(x, y)`` tuples, so this module does not import sc2.
+``for_bot`` and ``apply_expansions`` are the only helpers that touch a bot.
+``apply_expansions`` installs the cached expansions on a python-sc2 ``BotAI``
+and imports ``Point2`` only when it is called. An unknown map returns None,
+and the bot falls back to the live computation.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+MAP_DIR = os.path.join(os.path.dirname(__file__), "data", "maps")
+SCHEMA_VERSION = 1
+
+Pt = Tuple[float, float]
+
+
+@dataclass(frozen=True)
+class SpawnInfo:
+    """Everything about one start location that the bots used to compute live."""
+
+    start: Pt
+    expansions: Tuple[Pt, ...]          # by ground distance from ``start`` (own main first)
+    ramp_top: Optional[Pt] = None
+    ramp_bottom: Optional[Pt] = None
+    wall_pylon: Optional[Pt] = None     # Protoss ramp wall
+    wall_buildings: Tuple[Pt, ...] = ()
+    wall_warpin: Optional[Pt] = None
+    depots: Tuple[Pt, ...] = ()         # Terran ramp wall
+    barracks: Optional[Pt] = None
+    scout_route: Tuple[Pt, ...] = ()    # enemy main, then its expansions by ground distance
+
+    @property
+    def protoss_wall(self) -> Tuple[Optional[Pt], List[Pt], Optional[Pt]]:
+        """``(pylon, [building, building], hold)``, or ``(None, [], None)``."""
+        if self.wall_pylon is None or len(self.wall_buildings) < 2:
+            return (None, [], None)
+        return (self.wall_pylon, list(self.wall_buildings), self.wall_warpin)
+
+
+@dataclass(frozen=True)
+class MapInfo:
+    name: str
+    size: Tuple[int, int]
+    expansions: Tuple[Tuple[Pt, Tuple[Pt, ...]], ...]   # (position, resource positions)
+    spawns: Dict[Pt, SpawnInfo]
+
+
+def map_key(name: str) -> str:
+    """File key for a map: ``"Pylon AIE"`` and ``"PylonAIE"`` both give ``pylonaie``."""
+    return re.sub(r"[^a-z0-9]", "", name.lower())
+
+
+def _pt(p) -> Optional[Pt]:
+    return None if p is None else (float(p[0]), float(p[1]))
+
+
+def _pts(ps) -> Tuple[Pt, ...]:
+    return tuple(_pt(p) for p in ps or ())
+
+
+def _spawn(d: dict) -> SpawnInfo:
+    return SpawnInfo(
+        start=_pt(d["start"]), expansions=_pts(d.get("expansions")),
+        ramp_top=_pt(d.get("ramp_top")), ramp_bottom=_pt(d.get("ramp_bottom")),
+        wall_pylon=_pt(d.get("wall_pylon")), wall_buildings=_pts(d.get("wall_buildings")),
+        wall_warpin=_pt(d.get("wall_warpin")), depots=_pts(d.get("depots")),
+        barracks=_pt(d.get("barracks")), scout_route=_pts(d.get("scout_route")))
+
+
+@lru_cache(maxsize=None)
+def load(map_name: str, map_dir: str = MAP_DIR) -> Tuple[MapInfo, ...]:
+    """Every cached variant of ``map_name`` (empty if the map is not cached)."""
+    try:
+        with open(os.path.join(map_dir, map_key(map_name) + ".json")) as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return ()
+    if data.get("version") != SCHEMA_VERSION:
+        return ()
+    out = []
+    for v in data.get("variants", ()):
+        spawns = {s.start: s for s in (_spawn(d) for d in v.get("spawns", ()))}
+        out.append(MapInfo(
+            name=data.get("name", map_name), size=tuple(v["size"]),
+            expansions=tuple((_pt(e["pos"]), _pts(e["resources"]))
+                             for e in v.get("expansions", ())),
+            spawns=spawns))
+    return tuple(out)
+
+
+def lookup(map_name: str, size, start,
+           map_dir: str = MAP_DIR) -> Optional[Tuple[MapInfo, SpawnInfo]]:
+    """The cached variant and spawn matching the live map, or None."""
+    start = _pt(start)
+    size = (int(size[0]), int(size[1]))
+    for info in load(map_name, map_dir):
+        if info.size == size and start in info.spawns:
+            return info, info.spawns[start]
+    return None
+
+
+def for_bot(bot) -> Optional[SpawnInfo]:
+    """The cached spawn for a python-sc2 bot's map and start location (memoised on the bot)."""
+    hit = getattr(bot, "_map_cache_hit", False)
+    if hit is False:
+        try:
+            gi = bot.game_info
+            hit = lookup(gi.map_name, gi.map_size, gi.player_start_location)
+        except Exception:  # noqa: BLE001 - a cache miss must never cost the game
+            hit = None
+        bot._map_cache_hit = hit
+    return hit[1] if hit else None
+
+
+def apply_expansions(bot) -> bool:
+    """Install the cached expansions in place of ``BotAI._find_expansion_locations``.
+
+    Returns False (and installs nothing) on a cache miss, or if the cached
+    resources don't match the map's live resources. A mismatch also clears the
+    memoised hit, so every later ``for_bot`` falls back to the live computation.
+    """
+    for_bot(bot)
+    hit = getattr(bot, "_map_cache_hit", None)
+    if not hit:
+        return False
+    info = hit[0]
+    live = {(float(r.position.x), float(r.position.y)) for r in bot.resources}
+    cached = {r for _pos, res in info.expansions for r in res}
+    if not cached or not cached <= live:
+        bot._map_cache_hit = None         # re-published layout: no stale walls/routes
+        return False
+    from sc2.position import Point2
+
+    positions: List = []
+    by_resource: Dict = {}
+    for pos, resources in info.expansions:
+        p = Point2(pos)
+        positions.append(p)
+        for r in resources:
+            by_resource.setdefault(Point2(r), set()).add(p)
+    bot._expansion_positions_list = positions
+    bot._resource_location_to_expansion_position_dict = by_resource
+    return True
+
+
+def save_variant(map_name: str, variant: dict, map_dir: str = MAP_DIR) -> str:
+    """Write (or replace, by map size + starts) one variant; used by the builder."""
+    os.makedirs(map_dir, exist_ok=True)
+    path = os.path.join(map_dir, map_key(map_name) + ".json")
+    try:
+        with open(path) as f:
+            data = json.load(f)
+        if data.get("version") != SCHEMA_VERSION:
+            raise ValueError("stale schema")
+    except (OSError, ValueError):
+        data = {"version": SCHEMA_VERSION, "name": map_name, "variants": []}
+
+    def ident(v):
+        return (tuple(v["size"]), sorted(tuple(s["start"]) for s in v["spawns"]))
+
+    data["variants"] = [v for v in data["variants"] if ident(v) != ident(variant)]
+    data["variants"].append(variant)
+    with open(path, "w") as f:
+        json.dump(data, f, separators=(",", ":"))
+    load.cache_clear()
+    return path
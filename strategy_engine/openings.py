@@ -11,7 +11,8 @@ into reusable behavior:
   data is bucketed exactly the way a bot will classify an opponent live).
 - ``Opening`` / ``OPENINGS`` -- the canonical builds, loaded from the mined
   reference data in ``data/openings.json`` (build order, timings, placement
-  zones, and economy/unit reference bands).
+  zones, and economy/unit reference bands). The registry loads on first
+  access and keeps a pickled copy in ``data/__pycache__`` (see ``cache.cached_build``).
 - ``OpeningExecutor`` -- reproduce an opening: given what the bot has built so
   far, return the next structure + where to place it.
 - ``verify_opening`` -- check a played opening's telemetry (economy, units,
@@ -23,12 +24,16 @@ Pure Python: no ``sc2`` import, so it unit-tests without StarCraft II. A bot map
 
 from __future__ import annotations
 
+import bisect
+import heapq
 import json
 import os
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Mapping, Optional, Sequence
 
+from .cache import CACHE_DIR, LazyRegistry, cached_build  # noqa: F401 - re-exported
+
 DATA_PATH = os.path.join(os.path.dirname(__file__), "data", "openings.json")
 
 
@@ -192,7 +197,13 @@ def _load(path: str = DATA_PATH) -> dict:
             for name, fam in data.get("families", {}).items()}
 
 
-OPENINGS: dict = _load()
+def _load_cached() -> dict:
+    if __name__ != "strategy_engine.openings":   # pickles name classes by module
+        return _load()
+    return cached_build("openings", [DATA_PATH], _load, __file__)
+
+
+OPENINGS: Mapping = LazyRegistry(_load_cached)
 
 
 def openings_for_race(race: str) -> list:
@@ -213,6 +224,65 @@ def best_opening(race: str) -> Optional[Opening]:
 # Reproduce
 # ----------------------------------------------------------------------------
 
+class _StepIndex:
+    """Per-structure requirement index behind the executors' cheap next-step.
+
+    Step ``i`` needs ``count(key) >= need``. ``count(key)`` is ``have[key]``,
+    falling back to ``have[alias]`` when ``key`` is missing (the build guides'
+    token -> display-name fallback). Steps are grouped by ``(key, alias)``,
+    and within a group the needs rise with the step index. The first unmet
+    step of a group is therefore one bisect on its count. A lazy min-heap over
+    the groups' first unmet indices gives the first unmet step overall.
+
+    A call re-reads one count per group (a handful of structure types, however
+    long the build) and touches the heap only for groups whose count moved.
+    A count that drops (a building died) pushes an earlier index, so
+    rebuild-after-death works exactly as the full rescan did.
+    """
+
+    _DONE = float("inf")
+
+    def __init__(self, reqs):
+        groups: dict = {}
+        for i, (key, alias, need) in enumerate(reqs):
+            needs, idx = groups.setdefault((key, alias), ([], []))
+            needs.append(need)
+            idx.append(i)
+        self._groups = list(groups.items())
+        self._count = [None] * len(self._groups)   # last count read per group
+        self._pos = [0] * len(self._groups)        # steps met per group
+        self._first = [self._DONE] * len(self._groups)
+        self._heap: list = []
+        self._met = 0
+        self.size = len(reqs)
+
+    def sync(self, have: Mapping[str, int]) -> None:
+        for g, ((key, alias), (needs, idx)) in enumerate(self._groups):
+            c = have[key] if key in have else (have.get(alias, 0) if alias else 0)
+            if c == self._count[g]:
+                continue
+            self._count[g] = c
+            p = bisect.bisect_right(needs, c)
+            self._met += p - self._pos[g]
+            self._pos[g] = p
+            self._first[g] = idx[p] if p < len(idx) else self._DONE
+            if p < len(idx):
+                heapq.heappush(self._heap, (idx[p], g))
+        if len(self._heap) > 4 * len(self._groups) + 16:   # drop stale entries
+            self._heap = [(u, g) for g, u in enumerate(self._first) if u != self._DONE]
+            heapq.heapify(self._heap)
+
+    def first_unmet(self) -> Optional[int]:
+        heap = self._heap
+        while heap and self._first[heap[0][1]] != heap[0][0]:
+            heapq.heappop(heap)
+        return heap[0][0] if heap else None
+
+    @property
+    def met(self) -> int:
+        return self._met
+
+
 class OpeningExecutor:
     """Drive a bot through an opening's build order.
 
@@ -221,7 +291,8 @@ class OpeningExecutor:
     place (with its placement zone) or ``None`` when the opening is complete.
     Order is reproduced faithfully; exact timing emerges from the bot's economy,
     which is what keeps it robust across maps and interruptions (e.g. rebuilding
-    after a building dies just re-satisfies that step).
+    after a building dies just re-satisfies that step). Lookups are indexed per
+    structure (``_StepIndex``), so a per-step call doesn't rescan the order.
     """
 
     def __init__(self, opening: Opening):
@@ -232,17 +303,16 @@ class OpeningExecutor:
         for s in opening.steps:
             seen[s.structure] = seen.get(s.structure, 0) + 1
             self._required.append((s, seen[s.structure]))
+        self._index = _StepIndex([(s.structure, None, need) for s, need in self._required])
 
     def next_step(self, have: Mapping[str, int]) -> Optional[BuildStep]:
-        for step, need in self._required:
-            if have.get(step.structure, 0) < need:
-                return step
-        return None
+        self._index.sync(have)
+        i = self._index.first_unmet()
+        return None if i is None else self._required[i][0]
 
     def progress(self, have: Mapping[str, int]) -> float:
-        done = sum(1 for step, need in self._required
-                   if have.get(step.structure, 0) >= need)
-        return done / len(self._required) if self._required else 1.0
+        self._index.sync(have)
+        return self._index.met / len(self._required) if self._required else 1.0
 
     def is_complete(self, have: Mapping[str, int]) -> bool:
         return self.next_step(have) is None
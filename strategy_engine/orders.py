@@ -0,0 +1,271 @@
+"""orders: compact a step's unit commands before python-sc2 sends them.
+
+python-sc2 collects every ``unit.attack`` / ``unit.move`` / ``unit(ability)`` of a
+step in ``bot.actions`` and sends them in one ``RequestAction`` from
+``BotAI._after_step``. It merges identical orders, but only *adjacent* ones
+(``combine_actions`` is a ``groupby``), and sends every order a unit was given
+even when a later one in the same step replaces it. Our bots often order a unit
+several times per step (a rally move, then a kite, then a focus target), so much
+of the request is dead weight for the protocol and the SC2 server.
+
+``OrderBuffer.flush(bot)`` rewrites ``bot.actions`` in place, right before it is
+sent:
+
+- per unit, only the last non-queued order survives, plus any queued orders
+  given after it, since a targeted order (move, attack, a unit or point
+  ability) replaces the unit's current one. Orders without a target (stim,
+  siege, burrow, cloak, stop, hold) are not all like that: stim does not touch
+  the unit's order at all. A unit that got one this step is left exactly as the
+  bot ordered it, as are structure orders (trains, research), since repeating
+  those is meaningful (a reactor trains two at once);
+- an order identical to what the unit is already doing (same ability and the
+  same target unit or point) is dropped, unless the unit has more orders
+  queued or gets queued orders after it, since a fresh order clears the queue;
+- the surviving non-queued unit orders are sorted so identical orders from
+  different units sit together, and python-sc2 merges each run into a single
+  multi-unit command. Queued orders follow in their original order, so every
+  unit's queue still starts from its fresh order.
+
+``OrderBuffer.attack`` / ``move`` / ``issue`` filter earlier, when the bot gives
+the order: an order the unit is already carrying out is not given at all. A
+point target counts as the same within ``tolerance`` (1 cell by default), so a
+rally or attack point that drifts slightly from step to step doesn't re-send
+the order. This is for orders the bot repeats every step (rally, attack-move,
+focus target); a one-off order should still go through ``unit.attack`` etc.
+A unit that already got an order this step (directly, e.g. an inject or a kite
+move, or through the buffer) is never filtered: the filter compares against
+what the unit was doing at the last observation, and skipping the later order
+would let the earlier one win.
+
+``OrderStats`` counts per step and in total: the orders filtered at issue
+time, the orders issued, the orders sent, the raw commands after merging, and
+the serialized request size in bytes before and after filtering and
+compaction. The command and byte counts serialize the request twice more per
+step, so they are off unless ``measure_bytes=True`` (harness/play_one.py turns
+them on); they also need python-sc2.
+
+Duck-typed on python-sc2's ``UnitCommand`` (``ability``, ``unit``, ``target``,
+``queue``). Nothing here imports ``sc2`` at module load.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+
+def _target_key(target):
+    if target is None:
+        return None
+    tag = getattr(target, "tag", None)
+    if tag is not None:
+        return ("unit", tag)
+    return ("point", round(float(target[0]), 2), round(float(target[1]), 2))
+
+
+def is_current(unit, ability, target, tolerance: float = 0.0) -> bool:
+    """True if ``unit``'s current order is already ``ability`` on ``target``.
+
+    A point target matches within ``tolerance`` (0 = the exact point, like
+    python-sc2's own ``prevent_double_actions``).
+    """
+    orders = getattr(unit, "orders", None)
+    if not orders:
+        return False
+    current = orders[0]
+    ab = current.ability
+    if ability not in (ab.id, getattr(ab, "exact_id", ab.id)):
+        return False
+    have = current.target
+    if target is None:
+        return have is None or have == 0
+    tag = getattr(target, "tag", None)
+    if tag is not None:
+        return have == tag
+    if have is None or isinstance(have, int):
+        return False
+    dx, dy = float(have.x) - float(target[0]), float(have.y) - float(target[1])
+    return dx * dx + dy * dy <= tolerance * tolerance
+
+
+@lru_cache(maxsize=None)
+def _ability(name: str):
+    from sc2.ids.ability_id import AbilityId
+
+    return AbilityId[name]
+
+
+@dataclass
+class OrderStats:
+    steps: int = 0
+    seconds: float = 0.0     # game time at the last step
+    filtered: int = 0        # not given: the unit was already carrying it out
+    issued: int = 0          # orders the bot gave
+    superseded: int = 0      # replaced by a later order to the same unit in the step
+    noop: int = 0            # identical to the unit's current order
+    sent: int = 0            # orders left after compaction
+    commands: int = 0        # raw commands on the wire after merging
+    bytes_before: int = 0    # serialized RequestAction without compaction
+    bytes_after: int = 0
+    max_issued: int = 0
+    last: Dict[str, int] = field(default_factory=dict)
+
+    def record(self, step: Dict[str, int]) -> None:
+        self.steps += 1
+        self.last = step
+        self.seconds = step.get("seconds", self.seconds)
+        for k in ("filtered", "issued", "superseded", "noop", "sent", "commands",
+                  "bytes_before", "bytes_after"):
+            setattr(self, k, getattr(self, k) + step.get(k, 0))
+        self.max_issued = max(self.max_issued, step.get("issued", 0))
+
+    def as_dict(self) -> dict:
+        n = max(1, self.steps)
+        minutes = max(self.seconds / 60, 1 / 60)
+        return {"steps": self.steps, "filtered": self.filtered,
+                "issued": self.issued, "sent": self.sent,
+                "superseded": self.superseded, "noop": self.noop,
+                "commands": self.commands, "bytes_before": self.bytes_before,
+                "bytes_after": self.bytes_after,
+                "issued_per_step": round(self.issued / n, 2),
+                "commands_per_step": round(self.commands / n, 2),
+                "filtered_per_minute": round(self.filtered / minutes, 1),
+                "sent_per_minute": round(self.sent / minutes, 1),
+                "max_issued": self.max_issued}
+
+    def summary(self) -> str:
+        d = self.as_dict()
+        wire = f" as {d['commands']} commands" if self.bytes_before else ""
+        line = (f"orders: {d['issued']} issued over {d['steps']} steps "
+                f"({d['issued_per_step']}/step, max {d['max_issued']}), "
+                f"{d['sent']} sent{wire} "
+                f"({d['superseded']} superseded, {d['noop']} no-op); "
+                f"{d['filtered']} filtered at issue time "
+                f"({d['filtered_per_minute']}/min vs {d['sent_per_minute']}/min sent)")
+        if self.bytes_before:
+            line += (f", {self.bytes_after} of {self.bytes_before} bytes "
+                     f"({100 * self.bytes_after / self.bytes_before:.0f}%)")
+        return line
+
+
+class OrderBuffer:
+    def __init__(self, measure_bytes: bool = False, tolerance: float = 1.0):
+        self.stats = OrderStats()
+        self.measure_bytes = measure_bytes
+        self.tolerance = tolerance
+        self._filtered: List = []      # (unit, ability, target) skipped this step
+        self._ordered: set = set()     # tags given an order through issue() this step
+
+    def issue(self, unit, ability, target=None) -> bool:
+        """Give ``unit`` the order unless it is already carrying it out.
+
+        Returns False if the order was filtered. A unit with orders queued
+        behind the current one always gets it, since a fresh order clears
+        the queue, and so does a unit already ordered this step.
+        """
+        tag = unit.tag
+        if (tag not in self._ordered and not _received_action(unit)
+                and len(unit.orders) <= 1
+                and is_current(unit, ability, target, self.tolerance)):
+            self._filtered.append((unit, ability, target))
+            return False
+        self._ordered.add(tag)
+        unit(ability, target)
+        return True
+
+    def attack(self, unit, target) -> bool:
+        return self.issue(unit, _ability("ATTACK"), target)
+
+    def move(self, unit, target) -> bool:
+        return self.issue(unit, _ability("MOVE"), target)
+
+    def compact(self, actions: List) -> tuple:
+        """``(kept, superseded, noop)`` for one step's commands, in send order."""
+        # units whose orders are sent as given: structures, and units with an
+        # untargeted order that may not replace what they are doing
+        untouched = {a.unit.tag for a in actions
+                     if a.target is None or getattr(a.unit, "is_structure", False)}
+        last_fresh: Dict[int, int] = {}
+        follow_ups = set()
+        for i, a in enumerate(actions):
+            if a.unit.tag in untouched:
+                continue
+            if a.queue:
+                follow_ups.add(a.unit.tag)
+            else:
+                last_fresh[a.unit.tag] = i
+                follow_ups.discard(a.unit.tag)
+        fresh, as_given, queued = [], [], []
+        superseded = noop = 0
+        for i, a in enumerate(actions):
+            unit = a.unit
+            if unit.tag in untouched:
+                as_given.append(a)
+                continue
+            cut = last_fresh.get(unit.tag)
+            if cut is not None and i < cut:
+                superseded += 1                # the server would replace it anyway
+            elif a.queue:
+                queued.append(a)
+            elif (unit.tag not in follow_ups and len(unit.orders) <= 1
+                  and is_current(unit, a.ability, a.target)):
+                noop += 1                      # already doing exactly this
+            else:
+                fresh.append(a)
+        fresh.sort(key=lambda a: (a.ability.value, _target_key(a.target) or ()))
+        return fresh + as_given + queued, superseded, noop
+
+    def flush(self, bot) -> None:
+        """Compact ``bot.actions`` in place and record this step's stats."""
+        actions = bot.actions
+        filtered, self._filtered = self._filtered, []
+        self._ordered.clear()
+        step = {"seconds": getattr(bot, "time", 0.0), "filtered": len(filtered)}
+        if not actions and not filtered:
+            self.stats.record(step)
+            return
+        kept, superseded, noop = self.compact(actions)
+        step.update(issued=len(actions), sent=len(kept),
+                    superseded=superseded, noop=noop)
+        wire = _wire_size(kept) if self.measure_bytes else None
+        if wire is not None:
+            step["commands"], step["bytes_after"] = wire
+            before = _wire_size(_sc2_filtered(actions + _commands(filtered)))
+            step["bytes_before"] = before[1] if before else 0
+        actions[:] = kept
+        self.stats.record(step)
+
+
+def _received_action(unit) -> bool:
+    """Whether python-sc2 already has an order for ``unit`` this step."""
+    bot = getattr(unit, "_bot_object", None)
+    return unit.tag in getattr(bot, "unit_tags_received_action", ())
+
+
+def _sc2_filtered(actions: List) -> List:
+    """What python-sc2 would have sent: its own exact no-op filter only."""
+    return [a for a in actions if a.queue or getattr(a.unit, "is_structure", False)
+            or not is_current(a.unit, a.ability, a.target)]
+
+
+def _commands(filtered: List) -> List:
+    """The filtered orders as python-sc2 ``UnitCommand``s, to size what was saved."""
+    if not filtered:
+        return []
+    from sc2.unit_command import UnitCommand
+
+    return [UnitCommand(ability, unit, target=target) for unit, ability, target in filtered]
+
+
+def _wire_size(actions: List) -> Optional[tuple]:
+    """``(raw commands, serialized bytes)`` of the request python-sc2 builds."""
+    try:
+        from s2clientprotocol import sc2api_pb2 as sc_pb
+        from sc2.action import combine_actions
+    except ImportError:
+        return None
+    raw = list(combine_actions(actions))
+    request = sc_pb.Request(action=sc_pb.RequestAction(
+        actions=[sc_pb.Action(action_raw=r) for r in raw]))
+    return len(raw), request.ByteSize()
@@ -25,6 +25,7 @@ from .information import estimate_enemy, project_enemy
 from .rules import evaluate_rules
 from .openings import (
     OPENINGS,
+    cached_build,
     Placement,
     OpeningExecutor,
     classify_opening,
@@ -37,6 +38,10 @@ from .build_guides import BUILD_GUIDES, BuildExecutor, guides_for, get_build
 from .advisor import StrategicAdvisor
 from .macro import MacroPlan, recommend_macro
 from .tactics import Tactics, recommend_tactics
+from .combat_sim import simulate_fight, stats_for
+from . import maps
+from .orders import OrderBuffer
+from .economy import BASE_TIME, EconPlan, best_plan, compare_plans, income, rollout
 
 
 def _check(name: str, cond: bool) -> None:
@@ -548,6 +553,271 @@ def test_advisor_includes_macro_and_tactics() -> None:
            and "tactics:" in advice.summary())
 
 
+def test_economy_more_workers_more_income() -> None:
+    m1, _ = income(16, 1)
+    m2, _ = income(32, 2)
+    _check("income: more workers on more bases mine more", m2 > m1)
+    _check("income: a saturated base stops scaling", income(80, 1)[0] < 2 * income(40, 1)[0])
+
+
+def test_economy_rollout_lands_expansion_and_is_deterministic() -> None:
+    st = GameState(worker_count=30, base_count=2, minerals=500, supply_used=40,
+                   supply_cap=54, supply_left=14, production_structures=2)
+    plan = EconPlan(worker_target=50, production=3, expand_at=(0,))
+    r = rollout(st, plan, 180)
+    _check("rollout: expansion lands after BASE_TIME", r.at(BASE_TIME + 10)["bases"] == 3)
+    _check("rollout: no expansion before it finishes", r.at(BASE_TIME - 10)["bases"] == 2)
+    _check("rollout: workers grow toward the target", 30 < r.at(180)["workers"] <= 50)
+    _check("rollout: supply never exceeds 200", max(r.supply_used) <= 200)
+    again = rollout(st, plan, 180)
+    _check("rollout: deterministic", again.army_supply == r.army_supply
+           and again.bank == r.bank)
+
+
+def test_economy_compare_plans_ranks_by_objective() -> None:
+    st = GameState(worker_count=44, base_count=3, minerals=400, supply_used=70,
+                   supply_cap=86, supply_left=16, army_supply=20, production_structures=3)
+    drone = EconPlan(worker_target=66, production=3, name="drone")
+    army = EconPlan(worker_target=44, production=8, name="army")
+    _check("compare: all-in on army is strongest in 3 min",
+           best_plan(st, [drone, army], 180, "army").plan.name == "army")
+    _check("compare: droning is richest in 3 min",
+           best_plan(st, [drone, army], 180, "income").plan.name == "drone")
+    ranked = compare_plans(st, [drone, army], 180)
+    _check("compare: ranked best first", ranked[0].final_army >= ranked[1].final_army)
+
+
+def test_combat_sim_counters_and_reach() -> None:
+    _check("unit table: python-sc2 and sc2reader names agree",
+           stats_for("SIEGE_TANK_SIEGED") is stats_for("SiegeTankSieged") is not None)
+    air = simulate_fight({"Roach": 20}, {"Mutalisk": 10})
+    _check("sim: ground-only army can't touch air", air.winner == "theirs"
+           and air.their_value_lost == 0)
+    _check("sim: bigger army of the same unit wins",
+           simulate_fight({"Stalker": 12}, {"Stalker": 8}).winner == "ours")
+    mirror = simulate_fight({"Zergling": 24}, {"Zergling": 24})
+    _check("sim: mirror is a draw at ratio 1", mirror.winner == "draw"
+           and abs(mirror.strength_ratio - 1.0) < 0.05)
+    _check("sim: memoised", simulate_fight({"Zergling": 24}, {"Zergling": 24}) is mirror)
+    _check("sim: unknown names are reported, not counted",
+           simulate_fight({"Zergling": 8, "Drone": 5}, {"Marine": 2}).unknown == ("Drone",))
+
+
+def test_engagement_uses_sim_when_compositions_known() -> None:
+    # equal supply, but nothing of ours can shoot up
+    st = GameState(army_supply=40, enemy_army_supply=40, last_scouted_time=0,
+                   army_units={"Roach": 20}, enemy_army_units={"Mutalisk": 20})
+    _check("sim engagement: off by default", assess_engagement(st).fight is None)
+    adv = assess_engagement(st, simulate=True)
+    _check("sim engagement: can't hit air -> avoid", adv.verdict == Engagement.AVOID
+           and adv.fight is not None)
+    blind = assess_engagement(GameState(army_supply=40, enemy_army_supply=40,
+                                        last_scouted_time=0), simulate=True)
+    _check("no compositions -> supply ratio as before", blind.fight is None
+           and blind.effective_ratio == 1.0)
+    from types import SimpleNamespace
+    from . import combat
+    bot = SimpleNamespace(units=[SimpleNamespace(type_id=SimpleNamespace(name="Roach"))])
+    off = GameState.from_bot(bot).army_units
+    combat.SIMULATE_FIGHTS = True
+    try:
+        on = GameState.from_bot(bot).army_units
+    finally:
+        combat.SIMULATE_FIGHTS = False
+    _check("from_bot: compositions only while the sim is on",
+           off is None and on == {"Roach": 1})
+
+
+def test_map_cache_roundtrip_and_validation() -> None:
+    import tempfile
+    variant = {
+        "size": [152, 136],
+        "expansions": [{"pos": [33.5, 40.5], "resources": [[26.0, 40.5], [27.0, 37.5]]}],
+        "spawns": [{"start": [33.5, 40.5], "expansions": [[33.5, 40.5]],
+                    "ramp_top": [40.0, 50.0], "wall_pylon": [41.0, 52.0],
+                    "wall_buildings": [[38.5, 51.5], [43.5, 48.5]], "wall_warpin": [40.5, 49.5],
+                    "scout_route": [[118.5, 95.5]]}],
+    }
+    with tempfile.TemporaryDirectory() as d:
+        maps.save_variant("Test Map LE", variant, d)
+        maps.save_variant("Test Map LE", variant, d)     # same variant: replaced, not added
+        _check("map cache: one variant per size + starts", len(maps.load("TestMapLE", d)) == 1)
+        hit = maps.lookup("Test Map LE", (152, 136), (33.5, 40.5), d)
+        _check("map cache: live map + spawn found", hit is not None
+               and hit[1].protoss_wall == ((41.0, 52.0), [(38.5, 51.5), (43.5, 48.5)], (40.5, 49.5)))
+        _check("map cache: other size or spawn -> fall back to live",
+               maps.lookup("Test Map LE", (152, 140), (33.5, 40.5), d) is None
+               and maps.lookup("Test Map LE", (152, 136), (118.5, 95.5), d) is None)
+        from types import SimpleNamespace
+        moved = SimpleNamespace(position=SimpleNamespace(x=26.0, y=44.5))
+        bot = SimpleNamespace(_map_cache_hit=hit, resources=[moved])
+        _check("map cache: moved resources -> no expansions, no spawn",
+               not maps.apply_expansions(bot) and maps.for_bot(bot) is None)
+    _check("map cache: unknown map -> nothing", maps.load("NoSuchMap") == ())
+
+
+def test_indexed_executors_match_linear_scan() -> None:
+    import random
+    rng = random.Random(7)
+
+    def ref_next(required, count):
+        return next((r[0] for r in required if count(r) < r[-1]), None)
+
+    ok = True
+    for ex in ([OpeningExecutor(o) for o in OPENINGS.values()]
+               + [BuildExecutor(b) for b in BUILD_GUIDES.values()]):
+        keys = sorted({r[1] if len(r) == 3 else r[0].structure for r in ex._required}
+                      | {r[0].name for r in ex._required if len(r) == 3})
+        have: dict = {}
+        for _ in range(60):
+            k = rng.choice(keys)
+            if rng.random() < 0.15:
+                have.pop(k, None)                   # dropped from the report
+            else:                                   # built, or lost (rebuild-after-death)
+                have[k] = max(0, have.get(k, 0) + rng.choice((1, 1, 1, 2, -1)))
+            if isinstance(ex, OpeningExecutor):
+                want = ref_next(ex._required, lambda r: have.get(r[0].structure, 0))
+                got = ex.next_step(have)
+                met = sum(1 for s, n in ex._required if have.get(s.structure, 0) >= n)
+            else:
+                def c(r):
+                    a, key, _n = r
+                    return have.get(key, have.get(a.name, 0) if a.token else 0)
+                want = ref_next(ex._required, c)
+                got = ex.next_action(have)
+                met = sum(1 for r in ex._required if c(r) >= r[2])
+            ok &= got is want and abs(ex.progress(have) - met / len(ex._required)) < 1e-9
+    _check("indexed executors: same next step / progress as the linear scan", ok)
+
+
+def test_registries_load_lazily_from_cache() -> None:
+    import json
+    import os
+    import tempfile
+    with tempfile.TemporaryDirectory() as d:
+        src = os.path.join(d, "src.json")
+        with open(src, "w") as f:
+            json.dump({"a": 1}, f)
+        calls = []
+
+        def build():
+            calls.append(1)
+            with open(src) as f:
+                return json.load(f)
+
+        first = cached_build("t", [src], build, __file__, cache_dir=d)
+        again = cached_build("t", [src], build, __file__, cache_dir=d)
+        _check("data cache: second load skips the parse", first == again == {"a": 1}
+               and len(calls) == 1)
+        os.utime(src, ns=(1, 1))                    # touched, same bytes
+        cached_build("t", [src], build, __file__, cache_dir=d)
+        _check("data cache: mtime-only change accepted by hash", len(calls) == 1)
+        with open(src, "w") as f:
+            json.dump({"a": 2}, f)
+        _check("data cache: edited source rebuilds",
+               cached_build("t", [src], build, __file__, cache_dir=d) == {"a": 2})
+    _check("registries behave like dicts", OPENINGS.get("no_such") is None
+           and "zerg_pool_first" in OPENINGS and len(dict(OPENINGS.items())) == len(OPENINGS))
+
+
+def test_statefile_transaction() -> None:
+    import json
+    import os
+    import tempfile
+    from . import statefile
+    with tempfile.TemporaryDirectory() as d:
+        path = os.path.join(d, "state.json")
+
+        def load():
+            try:
+                with open(path) as f:
+                    return json.load(f)
+            except OSError:
+                return {"games": 0}
+
+        for _ in range(3):
+            with statefile.transaction(path, load) as state:
+                state["games"] += 1
+        _check("statefile: each transaction builds on the last", load() == {"games": 3})
+        try:
+            with statefile.transaction(path, load) as state:
+                state["games"] = -1
+                raise RuntimeError
+        except RuntimeError:
+            pass
+        _check("statefile: a failed update is not written", load() == {"games": 3}
+               and sorted(os.listdir(d)) == ["state.json", "state.lock"])
+
+
+def test_order_buffer_compacts_a_step() -> None:
+    from types import SimpleNamespace as NS
+    from enum import Enum
+
+    class Ab(Enum):
+        MOVE = 16
+        ATTACK = 23
+        STIM = 380
+        TRAIN = 560
+
+    def unit(tag, orders=(), structure=False):
+        return NS(tag=tag, orders=list(orders), is_structure=structure)
+
+    def cmd(ability, u, target=None, queue=False):
+        return NS(ability=ability, unit=u, target=target, queue=queue)
+
+    rally, enemy = (40.0, 40.0), NS(tag=99)
+    busy = unit(3, [NS(ability=NS(id=Ab.MOVE, exact_id=Ab.MOVE), target=NS(x=40.0, y=40.0))])
+    a, b, rax = unit(1), unit(2), unit(7, structure=True)
+    bot = NS(actions=[cmd(Ab.MOVE, a, rally), cmd(Ab.MOVE, b, rally), cmd(Ab.MOVE, busy, rally),
+                      cmd(Ab.ATTACK, a, enemy), cmd(Ab.MOVE, b, (50.0, 50.0), queue=True),
+                      cmd(Ab.TRAIN, rax), cmd(Ab.TRAIN, rax)])
+    buf = OrderBuffer()
+    buf.flush(bot)
+    sent = [(c.ability, c.unit.tag, c.queue) for c in bot.actions]
+    _check("orders: last fresh order per unit wins, queue kept after it",
+           sent == [(Ab.MOVE, 2, False), (Ab.ATTACK, 1, False), (Ab.TRAIN, 7, False),
+                    (Ab.TRAIN, 7, False), (Ab.MOVE, 2, True)])
+    _check("orders: a unit already doing it is skipped",
+           buf.stats.noop == 1 and buf.stats.superseded == 1 and buf.stats.issued == 7)
+    marine = unit(8)
+    bot = NS(actions=[cmd(Ab.ATTACK, marine, enemy), cmd(Ab.STIM, marine),
+                      cmd(Ab.MOVE, marine, rally)])
+    buf.flush(bot)
+    _check("orders: a unit with an untargeted order (stim) is sent as given",
+           [c.ability for c in bot.actions] == [Ab.ATTACK, Ab.STIM, Ab.MOVE])
+    _check("orders: byte counts are opt-in", buf.stats.bytes_before == 0)
+
+    class Unit:
+        def __init__(self, tag, orders=()):
+            self.tag, self.orders, self.is_structure = tag, list(orders), False
+
+        def __call__(self, ability, target=None):     # python-sc2's bot.do()
+            bot.actions.append(cmd(ability, self, target))
+            bot.unit_tags_received_action.add(self.tag)
+
+        @property
+        def _bot_object(self):
+            return bot
+
+    bot = NS(actions=[], time=60.0, unit_tags_received_action=set())
+    moving = Unit(4, busy.orders)
+    buf.issue(moving, Ab.MOVE, (40.6, 39.5))     # drifted rally point
+    buf.issue(moving, Ab.ATTACK, (40.0, 40.0))   # different ability
+    buf.issue(Unit(5), Ab.MOVE, rally)           # idle
+    _check("orders: a repeated order within tolerance is not given",
+           [(c.ability, c.unit.tag) for c in bot.actions] == [(Ab.ATTACK, 4), (Ab.MOVE, 5)])
+    buf.flush(bot)
+    _check("orders: filtered orders counted per minute",
+           buf.stats.filtered == 1 and buf.stats.as_dict()["filtered_per_minute"] == 1.0)
+
+    bot = NS(actions=[], time=60.0, unit_tags_received_action=set())
+    kiting = Unit(6, busy.orders)
+    kiting(Ab.MOVE, (10.0, 10.0))                # a direct kite order first
+    buf.issue(kiting, Ab.MOVE, rally)            # matches the observed order
+    _check("orders: a unit already ordered this step is not filtered",
+           [c.target for c in bot.actions] == [(10.0, 10.0), rally])
+
+
 def main() -> None:
     tests = [v for k, v in sorted(globals().items()) if k.startswith("test_")]
     print(f"running {len(tests)} strategy_engine checks...\n")
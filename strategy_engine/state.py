@@ -13,7 +13,7 @@ assume zero.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Dict, Optional
 
 
 @dataclass
@@ -36,6 +36,7 @@ class GameState:
 
     # --- own army / production / tech ---
     army_supply: float = 0.0
+    army_units: Optional[Dict[str, int]] = None  # unit name -> count, for the fight sim
     production_structures: int = 0
     idle_production: int = 0  # production buildings idle with money available
     tech_structures: int = 0
@@ -66,6 +67,7 @@ class GameState:
     enemy_base_count: Optional[int] = None
     enemy_worker_count: Optional[int] = None
     enemy_army_supply: Optional[float] = None
+    enemy_army_units: Optional[Dict[str, float]] = None  # visible army, name -> count
     enemy_production_structures: Optional[int] = None
     enemy_tech_structures: Optional[int] = None
     enemy_static_defense: Optional[int] = None
@@ -135,6 +137,21 @@ class GameState:
             army_supply=getattr(bot, "supply_army", 0.0),
         )
 
+        # Our army by type, for ``combat_sim`` (names it doesn't know are dropped);
+        # only counted while the engagement read uses the simulator.
+        from . import combat
+
+        units = getattr(bot, "units", None)
+        if units is not None and combat.SIMULATE_FIGHTS:
+            from .combat_sim import is_combat_unit
+
+            army: Dict[str, int] = {}
+            for u in units:
+                name = getattr(getattr(u, "type_id", None), "name", None)
+                if name and is_combat_unit(name):
+                    army[name] = army.get(name, 0) + 1
+            st.army_units = army
+
         # Best-effort trade values from python-sc2's score details, if present.
         score = getattr(getattr(bot, "state", None), "score", None)
         if score is not None:
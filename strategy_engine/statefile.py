@@ -0,0 +1,79 @@
+"""statefile: lock-safe read-modify-write of a bot's persisted JSON state.
+
+HydraBot's opening bandit, PhoenixBot's parameter tuner and the opponent_intel
+learner each keep one JSON file that parallel games (gauntlet ``--concurrency``,
+harness/versus.py runs) update at the same time. ``transaction`` is the one
+pattern they share:
+
+    with statefile.transaction(path, load) as state:
+        state["games"] += 1          # saved on exit, unless the block raises
+
+- an exclusive ``fcntl`` lock on a sidecar ``<name>.lock`` file is held from the
+  read to the write, so no update is lost;
+- the JSON is written to a temp file in the same dir and ``os.replace``d, so a
+  reader (or a crash) never sees half a file.
+
+No ``fcntl`` (Windows) means no lock: single-process use only. A failed write
+leaves the old file in place; persisted state is never worth a crashed game.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Iterator, Union
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows: serial access only
+    fcntl = None
+
+PathLike = Union[str, Path]
+
+
+@contextmanager
+def locked(path: PathLike) -> Iterator[None]:
+    """Hold an exclusive lock on ``path``'s sidecar ``.lock`` file."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path.with_suffix(".lock"), "a+") as lock:
+        if fcntl is not None:
+            fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock.fileno(), fcntl.LOCK_UN)
+
+
+def write_json(path: PathLike, data, **dump_kwargs) -> bool:
+    """Atomically replace ``path`` with ``data`` as JSON; False if it failed."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=str(path.parent), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f, **dump_kwargs)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp, 0o644)      # mkstemp's 0600 would hide shipped state files
+        os.replace(tmp, path)
+        return True
+    except OSError:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        return False
+
+
+@contextmanager
+def transaction(path: PathLike, load: Callable[[], dict], **dump_kwargs) -> Iterator[dict]:
+    """Under the lock: ``load()`` the state, yield it, write it back on exit."""
+    with locked(path):
+        state = load()
+        yield state
+        write_json(path, state, **dump_kwargs)